@@ -0,0 +1,108 @@
+"""
+미디어 스캐너 테스트 (os.scandir 한 번 스캔 + 정렬 키 캐시)
+
+테스트 범위:
+- 이미지/비디오 개별 정렬 (시퀀스 번호 → 수정 시간)
+- 통합 정렬 (타입 무관 번호순)
+- scene_XX_image 매핑 (루트 우선)
+- 썸네일/확장자 필터, images/ videos/ 서브폴더
+"""
+import os
+import sys
+import pytest
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from src.utils.media_scanner import scan_media_folder, extract_sequence, extract_unified_sequence
+
+
+def _touch(path: Path, mtime: float = 1000):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b'x')
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+class TestSequenceExtraction:
+    """시퀀스 번호 추출 규칙 (Frontend와 동일)"""
+
+    @pytest.mark.parametrize("filename,expected", [
+        ("1.jpg", 1),
+        ("02.png", 2),
+        ("scene_00_hook.jpeg", 0),
+        ("image_01.jpg", 1),
+        ("scene-02.png", 2),
+        ("Image_fx (47).jpg", 47),
+        ("Image_fx_abcdefgh12 (47).jpg", None),
+        ("random.jpg", None),
+    ])
+    def test_image_rules(self, filename, expected):
+        assert extract_sequence(filename, 'image') == expected
+
+    def test_video_skips_scene_prefix_rule(self):
+        assert extract_sequence("scene_05_intro.mp4", 'video') is None
+        assert extract_sequence("scene_05_intro.jpg", 'image') == 5
+
+    @pytest.mark.parametrize("stem,expected", [
+        ("image_01", 1),
+        ("clip(3)", 3),
+        ("(4)", 4),
+        ("05", 5),
+        ("영상06", 6),
+        ("nonumber", None),
+    ])
+    def test_unified_rules(self, stem, expected):
+        assert extract_unified_sequence(stem) == expected
+
+
+class TestScanMediaFolder:
+    """폴더 스캔 결과"""
+
+    def test_sorts_by_sequence_then_mtime(self, tmp_path):
+        _touch(tmp_path / "03.jpg")
+        _touch(tmp_path / "images" / "image_01.png")
+        _touch(tmp_path / "later.jpg", mtime=3000)
+        _touch(tmp_path / "earlier.JPEG", mtime=2000)
+        _touch(tmp_path / "thumbnail.jpg")
+        _touch(tmp_path / "notes.txt")
+
+        scan = scan_media_folder(tmp_path)
+        names = [m.path.name for m in scan.sorted_images()]
+        assert names == ["image_01.png", "03.jpg", "earlier.JPEG", "later.jpg"]
+        assert scan.scene_images == {}
+
+    def test_videos_from_root_and_videos_folder(self, tmp_path):
+        _touch(tmp_path / "02.MP4")
+        _touch(tmp_path / "videos" / "clip_01.mov")
+        _touch(tmp_path / "images" / "ignored.mp4")
+
+        scan = scan_media_folder(tmp_path)
+        assert [m.path.name for m in scan.sorted_videos()] == ["clip_01.mov", "02.MP4"]
+
+    def test_scene_images_prefer_root(self, tmp_path):
+        root_image = _touch(tmp_path / "scene_01_image.png")
+        _touch(tmp_path / "images" / "scene_01_image.jpg")
+        sub_image = _touch(tmp_path / "images" / "scene_02_image.jpeg")
+
+        scan = scan_media_folder(tmp_path)
+        assert scan.scene_images == {1: root_image, 2: sub_image}
+
+    def test_unified_sort_mixes_types_by_number(self, tmp_path):
+        _touch(tmp_path / "iii01.jpg")
+        _touch(tmp_path / "jjj02.mp4")
+        _touch(tmp_path / "ididi04.jpg")
+        _touch(tmp_path / "jjjj03.mp4")
+
+        scan = scan_media_folder(tmp_path)
+        ordered = sorted(scan.images + scan.videos, key=lambda m: m.unified_sort_key)
+        assert [m.path.name for m in ordered] == ["iii01.jpg", "jjj02.mp4", "jjjj03.mp4", "ididi04.jpg"]
+
+    def test_get_reuses_scanned_entry(self, tmp_path):
+        path = _touch(tmp_path / "01.jpg")
+        scan = scan_media_folder(tmp_path)
+        assert scan.get(path) is scan.images[0]
+
+        downloaded = _touch(tmp_path / "scene_05_image.png")
+        assert scan.get(downloaded).path == downloaded
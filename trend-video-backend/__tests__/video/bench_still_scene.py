@@ -0,0 +1,97 @@
+"""
+정지 이미지 씬 인코딩 벤치마크 (기존 명령 vs 고속 경로)
+
+합성 이미지(2400x1600) + 60초 오디오로 씬 하나를 두 방식으로 인코딩하고
+실행 시간과 FFmpeg 자식 프로세스 CPU 시간을 비교한다.
+
+사용법:
+    python __tests__/video/bench_still_scene.py
+    python __tests__/video/bench_still_scene.py --duration 60 --width 1080 --height 1920
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from src.utils.ffmpeg_utils import build_still_scene_commands, get_ffmpeg_path, get_video_duration
+
+
+def _run_timed(cmds, cwd=None):
+    """명령들을 순서대로 실행하고 (wall 초, 자식 CPU 초) 반환"""
+    before = os.times()
+    start = time.perf_counter()
+    for cmd in cmds:
+        subprocess.run(cmd, check=True, capture_output=True, cwd=cwd)
+    wall = time.perf_counter() - start
+    after = os.times()
+    cpu = (after.children_user - before.children_user) + (after.children_system - before.children_system)
+    return wall, cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description="정지 이미지 씬 인코딩 벤치마크")
+    parser.add_argument("--duration", type=float, default=60.0, help="씬 길이 (초, 기본: 60)")
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--codec", default="libx264")
+    parser.add_argument("--preset", default="ultrafast")
+    args = parser.parse_args()
+
+    ffmpeg = get_ffmpeg_path()
+    if not ffmpeg:
+        print("FFmpeg를 찾을 수 없습니다.")
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        image = tmp / "source.png"
+        audio = tmp / "narration.mp3"
+
+        # 합성 입력 생성
+        subprocess.run([ffmpeg, '-y', '-f', 'lavfi', '-i', 'testsrc2=size=2400x1600',
+                        '-frames:v', '1', str(image)], check=True, capture_output=True)
+        subprocess.run([ffmpeg, '-y', '-f', 'lavfi', '-i', f'sine=frequency=440:duration={args.duration}',
+                        '-c:a', 'libmp3lame', str(audio)], check=True, capture_output=True)
+
+        # 기존 명령 (매 프레임 리스케일)
+        legacy_out = tmp / "legacy.mp4"
+        legacy_cmd = [
+            ffmpeg, '-loop', '1', '-i', str(image), '-i', str(audio),
+            '-vf', f"scale={args.width}:{args.height}:force_original_aspect_ratio=increase,"
+                   f"crop={args.width}:{args.height},fps=25",
+            '-c:v', args.codec, '-preset', args.preset, '-c:a', 'aac',
+            '-shortest', '-pix_fmt', 'yuv420p', '-y', str(legacy_out)
+        ]
+
+        # 고속 경로 (사전 리스케일 + 저프레임 입력)
+        fast_out = tmp / "fast.mp4"
+        fast_cmds = build_still_scene_commands(
+            ffmpeg, image, audio, fast_out, tmp / "prescaled.png",
+            args.width, args.height, codec=args.codec, preset=args.preset
+        )
+
+        legacy_wall, legacy_cpu = _run_timed([legacy_cmd])
+        fast_wall, fast_cpu = _run_timed(list(fast_cmds))
+
+        print("=" * 70)
+        print(f"정지 이미지 씬 벤치마크: {args.duration:.0f}초, {args.width}x{args.height}, {args.codec}/{args.preset}")
+        print("=" * 70)
+        print(f"{'방식':<12}{'실행 시간':>12}{'CPU 시간':>12}{'출력 길이':>12}{'파일 크기':>14}")
+        for name, wall, cpu, out in (
+            ("기존", legacy_wall, legacy_cpu, legacy_out),
+            ("고속 경로", fast_wall, fast_cpu, fast_out),
+        ):
+            print(f"{name:<12}{wall:>10.2f}초{cpu:>10.2f}초{get_video_duration(out):>10.2f}초"
+                  f"{out.stat().st_size / 1024:>11.0f}KB")
+        if fast_cpu > 0:
+            print(f"CPU 절감: {legacy_cpu / fast_cpu:.1f}배")
+
+
+if __name__ == "__main__":
+    main()
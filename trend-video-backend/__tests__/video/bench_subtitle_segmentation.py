@@ -0,0 +1,74 @@
+"""
+자막 줄 나누기 벤치마크 (예전 O(n²) 구현 vs 누적 글자 수 O(n) 구현)
+
+합성 단어 타임스탬프 / 대본을 단어 수를 늘려 가며 두 방식으로 그룹화하고
+실행 시간과 결과 일치 여부를 출력한다.
+
+사용법:
+    python __tests__/video/bench_subtitle_segmentation.py
+    python __tests__/video/bench_subtitle_segmentation.py --sizes 1000 5000 20000 --repeat 3
+"""
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.utils.subtitle_segmentation import group_script_text, group_timed_words, split_script_sentences
+from test_subtitle_segmentation import (
+    legacy_group_script_text,
+    legacy_group_timed_words,
+    random_script,
+    random_word_timings,
+)
+
+
+def _best_of(fn, repeat):
+    """repeat번 실행해 가장 빠른 시간(초)과 결과 반환"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자막 줄 나누기 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs='+', default=[500, 2000, 8000, 20000], help="단어 수")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-chars", type=int, default=22)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print("=" * 70)
+    print(f"자막 줄 나누기 벤치마크 (max_chars={args.max_chars}, best of {args.repeat})")
+    print("=" * 70)
+    print(f"{'입력':<14}{'단어 수':>8}{'예전':>12}{'개선':>12}{'배수':>8}{'결과':>8}")
+
+    for size in args.sizes:
+        # 타임스탬프 경로: 수 분짜리 나레이션 전체가 한 번에 들어온다
+        timings = random_word_timings(rng, size)
+        legacy_t, legacy_r = _best_of(lambda: legacy_group_timed_words(timings, args.max_chars), args.repeat)
+        new_t, new_r = _best_of(lambda: group_timed_words(timings, args.max_chars), args.repeat)
+        print(f"{'타임스탬프':<14}{size:>8}{legacy_t * 1000:>10.1f}ms{new_t * 1000:>10.1f}ms"
+              f"{legacy_t / new_t:>7.1f}x{'일치' if legacy_r == new_r else '불일치':>8}")
+
+        # 대본 경로: 마침표 없는 긴 문장일수록 예전 구현이 느려진다
+        script = random_script(rng, size).replace('.', '').replace('!', '').replace('?', '')
+        legacy_t, legacy_r = _best_of(lambda: legacy_group_script_text(script, 600.0, args.max_chars), args.repeat)
+        new_t, new_r = _best_of(
+            lambda: group_script_text(split_script_sentences(script), 600.0, args.max_chars), args.repeat
+        )
+        print(f"{'대본(한 문장)':<14}{size:>8}{legacy_t * 1000:>10.1f}ms{new_t * 1000:>10.1f}ms"
+              f"{legacy_t / new_t:>7.1f}x{'일치' if legacy_r == new_r else '불일치':>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+프로젝트 오디오 트랙 조립 테스트 (FFmpeg 실행 대신 가짜 run_ffmpeg 사용)
+
+테스트 범위:
+- 씬 길이 → 샘플 단위 배치 (누적 반올림, 오차 없음)
+- 조립 filter_complex 그래프 (나레이션 패딩/자르기, 무음 씬)
+- 조립 명령 (AAC 한 번 인코딩) / 먹이기 명령 (스트림 복사) / 씬별 시작 시각 기록
+- 씬이 많으면 그룹별 구간 → concat demuxer (한 프로세스의 입력 수 제한)
+"""
+import sys
+import json
+import pytest
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from src.utils import audio_track
+from src.utils.audio_track import (
+    AudioTrackError,
+    assemble_audio_track,
+    build_audio_track_graph,
+    mux_audio_track,
+    scene_sample_spans,
+)
+
+
+class FakeRun:
+    """run_ffmpeg 호출 기록 (출력 파일과 filter 스크립트 내용 보관)"""
+
+    def __init__(self, monkeypatch, returncode=0):
+        self.calls = []
+        self.scripts = []
+        self.returncode = returncode
+        monkeypatch.setattr(audio_track, 'run_ffmpeg', self.run)
+
+    def run(self, cmd, **kwargs):
+        self.calls.append([str(c) for c in cmd])
+        if '-filter_complex_script' in cmd:
+            self.scripts.append(Path(cmd[cmd.index('-filter_complex_script') + 1]).read_text(encoding='utf-8'))
+        if self.returncode == 0:
+            Path(cmd[-1]).write_bytes(b'out')
+        return type('Result', (), {'returncode': self.returncode, 'stderr': 'boom'})()
+
+
+class TestSceneSampleSpans:
+    """씬 배치"""
+
+    def test_cumulative_rounding_has_no_drift(self):
+        spans = scene_sample_spans([1 / 3] * 300, 44100)
+        assert spans[0] == (0, 14700)
+        # 모든 씬 길이의 합 = 전체 길이 (씬마다 따로 반올림하면 쌓이는 오차 없음)
+        assert sum(samples for _, samples in spans) == 100 * 44100
+        assert all(start == prev_start + prev_samples
+                   for (prev_start, prev_samples), (start, _) in zip(spans, spans[1:]))
+
+
+class TestBuildAudioTrackGraph:
+    """조립 그래프"""
+
+    def test_pads_narration_and_fills_silence(self):
+        graph = build_audio_track_graph([True, False, True], [1.0, 0.5, 2.0], 44100)
+        lines = graph.split(";\n")
+        assert lines[0] == ("[0:a]aresample=44100,aformat=sample_fmts=fltp:channel_layouts=stereo,"
+                            "apad=whole_len=44100,atrim=end_sample=44100,asetpts=N/SR/TB[a0]")
+        assert lines[1] == "anullsrc=r=44100:cl=stereo,atrim=end_sample=22050,asetpts=N/SR/TB[a1]"
+        # 무음 씬은 입력을 쓰지 않으므로 다음 나레이션은 입력 1번
+        assert lines[2].startswith("[1:a]aresample=44100")
+        assert lines[3] == "[a0][a1][a2]concat=n=3:v=0:a=1[outa]"
+
+
+class TestAssembleAudioTrack:
+    """조립 / 먹이기"""
+
+    def test_single_pass_aac_encode_and_offsets(self, tmp_path, monkeypatch):
+        fake = FakeRun(monkeypatch)
+        segments = [(tmp_path / 'scene_01_audio.mp3', 2.0), (None, 1.0), (tmp_path / 'scene_03_audio.mp3', 3.0)]
+
+        track = assemble_audio_track(segments, tmp_path / 'narration_track.m4a', ffmpeg='ffmpeg', bitrate='64k')
+
+        cmd = fake.calls[0]
+        assert cmd.count('-i') == 2
+        assert cmd[cmd.index('-c:a') + 1] == 'aac'
+        assert cmd[cmd.index('-b:a') + 1] == '64k'
+        assert 'concat=n=3:v=0:a=1[outa]' in fake.scripts[0]
+        assert not (tmp_path / 'narration_track_filter.txt').exists()
+        assert track.offsets == [0.0, 2.0, 3.0]
+        assert track.duration == pytest.approx(6.0)
+
+        track.save(tmp_path / 'audio_track.json')
+        data = json.loads((tmp_path / 'audio_track.json').read_text(encoding='utf-8'))
+        assert data['audio'] == 'narration_track.m4a'
+        assert [scene['offset'] for scene in data['scenes']] == [0.0, 2.0, 3.0]
+
+    def test_many_scenes_bounded_groups(self, tmp_path, monkeypatch):
+        fake = FakeRun(monkeypatch)
+        segments = [(None if i % 10 == 9 else tmp_path / f'scene_{i + 1:03d}_audio.mp3', 1 / 3) for i in range(250)]
+
+        track = assemble_audio_track(segments, tmp_path / 'narration_track.m4a', ffmpeg='ffmpeg', group_size=16)
+
+        group_calls, final = fake.calls[:-1], fake.calls[-1]
+        assert len(group_calls) == 16
+        assert all(cmd.count('-i') <= 16 for cmd in fake.calls)
+        # 구간은 무손실 PCM, AAC 인코딩은 마지막 한 번
+        assert all(cmd[cmd.index('-c:a') + 1] == 'pcm_s16le' for cmd in group_calls)
+        assert final[final.index('-f') + 1] == 'concat' and final.count('-i') == 1
+        assert final[final.index('-c:a') + 1] == 'aac'
+        # 그룹 그래프를 합치면 전체 씬 수 / 전체 샘플 수와 같다
+        assert sum(int(script.rsplit('concat=n=', 1)[1].split(':')[0]) for script in fake.scripts) == 250
+        total = sum(int(line.split('end_sample=')[1].split(',')[0])
+                    for script in fake.scripts for line in script.split(";\n") if 'end_sample=' in line)
+        assert total == round(250 / 3 * 44100)
+        assert track.offsets[-1] == pytest.approx(249 / 3, abs=1e-4)
+        # 중간 구간 / 목록 / 스크립트 파일은 남지 않는다
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['narration_track.m4a']
+
+    def test_failure_raises(self, tmp_path, monkeypatch):
+        FakeRun(monkeypatch, returncode=1)
+        with pytest.raises(AudioTrackError):
+            assemble_audio_track([(None, 1.0)], tmp_path / 'track.m4a', ffmpeg='ffmpeg')
+        with pytest.raises(AudioTrackError):
+            assemble_audio_track([], tmp_path / 'track.m4a', ffmpeg='ffmpeg')
+        with pytest.raises(AudioTrackError):
+            assemble_audio_track([(None, 1.0)] * 5, tmp_path / 'track.m4a', ffmpeg='ffmpeg', group_size=2)
+        assert not list(tmp_path.glob('track_part*'))
+
+    def test_mux_copies_streams(self, tmp_path, monkeypatch):
+        fake = FakeRun(monkeypatch)
+        mux_audio_track(tmp_path / 'video.mp4', tmp_path / 'track.m4a', tmp_path / 'final.mp4', ffmpeg='ffmpeg')
+        cmd = fake.calls[0]
+        assert cmd[cmd.index('-c') + 1] == 'copy'
+        assert cmd[cmd.index('-map') + 1] == '0:v:0'
+        assert (tmp_path / 'final.mp4').exists()
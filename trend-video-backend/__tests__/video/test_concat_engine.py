@@ -0,0 +1,287 @@
+"""
+공용 영상 병합 엔진(smart_concat) 테스트 (FFmpeg 실행 대신 가짜 조회/실행 사용)
+
+테스트 범위:
+- 기준과 다른 연속 구간 찾기
+- 정규화 filter_complex 그래프 (기존 병합 그래프 + 무음 채우기)
+- 전략 선택: 스트림 복사 / 구간 재인코딩 후 복사 / 전체 재인코딩 / 오디오 전용 / 비디오 전용
+"""
+import sys
+import pytest
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from src.utils import concat_engine
+from src.utils.concat_engine import (
+    ConcatError,
+    smart_concat,
+    split_groups,
+    find_outlier_runs,
+    build_normalize_graph,
+    STRATEGY_STREAM_COPY,
+    STRATEGY_CONFORM_COPY,
+    STRATEGY_REENCODE,
+)
+
+
+def _info(width=1920, height=1080, rate='25/1', codec='h264', audio=True, duration=5.0):
+    return {
+        'duration': duration,
+        'format_name': 'mov,mp4,m4a,3gp,3g2,mj2',
+        'video': {
+            'codec_name': codec, 'profile': 'High', 'width': width, 'height': height,
+            'pix_fmt': 'yuv420p', 'sample_aspect_ratio': '1:1', 'r_frame_rate': rate, 'fps': 25.0,
+        },
+        'audio': {
+            'codec_name': 'aac', 'profile': 'LC', 'sample_rate': 44100,
+            'channels': 2, 'channel_layout': 'stereo',
+        } if audio else None,
+    }
+
+
+def _audio_info(codec='mp3', sample_rate=24000):
+    return {
+        'duration': 2.0, 'format_name': 'mp3', 'video': None,
+        'audio': {'codec_name': codec, 'profile': None, 'sample_rate': sample_rate,
+                  'channels': 1, 'channel_layout': 'mono'},
+    }
+
+
+class FakeFFmpeg:
+    """probe_many / concat_stream_copy / 인코딩 호출 기록"""
+
+    def __init__(self, monkeypatch, infos):
+        self.infos = infos
+        self.stream_copies = []
+        self.encodes = []
+        # 구간 재인코딩 결과 파일의 조회 결과
+        self.conformed_info = _info()
+        monkeypatch.setattr(concat_engine, 'probe_many', lambda paths, **kw: {p: infos.get(p) for p in paths})
+        monkeypatch.setattr(concat_engine, 'probe_media', lambda path, **kw: self.conformed_info)
+        monkeypatch.setattr(concat_engine, 'concat_stream_copy', self.concat_stream_copy)
+        monkeypatch.setattr(concat_engine, '_run', self.run)
+
+    def concat_stream_copy(self, ffmpeg, paths, output_path, list_path, stop_dir=None):
+        self.stream_copies.append(list(paths))
+        Path(output_path).write_bytes(b'mp4')
+        return type('Result', (), {'returncode': 0, 'stderr': ''})()
+
+    def run(self, cmd, what, duration=None, stop_dir=None):
+        self.encodes.append(cmd)
+        Path(cmd[-1]).write_bytes(b'mp4')
+
+
+def _inputs(tmp_path, count):
+    return [tmp_path / f"scene_{i:02d}.mp4" for i in range(count)]
+
+
+class TestFindOutlierRuns:
+    """기준과 다른 입력의 연속 구간"""
+
+    def test_groups_adjacent_outliers(self):
+        inputs = [Path(f"{i}.mp4") for i in range(7)]
+        outliers = [inputs[1], inputs[2], inputs[4], inputs[6]]
+        assert find_outlier_runs(inputs, outliers) == [[1, 2], [4], [6]]
+
+    def test_no_outliers(self):
+        assert find_outlier_runs([Path('a.mp4')], []) == []
+
+    def test_long_runs_split(self):
+        inputs = [Path(f"{i}.mp4") for i in range(6)]
+        assert find_outlier_runs(inputs, inputs[:5], max_run=2) == [[0, 1], [2, 3], [4]]
+
+    def test_split_groups(self):
+        assert split_groups(list(range(7)), 3) == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+class TestBuildNormalizeGraph:
+    """filter_complex 그래프"""
+
+    def test_matches_legacy_concat_graph(self):
+        graph = build_normalize_graph([True, True], [3.0, 4.0], 1920, 1080, 25)
+        assert graph == (
+            "[0:v]scale=1920:1080:force_original_aspect_ratio=decrease,"
+            "pad=1920:1080:(ow-iw)/2:(oh-ih)/2,setsar=1,fps=25[v0];"
+            "[1:v]scale=1920:1080:force_original_aspect_ratio=decrease,"
+            "pad=1920:1080:(ow-iw)/2:(oh-ih)/2,setsar=1,fps=25[v1];"
+            "[v0][0:a][v1][1:a]concat=n=2:v=1:a=1[outv][outa]"
+        )
+
+    def test_silent_input_gets_anullsrc(self):
+        graph = build_normalize_graph([True, False], [3.0, 2.5], 1080, 1920, '30000/1001', 48000, 'mono')
+        assert "anullsrc=r=48000:cl=mono,atrim=duration=2.500[a1]" in graph
+        assert "fps=30000/1001[v1]" in graph
+        assert graph.endswith("[v0][0:a][v1][a1]concat=n=2:v=1:a=1[outv][outa]")
+
+
+class TestSmartConcat:
+    """전략 선택"""
+
+    def test_identical_inputs_stream_copy(self, tmp_path, monkeypatch):
+        inputs = _inputs(tmp_path, 3)
+        fake = FakeFFmpeg(monkeypatch, {p: _info() for p in inputs})
+
+        result = smart_concat(inputs, tmp_path / 'out.mp4', ffmpeg='ffmpeg', codec='libx264')
+
+        assert result.strategy == STRATEGY_STREAM_COPY
+        assert result.reencoded_count == 0
+        assert fake.stream_copies == [inputs]
+        assert fake.encodes == []
+
+    def test_outlier_runs_conformed_then_copied(self, tmp_path, monkeypatch):
+        inputs = _inputs(tmp_path, 5)
+        infos = {p: _info() for p in inputs}
+        infos[inputs[1]] = _info(width=1280, height=720)
+        infos[inputs[2]] = _info(audio=False)
+        infos[inputs[4]] = _info(codec='hevc')
+        fake = FakeFFmpeg(monkeypatch, infos)
+
+        result = smart_concat(inputs, tmp_path / 'out.mp4', 1920, 1080, 25,
+                              ffmpeg='ffmpeg', codec='libx264', preset='fast')
+
+        assert result.strategy == STRATEGY_CONFORM_COPY
+        assert result.reencoded_count == 3
+        # 연속 구간 [1, 2]는 한 파일로, [4]는 따로 재인코딩
+        assert len(fake.encodes) == 2
+        conform_dir = tmp_path / '_conform'
+        assert fake.stream_copies == [[
+            inputs[0], conform_dir / 'run_0001.mp4', inputs[3], conform_dir / 'run_0004.mp4'
+        ]]
+        run_cmd = next(cmd for cmd in fake.encodes if cmd[-1].endswith('run_0001.mp4'))
+        assert run_cmd.count('-i') == 2
+        assert 'anullsrc' in run_cmd[run_cmd.index('-filter_complex') + 1]
+        assert ['-c:v', 'libx264', '-preset', 'fast'] == run_cmd[run_cmd.index('-c:v'):run_cmd.index('-c:v') + 4]
+        assert not conform_dir.exists()
+
+    def test_conform_matches_reference_level(self, tmp_path, monkeypatch):
+        inputs = _inputs(tmp_path, 3)
+        reference = _info()
+        reference['video']['level'] = 41
+        infos = {p: reference for p in inputs}
+        infos[inputs[1]] = _info(width=1280, height=720)
+        fake = FakeFFmpeg(monkeypatch, infos)
+        fake.conformed_info = reference
+
+        result = smart_concat(inputs, tmp_path / 'out.mp4', 1920, 1080, 25, ffmpeg='ffmpeg', codec='libx264')
+
+        assert result.strategy == STRATEGY_CONFORM_COPY
+        cmd = fake.encodes[0]
+        assert cmd[cmd.index('-level') + 1] == '4.1'
+
+    def test_no_reference_reencodes_everything(self, tmp_path, monkeypatch):
+        inputs = _inputs(tmp_path, 2)
+        fake = FakeFFmpeg(monkeypatch, {p: _info(width=1280, height=720) for p in inputs})
+
+        result = smart_concat(inputs, tmp_path / 'out.mp4', 1920, 1080, 25, ffmpeg='ffmpeg', codec='libx264')
+
+        assert result.strategy == STRATEGY_REENCODE
+        assert result.encoder == 'libx264'
+        assert fake.stream_copies == []
+        assert len(fake.encodes) == 1
+        assert 'scale=1920:1080' in fake.encodes[0][fake.encodes[0].index('-filter_complex') + 1]
+
+    def test_conform_mismatch_falls_back_to_reencode(self, tmp_path, monkeypatch):
+        inputs = _inputs(tmp_path, 3)
+        infos = {p: _info() for p in inputs}
+        infos[inputs[1]] = _info(width=1280, height=720)
+        fake = FakeFFmpeg(monkeypatch, infos)
+        fake.conformed_info = _info(codec='hevc')
+
+        result = smart_concat(inputs, tmp_path / 'out.mp4', 1920, 1080, 25, ffmpeg='ffmpeg', codec='libx264')
+
+        assert result.strategy == STRATEGY_REENCODE
+        assert fake.stream_copies == []
+        assert not (tmp_path / '_conform').exists()
+
+    def test_no_reference_without_reencode_raises(self, tmp_path, monkeypatch):
+        inputs = _inputs(tmp_path, 2)
+        FakeFFmpeg(monkeypatch, {p: _info(width=1280, height=720) for p in inputs})
+
+        with pytest.raises(ConcatError):
+            smart_concat(inputs, tmp_path / 'out.mp4', 1920, 1080, 25,
+                         ffmpeg='ffmpeg', codec='libx264', allow_reencode=False)
+
+    def test_missing_target_uses_majority(self, tmp_path, monkeypatch):
+        inputs = _inputs(tmp_path, 3)
+        infos = {p: _info(width=1080, height=1920) for p in inputs}
+        infos[inputs[0]] = _info(width=720, height=1280)
+        fake = FakeFFmpeg(monkeypatch, infos)
+        fake.conformed_info = _info(width=1080, height=1920)
+
+        result = smart_concat(inputs, tmp_path / 'out.mp4', ffmpeg='ffmpeg', codec='libx264')
+
+        assert result.strategy == STRATEGY_CONFORM_COPY
+        assert 'scale=1080:1920' in fake.encodes[0][fake.encodes[0].index('-filter_complex') + 1]
+
+    def test_audio_only_inputs(self, tmp_path, monkeypatch):
+        inputs = [tmp_path / f"seg_{i}.mp3" for i in range(3)]
+        fake = FakeFFmpeg(monkeypatch, {p: _audio_info() for p in inputs})
+        assert smart_concat(inputs, tmp_path / 'out.mp3', ffmpeg='ffmpeg', codec='libx264').strategy == STRATEGY_STREAM_COPY
+
+        fake.infos[inputs[1]] = _audio_info(sample_rate=44100)
+        result = smart_concat(inputs, tmp_path / 'out.mp3', ffmpeg='ffmpeg', codec='libx264')
+        assert result.strategy == STRATEGY_REENCODE
+        assert result.encoder == 'libmp3lame'
+
+    def test_many_inputs_reencoded_in_groups(self, tmp_path, monkeypatch):
+        inputs = _inputs(tmp_path, 10)
+        fake = FakeFFmpeg(monkeypatch, {p: _info(width=1280, height=720) for p in inputs})
+
+        result = smart_concat(inputs, tmp_path / 'out.mp4', 1920, 1080, 25,
+                              ffmpeg='ffmpeg', codec='libx264', group_size=4)
+
+        assert result.strategy == STRATEGY_REENCODE
+        # 그룹당 입력 수 제한 (4 + 4 + 2) 후 그룹 파일끼리 스트림 복사
+        assert sorted(cmd.count('-i') for cmd in fake.encodes) == [2, 4, 4]
+        group_dir = tmp_path / '_groups'
+        assert fake.stream_copies == [[group_dir / f"group_{i:04d}.mp4" for i in range(3)]]
+        for cmd in fake.encodes:
+            assert cmd[cmd.index('-pix_fmt') + 1] == 'yuv420p'
+            assert cmd[cmd.index('-ar') + 1] == '44100'
+        assert not group_dir.exists()
+
+    def test_long_outlier_run_conformed_in_groups(self, tmp_path, monkeypatch):
+        inputs = _inputs(tmp_path, 6)
+        infos = {p: _info(width=1280, height=720) for p in inputs}
+        infos[inputs[0]] = _info()
+        fake = FakeFFmpeg(monkeypatch, infos)
+
+        result = smart_concat(inputs, tmp_path / 'out.mp4', 1920, 1080, 25,
+                              ffmpeg='ffmpeg', codec='libx264', group_size=2)
+
+        assert result.strategy == STRATEGY_CONFORM_COPY
+        assert result.reencoded_count == 5
+        assert sorted(cmd.count('-i') for cmd in fake.encodes) == [1, 2, 2]
+        assert len(fake.stream_copies[0]) == 4
+
+    def test_video_only_inputs_stay_video_only(self, tmp_path, monkeypatch):
+        inputs = _inputs(tmp_path, 3)
+        infos = {p: _info(audio=False) for p in inputs}
+        infos[inputs[1]] = _info(width=1280, height=720, audio=False)
+        fake = FakeFFmpeg(monkeypatch, infos)
+        fake.conformed_info = _info(audio=False)
+
+        result = smart_concat(inputs, tmp_path / 'out.mp4', 1920, 1080, 25, ffmpeg='ffmpeg', codec='libx264')
+
+        # 오디오 없는 씬끼리도 기준이 되어 구간만 재인코딩, 무음을 만들어 넣지 않음
+        assert result.strategy == STRATEGY_CONFORM_COPY
+        cmd = fake.encodes[0]
+        assert 'anullsrc' not in cmd[cmd.index('-filter_complex') + 1]
+        assert '[outa]' not in cmd
+        assert '-an' in cmd and '-c:a' not in cmd
+
+    def test_video_only_full_reencode_drops_audio_args(self, tmp_path, monkeypatch):
+        inputs = _inputs(tmp_path, 2)
+        fake = FakeFFmpeg(monkeypatch, {p: _info(width=1280, height=720, audio=False) for p in inputs})
+
+        assert smart_concat(inputs, tmp_path / 'out.mp4', 1920, 1080, 25,
+                            ffmpeg='ffmpeg', codec='libx264').strategy == STRATEGY_REENCODE
+        cmd = fake.encodes[0]
+        assert cmd[cmd.index('-filter_complex') + 1].endswith("concat=n=2:v=1:a=0[outv]")
+        assert '-b:a' not in cmd and cmd[-2] == '-an'
+
+    def test_empty_inputs(self, tmp_path):
+        with pytest.raises(ConcatError):
+            smart_concat([], tmp_path / 'out.mp4', ffmpeg='ffmpeg')
@@ -0,0 +1,73 @@
+"""
+초안(프록시) 렌더링 테스트
+
+테스트 범위:
+- 초안 해상도 / 출력 경로
+- 초안 씬 타이밍 기록 → 최종 렌더링에서 승격 (오디오 복사, TTS 생략)
+- 나레이션/음성이 바뀌었거나 오디오가 사라진 씬은 승격하지 않음
+"""
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from src.utils.draft_render import DraftTiming, draft_output_path, draft_resolution
+
+WORD_TIMINGS = [{'word': '안녕하세요', 'start': 0.0, 'end': 0.8}]
+
+
+class TestDraftSettings:
+    """초안 해상도 / 경로"""
+
+    def test_resolution_keeps_aspect(self):
+        assert draft_resolution(1920, 1080) == (960, 540)
+        assert draft_resolution(1080, 1920) == (540, 960)
+        assert draft_resolution(1080, 1080) == (540, 540)
+
+    def test_output_path(self):
+        assert draft_output_path(Path('/p/제목.mp4')) == Path('/p/제목_draft.mp4')
+
+
+class TestDraftTiming:
+    """초안 타이밍 기록 / 승격"""
+
+    def _record(self, tmp_path):
+        draft_folder = tmp_path / 'generated_videos_draft'
+        draft_folder.mkdir()
+        audio = draft_folder / 'scene_01_audio.mp3'
+        audio.write_bytes(b'draft-audio')
+        timing = DraftTiming(draft_folder)
+        timing.record(1, '안녕하세요', audio, 3.25, WORD_TIMINGS, voice='ko-KR-SoonBokNeural', speed=1.0)
+        timing.save()
+        return draft_folder, audio
+
+    def test_promote_copies_audio_and_returns_timing(self, tmp_path):
+        draft_folder, _ = self._record(tmp_path)
+        final_audio = tmp_path / 'generated_videos' / 'scene_01_audio.mp3'
+
+        promoted = DraftTiming(draft_folder).promote(1, '안녕하세요', final_audio,
+                                                     voice='ko-KR-SoonBokNeural', speed=1.0)
+        assert promoted == (3.25, WORD_TIMINGS)
+        assert final_audio.read_bytes() == b'draft-audio'
+
+    def test_changed_scene_is_not_promoted(self, tmp_path):
+        draft_folder, audio = self._record(tmp_path)
+        timing = DraftTiming(draft_folder)
+        final_audio = tmp_path / 'scene_01_audio.mp3'
+
+        assert timing.promote(1, '바뀐 나레이션', final_audio, voice='ko-KR-SoonBokNeural', speed=1.0) is None
+        assert timing.promote(1, '안녕하세요', final_audio, voice='ko-KR-InJoonNeural', speed=1.0) is None
+        assert timing.promote(2, '안녕하세요', final_audio, voice='ko-KR-SoonBokNeural', speed=1.0) is None
+        audio.unlink()
+        assert timing.promote(1, '안녕하세요', final_audio, voice='ko-KR-SoonBokNeural', speed=1.0) is None
+        assert not final_audio.exists()
+
+    def test_promote_in_place(self, tmp_path):
+        draft_folder, audio = self._record(tmp_path)
+        assert DraftTiming(draft_folder).promote(1, '안녕하세요', audio, voice='ko-KR-SoonBokNeural',
+                                                 speed=1.0) == (3.25, WORD_TIMINGS)
+        assert audio.read_bytes() == b'draft-audio'
+
+    def test_missing_file_is_empty(self, tmp_path):
+        assert len(DraftTiming(tmp_path)) == 0
@@ -0,0 +1,118 @@
+"""
+머신 전체 인코딩 슬롯 스케줄러 테스트
+
+테스트 범위:
+- 슬롯 수 / 슬롯당 스레드 수 계산 (환경변수)
+- 같은 프로세스의 스레드끼리, 다른 프로세스끼리 슬롯 공유
+- 대기 중 취소
+- FFmpeg 명령에 -threads 주입
+"""
+import sys
+import time
+import threading
+import subprocess
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from src.utils.encode_slots import EncodeSlotPool, apply_thread_limit
+
+# 슬롯 폴더의 모든 슬롯을 잡고 'ready'를 출력한 뒤 stdin이 닫힐 때까지 유지
+HOLDER_SCRIPT = '''
+import sys
+sys.path.insert(0, {root!r})
+from src.utils.encode_slots import EncodeSlotPool
+pool = EncodeSlotPool({slot_dir!r}, slots={slots})
+held = [pool.try_acquire() for _ in range({slots})]
+assert all(held)
+print('ready', flush=True)
+sys.stdin.read()
+'''
+
+
+class TestEncodeSlotPool:
+    """슬롯 수 계산 / 잠금"""
+
+    def test_slot_count_from_cores_and_env(self, tmp_path, monkeypatch):
+        monkeypatch.delenv('ENCODE_SLOTS', raising=False)
+        monkeypatch.delenv('ENCODE_THREADS_PER_SLOT', raising=False)
+        monkeypatch.setattr('os.cpu_count', lambda: 16)
+        pool = EncodeSlotPool(tmp_path)
+        assert (pool.slots, pool.threads_per_slot) == (4, 4)
+
+        monkeypatch.setenv('ENCODE_THREADS_PER_SLOT', '8')
+        assert EncodeSlotPool(tmp_path).slots == 2
+        monkeypatch.setenv('ENCODE_SLOTS', '3')
+        assert EncodeSlotPool(tmp_path).slots == 3
+
+        monkeypatch.setattr('os.cpu_count', lambda: 2)
+        monkeypatch.delenv('ENCODE_SLOTS')
+        monkeypatch.delenv('ENCODE_THREADS_PER_SLOT')
+        pool = EncodeSlotPool(tmp_path)
+        assert (pool.slots, pool.threads_per_slot) == (1, 2)
+
+    def test_slots_exclusive_within_process(self, tmp_path):
+        pool = EncodeSlotPool(tmp_path, slots=2, threads_per_slot=3)
+        first = pool.try_acquire()
+        second = pool.try_acquire()
+        assert {first.index, second.index} == {0, 1}
+        assert first.threads == 3
+        assert pool.try_acquire() is None
+
+        first.release()
+        third = pool.try_acquire()
+        assert third.index == first.index
+        second.release()
+        third.release()
+
+    def test_waiting_thread_gets_released_slot(self, tmp_path):
+        pool = EncodeSlotPool(tmp_path, slots=1, threads_per_slot=1)
+        held = pool.try_acquire()
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+        waiter.start()
+        time.sleep(0.5)
+        assert not acquired
+
+        held.release()
+        waiter.join(timeout=5)
+        assert acquired[0] is not None
+        assert acquired[0].waited > 0.3
+        acquired[0].release()
+
+    def test_acquire_aborts(self, tmp_path):
+        pool = EncodeSlotPool(tmp_path, slots=1, threads_per_slot=1)
+        held = pool.try_acquire()
+        assert pool.acquire(should_abort=lambda: True) is None
+        assert pool.acquire(timeout=0.3) is None
+        held.release()
+
+    def test_slots_shared_across_processes(self, tmp_path):
+        script = HOLDER_SCRIPT.format(root=str(BACKEND_ROOT), slot_dir=str(tmp_path), slots=2)
+        holder = subprocess.Popen([sys.executable, '-c', script],
+                                  stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        try:
+            assert holder.stdout.readline().strip() == 'ready'
+            assert EncodeSlotPool(tmp_path, slots=2).try_acquire() is None
+        finally:
+            holder.stdin.close()
+            holder.wait(timeout=10)
+
+        # 프로세스가 끝나면 OS가 잠금을 풀어 준다
+        slot = EncodeSlotPool(tmp_path, slots=2).try_acquire()
+        assert slot is not None
+        slot.release()
+
+
+class TestApplyThreadLimit:
+    """-threads 주입"""
+
+    def test_inserted_before_output(self):
+        assert apply_thread_limit(['ffmpeg', '-i', 'a.mp4', '-c:v', 'libx264', Path('out.mp4')], 4) == [
+            'ffmpeg', '-i', 'a.mp4', '-c:v', 'libx264', '-threads', '4', 'out.mp4'
+        ]
+
+    def test_existing_threads_kept(self):
+        cmd = ['ffmpeg', '-i', 'a.mp4', '-threads', '2', 'out.mp4']
+        assert apply_thread_limit(cmd, 4) == cmd
@@ -0,0 +1,203 @@
+"""
+FFmpeg 작업 실행기 테스트 (진짜 FFmpeg 대신 -progress 출력을 흉내 내는 가짜 실행 파일 사용)
+
+테스트 범위:
+- -progress 블록 파싱 / 진행률 / ETA
+- 정상 종료 시 진행률 콜백과 실행 지표 기록
+- stderr 보관 줄 수 제한, check=True 실패 시 CalledProcessError
+- 타임아웃 / STOP 파일 취소 시 자식 프로세스까지 종료
+"""
+import os
+import sys
+import json
+import time
+import threading
+import subprocess
+import pytest
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from src.utils import ffmpeg_job
+from src.utils.encode_slots import EncodeSlotPool
+from src.utils.ffmpeg_job import (
+    FFmpegJob,
+    FFmpegJobCancelled,
+    FFmpegJobTimeout,
+    FFmpegProgress,
+    parse_progress_block,
+    run_ffmpeg,
+    load_job_metrics,
+)
+
+# 인자: <모드> ... 출력파일
+FAKE_FFMPEG = '''#!{python}
+import os, sys, json, time, subprocess
+args = sys.argv[1:]
+assert args[:3] == ['-progress', 'pipe:1', '-nostats'], args
+if os.environ.get('FAKE_ARGS_FILE'):
+    with open(os.environ['FAKE_ARGS_FILE'], 'w') as f:
+        json.dump(args, f)
+mode = args[3]
+for i in range(300):
+    sys.stderr.write(f"stderr line {{i}}\\n")
+for frame in (25, 50):
+    print(f"frame={{frame}}\\nfps=50.0\\nout_time_us={{frame * 40000}}\\ntotal_size=1024\\nspeed=2.5x\\nprogress=continue", flush=True)
+if mode == 'hang':
+    child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])
+    with open(args[4], 'w') as f:
+        f.write(str(child.pid))
+    time.sleep(60)
+print("frame=75\\nout_time_us=3000000\\nspeed=2.5x\\nprogress=end", flush=True)
+sys.exit(1 if mode == 'fail' else 0)
+'''
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path, monkeypatch):
+    if os.name == 'nt':
+        pytest.skip("POSIX 전용 가짜 실행 파일")
+    path = tmp_path / 'ffmpeg'
+    path.write_text(FAKE_FFMPEG.format(python=sys.executable))
+    path.chmod(0o755)
+    monkeypatch.setenv('FFMPEG_METRICS_PATH', str(tmp_path / 'metrics.jsonl'))
+    return str(path)
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # 좀비(부모가 아직 회수하지 않음)는 종료된 것으로 본다
+    try:
+        with open(f'/proc/{pid}/stat') as f:
+            return f.read().split()[2] != 'Z'
+    except OSError:
+        return True
+
+
+def _exits_soon(pid: int, timeout: float = 5.0) -> bool:
+    """SIGKILL 후 커널이 프로세스를 정리할 때까지 잠시 기다림"""
+    deadline = time.monotonic() + timeout
+    while _alive(pid):
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+class TestParseProgress:
+    """-progress 블록 파싱"""
+
+    def test_fields_and_eta(self):
+        progress = parse_progress_block([
+            'frame=250\n', 'fps=48.5\n', 'out_time_us=10000000\n', 'total_size=2048\n',
+            'speed=2.00x\n', 'progress=continue\n',
+        ], FFmpegProgress(duration=40.0))
+        assert progress.frame == 250
+        assert progress.out_time == pytest.approx(10.0)
+        assert progress.speed == pytest.approx(2.0)
+        assert progress.percent == pytest.approx(25.0)
+        assert progress.eta == pytest.approx(15.0)
+        assert not progress.finished
+
+    def test_na_values_keep_previous(self):
+        progress = parse_progress_block(['frame=10', 'speed=1.5x'])
+        parse_progress_block(['frame=N/A', 'speed=N/A', 'out_time_us=N/A', 'progress=end'], progress)
+        assert progress.frame == 10
+        assert progress.speed == pytest.approx(1.5)
+        assert progress.finished
+        assert progress.eta is None
+
+
+class TestFFmpegJob:
+    """실행 / 실패 / 타임아웃 / 취소"""
+
+    def test_success_reports_progress_and_metrics(self, fake_ffmpeg, tmp_path):
+        seen = []
+        result = FFmpegJob([fake_ffmpeg, 'ok', tmp_path / 'out.mp4'], duration=3.0,
+                           on_progress=lambda p: seen.append(p.frame)).run(check=True)
+
+        assert result.returncode == 0
+        assert seen == [25, 50, 75]
+        assert result.progress.finished
+        # stderr는 마지막 N줄만 보관
+        lines = result.stderr.splitlines()
+        assert len(lines) == ffmpeg_job.STDERR_TAIL_LINES
+        assert lines[-1] == 'stderr line 299'
+
+        records = load_job_metrics()
+        assert len(records) == 1
+        assert records[0]['name'] == 'out.mp4'
+        assert records[0]['status'] == 'ok'
+        assert records[0]['frames'] == 75
+        assert records[0]['speed'] == pytest.approx(2.5)
+
+    def test_failure_with_check_raises_called_process_error(self, fake_ffmpeg, tmp_path):
+        assert run_ffmpeg([fake_ffmpeg, 'fail', tmp_path / 'out.mp4']).returncode == 1
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            run_ffmpeg([fake_ffmpeg, 'fail', tmp_path / 'out.mp4'], check=True)
+        assert 'stderr line 299' in exc_info.value.stderr
+        assert [r['status'] for r in load_job_metrics()] == ['failed', 'failed']
+
+    def test_timeout_kills_process_tree(self, fake_ffmpeg, tmp_path):
+        pid_file = tmp_path / 'child.pid'
+        started = time.monotonic()
+        with pytest.raises(FFmpegJobTimeout):
+            run_ffmpeg([fake_ffmpeg, 'hang', pid_file, tmp_path / 'out.mp4'], timeout=3)
+        assert time.monotonic() - started < 15
+        assert _exits_soon(int(pid_file.read_text()))
+        assert load_job_metrics()[0]['status'] == 'timeout'
+
+    def test_stop_file_cancels(self, fake_ffmpeg, tmp_path):
+        pid_file = tmp_path / 'child.pid'
+
+        def create_stop_file():
+            # 자식 프로세스가 뜬 뒤 STOP 파일 생성 (프론트엔드 중지 버튼)
+            for _ in range(100):
+                if pid_file.exists() and pid_file.read_text():
+                    break
+                time.sleep(0.05)
+            (tmp_path / 'STOP').touch()
+
+        stopper = threading.Thread(target=create_stop_file)
+        stopper.start()
+        with pytest.raises(FFmpegJobCancelled):
+            run_ffmpeg([fake_ffmpeg, 'hang', pid_file, tmp_path / 'out.mp4'], stop_dir=tmp_path)
+        stopper.join()
+
+        assert _exits_soon(int(pid_file.read_text()))
+        assert load_job_metrics()[0]['status'] == 'cancelled'
+
+    def test_encode_slot_limits_threads(self, fake_ffmpeg, tmp_path, monkeypatch):
+        pool = EncodeSlotPool(tmp_path / 'slots', slots=1, threads_per_slot=3)
+        monkeypatch.setattr(ffmpeg_job, 'get_encode_slot_pool', lambda: pool)
+        monkeypatch.setenv('FAKE_ARGS_FILE', str(tmp_path / 'args.json'))
+
+        run_ffmpeg([fake_ffmpeg, 'ok', tmp_path / 'out.mp4'], encode_slot=True)
+
+        args = json.loads((tmp_path / 'args.json').read_text())
+        assert args[-3:] == ['-threads', '3', str(tmp_path / 'out.mp4')]
+        assert load_job_metrics()[0]['threads'] == 3
+        # 작업이 끝나면 슬롯 반환
+        slot = pool.try_acquire()
+        assert slot is not None
+        slot.release()
+
+    def test_cancel_while_waiting_for_slot(self, fake_ffmpeg, tmp_path, monkeypatch):
+        pool = EncodeSlotPool(tmp_path / 'slots', slots=1, threads_per_slot=1)
+        monkeypatch.setattr(ffmpeg_job, 'get_encode_slot_pool', lambda: pool)
+        held = pool.try_acquire()
+        (tmp_path / 'STOP').touch()
+        with pytest.raises(FFmpegJobCancelled):
+            run_ffmpeg([fake_ffmpeg, 'ok', tmp_path / 'out.mp4'], encode_slot=True, stop_dir=tmp_path)
+        held.release()
+
+    def test_default_timeout_scales_with_duration(self, monkeypatch):
+        monkeypatch.delenv('FFMPEG_JOB_TIMEOUT', raising=False)
+        assert FFmpegJob(['ffmpeg', 'out.mp4']).timeout == ffmpeg_job.DEFAULT_TIMEOUT
+        assert FFmpegJob(['ffmpeg', 'out.mp4'], duration=3600).timeout == 3600 * ffmpeg_job.TIMEOUT_PER_OUTPUT_SECOND
+        monkeypatch.setenv('FFMPEG_JOB_TIMEOUT', '0')
+        assert FFmpegJob(['ffmpeg', 'out.mp4']).timeout is None
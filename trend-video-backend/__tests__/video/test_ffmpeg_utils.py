@@ -0,0 +1,479 @@
+"""
+FFmpeg 공통 유틸리티 테스트 (FFmpeg 실행 없이 명령/파싱 로직만 검증)
+"""
+import os
+import sys
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+
+BACKEND_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import src.utils.ffmpeg_utils as ffmpeg_utils
+from src.utils.ffmpeg_utils import (
+    build_still_scene_commands,
+    build_image_scene_command,
+    find_concat_outliers,
+    merge_ass_files,
+    build_single_pass_graph,
+    STILL_INPUT_FPS,
+)
+
+
+class TestStillSceneCommands:
+    """정지 이미지 씬 명령 생성 테스트"""
+
+    def _build(self, **kwargs):
+        return build_still_scene_commands(
+            'ffmpeg', Path('img.jpg'), Path('a.mp3'), Path('out.mp4'), Path('pre.png'),
+            1920, 1080, **kwargs
+        )
+
+    def test_prescale_runs_once(self):
+        prescale, _ = self._build()
+        assert prescale[prescale.index('-frames:v') + 1] == '1'
+        vf = prescale[prescale.index('-vf') + 1]
+        assert vf == "scale=1920:1080:force_original_aspect_ratio=increase,crop=1920:1080"
+
+    def test_encode_uses_low_rate_input_and_no_scaling(self):
+        _, encode = self._build()
+        assert encode[encode.index('-framerate') + 1] == str(STILL_INPUT_FPS)
+        assert encode[encode.index('-i') + 1] == 'pre.png'
+        vf = encode[encode.index('-vf') + 1]
+        assert vf == 'fps=25'
+        assert 'scale' not in vf
+
+    def test_stillimage_tune_only_for_libx264(self):
+        _, x264 = self._build(codec='libx264')
+        _, nvenc = self._build(codec='h264_nvenc', preset='p4')
+        assert x264[x264.index('-tune') + 1] == 'stillimage'
+        assert '-tune' not in nvenc
+
+    def test_subtitle_filter_after_fps(self):
+        _, encode = self._build(subtitle_filter='ass=scene_01_audio.ass')
+        assert encode[encode.index('-vf') + 1] == 'fps=25,ass=scene_01_audio.ass'
+
+    def test_video_only_scene_uses_duration(self):
+        _, encode = build_still_scene_commands(
+            'ffmpeg', Path('img.jpg'), None, Path('out.mp4'), Path('pre.png'), 1920, 1080, duration=3.2
+        )
+        assert encode.count('-i') == 1
+        assert encode[encode.index('-t') + 1] == '3.200'
+        assert '-an' in encode and '-shortest' not in encode and '-c:a' not in encode
+
+    def test_audio_bitrate_only_when_given(self):
+        _, default = self._build()
+        _, draft = self._build(audio_bitrate='64k')
+        assert '-b:a' not in default
+        assert draft[draft.index('-b:a') + 1] == '64k'
+
+
+def _signature(width=1920, height=1080, fps='25/1', profile='High', sample_rate='24000', audio=True,
+               level=40, extradata_hash='SHA256:aa'):
+    return {
+        'video': {
+            'codec_name': 'h264', 'profile': profile, 'level': level, 'has_b_frames': 2,
+            'extradata_hash': extradata_hash, 'width': width, 'height': height,
+            'pix_fmt': 'yuv420p', 'sample_aspect_ratio': '1:1', 'r_frame_rate': fps,
+        },
+        'audio': {
+            'codec_name': 'aac', 'profile': 'LC', 'sample_rate': sample_rate, 'channels': 1,
+        } if audio else None,
+    }
+
+
+class TestImageSceneCommand:
+    """롱폼 이미지 씬 단일 FFmpeg 명령 테스트 (MoviePy ImageClip 대체)"""
+
+    def _build(self, duration=10.0, **kwargs):
+        return build_image_scene_command(
+            'ffmpeg', Path('img.png'), Path('a.mp3'), Path('out.mp4'), 1920, 1080, duration, **kwargs
+        )
+
+    def _filters(self, cmd):
+        return cmd[cmd.index('-vf') + 1].split(',')
+
+    def test_crop_to_aspect_then_fps_then_fades(self):
+        cmd = self._build(fps=30)
+        assert self._filters(cmd) == [
+            'scale=1920:1080:force_original_aspect_ratio=increase',
+            'crop=1920:1080',
+            'setsar=1',
+            'fps=30',
+            'format=yuv420p',
+            'fade=t=in:st=0:d=1',
+            'fade=t=out:st=9.000:d=1',
+        ]
+        # 이미지는 저프레임 반복 입력, 길이는 나레이션 길이
+        assert cmd[cmd.index('-framerate') + 1] == str(STILL_INPUT_FPS)
+        assert cmd[cmd.index('-t') + 1] == '10.000'
+        assert cmd[cmd.index('-map') + 1] == '0:v:0'
+        assert cmd[-1] == 'out.mp4'
+
+    def test_short_scene_has_no_fade(self):
+        assert not any(f.startswith('fade') for f in self._filters(self._build(duration=2.0)))
+        assert not any(f.startswith('fade') for f in self._filters(self._build(fade=0)))
+
+    def test_subtitles_burned_after_fades(self):
+        filters = self._filters(self._build(subtitle_filter='ass=scene_01_audio.ass'))
+        assert filters[-1] == 'ass=scene_01_audio.ass'
+        assert filters[-2].startswith('fade=t=out')
+
+    def test_encode_args(self):
+        default = self._build()
+        assert default[default.index('-c:v') + 1] == 'libx264'
+        assert default[default.index('-c:a') + 1] == 'aac'
+
+        draft = self._build(video_args=['-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '28'],
+                            audio_args=['-c:a', 'aac', '-b:a', '64k'])
+        assert draft[draft.index('-preset') + 1] == 'ultrafast'
+        assert draft[draft.index('-b:a') + 1] == '64k'
+        assert draft.count('-c:v') == 1
+
+
+class TestConcatOutliers:
+    """스트림 복사 concat 기준/재인코딩 대상 판단 테스트"""
+
+    def test_conformant_scenes_have_no_outliers(self):
+        signatures = {Path(f'scene_{i:02d}.mp4'): _signature() for i in range(1, 4)}
+        reference, outliers = find_concat_outliers(signatures, 1920, 1080)
+        assert reference == _signature()
+        assert outliers == []
+
+    def test_user_video_scene_is_outlier(self):
+        signatures = {
+            Path('scene_01.mp4'): _signature(),
+            Path('scene_02.mp4'): _signature(width=1280, height=720, fps='30000/1001', sample_rate='48000'),
+            Path('scene_03.mp4'): _signature(),
+        }
+        reference, outliers = find_concat_outliers(signatures, 1920, 1080)
+        assert reference == _signature()
+        assert outliers == [Path('scene_02.mp4')]
+
+    def test_level_or_extradata_mismatch_is_outlier(self):
+        # 해상도/코덱이 같아도 레벨이나 SPS/PPS가 다르면 스트림 복사 불가
+        signatures = {
+            Path('scene_01.mp4'): _signature(),
+            Path('scene_02.mp4'): _signature(level=51),
+            Path('scene_03.mp4'): _signature(extradata_hash='SHA256:bb'),
+            Path('scene_04.mp4'): _signature(),
+        }
+        reference, outliers = find_concat_outliers(signatures, 1920, 1080)
+        assert reference == _signature()
+        assert outliers == [Path('scene_02.mp4'), Path('scene_03.mp4')]
+
+    def test_probe_failure_and_missing_audio_are_outliers(self):
+        signatures = {
+            Path('scene_01.mp4'): _signature(),
+            Path('scene_02.mp4'): None,
+            Path('scene_03.mp4'): _signature(audio=False),
+        }
+        _, outliers = find_concat_outliers(signatures, 1920, 1080)
+        assert outliers == [Path('scene_02.mp4'), Path('scene_03.mp4')]
+
+    def test_no_reference_when_resolution_differs(self):
+        signatures = {Path('scene_01.mp4'): _signature(width=1080, height=1920)}
+        reference, outliers = find_concat_outliers(signatures, 1920, 1080)
+        assert reference is None
+        assert outliers == [Path('scene_01.mp4')]
+
+
+ASS_HEADER = """[Script Info]
+ScriptType: v4.00+
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+"""
+
+
+class TestSinglePass:
+    """단일 패스 렌더링 (자막 병합 / 필터 그래프) 테스트"""
+
+    def test_merge_ass_shifts_events_by_scene_offset(self, tmp_path):
+        first = tmp_path / 'scene_01_audio.ass'
+        second = tmp_path / 'scene_02_audio.ass'
+        first.write_text(ASS_HEADER + "Dialogue: 0,0:00:00.00,0:00:02.50,Default,,0,0,0,,첫 번째, 자막\n", encoding='utf-8')
+        second.write_text(ASS_HEADER + "Dialogue: 0,0:00:00.10,0:00:01.00,Default,,0,0,0,,두 번째\n", encoding='utf-8')
+
+        merged = merge_ass_files([(first, 0.0), (second, 59.95)], tmp_path / 'full.ass')
+        lines = merged.read_text(encoding='utf-8').splitlines()
+
+        assert lines.count('[Events]') == 1
+        assert lines[-2] == "Dialogue: 0,0:00:00.00,0:00:02.50,Default,,0,0,0,,첫 번째, 자막"
+        assert lines[-1] == "Dialogue: 0,0:01:00.05,0:01:00.95,Default,,0,0,0,,두 번째"
+
+    def test_graph_keeps_video_frames_on_audio_timeline(self):
+        segments = [
+            {'media_type': 'image', 'media_path': Path(f'{i}.jpg'), 'audio_path': Path(f'{i}.mp3'), 'duration': 1.01}
+            for i in range(10)
+        ]
+        input_args, graph = build_single_pass_graph(segments, 1920, 1080)
+
+        frames = [int(part.split('trim=end_frame=')[1].split(',')[0]) for part in graph.split(';') if 'end_frame=' in part]
+        assert sum(frames) == round(10.1 * 25)
+        assert input_args.count('-i') == 20
+        assert 'concat=n=10:v=1:a=0[outv]' in graph
+        assert 'concat=n=10:v=0:a=1[outa]' in graph
+
+    def test_graph_applies_subtitles_once_after_concat(self):
+        segments = [
+            {'media_type': 'image', 'media_path': Path('1.jpg'), 'audio_path': Path('1.mp3'), 'duration': 3.0},
+            {'media_type': 'video', 'media_path': Path('2.mp4'), 'audio_path': Path('2.mp3'), 'duration': 4.0},
+        ]
+        _, graph = build_single_pass_graph(segments, 1080, 1920, subtitle_filename='full_subtitles.ass')
+
+        assert graph.count('ass=') == 1
+        assert graph.rstrip().endswith('[vcat]ass=full_subtitles.ass[outv]')
+        assert 'tpad=stop_mode=clone' in graph
+
+
+class TestStillSceneSmartCrop:
+    """스마트 크롭 영역을 FFmpeg 필터로 전달"""
+
+    def test_crop_box_replaces_aspect_crop(self):
+        prescale, _ = build_still_scene_commands(
+            'ffmpeg', Path('img.jpg'), Path('a.mp3'), Path('out.mp4'), Path('pre.png'),
+            1080, 1920, crop_box=(656, 0, 1263, 1080)
+        )
+        assert prescale[prescale.index('-vf') + 1] == "crop=607:1080:656:0,scale=1080:1920:flags=lanczos"
+
+
+ENCODERS_OUTPUT = """Encoders:
+ V..... = Video
+ A..... = Audio
+ ------
+ V....D libx264              libx264 H.264 / AVC / MPEG-4 AVC (codec h264)
+ V....D h264_nvenc           NVIDIA NVENC H.264 encoder (codec h264)
+ A....D aac                  AAC (Advanced Audio Coding)
+"""
+
+
+FAKE_ENCODER_FPS = {'h264_nvenc': 400.0, 'libx264': 150.0}
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path, monkeypatch):
+    """PATH에 가짜 ffmpeg 바이너리를 두고 실행 횟수 기록"""
+    binary = tmp_path / 'bin' / 'ffmpeg'
+    binary.parent.mkdir()
+    binary.write_bytes(b'v1')
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd[1:])
+        return SimpleNamespace(returncode=0, stdout=ENCODERS_OUTPUT if '-encoders' in cmd else 'ffmpeg version 6')
+
+    monkeypatch.setenv('FFMPEG_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(ffmpeg_utils.shutil, 'which', lambda name: str(binary) if name == 'ffmpeg' else None)
+    monkeypatch.setattr(ffmpeg_utils.subprocess, 'run', run)
+    # 테스트 인코딩은 고정 처리 속도로 대체 (인코더 → fps, None이면 사용 불가)
+    monkeypatch.setattr(ffmpeg_utils, '_test_encode', lambda ffmpeg, encoder: FAKE_ENCODER_FPS.get(encoder))
+    ffmpeg_utils.reset_ffmpeg_resolver()
+    yield binary, calls
+    ffmpeg_utils.reset_ffmpeg_resolver()
+
+
+class TestFFmpegResolver:
+    """FFmpeg 경로/인코더 탐색 캐시"""
+
+    def test_resolved_once_per_process(self, fake_ffmpeg):
+        _, calls = fake_ffmpeg
+        assert ffmpeg_utils.get_ffmpeg_path() == 'ffmpeg'
+        assert ffmpeg_utils.get_ffprobe_path() == 'ffprobe'
+        ffmpeg_utils.get_ffmpeg_path()
+        assert calls == [['-version']]
+
+    def test_encoders_parsed_and_best_encoder_detected(self, fake_ffmpeg):
+        _, calls = fake_ffmpeg
+        assert ffmpeg_utils.get_ffmpeg_encoders() == ['libx264', 'h264_nvenc', 'aac']
+        assert ffmpeg_utils.detect_best_encoder() == ('h264_nvenc', 'gpu')
+        assert ffmpeg_utils.detect_best_encoder() == ('h264_nvenc', 'gpu')
+        assert calls == [['-version'], ['-hide_banner', '-encoders']]
+
+    def test_disk_cache_skips_spawns_in_fresh_process(self, fake_ffmpeg):
+        _, calls = fake_ffmpeg
+        ffmpeg_utils.detect_best_encoder()
+        ffmpeg_utils.reset_ffmpeg_resolver()
+
+        assert ffmpeg_utils.detect_best_encoder() == ('h264_nvenc', 'gpu')
+        assert len(calls) == 2
+
+    def test_binary_change_invalidates_disk_cache(self, fake_ffmpeg):
+        binary, calls = fake_ffmpeg
+        ffmpeg_utils.detect_best_encoder()
+        ffmpeg_utils.reset_ffmpeg_resolver()
+
+        binary.write_bytes(b'version 2')
+        os.utime(binary, (5000, 5000))
+        ffmpeg_utils.detect_best_encoder()
+        assert len(calls) == 4
+
+    def test_ffprobe_name_replaced_only_in_filename(self, monkeypatch):
+        monkeypatch.setattr(ffmpeg_utils, 'get_ffmpeg_path', lambda: os.path.join('opt', 'ffmpeg', 'bin', 'ffmpeg.exe'))
+        assert ffmpeg_utils.get_ffprobe_path() == os.path.join('opt', 'ffmpeg', 'bin', 'ffprobe.exe')
+
+
+class TestEncoderProbe:
+    """테스트 인코딩으로 검증한 인코더 중 가장 빠른 인코더 선택"""
+
+    def _probe_counter(self, monkeypatch, fps_by_encoder):
+        probed = []
+
+        def test_encode(ffmpeg, encoder):
+            probed.append(encoder)
+            return fps_by_encoder.get(encoder)
+
+        monkeypatch.setattr(ffmpeg_utils, '_test_encode', test_encode)
+        return probed
+
+    def test_listed_but_unusable_gpu_encoder_skipped(self, fake_ffmpeg, monkeypatch):
+        probed = self._probe_counter(monkeypatch, {'libx264': 150.0})
+        assert ffmpeg_utils.detect_best_encoder() == ('libx264', 'cpu')
+        assert probed == ['h264_nvenc', 'libx264']
+        assert ffmpeg_utils.probe_encoders()['h264_nvenc'] == {'ok': False, 'fps': None}
+
+    def test_fastest_working_encoder_wins(self, fake_ffmpeg, monkeypatch):
+        self._probe_counter(monkeypatch, {'h264_nvenc': 90.0, 'libx264': 150.0})
+        assert ffmpeg_utils.detect_best_encoder() == ('libx264', 'cpu')
+
+    def test_results_cached_on_disk_until_ttl(self, fake_ffmpeg, monkeypatch):
+        probed = self._probe_counter(monkeypatch, FAKE_ENCODER_FPS)
+        ffmpeg_utils.detect_best_encoder()
+        ffmpeg_utils.reset_ffmpeg_resolver()
+        assert ffmpeg_utils.detect_best_encoder() == ('h264_nvenc', 'gpu')
+        assert len(probed) == 2
+
+        ffmpeg_utils.reset_ffmpeg_resolver()
+        now = ffmpeg_utils.time.time()
+        monkeypatch.setattr(ffmpeg_utils.time, 'time', lambda: now + ffmpeg_utils.ENCODER_PROBE_TTL + 1)
+        ffmpeg_utils.detect_best_encoder()
+        assert len(probed) == 4
+
+    def test_startup_time_excluded_from_fps(self, monkeypatch):
+        # GPU: 세션 초기화 0.6초 + 400fps, CPU: 시작 0.05초 + 150fps
+        startup = {'h264_nvenc': 0.6, 'libx264': 0.05}
+        speed = {'h264_nvenc': 400.0, 'libx264': 150.0}
+        clock = [0.0]
+
+        def run(cmd, **kwargs):
+            encoder = cmd[cmd.index('-c:v') + 1]
+            clock[0] += startup[encoder] + int(cmd[cmd.index('-frames:v') + 1]) / speed[encoder]
+            return SimpleNamespace(returncode=0, stdout='', stderr='')
+
+        monkeypatch.setattr(ffmpeg_utils.subprocess, 'run', run)
+        monkeypatch.setattr(ffmpeg_utils.time, 'perf_counter', lambda: clock[0])
+        assert ffmpeg_utils._test_encode('ffmpeg', 'h264_nvenc') == pytest.approx(400.0)
+        assert ffmpeg_utils._test_encode('ffmpeg', 'libx264') == pytest.approx(150.0)
+
+    def test_test_encode_failure(self, monkeypatch):
+        commands = []
+
+        def run(cmd, **kwargs):
+            commands.append(cmd)
+            return SimpleNamespace(returncode=1, stdout='', stderr='No NVENC capable devices found')
+
+        monkeypatch.setattr(ffmpeg_utils.subprocess, 'run', run)
+        assert ffmpeg_utils._test_encode('ffmpeg', 'h264_nvenc') is None
+        cmd = commands[0]
+        assert cmd[cmd.index('-c:v') + 1] == 'h264_nvenc'
+        assert cmd[cmd.index('-preset') + 1] == 'p4'
+        assert cmd[-3:] == ['-f', 'null', '-']
+
+
+PROBE_JSON = """{
+  "streams": [
+    {"codec_type": "video", "codec_name": "h264", "profile": "High", "level": 40, "has_b_frames": 2,
+     "extradata_hash": "SHA256:aa", "width": 1920, "height": 1080,
+     "pix_fmt": "yuv420p", "sample_aspect_ratio": "N/A", "r_frame_rate": "30000/1001"},
+    {"codec_type": "audio", "codec_name": "aac", "profile": "LC", "sample_rate": "44100",
+     "channels": 2, "channel_layout": "stereo"}
+  ],
+  "format": {"format_name": "mov,mp4,m4a,3gp,3g2,mj2", "duration": "12.500000"}
+}"""
+
+
+@pytest.fixture
+def fake_probe(tmp_path, monkeypatch):
+    """ffprobe 대신 고정 JSON을 돌려주고 조회한 파일 기록"""
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd[-1])
+        if cmd[-1].endswith('broken.mp4'):
+            return SimpleNamespace(returncode=1, stdout='{}')
+        return SimpleNamespace(returncode=0, stdout=PROBE_JSON)
+
+    monkeypatch.setenv('PROBE_CACHE_DIR', str(tmp_path / 'probe'))
+    monkeypatch.setattr(ffmpeg_utils, 'get_ffprobe_path', lambda: 'ffprobe')
+    monkeypatch.setattr(ffmpeg_utils.subprocess, 'run', run)
+    monkeypatch.setattr(ffmpeg_utils, '_probe_memory', {})
+    return calls
+
+
+class TestProbeMany:
+    """일괄 미디어 조회 + (경로, 크기, 수정 시간) 캐시"""
+
+    def _media(self, tmp_path, name, content=b'media'):
+        path = tmp_path / name
+        path.write_bytes(content)
+        return path
+
+    def test_parses_streams_and_duration(self, tmp_path, fake_probe):
+        path = self._media(tmp_path, 'a.mp4')
+        info = ffmpeg_utils.probe_media(path)
+        assert info['duration'] == 12.5
+        assert info['video']['width'] == 1920
+        assert info['video']['fps'] == pytest.approx(29.97, abs=0.01)
+        assert info['audio']['channel_layout'] == 'stereo'
+
+    def test_requests_extradata_hash(self, tmp_path, monkeypatch):
+        commands = []
+
+        def run(cmd, **kwargs):
+            commands.append(cmd)
+            return SimpleNamespace(returncode=0, stdout=PROBE_JSON)
+
+        monkeypatch.setattr(ffmpeg_utils, 'get_ffprobe_path', lambda: 'ffprobe')
+        monkeypatch.setattr(ffmpeg_utils.subprocess, 'run', run)
+        ffmpeg_utils._run_probe(self._media(tmp_path, 'a.mp4'))
+        cmd = commands[0]
+        assert cmd[cmd.index('-show_data_hash') + 1] == 'sha256'
+        assert 'extradata_hash' in cmd[cmd.index('-show_entries') + 1]
+
+    def test_dedupes_and_memoizes(self, tmp_path, fake_probe):
+        a = self._media(tmp_path, 'a.mp4')
+        b = self._media(tmp_path, 'b.mp3')
+        results = ffmpeg_utils.probe_many([a, b, a], max_workers=4)
+        assert list(results) == [a, b]
+        ffmpeg_utils.probe_many([a, b])
+        assert ffmpeg_utils.get_video_duration(a) == 12.5
+        assert sorted(fake_probe) == [str(a), str(b)]
+
+    def test_disk_cache_survives_new_process(self, tmp_path, fake_probe, monkeypatch):
+        path = self._media(tmp_path, 'a.mp4')
+        ffmpeg_utils.probe_media(path)
+        monkeypatch.setattr(ffmpeg_utils, '_probe_memory', {})
+        assert ffmpeg_utils.probe_media(path)['duration'] == 12.5
+        assert len(fake_probe) == 1
+
+    def test_modified_file_is_probed_again(self, tmp_path, fake_probe):
+        path = self._media(tmp_path, 'a.mp4')
+        ffmpeg_utils.probe_media(path)
+        path.write_bytes(b'longer media')
+        ffmpeg_utils.probe_media(path)
+        assert len(fake_probe) == 2
+
+    def test_failures_are_not_cached(self, tmp_path, fake_probe):
+        path = self._media(tmp_path, 'broken.mp4')
+        assert ffmpeg_utils.probe_media(path) is None
+        assert ffmpeg_utils.probe_media(path) is None
+        assert ffmpeg_utils.probe_media(tmp_path / 'missing.mp4') is None
+        assert len(fake_probe) == 2
+
+    def test_stream_signature_normalizes_sar(self, tmp_path, fake_probe):
+        signature = ffmpeg_utils.probe_stream_signature(self._media(tmp_path, 'a.mp4'))
+        assert signature['video']['sample_aspect_ratio'] == '1:1'
+        assert signature['video']['level'] == 40
+        assert signature['video']['extradata_hash'] == 'SHA256:aa'
+        assert signature['audio'] == {'codec_name': 'aac', 'profile': 'LC', 'sample_rate': '44100', 'channels': 2}
@@ -0,0 +1,148 @@
+"""
+얼굴 중심 감지 서비스 캐시 테스트 (OpenCV 없이 감지 함수 대체)
+
+테스트 범위:
+- 같은 내용의 이미지는 경로가 달라도 한 번만 감지
+- 얼굴 없음(None) 결과도 캐시
+- 디스크 캐시 재로드
+- 일괄 감지 중복 제거
+- 9:16 스마트 크롭 영역 (기존 로직과 동일)
+"""
+import sys
+import pytest
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import src.utils.focus_detection as focus_detection
+from src.utils.focus_detection import FocusDetector
+
+
+@pytest.fixture
+def fake_detect(monkeypatch):
+    calls = []
+
+    def detect(image_path):
+        calls.append(image_path)
+        return None if 'noface' in Path(image_path).read_text() else (120, 80)
+
+    monkeypatch.setattr(focus_detection, 'OPENCV_AVAILABLE', True)
+    monkeypatch.setattr(focus_detection, '_detect_safely', detect)
+    return calls
+
+
+class TestFocusDetectorCache:
+    """내용 해시 캐시 테스트"""
+
+    def test_same_content_detected_once(self, tmp_path, fake_detect):
+        first = tmp_path / 'a.jpg'
+        second = tmp_path / 'copy.jpg'
+        first.write_text('face-image')
+        second.write_text('face-image')
+
+        detector = FocusDetector(cache_dir=tmp_path / 'cache')
+        assert detector.detect(first) == (120, 80)
+        assert detector.detect(second) == (120, 80)
+        assert len(fake_detect) == 1
+
+    def test_no_face_result_is_cached(self, tmp_path, fake_detect):
+        image = tmp_path / 'a.jpg'
+        image.write_text('noface')
+
+        detector = FocusDetector(use_disk_cache=False)
+        assert detector.detect(image) is None
+        assert detector.detect(image) is None
+        assert len(fake_detect) == 1
+
+    def test_disk_cache_survives_new_instance(self, tmp_path, fake_detect):
+        image = tmp_path / 'a.jpg'
+        image.write_text('face-image')
+
+        FocusDetector(cache_dir=tmp_path / 'cache').detect(image)
+        assert FocusDetector(cache_dir=tmp_path / 'cache').detect(image) == (120, 80)
+        assert len(fake_detect) == 1
+
+    def test_changed_image_is_detected_again(self, tmp_path, fake_detect):
+        image = tmp_path / 'a.jpg'
+        image.write_text('face-image')
+        detector = FocusDetector(use_disk_cache=False)
+        detector.detect(image)
+
+        image.write_text('noface now')
+        assert detector.detect(image) is None
+        assert len(fake_detect) == 2
+
+    def test_detect_many_dedupes_and_warms_cache(self, tmp_path, fake_detect):
+        paths = []
+        for name, content in [('1.jpg', 'face'), ('2.jpg', 'face'), ('3.jpg', 'noface')]:
+            path = tmp_path / name
+            path.write_text(content)
+            paths.append(path)
+
+        detector = FocusDetector(use_disk_cache=False)
+        results = detector.detect_many(paths + [paths[0]], max_workers=1)
+
+        assert results == {paths[0]: (120, 80), paths[1]: (120, 80), paths[2]: None}
+        assert len(fake_detect) == 2
+        detector.detect(paths[2])
+        assert len(fake_detect) == 2
+
+
+def _legacy_crop_box(width, height, focus_point):
+    """기존 _smart_crop_to_vertical의 크롭 영역 계산 (비교 기준)"""
+    target_ratio = 9 / 16
+    new_width = int(height * target_ratio)
+    if new_width > width:
+        new_height = int(width / target_ratio)
+        new_width = width
+        if focus_point:
+            focus_x, focus_y = focus_point
+            center_y = focus_y
+            top = max(0, center_y - new_height // 2)
+            bottom = min(height, top + new_height)
+            if bottom > height:
+                bottom = height
+                top = bottom - new_height
+            if top < 0:
+                top = 0
+                bottom = new_height
+        else:
+            top = 0
+            bottom = new_height
+        left = 0
+        right = width
+    else:
+        new_height = height
+        if focus_point:
+            focus_x, focus_y = focus_point
+            center_x = focus_x
+            left = max(0, center_x - new_width // 2)
+            right = min(width, left + new_width)
+            if right > width:
+                right = width
+                left = right - new_width
+            if left < 0:
+                left = 0
+                right = new_width
+        else:
+            left = (width - new_width) // 2
+            right = left + new_width
+        top = 0
+        bottom = height
+    return (left, top, right, bottom)
+
+
+class TestVerticalCropBox:
+    """9:16 스마트 크롭 영역 - 기존 로직과 동일해야 함"""
+
+    @pytest.mark.parametrize("width,height", [(1920, 1080), (1280, 720), (2048, 1152), (900, 2000), (1080, 1920)])
+    @pytest.mark.parametrize("focus", [None, (0, 0), (960, 540), (1900, 1000), (100, 1990), (450, 30)])
+    def test_matches_legacy_crop(self, width, height, focus):
+        assert focus_detection.vertical_crop_box(width, height, focus) == _legacy_crop_box(width, height, focus)
+
+    def test_landscape_detection(self):
+        assert focus_detection.is_landscape_16_9(1920, 1080)
+        assert focus_detection.is_landscape_16_9(1600, 1000)
+        assert not focus_detection.is_landscape_16_9(1080, 1920)
+        assert not focus_detection.is_landscape_16_9(1000, 1000)
@@ -0,0 +1,55 @@
+"""
+JSON 상태 파일 공통 함수 테스트
+
+테스트 범위:
+- 원자적 저장 (상위 폴더 생성, 임시 파일 정리)
+- 버전이 같은 문서만 읽기 / 손상·없는 파일은 None
+"""
+import sys
+import json
+import pytest
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from src.utils.json_store import atomic_write_json, load_versioned_json
+
+
+class TestAtomicWriteJson:
+    """원자적 저장"""
+
+    def test_creates_parent_and_replaces(self, tmp_path):
+        path = tmp_path / 'a' / 'b' / 'state.json'
+        atomic_write_json(path, {'version': 1, 'text': '한글'}, indent=2)
+        atomic_write_json(path, {'version': 1, 'text': '덮어쓰기'})
+        assert json.loads(path.read_text(encoding='utf-8')) == {'version': 1, 'text': '덮어쓰기'}
+        assert '덮어쓰기' in path.read_text(encoding='utf-8')
+        assert not list(path.parent.glob('*.tmp'))
+
+    def test_failed_dump_keeps_old_file(self, tmp_path):
+        path = tmp_path / 'state.json'
+        atomic_write_json(path, {'version': 1})
+        with pytest.raises(TypeError):
+            atomic_write_json(path, {'version': 1, 'bad': object()})
+        assert json.loads(path.read_text()) == {'version': 1}
+        assert not list(tmp_path.glob('*.tmp'))
+
+
+class TestLoadVersionedJson:
+    """버전 확인 읽기"""
+
+    def test_same_version(self, tmp_path):
+        path = tmp_path / 'state.json'
+        atomic_write_json(path, {'version': 2, 'items': {'1': 'x'}})
+        assert load_versioned_json(path, 2)['items'] == {'1': 'x'}
+
+    def test_missing_corrupt_and_other_version(self, tmp_path):
+        path = tmp_path / 'state.json'
+        assert load_versioned_json(path, 1, "테스트") is None
+        path.write_text('{broken')
+        assert load_versioned_json(path, 1, "테스트") is None
+        path.write_text(json.dumps([1, 2]))
+        assert load_versioned_json(path, 1) is None
+        path.write_text(json.dumps({'version': 0}))
+        assert load_versioned_json(path, 1) is None
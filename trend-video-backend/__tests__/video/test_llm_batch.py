@@ -0,0 +1,288 @@
+"""
+LLM 요청 일괄 처리 테스트
+
+테스트 범위:
+- 제공자별 분당 요청 수 / 동시 요청 수 (환경변수)
+- 요청 간격 예약, 429 이후 예약 미루기
+- 지터 백오프 재시도 / 재시도하지 않는 오류
+- 동시 처리 결과의 입력 순서 유지, 동시 실행 수 제한
+- 체크포인트 저장 / 복원 / 입력 변경 시 무시
+"""
+import sys
+import json
+import time
+import random
+import threading
+import pytest
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from src.utils import llm_batch
+from src.utils.llm_batch import (
+    BatchCheckpoint,
+    RateLimiter,
+    backoff_delay,
+    call_with_retry,
+    is_retryable_error,
+    provider_concurrency,
+    provider_rpm,
+    run_bounded,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeAPIError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = type('Response', (), {'status_code': status_code, 'headers': headers or {}})()
+
+
+class TestProviderLimits:
+    """제공자별 기본값 / 환경변수"""
+
+    def test_defaults_and_env_override(self, monkeypatch):
+        for name in ('LLM_RPM', 'LLM_RPM_OPENAI', 'LLM_CONCURRENCY', 'LLM_CONCURRENCY_OLLAMA'):
+            monkeypatch.delenv(name, raising=False)
+        assert provider_concurrency('ollama') == 1
+        assert provider_rpm('openai') == llm_batch.PROVIDER_LIMITS['openai'][0]
+        assert provider_rpm('unknown') == llm_batch.DEFAULT_LIMITS[0]
+
+        monkeypatch.setenv('LLM_RPM', '10')
+        monkeypatch.setenv('LLM_RPM_OPENAI', '120')
+        assert provider_rpm('openai') == 120
+        assert provider_rpm('groq') == 10
+
+        monkeypatch.setenv('LLM_CONCURRENCY_OLLAMA', '0')
+        assert provider_concurrency('ollama') == 1
+        monkeypatch.setenv('LLM_CONCURRENCY_OLLAMA', 'abc')
+        assert provider_concurrency('ollama') == 1
+
+    def test_image_providers(self, monkeypatch):
+        monkeypatch.delenv('LLM_CONCURRENCY', raising=False)
+        monkeypatch.delenv('LLM_CONCURRENCY_REPLICATE', raising=False)
+        for provider in ('dalle', 'imagen3', 'huggingface', 'replicate'):
+            assert provider_concurrency(provider) == llm_batch.PROVIDER_LIMITS[provider][1]
+        monkeypatch.setenv('LLM_CONCURRENCY_REPLICATE', '8')
+        assert provider_concurrency('replicate') == 8
+
+
+class TestRateLimiter:
+    """요청 간격 예약"""
+
+    def test_spaces_requests(self):
+        clock = FakeClock()
+        limiter = RateLimiter(30, clock=clock, sleep=clock.sleep)
+        waits = [limiter.acquire() for _ in range(3)]
+        assert waits == [0.0, pytest.approx(2.0), pytest.approx(2.0)]
+
+        # 충분히 쉬었으면 바로 통과
+        clock.now += 10
+        assert limiter.acquire() == 0.0
+
+    def test_unlimited(self):
+        clock = FakeClock()
+        limiter = RateLimiter(0, clock=clock, sleep=clock.sleep)
+        assert [limiter.acquire() for _ in range(5)] == [0.0] * 5
+
+    def test_defer_pushes_back_next_slot(self):
+        clock = FakeClock()
+        limiter = RateLimiter(60, clock=clock, sleep=clock.sleep)
+        limiter.acquire()
+        limiter.defer(10)
+        assert limiter.acquire() == pytest.approx(10.0)
+
+    def test_threads_share_schedule(self):
+        limiter = RateLimiter(600)  # 0.1초 간격
+        started = []
+        lock = threading.Lock()
+
+        def worker():
+            limiter.acquire()
+            with lock:
+                started.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        started.sort()
+        assert started[-1] - started[0] >= 0.25
+
+
+class TestRetry:
+    """지터 백오프 재시도"""
+
+    def test_backoff_is_bounded_full_jitter(self):
+        rng = random.Random(0)
+        delays = [backoff_delay(3, base_delay=1.0, max_delay=5.0, rng=rng) for _ in range(200)]
+        assert all(0 <= d <= 5.0 for d in delays)
+        assert len(set(delays)) > 100
+
+    def test_retryable_errors(self):
+        assert is_retryable_error(FakeAPIError(429))
+        assert is_retryable_error(FakeAPIError(503))
+        assert not is_retryable_error(FakeAPIError(400))
+        assert not is_retryable_error(FakeAPIError(401))
+        assert is_retryable_error(json.JSONDecodeError('bad', '{', 0))
+        assert is_retryable_error(KeyError('narration'))
+        assert is_retryable_error(ConnectionError())
+        assert not is_retryable_error(RuntimeError('boom'))
+
+    def test_retries_until_success(self):
+        calls = []
+        sleeps = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise json.JSONDecodeError('bad', '{', 0)
+            return 'ok'
+
+        assert call_with_retry(flaky, sleep=sleeps.append, rng=random.Random(1)) == 'ok'
+        assert len(calls) == 3
+        assert len(sleeps) == 2
+        assert sleeps[1] <= llm_batch.RETRY_BASE_DELAY * 2
+
+    def test_non_retryable_raises_immediately(self):
+        calls = []
+
+        def denied():
+            calls.append(1)
+            raise FakeAPIError(401)
+
+        with pytest.raises(FakeAPIError):
+            call_with_retry(denied, sleep=lambda s: None)
+        assert len(calls) == 1
+
+    def test_gives_up_after_attempts(self):
+        calls = []
+
+        def down():
+            calls.append(1)
+            raise FakeAPIError(500)
+
+        with pytest.raises(FakeAPIError):
+            call_with_retry(down, attempts=3, sleep=lambda s: None)
+        assert len(calls) == 3
+
+    def test_rate_limit_honours_retry_after(self):
+        clock = FakeClock()
+        limiter = RateLimiter(6000, clock=clock, sleep=clock.sleep)
+        calls = []
+
+        def limited():
+            calls.append(clock.now)
+            if len(calls) == 1:
+                raise FakeAPIError(429, headers={'retry-after': '7'})
+            return 'ok'
+
+        assert call_with_retry(limited, limiter=limiter, sleep=clock.sleep, base_delay=0.1) == 'ok'
+        assert clock.sleeps == [7.0]
+        assert calls[1] - calls[0] == pytest.approx(7.0)
+        # 다른 스레드의 요청도 Retry-After 이후로 예약됨
+        limiter.defer(5)
+        assert limiter.acquire() == pytest.approx(5.0)
+
+
+class TestRunBounded:
+    """동시 처리 / 순서 유지"""
+
+    def test_results_in_input_order(self):
+        rng = random.Random(2)
+        delays = [rng.uniform(0, 0.05) for _ in range(12)]
+        done = []
+
+        def work(index):
+            time.sleep(delays[index])
+            return index * 10
+
+        results = run_bounded(work, list(range(12)), max_workers=4, on_done=lambda i, r: done.append(i))
+        assert results == [i * 10 for i in range(12)]
+        assert sorted(done) == list(range(12))
+
+    def test_concurrency_is_bounded(self):
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def work(item):
+            with lock:
+                active.append(item)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(item)
+            return item
+
+        run_bounded(work, list(range(10)), max_workers=3)
+        assert 1 < max(peak) <= 3
+
+    def test_error_propagates(self):
+        def work(item):
+            if item == 2:
+                raise ValueError('scene 2')
+            return item
+
+        with pytest.raises(ValueError):
+            run_bounded(work, list(range(5)), max_workers=2)
+
+    def test_sequential_when_single_worker(self):
+        order = []
+        assert run_bounded(lambda x: order.append(x) or x, [3, 1, 2], max_workers=1) == [3, 1, 2]
+        assert order == [3, 1, 2]
+
+
+class TestBatchCheckpoint:
+    """체크포인트 저장 / 복원"""
+
+    def test_resume_only_missing(self, tmp_path):
+        path = tmp_path / 'narration_checkpoint.json'
+        checkpoint = BatchCheckpoint(path)
+        checkpoint.put('1', 'fp1', '씬 1 나레이션')
+        checkpoint.put('3', 'fp3', '씬 3 나레이션')
+        assert path.exists()
+        assert not list(tmp_path.glob('*.tmp'))
+
+        # 중단 후 재실행: 끝난 씬만 복원되고 나머지는 다시 생성
+        resumed = BatchCheckpoint(path)
+        assert len(resumed) == 2
+        generated = []
+        for scene, fp in (('1', 'fp1'), ('2', 'fp2'), ('3', 'fp3')):
+            if resumed.get(scene, fp) is None:
+                generated.append(scene)
+        assert generated == ['2']
+        assert resumed.get('1', 'fp1') == '씬 1 나레이션'
+
+    def test_changed_input_ignored(self, tmp_path):
+        checkpoint = BatchCheckpoint(tmp_path / 'cp.json')
+        checkpoint.put('1', 'old-outline', 'x')
+        assert checkpoint.get('1', 'new-outline') is None
+
+    def test_version_mismatch_and_corrupt_file(self, tmp_path):
+        path = tmp_path / 'cp.json'
+        path.write_text(json.dumps({'version': 0, 'items': {'1': {'fingerprint': 'a', 'value': 'x'}}}))
+        assert len(BatchCheckpoint(path)) == 0
+        path.write_text('{broken')
+        assert len(BatchCheckpoint(path)) == 0
+
+    def test_concurrent_puts(self, tmp_path):
+        path = tmp_path / 'cp.json'
+        checkpoint = BatchCheckpoint(path)
+        run_bounded(lambda i: checkpoint.put(str(i), f'fp{i}', f'v{i}'), list(range(20)), max_workers=8)
+        assert len(BatchCheckpoint(path)) == 20
@@ -0,0 +1,175 @@
+"""
+컨테이너 헤더 기반 미디어 길이 리더 테스트
+
+테스트 범위:
+- WAV fmt/data 청크
+- MP3 CBR 프레임 스캔 (MPEG1 / Edge TTS 형식 MPEG2 모노), ID3v2/ID3v1 태그, Xing 헤더
+- MP4 mvhd (v0/v1), mdhd 폴백, mdat 뒤에 moov
+- 지원하지 않는 포맷/손상 파일은 None
+- FFmpeg가 있으면 생성한 파일들로 ffprobe 결과와 비교
+"""
+import sys
+import json
+import wave
+import shutil
+import struct
+import subprocess
+import pytest
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from src.utils.media_duration import read_media_duration
+
+# MPEG1 Layer III 128kbps 44.1kHz 스테레오 (프레임 417바이트, 1152샘플)
+MPEG1_HEADER = bytes([0xFF, 0xFB, 0x90, 0x00])
+# MPEG2 Layer III 48kbps 24kHz 모노 (Edge TTS 출력 형식, 프레임 144바이트, 576샘플)
+MPEG2_MONO_HEADER = bytes([0xFF, 0xF3, 0x64, 0xC0])
+
+
+def _mp3_frames(header: bytes, frame_length: int, count: int) -> bytes:
+    return (header + bytes(frame_length - 4)) * count
+
+
+def _box(box_type: bytes, payload: bytes) -> bytes:
+    return struct.pack('>I4s', 8 + len(payload), box_type) + payload
+
+
+def _mvhd(timescale: int, duration: int, version: int = 0) -> bytes:
+    if version == 1:
+        body = bytes([1, 0, 0, 0]) + bytes(16) + struct.pack('>IQ', timescale, duration)
+    else:
+        body = bytes(4) + bytes(8) + struct.pack('>II', timescale, duration)
+    return body + bytes(80)
+
+
+class TestWavDuration:
+    """WAV 헤더"""
+
+    def test_pcm_wav(self, tmp_path):
+        path = tmp_path / 'a.wav'
+        with wave.open(str(path), 'wb') as f:
+            f.setnchannels(2)
+            f.setsampwidth(2)
+            f.setframerate(24000)
+            f.writeframes(bytes(24000 * 4 * 3))
+        assert read_media_duration(path) == pytest.approx(3.0)
+
+    def test_extra_chunk_before_data(self, tmp_path):
+        fmt = struct.pack('<HHIIHH', 1, 1, 16000, 32000, 2, 16)
+        data = bytes(16000)
+        body = b'WAVE' + _riff_chunk(b'fmt ', fmt) + _riff_chunk(b'LIST', b'abc') + _riff_chunk(b'data', data)
+        path = tmp_path / 'b.wav'
+        path.write_bytes(b'RIFF' + struct.pack('<I', len(body)) + body)
+        assert read_media_duration(path) == pytest.approx(0.5)
+
+
+def _riff_chunk(chunk_id: bytes, payload: bytes) -> bytes:
+    pad = b'\x00' if len(payload) % 2 else b''
+    return chunk_id + struct.pack('<I', len(payload)) + payload + pad
+
+
+class TestMp3Duration:
+    """MP3 프레임 스캔 / Xing"""
+
+    def test_cbr_frame_scan(self, tmp_path):
+        path = tmp_path / 'a.mp3'
+        path.write_bytes(_mp3_frames(MPEG1_HEADER, 417, 100))
+        assert read_media_duration(path) == pytest.approx(100 * 1152 / 44100)
+
+    def test_edge_tts_mono_with_id3_tags(self, tmp_path):
+        id3v2 = b'ID3' + bytes([4, 0, 0]) + bytes([0, 0, 1, 0]) + bytes(128)
+        id3v1 = b'TAG' + bytes(125)
+        path = tmp_path / 'tts.mp3'
+        path.write_bytes(id3v2 + _mp3_frames(MPEG2_MONO_HEADER, 144, 250) + id3v1)
+        assert read_media_duration(path) == pytest.approx(250 * 576 / 24000)
+
+    def test_xing_frame_count(self, tmp_path):
+        xing_frame = bytearray(_mp3_frames(MPEG1_HEADER, 417, 1))
+        xing_frame[36:48] = b'Xing' + struct.pack('>II', 0x01, 5000)
+        path = tmp_path / 'vbr.mp3'
+        path.write_bytes(bytes(xing_frame) + _mp3_frames(MPEG1_HEADER, 417, 3))
+        assert read_media_duration(path) == pytest.approx(5000 * 1152 / 44100)
+
+    def test_garbage_returns_none(self, tmp_path):
+        path = tmp_path / 'bad.mp3'
+        path.write_bytes(b'not an mp3 file' * 10)
+        assert read_media_duration(path) is None
+
+
+class TestMp4Duration:
+    """MP4 moov/mvhd"""
+
+    def test_mvhd_v0_after_mdat(self, tmp_path):
+        path = tmp_path / 'a.mp4'
+        path.write_bytes(
+            _box(b'ftyp', b'isom' + bytes(4)) + _box(b'mdat', bytes(4096))
+            + _box(b'moov', _box(b'mvhd', _mvhd(1000, 12345)))
+        )
+        assert read_media_duration(path) == pytest.approx(12.345)
+
+    def test_mvhd_v1(self, tmp_path):
+        path = tmp_path / 'a.mov'
+        path.write_bytes(_box(b'moov', _box(b'mvhd', _mvhd(90000, 90000 * 7, version=1))))
+        assert read_media_duration(path) == pytest.approx(7.0)
+
+    def test_mdhd_fallback_uses_longest_track(self, tmp_path):
+        tracks = b''.join(
+            _box(b'trak', _box(b'mdia', _box(b'mdhd', _mvhd(timescale, duration))))
+            for timescale, duration in [(12800, 12800 * 4), (44100, 44100 * 5)]
+        )
+        path = tmp_path / 'frag.mp4'
+        path.write_bytes(_box(b'moov', _box(b'mvhd', _mvhd(1000, 0)) + tracks))
+        assert read_media_duration(path) == pytest.approx(5.0)
+
+    def test_missing_moov_returns_none(self, tmp_path):
+        path = tmp_path / 'partial.mp4'
+        path.write_bytes(_box(b'ftyp', b'isom') + _box(b'mdat', bytes(64)))
+        assert read_media_duration(path) is None
+
+
+class TestUnsupported:
+    """헤더 리더가 처리하지 않는 경우 (ffprobe 폴백 대상)"""
+
+    def test_unknown_extension_and_missing_file(self, tmp_path):
+        path = tmp_path / 'a.webm'
+        path.write_bytes(b'\x1a\x45\xdf\xa3')
+        assert read_media_duration(path) is None
+        assert read_media_duration(tmp_path / 'missing.mp3') is None
+        empty = tmp_path / 'empty.wav'
+        empty.write_bytes(b'')
+        assert read_media_duration(empty) is None
+
+
+FFMPEG = shutil.which('ffmpeg')
+FFPROBE = shutil.which('ffprobe')
+
+# (파일명, 생성 옵션)
+FFMPEG_CORPUS = [
+    ('tts.mp3', ['-f', 'lavfi', '-i', 'sine=frequency=440:duration=3.3', '-ar', '24000', '-ac', '1', '-b:a', '48k']),
+    ('vbr.mp3', ['-f', 'lavfi', '-i', 'sine=frequency=440:duration=5.1', '-q:a', '4']),
+    ('pcm.wav', ['-f', 'lavfi', '-i', 'sine=frequency=440:duration=2.25', '-ar', '44100']),
+    ('scene.mp4', ['-f', 'lavfi', '-i', 'testsrc=size=320x240:rate=25:duration=4',
+                   '-f', 'lavfi', '-i', 'sine=duration=4', '-c:v', 'libx264', '-preset', 'ultrafast',
+                   '-c:a', 'aac', '-shortest']),
+    ('audio.m4a', ['-f', 'lavfi', '-i', 'sine=duration=1.7', '-c:a', 'aac']),
+]
+
+
+@pytest.mark.skipif(not (FFMPEG and FFPROBE), reason="FFmpeg/FFprobe 없음")
+class TestAgainstFFprobe:
+    """FFmpeg로 만든 파일들의 헤더 길이가 ffprobe 결과와 같은지 확인"""
+
+    @pytest.mark.parametrize("name,args", FFMPEG_CORPUS)
+    def test_matches_ffprobe(self, tmp_path, name, args):
+        path = tmp_path / name
+        subprocess.run([FFMPEG, '-y', '-v', 'error', *args, str(path)], check=True)
+
+        result = subprocess.run(
+            [FFPROBE, '-v', 'error', '-show_entries', 'format=duration', '-of', 'json', str(path)],
+            capture_output=True, text=True, check=True
+        )
+        expected = float(json.loads(result.stdout)['format']['duration'])
+        # MP3 인코더 지연(LAME 1105샘플) + 마지막 프레임 패딩, AAC 프라이밍 차이만 허용
+        assert read_media_duration(path) == pytest.approx(expected, abs=0.1)
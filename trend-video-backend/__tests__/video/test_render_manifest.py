@@ -0,0 +1,93 @@
+"""
+증분 재렌더링 매니페스트 테스트
+
+테스트 범위:
+- 입력이 같으면 기존 씬 재사용
+- 미디어 파일/파라미터가 바뀌면 재렌더링
+- 출력 파일이 바뀌거나 사라지면 재렌더링
+- 매니페스트 저장/재로드
+"""
+import sys
+import pytest
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from src.utils.render_manifest import RenderManifest
+
+
+@pytest.fixture
+def project(tmp_path):
+    output_folder = tmp_path / 'generated_videos'
+    output_folder.mkdir()
+    image = tmp_path / 'scene_01_image.jpg'
+    image.write_bytes(b'image-v1')
+    audio = output_folder / 'scene_01_audio.mp3'
+    audio.write_bytes(b'audio')
+    video = output_folder / 'scene_01.mp4'
+    video.write_bytes(b'video-bytes')
+    return output_folder, image, audio, video
+
+
+def _fingerprint(manifest, image, audio, codec='libx264'):
+    return manifest.fingerprint(
+        media=manifest.file_hash(image),
+        audio=manifest.file_hash(audio),
+        width=1920, height=1080, codec=codec, preset='ultrafast',
+        filter='scale=1920:1080,fps=25',
+    )
+
+
+class TestRenderManifest:
+    """씬 재사용 판단 테스트"""
+
+    def test_unchanged_scene_is_fresh_after_reload(self, project):
+        output_folder, image, audio, video = project
+        manifest = RenderManifest(output_folder)
+        fp = _fingerprint(manifest, image, audio)
+        manifest.record(1, fp, video)
+
+        reloaded = RenderManifest(output_folder)
+        assert reloaded.is_fresh(1, _fingerprint(reloaded, image, audio), video)
+
+    def test_changed_image_forces_rerender(self, project):
+        output_folder, image, audio, video = project
+        manifest = RenderManifest(output_folder)
+        manifest.record(1, _fingerprint(manifest, image, audio), video)
+
+        image.write_bytes(b'image-v2-different')
+        assert not manifest.is_fresh(1, _fingerprint(manifest, image, audio), video)
+
+    def test_changed_codec_forces_rerender(self, project):
+        output_folder, image, audio, video = project
+        manifest = RenderManifest(output_folder)
+        manifest.record(1, _fingerprint(manifest, image, audio), video)
+
+        assert not manifest.is_fresh(1, _fingerprint(manifest, image, audio, codec='h264_nvenc'), video)
+
+    def test_missing_or_modified_output_forces_rerender(self, project):
+        output_folder, image, audio, video = project
+        manifest = RenderManifest(output_folder)
+        fp = _fingerprint(manifest, image, audio)
+        manifest.record(1, fp, video)
+
+        video.write_bytes(b'truncated')
+        assert not manifest.is_fresh(1, fp, video)
+
+        video.unlink()
+        assert not manifest.is_fresh(1, fp, video)
+
+    def test_invalidate(self, project):
+        output_folder, image, audio, video = project
+        manifest = RenderManifest(output_folder)
+        fp = _fingerprint(manifest, image, audio)
+        manifest.record(1, fp, video)
+        manifest.invalidate(1)
+        assert not manifest.is_fresh(1, fp, video)
+
+    def test_corrupt_manifest_is_ignored(self, project):
+        output_folder, image, audio, video = project
+        (output_folder / 'render_manifest.json').write_text('{not json', encoding='utf-8')
+        manifest = RenderManifest(output_folder)
+        assert manifest.scenes == {}
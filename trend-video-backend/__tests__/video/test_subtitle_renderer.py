@@ -0,0 +1,169 @@
+"""
+나레이션 자막 렌더링 엔진 테스트
+
+테스트 범위:
+- 문장 분리 / 균등 타이밍
+- 색상 변환, 스타일 → ASS 문서 (배경 박스 + 외곽선 두 레이어)
+- 스프라이트 overlay 그래프 (같은 문장 스프라이트 재사용)
+- 비트맵 렌더러 캐시 / 폰트 1회 로드 (Pillow가 있을 때만)
+"""
+import sys
+import pytest
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from src.utils import subtitle_renderer
+from src.utils.subtitle_renderer import (
+    PIL_AVAILABLE,
+    SubtitleStyle,
+    ass_color,
+    build_narration_ass,
+    build_overlay_graph,
+    sentence_events,
+    split_sentences,
+    to_rgb,
+)
+
+
+class TestSentenceEvents:
+    """문장 분리 / 타이밍"""
+
+    def test_split_and_even_timing(self):
+        assert split_sentences("첫 문장입니다. 두 번째! 세 번째?  ") == ['첫 문장입니다', '두 번째', '세 번째']
+        events = sentence_events("하나. 둘. 셋.", 9.0)
+        assert events == [(0.0, 3.0, '하나'), (3.0, 6.0, '둘'), (6.0, 9.0, '셋')]
+
+    def test_empty(self):
+        assert sentence_events("   ", 5.0) == []
+        assert sentence_events("문장.", 0) == []
+
+
+class TestAssOutput:
+    """스타일 → ASS"""
+
+    def test_colors(self):
+        assert to_rgb('white') == (255, 255, 255)
+        assert to_rgb('#FF8000') == (255, 128, 0)
+        assert to_rgb([1, 2, 3]) == (1, 2, 3)
+        # &HAABBGGRR, 알파 0 = 불투명
+        assert ass_color('#FF8000') == '&H000080FF'
+        assert ass_color((0, 0, 0), 0.7) == '&H4D000000'
+
+    def test_style_from_config(self):
+        style = SubtitleStyle.from_config({'font_size': 60, 'background_color': [10, 20, 30], 'color': [1, 2, 3]})
+        assert style.font_size == 60
+        assert style.background_color == (10, 20, 30)
+        assert style.color == (1, 2, 3)
+        hash(style)  # 렌더러 캐시 키로 쓰임
+
+    def test_document(self):
+        events = [(0.0, 2.5, '안녕하세요'), (2.5, 5.0, '중괄호 {태그} 아님')]
+        doc = build_narration_ass(events, SubtitleStyle(background=False), 1920, 1080)
+        lines = doc.splitlines()
+        assert 'PlayResX: 1920' in lines and 'PlayResY: 1080' in lines
+        style_lines = [line for line in lines if line.startswith('Style:')]
+        assert len(style_lines) == 1
+        fields = style_lines[0].split(',')
+        assert fields[1:3] == ['NanumGothic', '52']
+        # BorderStyle 1 + stroke 3, 하단 중앙, 좌우 여백 = 화면의 7.5%
+        assert fields[15:19] == ['1', '3', '0', '2']
+        assert fields[19:22] == ['144', '144', '80']
+        assert lines[-2] == 'Dialogue: 1,0:00:00.00,0:00:02.50,Default,,0,0,0,,안녕하세요'
+        assert lines[-1].endswith(',중괄호 \\{태그\\} 아님')
+
+    def test_background_box_keeps_outline(self):
+        doc = build_narration_ass([(0, 1, 'x')], SubtitleStyle(position='top'), 1080, 1920)
+        styles = {line.split(',')[0]: line.split(',') for line in doc.splitlines() if line.startswith('Style:')}
+        # 글자: 외곽선 스타일 그대로
+        text_style = styles['Style: Default']
+        assert text_style[15:17] == ['1', '3']
+        assert text_style[5] == '&H00000000'
+        assert text_style[18] == '8'
+        # 박스: 글자는 투명, 배경색 박스
+        box_style = styles['Style: Box']
+        assert box_style[3] == '&HFF000000'
+        assert box_style[15] == '3'
+        assert box_style[5] == '&H4D000000'
+        # 박스가 아래 레이어, 글자가 위 레이어
+        dialogues = [line for line in doc.splitlines() if line.startswith('Dialogue:')]
+        assert [d.split(',')[0] for d in dialogues] == ['Dialogue: 0', 'Dialogue: 1']
+        assert [d.split(',')[3] for d in dialogues] == ['Box', 'Default']
+
+
+class TestOverlayGraph:
+    """스프라이트 overlay 그래프"""
+
+    def test_chain_and_enable_windows(self):
+        graph = build_overlay_graph([(1, 0.0, 2.0), (2, 2.0, 4.5)], SubtitleStyle(margin=50))
+        parts = graph.split(';\n')
+        assert parts == [
+            "[0:v][1:v]overlay=x=(main_w-overlay_w)/2:y=main_h-overlay_h-50:enable='between(t,0.000,2.000)'[v0]",
+            "[v0][2:v]overlay=x=(main_w-overlay_w)/2:y=main_h-overlay_h-50:enable='between(t,2.000,4.500)'[outv]",
+        ]
+
+    def test_repeated_sentence_split_from_one_input(self):
+        graph = build_overlay_graph([(1, 0, 1), (2, 1, 2), (1, 2, 3)], SubtitleStyle(position='center'))
+        assert graph.startswith("[1:v]split=2[s1_0][s1_1]")
+        assert "[0:v][s1_0]overlay" in graph
+        assert "[v1][s1_1]overlay" in graph
+        assert "y=(main_h-overlay_h)/2" in graph
+        assert graph.endswith("[outv]")
+
+    def test_no_placements(self):
+        assert build_overlay_graph([], SubtitleStyle()) == "[0:v]null[outv]"
+
+
+@pytest.mark.skipif(not PIL_AVAILABLE, reason="Pillow 필요")
+class TestSubtitleRenderer:
+    """비트맵 렌더링 / 캐시"""
+
+    def test_bitmap_cached_per_sentence_and_style(self, tmp_path):
+        style = SubtitleStyle(font_size=24)
+        renderer = subtitle_renderer.get_subtitle_renderer(style)
+        assert subtitle_renderer.get_subtitle_renderer(SubtitleStyle(font_size=24)) is renderer
+
+        first = renderer.render('같은 문장', 400)
+        assert renderer.render('같은 문장', 400) is first
+        assert renderer.hits == 1 and renderer.misses == 1
+        assert first.mode == 'RGBA'
+
+        sprite = renderer.save_sprite('같은 문장', 400, tmp_path)
+        assert renderer.save_sprite('같은 문장', 400, tmp_path) == sprite
+        assert sprite.exists()
+        other_style = subtitle_renderer.get_subtitle_renderer(SubtitleStyle(font_size=24, color='yellow'))
+        assert other_style.save_sprite('같은 문장', 400, tmp_path) != sprite
+
+    def test_bitmap_cache_is_bounded_lru(self):
+        renderer = subtitle_renderer.SubtitleRenderer(SubtitleStyle(font_size=20), cache_size=2)
+        first = renderer.render('첫 문장', 400)
+        renderer.render('둘째 문장', 400)
+        assert renderer.render('첫 문장', 400) is first
+        renderer.render('셋째 문장', 400)
+
+        # 가장 오래 쓰지 않은 '둘째 문장'만 밀려남
+        assert len(renderer._cache) == 2
+        assert renderer.render('첫 문장', 400) is first
+        misses = renderer.misses
+        renderer.render('둘째 문장', 400)
+        assert renderer.misses == misses + 1
+
+    def test_stroke_drawn_natively_once_per_line(self, monkeypatch):
+        calls = []
+        original = subtitle_renderer.ImageDraw.ImageDraw.text
+
+        def counting_text(self, *args, **kwargs):
+            calls.append(kwargs.get('stroke_width'))
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(subtitle_renderer.ImageDraw.ImageDraw, 'text', counting_text)
+        renderer = subtitle_renderer.SubtitleRenderer(SubtitleStyle(font_size=20, stroke_width=3))
+        renderer.render('한 줄 자막', 1000)
+        assert calls == [3]
+
+    def test_wrap_respects_width(self):
+        renderer = subtitle_renderer.SubtitleRenderer(SubtitleStyle(font_size=20))
+        lines = renderer.wrap('아주 긴 문장을 여러 줄로 나누어야 합니다 ' * 3, 200)
+        assert len(lines) > 1
+        assert all(renderer.font.getlength(line) <= 200 or ' ' not in line for line in lines)
@@ -0,0 +1,265 @@
+"""
+자막 줄 나누기 공통 모듈 테스트
+
+테스트 범위:
+- 남은 글자 수 누적값 (suffix)
+- 예전 O(n²) 구현과 같은 줄 / 같은 시간 (무작위 입력 포함)
+- 예전과 바이트 단위로 같은 ASS 파일
+- 문장 분리 / 제어 명령어 제거 / 겹침 조정 / 길이 자르기
+"""
+import sys
+import random
+import pytest
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from src.utils.ffmpeg_utils import format_ass_timestamp
+from src.utils.subtitle_segmentation import (
+    build_subtitle_ass,
+    clip_to_duration,
+    group_script_text,
+    group_timed_words,
+    resolve_overlaps,
+    split_script_sentences,
+    strip_control_markers,
+    suffix_char_counts,
+    write_subtitle_ass,
+)
+
+WORDS = ['안녕하세요', '오늘은', '정말', '좋은', '날씨', '네요', '가', '나', '다', '그리고', '우리는',
+         '함께', '산책을', '나갔습니다', 'AI', '영상', '자동', '생성', '파이프라인입니다']
+
+
+# --- 예전 구현 (비교 기준, create_video_from_folder / video_merge에서 그대로 옮김) ---
+
+def legacy_group_timed_words(word_segments, max_chars_per_line=22):
+    subtitles = []
+    current_text = ""
+    current_start = None
+    current_end = None
+    MIN_REMAINING_CHARS = 5
+    for i, word_info in enumerate(word_segments):
+        word = word_info["word"]
+        start = word_info["start"]
+        end = word_info["end"]
+        if not word.strip():
+            continue
+        if current_start is None:
+            current_start = start
+        next_text = current_text + (" " if current_text else "") + word
+        remaining_words = word_segments[i+1:]
+        remaining_text = " ".join([w["word"] for w in remaining_words]) if remaining_words else ""
+        if len(next_text) > max_chars_per_line and current_text:
+            if len(remaining_text) > 0 and len(remaining_text) < MIN_REMAINING_CHARS:
+                current_text = next_text + (" " + remaining_text if remaining_text else "")
+                if remaining_words:
+                    current_end = remaining_words[-1]["end"]
+                else:
+                    current_end = end
+                subtitles.append({"start": current_start, "end": current_end, "text": current_text.strip()})
+                break
+            else:
+                subtitles.append({"start": current_start, "end": current_end, "text": current_text.strip()})
+                current_text = word
+                current_start = start
+                current_end = end
+        else:
+            current_text = next_text
+            current_end = end
+    if current_text:
+        subtitles.append({"start": current_start, "end": current_end, "text": current_text.strip()})
+    return subtitles
+
+
+def legacy_group_script_text(narration, audio_duration, max_chars_per_line=22):
+    import re
+    sentences = re.split(r'([.!?。！？])', narration)
+    combined_sentences = []
+    for i in range(0, len(sentences)-1, 2):
+        if i+1 < len(sentences):
+            combined_sentences.append((sentences[i] + sentences[i+1]).strip())
+    if len(sentences) % 2 == 1 and sentences[-1].strip():
+        combined_sentences.append(sentences[-1].strip())
+    if not combined_sentences:
+        combined_sentences = [narration.strip()]
+    total_text = " ".join(combined_sentences)
+    total_chars = len(total_text)
+    time_per_char = audio_duration / total_chars if total_chars > 0 else 0
+    subtitles = []
+    current_time = 0.0
+    MIN_REMAINING_CHARS = 5
+    for sentence in combined_sentences:
+        words = sentence.split()
+        if not words:
+            continue
+        current_text = ""
+        for i, word in enumerate(words):
+            next_text = current_text + (" " if current_text else "") + word
+            remaining_words = words[i+1:]
+            remaining_text = " ".join(remaining_words) if remaining_words else ""
+            if len(next_text) > max_chars_per_line and current_text:
+                if len(remaining_text) > 0 and len(remaining_text) < MIN_REMAINING_CHARS:
+                    current_text = next_text + (" " + remaining_text if remaining_text else "")
+                    duration = len(current_text) * time_per_char
+                    end_time = current_time + duration
+                    subtitles.append({"start": current_time, "end": end_time, "text": current_text.strip()})
+                    current_text = ""
+                    current_time = end_time
+                    break
+                else:
+                    duration = len(current_text) * time_per_char
+                    end_time = current_time + duration
+                    subtitles.append({"start": current_time, "end": end_time, "text": current_text.strip()})
+                    current_text = word
+                    current_time = end_time
+            else:
+                current_text = next_text
+        if current_text:
+            duration = len(current_text) * time_per_char
+            end_time = current_time + duration
+            subtitles.append({"start": current_time, "end": end_time, "text": current_text.strip()})
+            current_time = end_time
+    return subtitles
+
+
+def legacy_write_ass(subtitles, ass_path):
+    with open(ass_path, 'w', encoding='utf-8') as f:
+        f.write("[Script Info]\n")
+        f.write("ScriptType: v4.00+\n")
+        f.write("PlayResX: 1920\n")
+        f.write("PlayResY: 1080\n\n")
+        f.write("[V4+ Styles]\n")
+        f.write("Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n")
+        f.write("Style: Default,NanumGothic,96,&H00FFFFFF,&H000000FF,&H00000000,&H00000000,-1,0,0,0,100,100,0,0,1,3,2,2,10,10,20,1\n\n")
+        f.write("[Events]\n")
+        f.write("Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n")
+        for sub in subtitles:
+            start = format_ass_timestamp(sub["start"])
+            end = format_ass_timestamp(sub["end"])
+            text = sub['text'].replace('\n', '\\N')
+            f.write(f"Dialogue: 0,{start},{end},Default,,0,0,0,,{text}\n")
+
+
+def random_word_timings(rng, count, blank_ratio=0.05):
+    timings = []
+    t = 0.0
+    for _ in range(count):
+        word = '' if rng.random() < blank_ratio else rng.choice(WORDS)
+        duration = rng.uniform(0.1, 0.6)
+        timings.append({"word": word, "start": t, "end": t + duration})
+        t += duration + rng.uniform(0, 0.1)
+    return timings
+
+
+def random_script(rng, count):
+    parts = []
+    for _ in range(count):
+        parts.append(rng.choice(WORDS))
+        if rng.random() < 0.15:
+            parts[-1] += rng.choice('.!?')
+    return " ".join(parts)
+
+
+class TestSuffixCounts:
+    """남은 글자 수 누적값"""
+
+    def test_matches_join_length(self):
+        words = ['가나', '', '다', '라마바', '']
+        counts = suffix_char_counts(words)
+        assert counts == [len(" ".join(words[k:])) for k in range(len(words) + 1)]
+
+    def test_empty(self):
+        assert suffix_char_counts([]) == [0]
+
+
+class TestTimedWords:
+    """타임스탬프 단어 그룹화 - 예전 구현과 동일"""
+
+    def test_short_tail_merged_into_line(self):
+        words = ['아주아주긴단어입니다', '그리고또아주긴단어', '끝에', '가']
+        timings = [{"word": w, "start": i, "end": i + 0.9} for i, w in enumerate(words)]
+        subtitles = group_timed_words(timings, max_chars=22)
+        assert subtitles == legacy_group_timed_words(timings)
+        # '끝에'에서 줄을 바꾸면 '가' 한 글자만 남으므로 남은 단어까지 한 줄로
+        assert subtitles[0] == {"start": 0, "end": 3.9, "text": '아주아주긴단어입니다 그리고또아주긴단어 끝에 가'}
+
+    @pytest.mark.parametrize('seed', range(30))
+    def test_random_inputs_match_legacy(self, seed):
+        rng = random.Random(seed)
+        timings = random_word_timings(rng, rng.randint(0, 300))
+        for max_chars in (8, 15, 22):
+            assert group_timed_words(timings, max_chars) == legacy_group_timed_words(timings, max_chars)
+
+
+class TestScriptText:
+    """대본 기반 그룹화 - 예전 구현과 동일"""
+
+    def test_sentences(self):
+        assert split_script_sentences("첫 문장. 둘째! 셋째") == ['첫 문장.', '둘째!', '셋째']
+        assert split_script_sentences("   ") == ['']
+        assert strip_control_markers("안녕 [무음 3초]하세요 [침묵][pause 1.5초]") == "안녕 하세요 "
+
+    @pytest.mark.parametrize('seed', range(30))
+    def test_random_inputs_match_legacy(self, seed):
+        rng = random.Random(seed)
+        narration = random_script(rng, rng.randint(1, 400))
+        duration = rng.uniform(1, 300)
+        for max_chars in (8, 15, 22):
+            assert group_script_text(split_script_sentences(narration), duration, max_chars) == \
+                legacy_group_script_text(narration, duration, max_chars)
+
+
+class TestAssOutput:
+    """ASS 파일 - 예전과 바이트 단위로 동일"""
+
+    def test_timed_pipeline_bytes(self, tmp_path):
+        rng = random.Random(7)
+        timings = random_word_timings(rng, 500)
+        audio_duration = timings[-1]["end"] - 1.0
+
+        legacy = legacy_group_timed_words(timings)
+        resolve_overlaps(legacy)
+        legacy[-1]["end"] = min(legacy[-1]["end"], audio_duration)
+        legacy_write_ass(clip_to_duration(legacy, audio_duration), tmp_path / 'legacy.ass')
+
+        subtitles = resolve_overlaps(group_timed_words(timings))
+        subtitles[-1]["end"] = min(subtitles[-1]["end"], audio_duration)
+        write_subtitle_ass(clip_to_duration(subtitles, audio_duration), tmp_path / 'new.ass')
+
+        assert (tmp_path / 'new.ass').read_bytes() == (tmp_path / 'legacy.ass').read_bytes()
+
+    def test_script_pipeline_bytes(self, tmp_path):
+        narration = random_script(random.Random(3), 800) + "\n줄바꿈 포함."
+        legacy_write_ass(legacy_group_script_text(narration, 240.0), tmp_path / 'legacy.ass')
+        write_subtitle_ass(group_script_text(split_script_sentences(narration), 240.0), tmp_path / 'new.ass')
+        assert (tmp_path / 'new.ass').read_bytes() == (tmp_path / 'legacy.ass').read_bytes()
+
+    def test_document_shape(self):
+        doc = build_subtitle_ass([{"start": 0.0, "end": 1.5, "text": "한 줄\n두 줄"}])
+        assert 'Style: Default,NanumGothic,96,' in doc
+        assert doc.endswith("Dialogue: 0,0:00:00.00,0:00:01.50,Default,,0,0,0,,한 줄\\N두 줄\n")
+
+
+class TestTimingAdjustments:
+    """겹침 조정 / 길이 자르기"""
+
+    def test_overlap_shortened_or_pushed(self):
+        subtitles = [
+            {"start": 0.0, "end": 2.0, "text": "a"},
+            {"start": 1.5, "end": 3.0, "text": "b"},
+            {"start": 1.6, "end": 4.0, "text": "c"},
+        ]
+        resolve_overlaps(subtitles)
+        assert subtitles[0]["end"] == pytest.approx(1.45)
+        # b가 0.3초 미만으로 줄어들면 0.3초를 보장하고 c를 뒤로 민다
+        assert subtitles[1]["end"] == pytest.approx(1.8)
+        assert subtitles[2]["start"] == pytest.approx(1.85)
+
+    def test_clip(self):
+        subtitles = [{"start": 0, "end": 4, "text": "a"}, {"start": 4, "end": 6, "text": "b"},
+                     {"start": 5, "end": 7, "text": "c"}]
+        assert clip_to_duration(subtitles, 5) == [
+            {"start": 0, "end": 4, "text": "a"}, {"start": 4, "end": 5, "text": "b"},
+        ]
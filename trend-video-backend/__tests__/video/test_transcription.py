@@ -0,0 +1,126 @@
+"""
+Whisper 음성 인식 공용 서비스 테스트 (실제 모델 대신 가짜 백엔드 사용)
+
+테스트 범위:
+- 모델 크기별 한 번만 로드 (스레드 동시 요청 포함)
+- 같은 모델 요청 직렬화
+- 백엔드별 결과 정규화 (openai-whisper dict / faster-whisper 제너레이터)
+- 세그먼트 → 단어 타임스탬프 균등 분배
+"""
+import sys
+import time
+import asyncio
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+BACKEND_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from src.utils.transcription import TranscriptionService, split_segments_to_words
+
+
+class FakeOpenAIModel:
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.calls = []
+
+    def transcribe(self, audio, **kwargs):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        self.calls.append((audio, kwargs))
+        self.active -= 1
+        return {"segments": [{"start": 0.0, "end": 1.0, "text": " 안녕 하세요 "}]}
+
+
+class FakeFasterModel:
+    def transcribe(self, audio, **kwargs):
+        segments = (SimpleNamespace(start=s, end=s + 0.5, text=f" 문장{i} ") for i, s in enumerate([0.0, 0.5]))
+        return segments, SimpleNamespace(language=kwargs.get("language"))
+
+
+def _service(backend, factory):
+    service = TranscriptionService(backend=backend)
+    loads = []
+
+    def load(model_size):
+        loads.append(model_size)
+        return factory()
+
+    service._load_model = load
+    return service, loads
+
+
+class TestTranscriptionService:
+    """모델 싱글톤 + 요청 직렬화"""
+
+    def test_model_loaded_once_per_size(self):
+        service, loads = _service('openai', FakeOpenAIModel)
+        service.transcribe('a.mp3', model_size='base', language='ko')
+        service.transcribe('b.mp3', model_size='base', language='ko')
+        service.transcribe('c.mp3', model_size='medium', language='zh')
+        assert loads == ['base', 'medium']
+
+    def test_concurrent_requests_share_model_and_are_serialized(self):
+        service, loads = _service('openai', FakeOpenAIModel)
+        threads = [threading.Thread(target=service.transcribe, args=(f'{i}.mp3',)) for i in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        model, _ = service.get_model('base')
+        assert loads == ['base']
+        assert len(model.calls) == 6
+        assert model.max_active == 1
+
+    def test_openai_result_normalized(self):
+        service, _ = _service('openai', FakeOpenAIModel)
+        segments = service.transcribe(Path('a.mp3'), language='ko')
+        assert segments == [{"start": 0.0, "end": 1.0, "text": "안녕 하세요"}]
+
+        model, _ = service.get_model('base')
+        audio, kwargs = model.calls[0]
+        assert audio == 'a.mp3'
+        assert kwargs['fp16'] is False
+        assert kwargs['language'] == 'ko'
+
+    def test_faster_result_normalized(self):
+        service, _ = _service('faster', FakeFasterModel)
+        segments = service.transcribe('a.mp3', language='zh')
+        assert segments == [
+            {"start": 0.0, "end": 0.5, "text": "문장0"},
+            {"start": 0.5, "end": 1.0, "text": "문장1"},
+        ]
+
+    def test_async_uses_same_model(self):
+        service, loads = _service('openai', FakeOpenAIModel)
+
+        async def run():
+            return await asyncio.gather(*(service.transcribe_async(f'{i}.mp3') for i in range(3)))
+
+        results = asyncio.run(run())
+        assert len(results) == 3
+        assert loads == ['base']
+
+    def test_backend_names(self):
+        assert TranscriptionService(backend='faster-whisper').backend == 'faster'
+        assert TranscriptionService(backend='whisper').backend == 'openai'
+
+
+class TestSplitSegmentsToWords:
+    """세그먼트 시간을 단어 개수로 균등 분배"""
+
+    def test_even_distribution(self):
+        words = split_segments_to_words([
+            {"start": 1.0, "end": 2.0, "text": " 하나 둘 "},
+            {"start": 2.0, "end": 3.0, "text": "   "},
+            {"start": 3.0, "end": 3.3, "text": "셋"},
+        ])
+        assert words == [
+            {"word": "하나", "start": 1.0, "end": 1.5},
+            {"word": "둘", "start": 1.5, "end": 2.0},
+            {"word": "셋", "start": 3.0, "end": 3.3},
+        ]
@@ -0,0 +1,101 @@
+"""
+TTS 디스크 캐시 테스트
+
+테스트 범위:
+- 키 생성 (provider/voice/speed/text 구분)
+- 저장 후 조회 (오디오 복사 + 타임스탬프/길이 복원)
+- 크기 제한 LRU 정리
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from src.utils.tts_cache import TTSCache, make_tts_cache_key
+
+
+WORDS = [
+    {"word": "안녕하세요", "start": 0.0, "end": 0.6},
+    {"word": "여러분", "start": 0.7, "end": 1.1},
+]
+
+
+def _write_audio(path: Path, size: int = 1000) -> Path:
+    path.write_bytes(b"\xff\xfb" + b"\x00" * (size - 2))
+    return path
+
+
+class TestTTSCacheKey:
+    """캐시 키 테스트"""
+
+    def test_same_input_same_key(self):
+        a = make_tts_cache_key('edge', 'ko-KR-SoonBokNeural', 1.0, '안녕하세요.\n')
+        b = make_tts_cache_key('edge', 'ko-KR-SoonBokNeural', 1.0, '안녕하세요.\n')
+        assert a == b
+
+    def test_each_field_changes_key(self):
+        base = make_tts_cache_key('edge', 'ko-KR-SoonBokNeural', 1.0, '안녕')
+        assert base != make_tts_cache_key('google', 'ko-KR-SoonBokNeural', 1.0, '안녕')
+        assert base != make_tts_cache_key('edge', 'ko-KR-SunHiNeural', 1.0, '안녕')
+        assert base != make_tts_cache_key('edge', 'ko-KR-SoonBokNeural', 1.2, '안녕')
+        assert base != make_tts_cache_key('edge', 'ko-KR-SoonBokNeural', 1.0, '안녕.')
+
+
+class TestTTSCache:
+    """저장/조회/정리 테스트"""
+
+    def test_miss_returns_none(self, tmp_path):
+        cache = TTSCache(cache_dir=tmp_path / 'cache')
+        assert cache.get('0' * 64, tmp_path / 'out.mp3') is None
+
+    def test_put_then_get(self, tmp_path):
+        cache = TTSCache(cache_dir=tmp_path / 'cache')
+        src = _write_audio(tmp_path / 'scene_01_audio.mp3')
+        key = make_tts_cache_key('edge', 'v', 1.0, 'text')
+
+        assert cache.put(key, src, 1.25, WORDS, provider='edge')
+
+        out = tmp_path / 'generated_videos' / 'scene_01_audio.mp3'
+        result = cache.get(key, out)
+        assert result is not None
+        duration, word_timings = result
+        assert duration == 1.25
+        assert word_timings == WORDS
+        assert out.read_bytes() == src.read_bytes()
+
+    def test_empty_audio_not_cached(self, tmp_path):
+        cache = TTSCache(cache_dir=tmp_path / 'cache')
+        src = tmp_path / 'empty.mp3'
+        src.write_bytes(b'')
+        assert not cache.put('a' * 64, src, 1.0, [])
+
+    def test_corrupt_sidecar_is_miss(self, tmp_path):
+        cache = TTSCache(cache_dir=tmp_path / 'cache')
+        key = 'b' * 64
+        cache.put(key, _write_audio(tmp_path / 'a.mp3'), 1.0, WORDS)
+        cache._entry_paths(key)[1].write_text('{broken', encoding='utf-8')
+
+        assert cache.get(key, tmp_path / 'out.mp3') is None
+        assert not cache._entry_paths(key)[0].exists()
+
+    def test_lru_eviction_keeps_recently_used(self, tmp_path):
+        cache = TTSCache(cache_dir=tmp_path / 'cache', max_bytes=10_000_000)
+        keys = [c * 64 for c in 'cde']
+        for i, key in enumerate(keys):
+            cache.put(key, _write_audio(tmp_path / f'{i}.mp3', 4000), 1.0, [])
+            # mtime 해상도가 낮은 파일시스템 대비
+            meta = cache._entry_paths(key)[1]
+            os.utime(meta, (time.time() - 100 + i, time.time() - 100 + i))
+
+        # 가장 오래된 엔트리를 사용 → 최근 사용으로 갱신
+        assert cache.get(keys[0], tmp_path / 'out.mp3') is not None
+
+        cache.max_bytes = 9000  # 엔트리 2개 정도만 남도록
+        cache.evict()
+
+        assert cache._entry_paths(keys[0])[0].exists()
+        assert not cache._entry_paths(keys[1])[0].exists()
+        assert cache._entry_paths(keys[2])[0].exists()
@@ -13,6 +13,12 @@ import mimetypes
 import cv2
 from colorama import Fore, Style, init
 
+try:
+    from ..utils.concat_engine import smart_concat
+    SMART_CONCAT_AVAILABLE = True
+except ImportError:
+    SMART_CONCAT_AVAILABLE = False
+
 # Initialize colorama
 init(autoreset=True)
 
@@ -148,11 +154,18 @@ def concatenate_videos_lossless(segment_paths: List[Path], output_path: Path) ->
     """
     Concatenate videos using FFmpeg lossless concat demuxer.
     Much faster and no quality loss compared to re-encoding.
+
+    When the shared concat engine is available, segments whose stream
+    parameters differ are conformed first instead of producing a broken file.
     """
     ffmpeg = get_ffmpeg_path()
     if not ffmpeg:
         raise RuntimeError("FFmpeg not found. Install FFmpeg or imageio-ffmpeg.")
 
+    if SMART_CONCAT_AVAILABLE:
+        smart_concat(segment_paths, output_path, ffmpeg=ffmpeg)
+        return output_path
+
     # Create concat file
     concat_file = output_path.with_suffix('.txt')
     with open(concat_file, 'w', encoding='utf-8') as f:
@@ -2,11 +2,84 @@
 from .db_log_handler import DatabaseLogHandler, setup_db_logging, auto_setup_db_logging
 from .ffmpeg_utils import (
     get_ffmpeg_path,
+    get_ffprobe_path,
+    get_ffmpeg_encoders,
+    reset_ffmpeg_resolver,
     get_video_duration,
     get_audio_duration,
     detect_best_encoder,
+    get_encoder_preset,
     format_ass_time,
     format_ass_timestamp,
+    build_still_scene_commands,
+    build_image_scene_command,
+    probe_media,
+    probe_many,
+    stream_signature,
+    probe_stream_signature,
+    find_concat_outliers,
+    concat_stream_copy,
+    merge_ass_files,
+    build_single_pass_graph,
+)
+from .media_duration import read_media_duration
+from .json_store import atomic_write_json, load_versioned_json
+from .encode_slots import EncodeSlot, EncodeSlotPool, get_encode_slot_pool
+from .ffmpeg_job import (
+    FFmpegJob,
+    FFmpegJobResult,
+    FFmpegJobCancelled,
+    FFmpegJobTimeout,
+    FFmpegProgress,
+    run_ffmpeg,
+)
+from .concat_engine import ConcatError, ConcatResult, smart_concat
+from .audio_track import AudioTrack, AudioTrackError, assemble_audio_track, mux_audio_track
+from .tts_cache import TTSCache, make_tts_cache_key
+from .render_manifest import RenderManifest
+from .draft_render import (
+    DRAFT_REENCODE_ARGS,
+    DraftTiming,
+    draft_output_path,
+    draft_resolution,
+)
+from .llm_batch import (
+    BatchCheckpoint,
+    RateLimiter,
+    call_with_retry,
+    get_rate_limiter,
+    provider_concurrency,
+    run_bounded,
+)
+from .subtitle_renderer import (
+    PIL_AVAILABLE,
+    SubtitleRenderer,
+    SubtitleStyle,
+    build_narration_ass,
+    get_subtitle_renderer,
+    sentence_events,
+)
+from .subtitle_segmentation import (
+    clip_to_duration,
+    group_script_text,
+    group_timed_words,
+    resolve_overlaps,
+    split_script_sentences,
+    strip_control_markers,
+    write_subtitle_ass,
+)
+from .media_scanner import MediaFile, MediaScan, scan_media_folder
+from .focus_detection import (
+    OPENCV_AVAILABLE,
+    FocusDetector,
+    get_focus_detector,
+    is_landscape_16_9,
+    vertical_crop_box,
+)
+from .transcription import (
+    TranscriptionService,
+    get_transcription_service,
+    split_segments_to_words,
 )
 
 __all__ = [
@@ -14,9 +87,79 @@ __all__ = [
     'setup_db_logging',
     'auto_setup_db_logging',
     'get_ffmpeg_path',
+    'get_ffprobe_path',
+    'get_ffmpeg_encoders',
+    'reset_ffmpeg_resolver',
     'get_video_duration',
     'get_audio_duration',
     'detect_best_encoder',
+    'get_encoder_preset',
     'format_ass_time',
     'format_ass_timestamp',
+    'build_still_scene_commands',
+    'build_image_scene_command',
+    'probe_media',
+    'probe_many',
+    'stream_signature',
+    'probe_stream_signature',
+    'find_concat_outliers',
+    'concat_stream_copy',
+    'merge_ass_files',
+    'build_single_pass_graph',
+    'read_media_duration',
+    'atomic_write_json',
+    'load_versioned_json',
+    'EncodeSlot',
+    'EncodeSlotPool',
+    'get_encode_slot_pool',
+    'FFmpegJob',
+    'FFmpegJobResult',
+    'FFmpegJobCancelled',
+    'FFmpegJobTimeout',
+    'FFmpegProgress',
+    'run_ffmpeg',
+    'ConcatError',
+    'ConcatResult',
+    'smart_concat',
+    'AudioTrack',
+    'AudioTrackError',
+    'assemble_audio_track',
+    'mux_audio_track',
+    'TTSCache',
+    'make_tts_cache_key',
+    'RenderManifest',
+    'DRAFT_REENCODE_ARGS',
+    'DraftTiming',
+    'draft_output_path',
+    'draft_resolution',
+    'BatchCheckpoint',
+    'RateLimiter',
+    'call_with_retry',
+    'get_rate_limiter',
+    'provider_concurrency',
+    'run_bounded',
+    'PIL_AVAILABLE',
+    'SubtitleRenderer',
+    'SubtitleStyle',
+    'build_narration_ass',
+    'get_subtitle_renderer',
+    'sentence_events',
+    'clip_to_duration',
+    'group_script_text',
+    'group_timed_words',
+    'resolve_overlaps',
+    'split_script_sentences',
+    'strip_control_markers',
+    'write_subtitle_ass',
+    'MediaFile',
+    'MediaScan',
+    'scan_media_folder',
+    'OPENCV_AVAILABLE',
+    'FocusDetector',
+    'get_focus_detector',
+    'is_landscape_16_9',
+    'vertical_crop_box',
+    'TranscriptionService',
+    'get_transcription_service',
+    'split_segments_to_words',
 ]
@@ -0,0 +1,250 @@
+"""
+프로젝트 단위 오디오 트랙 조립
+
+씬마다 나레이션 MP3를 AAC로 재인코딩하고 병합 단계에서 또 192k로 재인코딩하면
+CPU를 두 번 쓰고, 세그먼트마다 붙는 AAC priming 때문에 씬 경계마다 작은 틈이 생긴다.
+
+대신 씬은 비디오만 렌더링하고, 모든 씬 나레이션(과 무음 구간)을 FFmpeg 한 번으로
+하나의 타임라인에 이어 붙여 AAC로 한 번만 인코딩한 뒤 병합된 비디오에 스트림 복사로 먹인다.
+
+- 씬 길이는 샘플 단위로 누적 반올림하므로 씬이 수백 개여도 비디오와 어긋나지 않는다
+- 씬별 시작 시각(offsets)을 기록해 자막 등에서 그대로 쓸 수 있다
+- 한 FFmpeg 프로세스는 나레이션 입력을 최대 CONCAT_GROUP_SIZE개까지만 연다. 씬이 더 많으면
+  그룹별로 무손실 PCM(WAV) 구간을 만든 뒤 concat demuxer로 이어 붙여 AAC로 한 번 인코딩한다
+  (구간 길이도 샘플 단위라 이음매에 틈이 없다)
+"""
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from .ffmpeg_utils import get_ffmpeg_path, write_concat_list
+from .ffmpeg_job import run_ffmpeg
+from .concat_engine import get_concat_group_size, split_groups
+from .json_store import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+AUDIO_TRACK_SAMPLE_RATE = 44100
+AUDIO_TRACK_BITRATE = '192k'
+
+
+class AudioTrackError(RuntimeError):
+    """오디오 트랙 조립/먹이기 실패"""
+
+
+@dataclass
+class AudioTrack:
+    """조립된 오디오 트랙과 씬별 배치"""
+    path: Path
+    offsets: List[float] = field(default_factory=list)
+    durations: List[float] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        return self.offsets[-1] + self.durations[-1] if self.offsets else 0.0
+
+    def save(self, path: Path):
+        """씬별 시작 시각/길이를 JSON으로 저장 (자막 후처리용)"""
+        data = {
+            'audio': Path(self.path).name,
+            'duration': round(self.duration, 6),
+            'scenes': [
+                {'offset': round(offset, 6), 'duration': round(duration, 6)}
+                for offset, duration in zip(self.offsets, self.durations)
+            ],
+        }
+        atomic_write_json(path, data, indent=2)
+
+
+def scene_sample_spans(durations: Sequence[float], sample_rate: int = AUDIO_TRACK_SAMPLE_RATE) -> List[Tuple[int, int]]:
+    """씬별 (시작 샘플, 샘플 수) - 누적 시각 기준 반올림 (오차가 쌓이지 않음)"""
+    spans = []
+    cursor = 0.0
+    for duration in durations:
+        start = round(cursor * sample_rate)
+        cursor += duration
+        spans.append((start, max(1, round(cursor * sample_rate) - start)))
+    return spans
+
+
+def build_audio_track_graph(
+    has_audio: Sequence[bool],
+    durations: Sequence[float],
+    sample_rate: int = AUDIO_TRACK_SAMPLE_RATE,
+    channel_layout: str = 'stereo'
+) -> str:
+    """
+    씬 나레이션들을 씬 길이에 맞춰 패딩/자른 뒤 하나로 이어 붙이는 filter_complex 그래프
+
+    Args:
+        has_audio: 씬별 나레이션 입력 여부 (False면 씬 길이만큼 무음)
+        durations: 씬별 타임라인 길이 (초)
+        sample_rate, channel_layout: 출력 오디오 형식
+
+    Returns:
+        그래프 문자열 (입력은 나레이션이 있는 씬만 순서대로 0, 1, 2..., 출력 라벨 [outa])
+    """
+    samples = [count for _, count in scene_sample_spans(durations, sample_rate)]
+    return _timeline_graph(has_audio, samples, sample_rate, channel_layout)
+
+
+def _timeline_graph(has_audio: Sequence[bool], scene_samples: Sequence[int], sample_rate: int,
+                    channel_layout: str = 'stereo') -> str:
+    """씬별 샘플 수로 조립 그래프 생성 (build_audio_track_graph / 그룹 구간 공용)"""
+    parts = []
+    input_index = 0
+    for i, (samples, audio) in enumerate(zip(scene_samples, has_audio)):
+        if audio:
+            source = (f"[{input_index}:a]aresample={sample_rate},"
+                      f"aformat=sample_fmts=fltp:channel_layouts={channel_layout},apad=whole_len={samples}")
+            input_index += 1
+        else:
+            source = f"anullsrc=r={sample_rate}:cl={channel_layout}"
+        parts.append(f"{source},atrim=end_sample={samples},asetpts=N/SR/TB[a{i}]")
+
+    count = len(scene_samples)
+    parts.append("".join(f"[a{i}]" for i in range(count)) + f"concat=n={count}:v=0:a=1[outa]")
+    return ";\n".join(parts)
+
+
+def _render_timeline(
+    ffmpeg: str,
+    audio_paths: Sequence[Optional[Path]],
+    scene_samples: Sequence[int],
+    output_path: Path,
+    codec_args: List[str],
+    sample_rate: int,
+    stop_dir: Optional[Path],
+):
+    """씬 나레이션들을 FFmpeg 한 번으로 이어 붙여 output_path에 저장 (입력 수는 호출 쪽에서 제한)"""
+    input_args = []
+    for audio in audio_paths:
+        if audio is not None:
+            input_args.extend(['-i', str(audio)])
+
+    # 씬이 많으면 명령줄 길이 제한을 넘으므로 그래프는 파일로 전달
+    script_path = output_path.with_name(f"{output_path.stem}_filter.txt")
+    with open(script_path, 'w', encoding='utf-8') as f:
+        f.write(_timeline_graph([audio is not None for audio in audio_paths], scene_samples, sample_rate))
+
+    cmd = [
+        ffmpeg, '-y',
+        *input_args,
+        '-filter_complex_script', str(script_path),
+        '-map', '[outa]',
+        *codec_args,
+        '-ar', str(sample_rate),
+        str(output_path)
+    ]
+    try:
+        result = run_ffmpeg(cmd, duration=sum(scene_samples) / sample_rate, stop_dir=stop_dir)
+    finally:
+        script_path.unlink(missing_ok=True)
+    if result.returncode != 0 or not output_path.exists():
+        raise AudioTrackError(f"오디오 트랙 조립 실패 (종료 코드: {result.returncode}):\n{(result.stderr or '')[-1000:]}")
+
+
+def assemble_audio_track(
+    segments: Sequence[Tuple[Optional[Path], float]],
+    output_path: Path,
+    ffmpeg: Optional[str] = None,
+    bitrate: str = AUDIO_TRACK_BITRATE,
+    sample_rate: int = AUDIO_TRACK_SAMPLE_RATE,
+    stop_dir: Optional[Path] = None,
+    group_size: Optional[int] = None,
+) -> AudioTrack:
+    """
+    씬 나레이션들을 하나의 AAC 트랙으로 조립 (AAC 인코딩은 트랙 전체에서 한 번)
+
+    Args:
+        segments: [(나레이션 파일 또는 None(무음), 씬 길이 초), ...] (재생 순서)
+        output_path: 출력 오디오 (.m4a)
+        bitrate: AAC 비트레이트 (트랙 전체에서 한 번만 인코딩)
+        stop_dir: 이 폴더에 STOP 파일이 생기면 중단 (FFmpegJobCancelled)
+        group_size: 한 FFmpeg 프로세스가 여는 최대 입력 수 (기본: get_concat_group_size())
+
+    Raises:
+        AudioTrackError: 조립 실패
+    """
+    if not segments:
+        raise AudioTrackError("조립할 씬이 없습니다")
+    ffmpeg = ffmpeg or get_ffmpeg_path()
+    if not ffmpeg:
+        raise AudioTrackError("FFmpeg not found. Install FFmpeg or imageio-ffmpeg.")
+
+    output_path = Path(output_path)
+    spans = scene_sample_spans([duration for _, duration in segments], sample_rate)
+    scene_samples = [samples for _, samples in spans]
+    audio_paths = [audio for audio, _ in segments]
+    aac_args = ['-c:a', 'aac', '-b:a', bitrate]
+
+    groups = split_groups(range(len(segments)), max(2, group_size or get_concat_group_size()))
+    if len(groups) == 1:
+        _render_timeline(ffmpeg, audio_paths, scene_samples, output_path, aac_args, sample_rate, stop_dir)
+    else:
+        # 그룹별 무손실 구간 → concat demuxer (입력 1개) → AAC 한 번
+        part_paths = [output_path.with_name(f"{output_path.stem}_part{n:03d}.wav") for n in range(len(groups))]
+        list_path = output_path.with_name(f"{output_path.stem}_parts.txt")
+        try:
+            for group, part_path in zip(groups, part_paths):
+                _render_timeline(ffmpeg, [audio_paths[i] for i in group], [scene_samples[i] for i in group],
+                                 part_path, ['-c:a', 'pcm_s16le'], sample_rate, stop_dir)
+            write_concat_list(part_paths, list_path)
+            cmd = [
+                ffmpeg, '-y',
+                '-f', 'concat', '-safe', '0',
+                '-i', str(list_path),
+                *aac_args,
+                '-ar', str(sample_rate),
+                str(output_path)
+            ]
+            result = run_ffmpeg(cmd, duration=sum(scene_samples) / sample_rate, stop_dir=stop_dir)
+            if result.returncode != 0 or not output_path.exists():
+                raise AudioTrackError(
+                    f"오디오 트랙 구간 병합 실패 (종료 코드: {result.returncode}):\n{(result.stderr or '')[-1000:]}"
+                )
+        finally:
+            for path in [*part_paths, list_path]:
+                path.unlink(missing_ok=True)
+
+    track = AudioTrack(
+        output_path,
+        offsets=[start / sample_rate for start, _ in spans],
+        durations=[samples / sample_rate for samples in scene_samples],
+    )
+    logger.info(f"🔊 오디오 트랙 조립 완료: {len(segments)}개 씬 ({len(groups)}개 그룹), "
+                f"{track.duration:.1f}초 → {output_path.name}")
+    return track
+
+
+def mux_audio_track(
+    video_path: Path,
+    audio_path: Path,
+    output_path: Path,
+    ffmpeg: Optional[str] = None,
+    stop_dir: Optional[Path] = None,
+):
+    """
+    비디오 전용 영상에 조립된 오디오 트랙을 재인코딩 없이 먹이기
+
+    Raises:
+        AudioTrackError: 실패
+    """
+    ffmpeg = ffmpeg or get_ffmpeg_path()
+    if not ffmpeg:
+        raise AudioTrackError("FFmpeg not found. Install FFmpeg or imageio-ffmpeg.")
+
+    cmd = [
+        ffmpeg, '-y',
+        '-i', str(video_path),
+        '-i', str(audio_path),
+        '-map', '0:v:0',
+        '-map', '1:a:0',
+        '-c', 'copy',
+        '-movflags', '+faststart',
+        str(output_path)
+    ]
+    result = run_ffmpeg(cmd, stop_dir=stop_dir)
+    if result.returncode != 0 or not Path(output_path).exists():
+        raise AudioTrackError(f"오디오 트랙 먹이기 실패 (종료 코드: {result.returncode}):\n{(result.stderr or '')[-1000:]}")
@@ -0,0 +1,524 @@
+"""
+공용 영상 병합(concat) 엔진
+
+모든 파이프라인의 최종 병합을 한 곳에서 처리한다.
+입력을 probe_many로 한 번에 조회해 기준 속성(코덱/프로파일/해상도/FPS/픽셀 포맷/오디오)을 정하고,
+가장 빠르면서 올바른 전략을 고른다.
+
+전략:
+    stream_copy   모든 입력이 같은 속성 → concat demuxer + -c copy
+    conform_copy  기준과 다른 연속 구간만 구간별로 한 파일로 재인코딩 → 나머지와 함께 스트림 복사
+    reencode      기준으로 삼을 입력이 없음 → filter_complex로 전체 재인코딩
+
+재인코딩은 한 FFmpeg 프로세스에 입력을 최대 CONCAT_GROUP_SIZE개까지만 연다.
+입력이 더 많으면 그룹별 중간 파일을 병렬로 인코딩한 뒤 스트림 복사로 이어 붙이므로
+씬이 수백 개여도 동시에 열린 디코더/파일 수와 메모리 사용량이 일정하다.
+
+오디오만 있는 입력(TTS 세그먼트 등)은 속성이 모두 같으면 스트림 복사, 다르면 재인코딩한다.
+모든 입력에 오디오가 없으면(비디오 전용 씬) 출력도 비디오 전용으로 만든다.
+"""
+import os
+import shutil
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Union
+
+from .ffmpeg_utils import (
+    get_ffmpeg_path,
+    detect_best_encoder,
+    get_encoder_preset,
+    probe_many,
+    probe_media,
+    stream_signature,
+    find_concat_outliers,
+    concat_stream_copy,
+)
+from .ffmpeg_job import run_ffmpeg
+from .encode_slots import get_encode_slot_pool
+
+logger = logging.getLogger(__name__)
+
+STRATEGY_STREAM_COPY = 'stream_copy'
+STRATEGY_CONFORM_COPY = 'conform_copy'
+STRATEGY_REENCODE = 'reencode'
+
+# 전체 재인코딩 기본 출력 옵션 (기존 filter_complex 병합과 동일한 화질)
+DEFAULT_REENCODE_ARGS = [
+    '-c:v', 'libx264',
+    '-preset', 'medium',
+    '-crf', '18',
+    '-c:a', 'aac',
+    '-b:a', '192k',
+]
+
+# 한 FFmpeg 프로세스가 여는 최대 입력 수 (CONCAT_GROUP_SIZE 환경변수로 변경 가능)
+DEFAULT_CONCAT_GROUP_SIZE = 16
+
+# 그룹 중간 파일끼리 스트림 복사가 가능하도록 고정하는 출력 속성
+GROUP_OUTPUT_DEFAULTS = {
+    '-pix_fmt': 'yuv420p',
+    '-ar': '44100',
+    '-ac': '2',
+}
+
+_CHANNEL_LAYOUTS = {1: 'mono', 2: 'stereo'}
+
+
+class ConcatError(RuntimeError):
+    """병합 실패 (FFmpeg 없음, 입력 조회 실패, 인코딩 실패 등)"""
+
+
+@dataclass
+class ConcatResult:
+    """병합 결과 - 선택한 전략과 단계별 소요 시간"""
+    output_path: Path
+    strategy: str
+    input_count: int
+    reencoded_count: int = 0
+    encoder: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def elapsed(self) -> float:
+        return sum(self.timings.values())
+
+    def summary(self) -> str:
+        stages = ", ".join(f"{name} {seconds:.1f}초" for name, seconds in self.timings.items())
+        encoder = f", 인코더 {self.encoder}" if self.encoder else ""
+        return (f"{self.strategy} - 입력 {self.input_count}개, 재인코딩 {self.reencoded_count}개"
+                f"{encoder}, {self.elapsed:.1f}초 ({stages})")
+
+
+def get_concat_group_size() -> int:
+    """한 FFmpeg 프로세스가 여는 최대 입력 수 (CONCAT_GROUP_SIZE 환경변수 또는 기본값)"""
+    try:
+        return max(2, int(os.getenv('CONCAT_GROUP_SIZE') or DEFAULT_CONCAT_GROUP_SIZE))
+    except ValueError:
+        return DEFAULT_CONCAT_GROUP_SIZE
+
+
+def split_groups(items: Sequence, group_size: int) -> List[list]:
+    """순서를 유지하며 최대 group_size개씩 나누기"""
+    return [list(items[i:i + group_size]) for i in range(0, len(items), group_size)]
+
+
+def find_outlier_runs(
+    inputs: Sequence[Path],
+    outliers: Sequence[Path],
+    max_run: Optional[int] = None
+) -> List[List[int]]:
+    """
+    기준과 다른 입력의 연속 구간 (입력 인덱스 목록들, 순서 유지)
+
+    max_run을 주면 긴 구간을 최대 max_run개씩 나눈다.
+    """
+    outlier_set = set(outliers)
+    runs: List[List[int]] = []
+    for index, path in enumerate(inputs):
+        if path not in outlier_set:
+            continue
+        if runs and runs[-1][-1] == index - 1 and (not max_run or len(runs[-1]) < max_run):
+            runs[-1].append(index)
+        else:
+            runs.append([index])
+    return runs
+
+
+def build_normalize_graph(
+    has_audio: Sequence[bool],
+    durations: Sequence[Optional[float]],
+    width: int,
+    height: int,
+    fps: Union[int, str] = 25,
+    sample_rate: int = 44100,
+    channel_layout: str = 'stereo',
+    with_audio: bool = True
+) -> str:
+    """
+    입력들을 같은 해상도/SAR/FPS로 맞춰 이어 붙이는 filter_complex 그래프
+
+    오디오가 없는 입력은 입력 길이만큼 무음으로 채운다.
+    출력 라벨: [outv] [outa] (with_audio=False면 [outv]만)
+    """
+    parts = []
+    concat_inputs = []
+    for i, audio in enumerate(has_audio):
+        parts.append(
+            f"[{i}:v]scale={width}:{height}:force_original_aspect_ratio=decrease,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={fps}[v{i}]"
+        )
+        if not with_audio:
+            concat_inputs.append(f"[v{i}]")
+        elif audio:
+            concat_inputs.append(f"[v{i}][{i}:a]")
+        else:
+            parts.append(f"anullsrc=r={sample_rate}:cl={channel_layout},atrim=duration={durations[i] or 0:.3f}[a{i}]")
+            concat_inputs.append(f"[v{i}][a{i}]")
+
+    if not with_audio:
+        return ";".join(parts) + ";" + "".join(concat_inputs) + f"concat=n={len(has_audio)}:v=1:a=0[outv]"
+    return ";".join(parts) + ";" + "".join(concat_inputs) + f"concat=n={len(has_audio)}:v=1:a=1[outv][outa]"
+
+
+def _run(cmd: List[str], what: str, duration: Optional[float] = None, stop_dir: Optional[Path] = None):
+    result = run_ffmpeg(cmd, duration=duration, stop_dir=stop_dir, encode_slot=True)
+    if result.returncode != 0:
+        raise ConcatError(f"{what} 실패 (종료 코드: {result.returncode}):\n{(result.stderr or '')[-1000:]}")
+    return result
+
+
+def _arg_value(args: List[str], option: str) -> Optional[str]:
+    """FFmpeg 인자 목록에서 옵션 값 (없으면 None)"""
+    if option in args[:-1]:
+        return args[args.index(option) + 1]
+    return None
+
+
+def _with_defaults(args: List[str], defaults: Dict[str, str]) -> List[str]:
+    """출력 인자에 없는 옵션만 기본값으로 추가"""
+    args = list(args)
+    for option, value in defaults.items():
+        if _arg_value(args, option) is None:
+            args.extend([option, value])
+    return args
+
+
+def _strip_audio_args(args: List[str]) -> List[str]:
+    """출력 인자에서 오디오 옵션 제거 (비디오 전용 병합)"""
+    stripped = []
+    skip = False
+    for arg in args:
+        if skip:
+            skip = False
+        elif arg in ('-c:a', '-b:a', '-ar', '-ac', '-af'):
+            skip = True
+        elif arg != '-an':
+            stripped.append(arg)
+    return stripped
+
+
+def _majority_target(signatures: Dict[Path, Optional[dict]], require_audio: bool = True):
+    """가장 많은 입력의 (width, height, r_frame_rate) - 기준 후보가 없으면 None"""
+    counts = Counter(
+        (sig['video']['width'], sig['video']['height'], sig['video']['r_frame_rate'])
+        for sig in signatures.values()
+        if sig and (sig['audio'] or not require_audio) and sig['video']['sample_aspect_ratio'] == '1:1'
+    )
+    return counts.most_common(1)[0][0] if counts else None
+
+
+class _ConcatJob:
+    """smart_concat 한 번의 실행 상태"""
+
+    def __init__(self, inputs, output_path, width, height, fps, work_dir, codec, preset,
+                 reencode_args, ffmpeg, max_workers, group_size, stop_dir):
+        self.inputs = inputs
+        self.output_path = output_path
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.work_dir = work_dir
+        self.codec = codec
+        self.preset = preset
+        self.reencode_args = reencode_args
+        self.ffmpeg = ffmpeg
+        self.max_workers = max_workers
+        self.group_size = group_size
+        self.stop_dir = stop_dir
+        self.timings: Dict[str, float] = {}
+        self.probes: Dict[Path, Optional[dict]] = {}
+        self.video_only = False
+
+    def workers(self, jobs: int) -> int:
+        """인코딩 동시 실행 수 (기본: 머신 전체 인코딩 슬롯 수 - 실제 동시 실행은 슬롯이 제한)"""
+        workers = self.max_workers or get_encode_slot_pool().slots
+        return max(1, min(jobs, workers))
+
+    def stage(self, name: str, started: float):
+        self.timings[name] = self.timings.get(name, 0.0) + perf_counter() - started
+
+    def result(self, strategy: str, reencoded: int = 0, encoder: Optional[str] = None) -> ConcatResult:
+        return ConcatResult(self.output_path, strategy, len(self.inputs), reencoded, encoder, dict(self.timings))
+
+    def stream_copy(self, paths: List[Path]):
+        started = perf_counter()
+        list_path = self.work_dir / "concat_list.txt"
+        try:
+            result = concat_stream_copy(self.ffmpeg, paths, self.output_path, list_path, stop_dir=self.stop_dir)
+        finally:
+            list_path.unlink(missing_ok=True)
+            self.stage('concat', started)
+        if result.returncode != 0 or not self.output_path.exists():
+            raise ConcatError(f"스트림 복사 병합 실패 (종료 코드: {result.returncode}):\n{(result.stderr or '')[-500:]}")
+
+    def normalize(self, paths: List[Path], output: Path, width: int, height: int, fps, output_args: List[str],
+                  sample_rate: int = 44100, channel_layout: str = 'stereo'):
+        """여러 입력을 하나로 정규화 인코딩 (filter_complex)"""
+        infos = [self.probes.get(p) or {} for p in paths]
+        has_audio = [bool(info.get('audio')) for info in infos]
+        durations = [info.get('duration') for info in infos]
+        if not self.video_only and not all(audio or duration for audio, duration in zip(has_audio, durations)):
+            raise ConcatError("오디오도 길이 정보도 없는 입력이 있어 무음을 채울 수 없습니다")
+
+        input_args = []
+        for path in paths:
+            input_args.extend(['-i', str(path)])
+        graph = build_normalize_graph(has_audio, durations, width, height, fps, sample_rate, channel_layout,
+                                      with_audio=not self.video_only)
+        maps = ['-map', '[outv]'] if self.video_only else ['-map', '[outv]', '-map', '[outa]']
+        cmd = [
+            self.ffmpeg, '-y',
+            *input_args,
+            '-filter_complex', graph,
+            *maps,
+            *output_args,
+            str(output)
+        ]
+        _run(cmd, f"{output.name} 인코딩", sum(d or 0 for d in durations) or None, self.stop_dir)
+
+    def reencode_all(self) -> ConcatResult:
+        videos = [self.probes[p]['video'] for p in self.inputs if self.probes.get(p) and self.probes[p]['video']]
+        width = self.width or (videos[0]['width'] if videos else 1920)
+        height = self.height or (videos[0]['height'] if videos else 1080)
+        fps = self.fps or 25
+
+        logger.info(f"🎬 전체 재인코딩 병합: {len(self.inputs)}개 입력 → {width}x{height} @ {fps}fps")
+        if len(self.inputs) > self.group_size:
+            self.reencode_grouped(width, height, fps)
+        else:
+            started = perf_counter()
+            try:
+                self.normalize(self.inputs, self.output_path, width, height, fps, self.reencode_args)
+            finally:
+                self.stage('reencode', started)
+        if not self.output_path.exists():
+            raise ConcatError(f"출력 비디오가 생성되지 않았습니다: {self.output_path}")
+        return self.result(STRATEGY_REENCODE, len(self.inputs), _arg_value(self.reencode_args, '-c:v'))
+
+    def reencode_grouped(self, width: int, height: int, fps):
+        """입력을 그룹별 중간 파일로 병렬 인코딩 → 스트림 복사로 이어 붙이기"""
+        groups = split_groups(self.inputs, self.group_size)
+        defaults = dict(GROUP_OUTPUT_DEFAULTS)
+        if self.video_only:
+            defaults = {'-pix_fmt': defaults['-pix_fmt']}
+        output_args = _with_defaults(self.reencode_args, defaults)
+        sample_rate = int(_arg_value(output_args, '-ar') or 44100)
+        channel_layout = _CHANNEL_LAYOUTS.get(int(_arg_value(output_args, '-ac') or 2), 'stereo')
+        group_dir = self.work_dir / "_groups"
+        group_dir.mkdir(parents=True, exist_ok=True)
+        logger.info(f"🧩 그룹 병합: {len(groups)}개 그룹 (그룹당 최대 {self.group_size}개 입력)")
+
+        def encode(item):
+            index, paths = item
+            output = group_dir / f"group_{index:04d}.mp4"
+            self.normalize(paths, output, width, height, fps, output_args, sample_rate, channel_layout)
+            return output
+
+        try:
+            started = perf_counter()
+            try:
+                with ThreadPoolExecutor(max_workers=self.workers(len(groups))) as executor:
+                    outputs = list(executor.map(encode, enumerate(groups)))
+            finally:
+                self.stage('reencode', started)
+            self.stream_copy(outputs)
+        finally:
+            shutil.rmtree(group_dir, ignore_errors=True)
+
+    def conform_runs(self, reference: dict, runs: List[List[int]]) -> Dict[int, Path]:
+        """기준과 다른 연속 구간을 구간별로 한 파일로 재인코딩 → {구간 시작 인덱스: 파일}"""
+        video = reference['video']
+        audio = reference['audio']
+        output_args = ['-c:v', self.codec]
+        if self.preset:
+            output_args.extend(['-preset', self.preset])
+        output_args.extend(['-pix_fmt', video['pix_fmt']])
+        if video.get('profile'):
+            # ffprobe 표기(High, Constrained Baseline) → 인코더 옵션(high, baseline)
+            output_args.extend(['-profile:v', video['profile'].lower().replace('constrained ', '')])
+        if video.get('codec_name') == 'h264' and (video.get('level') or 0) > 0:
+            # ffprobe 표기(41) → 인코더 옵션(4.1), 레벨이 다르면 SPS가 달라 스트림 복사 불가
+            output_args.extend(['-level', f"{video['level'] / 10:g}"])
+        if audio:
+            output_args.extend(['-c:a', 'aac', '-ar', str(audio['sample_rate']), '-ac', str(audio['channels'])])
+            sample_rate, channel_layout = int(audio['sample_rate']), _CHANNEL_LAYOUTS.get(audio['channels'], 'stereo')
+        else:
+            output_args.append('-an')
+            sample_rate, channel_layout = 44100, 'stereo'
+
+        conform_dir = self.work_dir / "_conform"
+        conform_dir.mkdir(parents=True, exist_ok=True)
+        rate = video['r_frame_rate']
+        fps = rate[:-2] if rate.endswith('/1') else rate
+
+        def conform(run: List[int]):
+            output = conform_dir / f"run_{run[0]:04d}.mp4"
+            self.normalize([self.inputs[i] for i in run], output, video['width'], video['height'], fps,
+                           output_args, sample_rate, channel_layout)
+            if stream_signature(probe_media(output, use_disk_cache=False)) != reference:
+                raise ConcatError(f"{output.name} 재인코딩 후에도 속성이 달라 스트림 복사 불가")
+            return run[0], output
+
+        started = perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers(len(runs))) as executor:
+                return dict(executor.map(conform, runs))
+        finally:
+            self.stage('conform', started)
+
+    def run(self, allow_reencode: bool) -> ConcatResult:
+        started = perf_counter()
+        self.probes = probe_many(self.inputs, max_workers=self.max_workers)
+        self.stage('probe', started)
+
+        if all(info and not info['video'] and info['audio'] for info in self.probes.values()):
+            return self.concat_audio()
+        self.video_only = all(info and info['video'] and not info['audio'] for info in self.probes.values())
+        if self.video_only:
+            self.reencode_args = [*_strip_audio_args(self.reencode_args), '-an']
+
+        signatures = {path: stream_signature(self.probes[path]) for path in self.inputs}
+        # 지정하지 않은 해상도/FPS는 가장 많은 입력의 값을 사용
+        majority = _majority_target(signatures, require_audio=not self.video_only) or (None, None, None)
+        self.width = self.width or majority[0]
+        self.height = self.height or majority[1]
+        self.fps = self.fps or majority[2]
+
+        reference = None
+        if self.width and self.height and self.fps:
+            reference, outliers = find_concat_outliers(signatures, self.width, self.height, self.fps,
+                                                       require_audio=not self.video_only)
+
+        if reference is None:
+            if not allow_reencode:
+                raise ConcatError("스트림 복사 기준으로 삼을 입력이 없습니다")
+            logger.info("ℹ️ 스트림 복사 기준으로 삼을 입력이 없습니다")
+            return self.reencode_all()
+
+        if not outliers:
+            self.stream_copy(self.inputs)
+            return self.result(STRATEGY_STREAM_COPY)
+
+        runs = find_outlier_runs(self.inputs, outliers, max_run=self.group_size)
+        reencoded = sum(len(run) for run in runs)
+        logger.info(f"⚡ 스트림 복사 병합: 기준 속성 입력 {len(self.inputs) - reencoded}개, "
+                    f"재인코딩 {reencoded}개 ({len(runs)}개 구간, {self.codec})")
+        conform_dir = self.work_dir / "_conform"
+        try:
+            conformed = self.conform_runs(reference, runs)
+            run_by_start = {run[0]: run for run in runs}
+            concat_inputs = []
+            index = 0
+            while index < len(self.inputs):
+                if index in conformed:
+                    concat_inputs.append(conformed[index])
+                    index += len(run_by_start[index])
+                else:
+                    concat_inputs.append(self.inputs[index])
+                    index += 1
+            self.stream_copy(concat_inputs)
+        except ConcatError as e:
+            if not allow_reencode:
+                raise
+            logger.warning(f"⚠️ {e}")
+            return self.reencode_all()
+        finally:
+            shutil.rmtree(conform_dir, ignore_errors=True)
+
+        return self.result(STRATEGY_CONFORM_COPY, reencoded, self.codec)
+
+    def concat_audio(self) -> ConcatResult:
+        """오디오만 있는 입력 병합"""
+        signatures = {
+            (info['audio']['codec_name'], info['audio']['sample_rate'], info['audio']['channels'])
+            for info in self.probes.values()
+        }
+        if len(signatures) == 1:
+            self.stream_copy(self.inputs)
+            return self.result(STRATEGY_STREAM_COPY)
+
+        started = perf_counter()
+        input_args = []
+        for path in self.inputs:
+            input_args.extend(['-i', str(path)])
+        concat_inputs = "".join(f"[{i}:a]" for i in range(len(self.inputs)))
+        codec = 'libmp3lame' if self.output_path.suffix.lower() == '.mp3' else 'aac'
+        cmd = [
+            self.ffmpeg, '-y',
+            *input_args,
+            '-filter_complex', f"{concat_inputs}concat=n={len(self.inputs)}:v=0:a=1[outa]",
+            '-map', '[outa]',
+            '-c:a', codec,
+            str(self.output_path)
+        ]
+        try:
+            durations = [info.get('duration') or 0 for info in self.probes.values()]
+            _run(cmd, "오디오 병합", sum(durations) or None, self.stop_dir)
+        finally:
+            self.stage('reencode', started)
+        return self.result(STRATEGY_REENCODE, len(self.inputs), codec)
+
+
+def smart_concat(
+    inputs: Sequence[Path],
+    output_path: Path,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    fps: Optional[Union[int, str]] = None,
+    work_dir: Optional[Path] = None,
+    codec: Optional[str] = None,
+    preset: Optional[str] = None,
+    reencode_args: Optional[List[str]] = None,
+    allow_reencode: bool = True,
+    ffmpeg: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    group_size: Optional[int] = None,
+    stop_dir: Optional[Path] = None,
+) -> ConcatResult:
+    """
+    입력 영상(또는 오디오)들을 가장 빠른 올바른 방법으로 하나로 병합
+
+    Args:
+        inputs: 입력 파일 (순서대로)
+        output_path: 출력 파일
+        width, height, fps: 최종 해상도/FPS (생략하면 가장 많은 입력의 속성 사용)
+        work_dir: 목록 파일/중간 파일 폴더 (기본: 출력 폴더)
+        codec, preset: 구간 재인코딩 인코더 (기본: 사용 가능한 최고 인코더)
+        reencode_args: 전체 재인코딩 시 출력 옵션 (기본: libx264 medium crf 18 + aac 192k)
+        allow_reencode: False면 스트림 복사가 불가능할 때 전체 재인코딩 대신 ConcatError
+        ffmpeg: FFmpeg 실행 파일 (기본: get_ffmpeg_path())
+        max_workers: 조회/재인코딩 동시 실행 수
+        group_size: 한 FFmpeg 프로세스가 여는 최대 입력 수 (기본: get_concat_group_size())
+        stop_dir: 이 폴더에 STOP 파일이 생기면 실행 중인 FFmpeg 중단 (FFmpegJobCancelled)
+
+    Returns:
+        ConcatResult (선택한 전략, 재인코딩한 입력 수, 단계별 소요 시간)
+
+    Raises:
+        ConcatError: 병합 실패
+    """
+    inputs = [Path(p) for p in inputs]
+    if not inputs:
+        raise ConcatError("병합할 입력이 없습니다")
+
+    ffmpeg = ffmpeg or get_ffmpeg_path()
+    if not ffmpeg:
+        raise ConcatError("FFmpeg not found. Install FFmpeg or imageio-ffmpeg.")
+
+    output_path = Path(output_path)
+    work_dir = Path(work_dir) if work_dir else output_path.parent
+    work_dir.mkdir(parents=True, exist_ok=True)
+    if codec is None:
+        codec = detect_best_encoder()[0]
+        preset = preset or get_encoder_preset(codec)
+
+    job = _ConcatJob(inputs, output_path, width, height, fps, work_dir, codec, preset,
+                     list(reencode_args or DEFAULT_REENCODE_ARGS), ffmpeg, max_workers,
+                     max(2, group_size or get_concat_group_size()), stop_dir)
+    result = job.run(allow_reencode)
+    logger.info(f"🔗 병합 완료 [{result.summary()}]: {output_path.name}")
+    return result
@@ -0,0 +1,145 @@
+"""
+초안(프록시) 렌더링 설정과 씬 타이밍 승격
+
+초안 모드는 검수용 영상을 빠르게 만든다:
+    - 짧은 변 540px (16:9 → 960x540, 9:16 → 540x960), libx264 ultrafast
+    - 저비트레이트 오디오 (64k), 자막은 그대로 번인
+    - 최종 렌더링과 다른 출력 경로 (*_draft.mp4)
+
+초안 렌더링은 씬별 나레이션 오디오/길이/단어 타임스탬프를 draft_timing.json 에 남긴다.
+최종 렌더링에서 이 기록을 승격하면 나레이션이 같은 씬은 TTS를 다시 만들지 않고
+초안의 오디오를 그대로 써서 초안과 똑같은 씬 타이밍으로 렌더링한다.
+"""
+import shutil
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .json_store import atomic_write_json, load_versioned_json
+
+logger = logging.getLogger(__name__)
+
+DRAFT_SHORT_SIDE = 540
+DRAFT_PRESET = 'ultrafast'
+DRAFT_CRF = 28
+DRAFT_AUDIO_BITRATE = '64k'
+DRAFT_SUFFIX = '_draft'
+
+# 초안 전체 재인코딩(병합/단일 패스) 출력 옵션
+DRAFT_VIDEO_ARGS = ['-c:v', 'libx264', '-preset', DRAFT_PRESET, '-crf', str(DRAFT_CRF)]
+DRAFT_AUDIO_ARGS = ['-c:a', 'aac', '-b:a', DRAFT_AUDIO_BITRATE]
+DRAFT_REENCODE_ARGS = [*DRAFT_VIDEO_ARGS, *DRAFT_AUDIO_ARGS]
+
+# 기록 형식이 바뀌면 올려서 기존 초안 타이밍을 무시
+DRAFT_TIMING_VERSION = 1
+DRAFT_TIMING_FILENAME = 'draft_timing.json'
+
+
+def draft_resolution(width: int, height: int) -> Tuple[int, int]:
+    """최종 해상도의 비율을 유지한 초안 해상도 (짧은 변 540px, 짝수로 맞춤)"""
+    scale = DRAFT_SHORT_SIDE / min(width, height)
+    return int(round(width * scale / 2)) * 2, int(round(height * scale / 2)) * 2
+
+
+def draft_output_path(path: Path) -> Path:
+    """최종 출력 경로 옆의 초안 출력 경로 (title.mp4 → title_draft.mp4)"""
+    path = Path(path)
+    return path.with_name(f"{path.stem}{DRAFT_SUFFIX}{path.suffix}")
+
+
+def narration_hash(text: str) -> str:
+    """나레이션 텍스트 해시 (초안과 최종 렌더링의 씬 비교용)"""
+    return hashlib.sha1((text or '').strip().encode('utf-8')).hexdigest()
+
+
+class DraftTiming:
+    """초안 렌더링의 씬별 오디오/타이밍 기록 (draft_timing.json)"""
+
+    def __init__(self, folder: Path):
+        """
+        Args:
+            folder: 기록 파일을 둘 폴더 (초안 씬 출력 폴더)
+        """
+        self.path = Path(folder) / DRAFT_TIMING_FILENAME
+        self._lock = threading.Lock()
+        self.scenes: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self):
+        data = load_versioned_json(self.path, DRAFT_TIMING_VERSION, "초안 타이밍")
+        if data is not None:
+            self.scenes = data.get('scenes', {})
+
+    def __len__(self) -> int:
+        return len(self.scenes)
+
+    def record(self, scene_num: int, narration: str, audio_path: Path, duration: float,
+               word_timings: Optional[List] = None, voice: Optional[str] = None,
+               speed: Optional[float] = None):
+        """초안 씬의 나레이션 오디오와 타이밍 기록 (save()로 저장)"""
+        audio_path = Path(audio_path)
+        try:
+            size = audio_path.stat().st_size
+        except OSError:
+            return
+
+        with self._lock:
+            self.scenes[str(scene_num)] = {
+                'narration': narration_hash(narration),
+                'audio': str(audio_path.resolve()),
+                'size': size,
+                'duration': duration,
+                'word_timings': word_timings or [],
+                'voice': voice,
+                'speed': speed,
+            }
+
+    def lookup(self, scene_num: int, narration: str, voice: Optional[str] = None,
+               speed: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """나레이션/음성/속도가 같고 오디오 파일이 그대로 남아 있는 씬 기록 (없으면 None)"""
+        with self._lock:
+            entry = self.scenes.get(str(scene_num))
+        if not entry or entry.get('narration') != narration_hash(narration):
+            return None
+        if entry.get('voice') != voice or entry.get('speed') != speed:
+            return None
+        try:
+            if Path(entry['audio']).stat().st_size != entry.get('size'):
+                return None
+        except OSError:
+            return None
+        return entry
+
+    def promote(self, scene_num: int, narration: str, audio_path: Path, voice: Optional[str] = None,
+                speed: Optional[float] = None) -> Optional[Tuple[float, List]]:
+        """
+        초안 씬 오디오를 audio_path로 복사하고 초안 타이밍 반환
+
+        Returns:
+            (오디오 길이, 단어 타임스탬프), 기록이 없거나 나레이션이 바뀌었으면 None
+        """
+        entry = self.lookup(scene_num, narration, voice, speed)
+        if entry is None:
+            return None
+
+        audio_path = Path(audio_path)
+        source = Path(entry['audio'])
+        try:
+            if source.resolve() != audio_path.resolve():
+                audio_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source, audio_path)
+        except OSError as e:
+            logger.warning(f"⚠️ 씬 {scene_num} 초안 오디오 복사 실패: {e}")
+            return None
+        return entry['duration'], entry.get('word_timings') or []
+
+    def save(self):
+        """기록 저장 (임시 파일 → os.replace)"""
+        with self._lock:
+            data = {'version': DRAFT_TIMING_VERSION, 'scenes': dict(self.scenes)}
+            try:
+                atomic_write_json(self.path, data, indent=2)
+            except OSError as e:
+                logger.warning(f"⚠️ 초안 타이밍 저장 실패: {e}")
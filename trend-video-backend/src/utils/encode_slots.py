@@ -0,0 +1,181 @@
+"""
+머신 전체 인코딩 슬롯 스케줄러 (파일 잠금 기반 세마포어)
+
+여러 작업(별도 프로세스)이 동시에 렌더링해도 CPU를 정확히 한 번만 채우도록
+인코딩 슬롯을 나눠 주고 슬롯마다 FFmpeg `-threads` 값을 정한다.
+
+- 슬롯 수 × 슬롯당 스레드 수 ≈ CPU 코어 수 (16코어 → 기본 4슬롯 × 4스레드)
+- 슬롯은 공용 폴더의 slot_N.lock 파일에 대한 배타적 파일 잠금
+  (같은 프로세스의 스레드끼리도, 다른 프로세스끼리도 공유되며 프로세스가 죽으면 OS가 잠금 해제)
+- 설정: ENCODE_SLOT_DIR, ENCODE_SLOTS, ENCODE_THREADS_PER_SLOT 환경변수
+"""
+import os
+import time
+import random
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SLOT_DIR = Path(tempfile.gettempdir()) / 'trend-video-encode-slots'
+DEFAULT_THREADS_PER_SLOT = 4
+SLOT_POLL_INTERVAL = 0.2
+
+
+def _env_int(name: str) -> Optional[int]:
+    try:
+        value = int(os.getenv(name) or 0)
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def _try_lock(f) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        elif msvcrt is not None:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(f):
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        elif msvcrt is not None:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    except OSError:
+        pass
+
+
+class EncodeSlot:
+    """잡고 있는 인코딩 슬롯 하나"""
+
+    def __init__(self, index: int, threads: int, lock_file, waited: float = 0.0):
+        self.index = index
+        self.threads = threads
+        self.waited = waited
+        self._file = lock_file
+
+    def release(self):
+        if self._file is None:
+            return
+        _unlock(self._file)
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class EncodeSlotPool:
+    """파일 잠금으로 구현한 머신 전체 인코딩 세마포어"""
+
+    def __init__(self, slot_dir: Optional[Path] = None, slots: Optional[int] = None,
+                 threads_per_slot: Optional[int] = None):
+        """
+        Args:
+            slot_dir: 잠금 파일 폴더 (기본: ENCODE_SLOT_DIR 또는 시스템 임시 폴더)
+            slots: 슬롯 수 (기본: ENCODE_SLOTS 또는 코어 수 / 슬롯당 스레드 수)
+            threads_per_slot: 슬롯당 FFmpeg 스레드 수 (기본: ENCODE_THREADS_PER_SLOT 또는 4)
+        """
+        cpu_count = os.cpu_count() or 2
+        self.slot_dir = Path(slot_dir or os.getenv('ENCODE_SLOT_DIR') or DEFAULT_SLOT_DIR)
+        self.threads_per_slot = (threads_per_slot or _env_int('ENCODE_THREADS_PER_SLOT')
+                                 or min(DEFAULT_THREADS_PER_SLOT, cpu_count))
+        self.slots = slots or _env_int('ENCODE_SLOTS') or max(1, cpu_count // self.threads_per_slot)
+
+    def _lock_path(self, index: int) -> Path:
+        return self.slot_dir / f"slot_{index}.lock"
+
+    def try_acquire(self) -> Optional[EncodeSlot]:
+        """비어 있는 슬롯을 바로 잡기 (없으면 None)"""
+        self.slot_dir.mkdir(parents=True, exist_ok=True)
+        # 여러 프로세스가 같은 슬롯부터 두드리지 않도록 시작 위치를 섞음
+        start = random.randrange(self.slots)
+        for offset in range(self.slots):
+            index = (start + offset) % self.slots
+            f = open(self._lock_path(index), 'a+')
+            if _try_lock(f):
+                return EncodeSlot(index, self.threads_per_slot, f)
+            f.close()
+        return None
+
+    def acquire(self, should_abort: Optional[Callable[[], bool]] = None,
+                timeout: Optional[float] = None) -> Optional[EncodeSlot]:
+        """
+        슬롯이 빌 때까지 대기
+
+        Returns:
+            EncodeSlot, should_abort()가 True가 되거나 timeout이 지나면 None
+        """
+        started = time.monotonic()
+        logged = False
+        while True:
+            slot = self.try_acquire()
+            if slot:
+                slot.waited = time.monotonic() - started
+                if logged:
+                    logger.info(f"🎟️ 인코딩 슬롯 {slot.index} 확보 ({slot.waited:.1f}초 대기)")
+                return slot
+            if should_abort and should_abort():
+                return None
+            if timeout is not None and time.monotonic() - started > timeout:
+                return None
+            if not logged:
+                logger.info(f"⏳ 인코딩 슬롯 대기 중... (전체 {self.slots}개 사용 중)")
+                logged = True
+            time.sleep(SLOT_POLL_INTERVAL)
+
+    @contextmanager
+    def slot(self):
+        """with pool.slot() as slot: ... (슬롯을 잡을 때까지 대기)"""
+        slot = self.acquire()
+        try:
+            yield slot
+        finally:
+            slot.release()
+
+
+def apply_thread_limit(args: Sequence, threads: int) -> List[str]:
+    """FFmpeg 명령의 출력 파일 앞에 -threads 추가 (이미 지정돼 있으면 그대로)"""
+    args = [str(a) for a in args]
+    if '-threads' in args:
+        return args
+    return [*args[:-1], '-threads', str(threads), args[-1]]
+
+
+_pool: Optional[EncodeSlotPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_encode_slot_pool() -> EncodeSlotPool:
+    """프로세스 공용 슬롯 풀 (설정은 첫 호출 시 환경변수에서 읽음)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = EncodeSlotPool()
+            logger.info(f"🎛️ 인코딩 슬롯: {_pool.slots}개 × {_pool.threads_per_slot}스레드 ({_pool.slot_dir})")
+        return _pool
@@ -0,0 +1,408 @@
+"""
+FFmpeg 작업 실행기 (진행률 / 타임아웃 / 취소 / 실행 지표)
+
+subprocess.run(capture_output=True) 대신 사용하는 공용 FFmpeg 실행기.
+
+- `-progress pipe:1`을 읽어 프레임/속도/남은 시간(ETA)을 주기적으로 로그에 남긴다
+- stderr는 줄 단위로 작업 로그(debug)에 흘려보내고 마지막 N줄만 메모리에 보관한다
+- 벽시계 기준 타임아웃, STOP 파일/취소 이벤트로 실행 중인 인코딩을 중단한다
+  (중단 시 FFmpeg와 그 자식 프로세스까지 프로세스 트리 전체 종료)
+- 실행마다 소요 시간/처리 속도 지표를 JSONL로 기록한다 (cache/metrics/ffmpeg_jobs.jsonl)
+- encode_slot=True면 머신 전체 인코딩 슬롯을 잡은 뒤 슬롯의 -threads 값으로 실행한다 (encode_slots)
+
+기존 호출부를 쉽게 바꿀 수 있도록 결과 객체는 returncode/stdout/stderr를 가지며,
+check=True면 subprocess.CalledProcessError, 타임아웃이면 subprocess.TimeoutExpired 계열 예외를 던진다.
+"""
+import os
+import json
+import time
+import signal
+import logging
+import threading
+import subprocess
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from .encode_slots import apply_thread_limit, get_encode_slot_pool
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_METRICS_PATH = Path(__file__).resolve().parents[2] / 'cache' / 'metrics' / 'ffmpeg_jobs.jsonl'
+
+# 타임아웃 기본값 (FFMPEG_JOB_TIMEOUT 환경변수로 변경, 0이면 무제한)
+DEFAULT_TIMEOUT = 3600
+# 출력 길이를 알 때 최소 보장 배속 (길이 × 이 값이 기본 타임아웃보다 길면 그 값을 사용)
+TIMEOUT_PER_OUTPUT_SECOND = 10
+# 메모리에 보관하는 stderr 줄 수
+STDERR_TAIL_LINES = 200
+# 진행률 로그 간격 (초)
+PROGRESS_LOG_INTERVAL = 10.0
+# STOP 파일/취소/타임아웃 확인 간격 (초)
+POLL_INTERVAL = 0.25
+
+_metrics_lock = threading.Lock()
+
+
+class FFmpegJobCancelled(RuntimeError):
+    """STOP 파일 또는 취소 요청으로 FFmpeg 작업을 중단함"""
+
+
+class FFmpegJobTimeout(subprocess.TimeoutExpired):
+    """FFmpeg 작업이 타임아웃을 넘겨 중단됨"""
+
+
+@dataclass
+class FFmpegProgress:
+    """-progress 출력 한 블록"""
+    frame: int = 0
+    fps: float = 0.0
+    out_time: float = 0.0
+    speed: Optional[float] = None
+    total_size: int = 0
+    finished: bool = False
+    duration: Optional[float] = None
+
+    @property
+    def percent(self) -> Optional[float]:
+        if not self.duration:
+            return None
+        return min(100.0, self.out_time / self.duration * 100)
+
+    @property
+    def eta(self) -> Optional[float]:
+        """남은 시간 (초) - 출력 길이와 속도를 알 때만"""
+        if not self.duration or not self.speed:
+            return None
+        return max(0.0, (self.duration - self.out_time) / self.speed)
+
+
+@dataclass
+class FFmpegJobResult:
+    """subprocess.CompletedProcess와 같은 형태의 실행 결과"""
+    args: List[str]
+    returncode: int
+    stderr: str
+    elapsed: float
+    progress: FFmpegProgress
+    stdout: str = ''
+    metrics: Dict = field(default_factory=dict)
+
+
+def parse_progress_block(lines: Sequence[str], progress: Optional[FFmpegProgress] = None) -> FFmpegProgress:
+    """
+    -progress 출력의 key=value 줄들을 FFmpegProgress로 변환
+
+    값이 N/A인 항목은 이전 값을 유지한다.
+    """
+    progress = progress or FFmpegProgress()
+    for line in lines:
+        key, sep, value = line.strip().partition('=')
+        if not sep or value in ('', 'N/A'):
+            continue
+        try:
+            if key == 'frame':
+                progress.frame = int(value)
+            elif key == 'fps':
+                progress.fps = float(value)
+            elif key in ('out_time_us', 'out_time_ms'):
+                # FFmpeg 버전에 따라 out_time_ms도 마이크로초 단위
+                progress.out_time = max(0.0, int(value) / 1_000_000)
+            elif key == 'speed':
+                progress.speed = float(value.rstrip('x'))
+            elif key == 'total_size':
+                progress.total_size = int(value)
+            elif key == 'progress':
+                progress.finished = value == 'end'
+        except ValueError:
+            continue
+    return progress
+
+
+def kill_process_tree(pid: int):
+    """프로세스와 모든 자식 프로세스 강제 종료"""
+    if PSUTIL_AVAILABLE:
+        try:
+            parent = psutil.Process(pid)
+            procs = parent.children(recursive=True) + [parent]
+        except psutil.NoSuchProcess:
+            return
+        for proc in procs:
+            try:
+                proc.kill()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        psutil.wait_procs(procs, timeout=3)
+    elif os.name == 'nt':
+        subprocess.run(['taskkill', '/F', '/T', '/PID', str(pid)], capture_output=True)
+    else:
+        # start_new_session=True로 띄웠으므로 프로세스 그룹 전체 종료
+        try:
+            os.killpg(os.getpgid(pid), signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+
+def _metrics_path() -> Path:
+    """실행 지표 파일 (FFMPEG_METRICS_PATH 환경변수 또는 cache/metrics/ffmpeg_jobs.jsonl)"""
+    return Path(os.getenv('FFMPEG_METRICS_PATH') or DEFAULT_METRICS_PATH)
+
+
+def _default_timeout(duration: Optional[float]) -> Optional[float]:
+    try:
+        timeout = float(os.getenv('FFMPEG_JOB_TIMEOUT') or DEFAULT_TIMEOUT)
+    except ValueError:
+        timeout = DEFAULT_TIMEOUT
+    if timeout <= 0:
+        return None
+    if duration:
+        timeout = max(timeout, duration * TIMEOUT_PER_OUTPUT_SECOND)
+    return timeout
+
+
+def _arg_value(args: Sequence[str], *options: str) -> Optional[str]:
+    for option in options:
+        if option in args[:-1]:
+            return args[list(args).index(option) + 1]
+    return None
+
+
+class FFmpegJob:
+    """FFmpeg 한 번 실행"""
+
+    def __init__(
+        self,
+        args: Sequence,
+        name: Optional[str] = None,
+        duration: Optional[float] = None,
+        timeout: Optional[float] = None,
+        stop_dir: Optional[Path] = None,
+        cancel_event: Optional[threading.Event] = None,
+        on_progress: Optional[Callable[[FFmpegProgress], None]] = None,
+        cwd: Optional[Path] = None,
+        record_metrics: bool = True,
+        encode_slot: bool = False,
+    ):
+        """
+        Args:
+            args: FFmpeg 명령 (첫 번째 요소가 실행 파일)
+            name: 로그/지표에 쓸 작업 이름 (기본: 출력 파일명)
+            duration: 예상 출력 길이(초) - 진행률/ETA 계산과 기본 타임아웃에 사용
+            timeout: 벽시계 타임아웃(초) (기본: FFMPEG_JOB_TIMEOUT 또는 1시간, 출력이 길면 길이 × 10)
+            stop_dir: 이 폴더에 STOP 파일이 생기면 중단
+            cancel_event: set()되면 중단
+            on_progress: 진행률 블록마다 호출되는 콜백
+            cwd: 작업 폴더 (ass 필터 등 상대 경로용)
+            record_metrics: 실행 지표 기록 여부
+            encode_slot: 인코딩 작업이면 True - 머신 전체 슬롯을 기다렸다가 슬롯 스레드 수로 실행
+                (스트림 복사/프레임 추출처럼 가벼운 작업은 False)
+        """
+        self.args = [str(a) for a in args]
+        self.name = name or Path(self.args[-1]).name
+        self.duration = duration
+        self.timeout = timeout if timeout is not None else _default_timeout(duration)
+        self.stop_file = Path(stop_dir) / 'STOP' if stop_dir else None
+        self.cancel_event = cancel_event or threading.Event()
+        self.on_progress = on_progress
+        self.cwd = str(cwd) if cwd else None
+        self.record_metrics = record_metrics
+        self.encode_slot = encode_slot
+        self.threads: Optional[int] = None
+        self.slot_wait = 0.0
+
+        self.progress = FFmpegProgress(duration=duration)
+        self._stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+        self._last_progress_log = 0.0
+
+    def cancel(self):
+        """실행 중인 작업 중단 요청"""
+        self.cancel_event.set()
+
+    def _command(self) -> List[str]:
+        # 출력이 stdout(pipe)이면 진행률을 받을 수 없으므로 그대로 실행
+        if '-progress' in self.args or self.args[-1] in ('-', 'pipe:1', 'pipe:'):
+            return list(self.args)
+        return [self.args[0], '-progress', 'pipe:1', '-nostats', *self.args[1:]]
+
+    def _read_progress(self, stream):
+        block = []
+        for line in stream:
+            block.append(line)
+            if line.startswith('progress='):
+                parse_progress_block(block, self.progress)
+                block = []
+                self._report_progress()
+
+    def _read_stderr(self, stream):
+        for line in stream:
+            line = line.rstrip()
+            if line:
+                self._stderr_tail.append(line)
+                logger.debug(f"[ffmpeg:{self.name}] {line}")
+
+    def _report_progress(self):
+        if self.on_progress:
+            try:
+                self.on_progress(self.progress)
+            except Exception as e:
+                logger.debug(f"진행률 콜백 오류: {e}")
+
+        now = time.monotonic()
+        if now - self._last_progress_log < PROGRESS_LOG_INTERVAL or self.progress.finished:
+            return
+        self._last_progress_log = now
+        p = self.progress
+        parts = [f"frame {p.frame}", f"{p.out_time:.1f}초"]
+        if p.speed:
+            parts.append(f"{p.speed:.2f}x")
+        if p.eta is not None:
+            parts.append(f"ETA {p.eta:.0f}초")
+        percent = f" {p.percent:.0f}%" if p.percent is not None else ""
+        logger.info(f"⏳ {self.name}{percent} ({', '.join(parts)})")
+
+    def _stop_reason(self, started: float) -> Optional[str]:
+        if self._cancel_requested():
+            return 'cancelled'
+        if self.timeout and time.monotonic() - started > self.timeout:
+            return 'timeout'
+        return None
+
+    def run(self, check: bool = False) -> FFmpegJobResult:
+        """
+        실행 후 완료될 때까지 대기
+
+        Raises:
+            FFmpegJobCancelled: STOP 파일/취소 요청
+            FFmpegJobTimeout: 타임아웃 (subprocess.TimeoutExpired 하위 클래스)
+            subprocess.CalledProcessError: check=True이고 종료 코드가 0이 아님
+        """
+        cmd = self._command()
+        if not self.encode_slot:
+            return self._execute(cmd, check)
+
+        slot = get_encode_slot_pool().acquire(should_abort=self._cancel_requested)
+        if slot is None:
+            raise FFmpegJobCancelled(f"FFmpeg 작업 취소 (슬롯 대기 중): {self.name}")
+        try:
+            self.threads = slot.threads
+            self.slot_wait = slot.waited
+            return self._execute(apply_thread_limit(cmd, slot.threads), check)
+        finally:
+            slot.release()
+
+    def _cancel_requested(self) -> bool:
+        return self.cancel_event.is_set() or bool(self.stop_file and self.stop_file.exists())
+
+    def _execute(self, cmd: List[str], check: bool) -> FFmpegJobResult:
+        started_at = datetime.now().isoformat(timespec='seconds')
+        started = time.monotonic()
+        popen_kwargs = {'start_new_session': True} if os.name != 'nt' else {}
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='ignore',
+            cwd=self.cwd,
+            **popen_kwargs
+        )
+        readers = [
+            threading.Thread(target=self._read_progress, args=(proc.stdout,), daemon=True),
+            threading.Thread(target=self._read_stderr, args=(proc.stderr,), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+
+        status = None
+        while proc.poll() is None:
+            status = self._stop_reason(started)
+            if status:
+                logger.warning(f"🛑 FFmpeg 중단 ({'타임아웃' if status == 'timeout' else '취소'}): {self.name}")
+                kill_process_tree(proc.pid)
+                break
+            try:
+                proc.wait(timeout=POLL_INTERVAL)
+            except subprocess.TimeoutExpired:
+                pass
+        returncode = proc.wait()
+        for reader in readers:
+            reader.join(timeout=5)
+        elapsed = time.monotonic() - started
+
+        status = status or ('ok' if returncode == 0 else 'failed')
+        stderr = "\n".join(self._stderr_tail)
+        metrics = self._metrics(started_at, elapsed, returncode, status)
+        if self.record_metrics:
+            self._write_metrics(metrics)
+        result = FFmpegJobResult(self.args, returncode, stderr, elapsed, self.progress, metrics=metrics)
+
+        if status == 'cancelled':
+            raise FFmpegJobCancelled(f"FFmpeg 작업 취소: {self.name}")
+        if status == 'timeout':
+            raise FFmpegJobTimeout(self.args, self.timeout, stderr=stderr)
+        if check and returncode != 0:
+            raise subprocess.CalledProcessError(returncode, self.args, output='', stderr=stderr)
+        return result
+
+    def _metrics(self, started_at: str, elapsed: float, returncode: int, status: str) -> Dict:
+        p = self.progress
+        return {
+            'name': self.name,
+            'started_at': started_at,
+            'status': status,
+            'returncode': returncode,
+            'elapsed': round(elapsed, 3),
+            'frames': p.frame,
+            'out_time': round(p.out_time, 3),
+            'speed': p.speed,
+            'realtime_factor': round(p.out_time / elapsed, 3) if elapsed > 0 and p.out_time else None,
+            'fps': round(p.frame / elapsed, 2) if elapsed > 0 and p.frame else None,
+            'output_bytes': p.total_size,
+            'video_codec': _arg_value(self.args, '-c:v', '-vcodec'),
+            'preset': _arg_value(self.args, '-preset'),
+            'threads': self.threads,
+            'slot_wait': round(self.slot_wait, 3) if self.encode_slot else None,
+        }
+
+    def _write_metrics(self, metrics: Dict):
+        path = _metrics_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with _metrics_lock, open(path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(metrics, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.debug(f"FFmpeg 지표 기록 실패: {e}")
+
+
+def run_ffmpeg(args: Sequence, check: bool = False, **kwargs) -> FFmpegJobResult:
+    """
+    FFmpegJob(args, **kwargs).run(check) 단축 함수
+
+    subprocess.run(cmd, capture_output=True, text=True) 자리에 그대로 쓸 수 있다.
+    """
+    return FFmpegJob(args, **kwargs).run(check=check)
+
+
+def load_job_metrics(path: Optional[Path] = None) -> List[Dict]:
+    """기록된 실행 지표 읽기 (분석용)"""
+    path = Path(path) if path else _metrics_path()
+    if not path.exists():
+        return []
+    records = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
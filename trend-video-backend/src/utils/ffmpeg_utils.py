@@ -2,22 +2,102 @@
 FFmpeg 공통 유틸리티 함수
 video_merge.py와 create_video_from_folder.py에서 공통으로 사용
 """
+import os
+import json
+import math
+import shutil
+import hashlib
+import threading
+import time
 import subprocess
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .json_store import atomic_write_json, load_versioned_json
+from .media_duration import read_media_duration
+from .ffmpeg_job import run_ffmpeg
+from .encode_slots import get_encode_slot_pool
 
 logger = logging.getLogger(__name__)
 
 
-def get_ffmpeg_path() -> Optional[str]:
-    """FFmpeg 경로 확인"""
+# 캐시 포맷이 바뀌면 올려서 기존 캐시를 무효화
+FFMPEG_CACHE_VERSION = 1
+DEFAULT_FFMPEG_CACHE_DIR = Path(__file__).resolve().parents[2] / 'cache' / 'ffmpeg'
+
+# 프로세스 메모리 캐시 (경로 탐색/인코더 목록은 프로세스당 한 번)
+_resolver_lock = threading.Lock()
+_ffmpeg_resolved = False
+_ffmpeg_path: Optional[str] = None
+_encoders: Dict[str, List[str]] = {}
+_encoder_probes: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+
+def _tools_cache_file() -> Path:
+    """디스크 캐시 파일 (FFMPEG_CACHE_DIR 환경변수 또는 cache/ffmpeg)"""
+    return Path(os.getenv('FFMPEG_CACHE_DIR') or DEFAULT_FFMPEG_CACHE_DIR) / 'tools.json'
+
+
+def _binary_signature(binary: str) -> Optional[Dict[str, float]]:
+    try:
+        stat = os.stat(binary)
+    except OSError:
+        return None
+    return {'mtime': stat.st_mtime, 'size': stat.st_size}
+
+
+def _load_tools_cache() -> Dict[str, Dict[str, Any]]:
+    data = load_versioned_json(_tools_cache_file(), FFMPEG_CACHE_VERSION)
+    return data.get('binaries', {}) if data else {}
+
+
+def _cached_binary_info(binary: str) -> Dict[str, Any]:
+    """바이너리 경로 + 수정 시간/크기가 같을 때만 디스크 캐시 엔트리 반환"""
+    signature = _binary_signature(binary)
+    entry = _load_tools_cache().get(binary)
+    if signature is None or not entry:
+        return {}
+    if entry.get('mtime') != signature['mtime'] or entry.get('size') != signature['size']:
+        return {}
+    return entry
+
+
+def _update_binary_info(binary: str, **fields):
+    """디스크 캐시 엔트리 갱신 (원자적 교체, 실패해도 무시)"""
+    signature = _binary_signature(binary)
+    if signature is None:
+        return
+
+    binaries = _load_tools_cache()
+    entry = binaries.get(binary) or {}
+    if entry.get('mtime') != signature['mtime'] or entry.get('size') != signature['size']:
+        entry = dict(signature)
+    entry.update(fields)
+    binaries[binary] = entry
+
     try:
-        result = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True)
-        if result.returncode == 0:
+        atomic_write_json(_tools_cache_file(), {'version': FFMPEG_CACHE_VERSION, 'binaries': binaries}, indent=2)
+    except OSError as e:
+        logger.warning(f"⚠️ FFmpeg 캐시 저장 실패: {e}")
+
+
+def _discover_ffmpeg() -> Optional[str]:
+    """FFmpeg 탐색 (시스템 ffmpeg → imageio-ffmpeg)"""
+    system_ffmpeg = shutil.which('ffmpeg')
+    if system_ffmpeg:
+        # 같은 바이너리로 이미 확인했으면 -version 실행 생략
+        if _cached_binary_info(system_ffmpeg).get('version_ok'):
             return 'ffmpeg'
-    except FileNotFoundError:
-        pass
+        try:
+            result = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True)
+            if result.returncode == 0:
+                _update_binary_info(system_ffmpeg, version_ok=True)
+                return 'ffmpeg'
+        except FileNotFoundError:
+            pass
 
     # imageio-ffmpeg 시도
     try:
@@ -29,50 +109,291 @@ def get_ffmpeg_path() -> Optional[str]:
     return None
 
 
-def get_video_duration(video_path: Path) -> float:
-    """FFprobe로 비디오 길이 확인"""
+def get_ffmpeg_path() -> Optional[str]:
+    """FFmpeg 경로 확인 (프로세스당 한 번만 탐색)"""
+    global _ffmpeg_resolved, _ffmpeg_path
+    if not _ffmpeg_resolved:
+        with _resolver_lock:
+            if not _ffmpeg_resolved:
+                _ffmpeg_path = _discover_ffmpeg()
+                _ffmpeg_resolved = True
+    return _ffmpeg_path
+
+
+def get_ffprobe_path() -> Optional[str]:
+    """FFmpeg와 같은 위치의 FFprobe 경로 (파일명만 치환)"""
     ffmpeg = get_ffmpeg_path()
     if not ffmpeg:
-        raise RuntimeError("FFmpeg not found.")
+        return None
+    folder, name = os.path.split(ffmpeg)
+    return os.path.join(folder, name.replace('ffmpeg', 'ffprobe'))
+
+
+def _parse_encoder_names(output: str) -> List[str]:
+    """ffmpeg -encoders 출력에서 인코더 이름 목록 추출 (범례 이후 행만)"""
+    names = []
+    in_list = False
+    for line in output.splitlines():
+        if not in_list:
+            in_list = line.strip().startswith('---')
+            continue
+        parts = line.split()
+        if len(parts) >= 2:
+            names.append(parts[1])
+    return names
+
+
+def get_ffmpeg_encoders(ffmpeg_path: Optional[str] = None) -> List[str]:
+    """
+    FFmpeg가 지원하는 인코더 목록 (프로세스 메모리 + 바이너리 경로/수정 시간 기준 디스크 캐시)
+
+    Raises:
+        subprocess.CalledProcessError, subprocess.TimeoutExpired: -encoders 실행 실패 시
+    """
+    ffmpeg = ffmpeg_path or get_ffmpeg_path()
+    if not ffmpeg:
+        return []
+
+    with _resolver_lock:
+        if ffmpeg in _encoders:
+            return _encoders[ffmpeg]
+
+    binary = shutil.which(ffmpeg) or ffmpeg
+    encoders = _cached_binary_info(binary).get('encoders')
+    if encoders is None:
+        result = subprocess.run(
+            [ffmpeg, "-hide_banner", "-encoders"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+            timeout=10
+        )
+        encoders = _parse_encoder_names(result.stdout)
+        _update_binary_info(binary, encoders=encoders)
+
+    with _resolver_lock:
+        _encoders[ffmpeg] = encoders
+    return encoders
+
+
+def reset_ffmpeg_resolver():
+    """프로세스 메모리 캐시 초기화 (디스크 캐시는 유지)"""
+    global _ffmpeg_resolved, _ffmpeg_path
+    with _resolver_lock:
+        _ffmpeg_resolved = False
+        _ffmpeg_path = None
+        _encoders.clear()
+        _encoder_probes.clear()
+
+
+# 미디어 메타데이터 캐시 포맷이 바뀌면 올려서 기존 캐시를 무효화
+PROBE_CACHE_VERSION = 2
+DEFAULT_PROBE_CACHE_DIR = Path(__file__).resolve().parents[2] / 'cache' / 'probe'
+PROBE_MAX_WORKERS = 8
+
+_PROBE_ENTRIES = (
+    'format=duration,format_name:'
+    'stream=codec_type,codec_name,profile,level,has_b_frames,extradata_hash,width,height,'
+    'pix_fmt,sample_aspect_ratio,r_frame_rate,sample_rate,channels,channel_layout'
+)
+
+_probe_memory: Dict[str, Dict[str, Any]] = {}
+_probe_lock = threading.Lock()
+
+
+def _probe_cache_dir() -> Path:
+    return Path(os.getenv('PROBE_CACHE_DIR') or DEFAULT_PROBE_CACHE_DIR)
+
+
+def _probe_key(media_path: Path) -> Optional[str]:
+    """(절대 경로, 크기, 수정 시간) 기준 캐시 키 - 파일이 없으면 None"""
+    try:
+        stat = os.stat(media_path)
+    except OSError:
+        return None
+    payload = f"v{PROBE_CACHE_VERSION}:{Path(media_path).resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
 
-    ffprobe_path = ffmpeg.replace('ffmpeg', 'ffprobe')
+
+def _parse_frame_rate(rate: Optional[str]) -> Optional[float]:
+    try:
+        num, _, den = (rate or '').partition('/')
+        return float(num) / float(den or 1)
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def _run_probe(media_path: Path) -> Optional[Dict[str, Any]]:
+    """ffprobe 한 번으로 길이/포맷/비디오·오디오 스트림 속성 조회 (캐시 없음)"""
+    ffprobe_path = get_ffprobe_path()
+    if not ffprobe_path:
+        raise RuntimeError("FFmpeg not found.")
 
     try:
         cmd = [
             ffprobe_path,
             '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1',
-            str(video_path)
+            '-show_entries', _PROBE_ENTRIES,
+            # SPS/PPS 등 코덱 초기화 데이터가 같은지 비교하기 위한 해시
+            '-show_data_hash', 'sha256',
+            '-of', 'json',
+            str(media_path)
         ]
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        return float(result.stdout.strip())
+        data = json.loads(result.stdout or '{}')
     except Exception as e:
-        logger.warning(f"⚠️ 비디오 길이 확인 실패: {e}")
+        logger.warning(f"⚠️ 미디어 정보 확인 실패 ({Path(media_path).name}): {e}")
+        return None
+
+    fmt = data.get('format') or {}
+    streams = data.get('streams') or []
+    if result.returncode != 0 or not (fmt or streams):
+        return None
+
+    try:
+        duration = float(fmt.get('duration'))
+    except (TypeError, ValueError):
+        duration = None
+
+    video = next((s for s in streams if s.get('codec_type') == 'video'), None)
+    audio = next((s for s in streams if s.get('codec_type') == 'audio'), None)
+    return {
+        'duration': duration,
+        'format_name': fmt.get('format_name'),
+        'video': {
+            'codec_name': video.get('codec_name'),
+            'profile': video.get('profile'),
+            'level': video.get('level'),
+            'has_b_frames': video.get('has_b_frames'),
+            'extradata_hash': video.get('extradata_hash'),
+            'width': video.get('width'),
+            'height': video.get('height'),
+            'pix_fmt': video.get('pix_fmt'),
+            'sample_aspect_ratio': video.get('sample_aspect_ratio'),
+            'r_frame_rate': video.get('r_frame_rate'),
+            'fps': _parse_frame_rate(video.get('r_frame_rate')),
+        } if video else None,
+        'audio': {
+            'codec_name': audio.get('codec_name'),
+            'profile': audio.get('profile'),
+            'sample_rate': audio.get('sample_rate'),
+            'channels': audio.get('channels'),
+            'channel_layout': audio.get('channel_layout'),
+        } if audio else None,
+    }
+
+
+def _load_probe(key: str, use_disk_cache: bool) -> Optional[Dict[str, Any]]:
+    with _probe_lock:
+        if key in _probe_memory:
+            return _probe_memory[key]
+    if not use_disk_cache:
+        return None
+
+    try:
+        with open(_probe_cache_dir() / key[:2] / f"{key}.json", 'r', encoding='utf-8') as f:
+            info = json.load(f)
+    except (OSError, ValueError):
+        return None
+    with _probe_lock:
+        _probe_memory[key] = info
+    return info
+
+
+def _store_probe(key: str, info: Dict[str, Any], use_disk_cache: bool):
+    with _probe_lock:
+        _probe_memory[key] = info
+    if not use_disk_cache:
+        return
+
+    try:
+        atomic_write_json(_probe_cache_dir() / key[:2] / f"{key}.json", info)
+    except OSError as e:
+        logger.warning(f"⚠️ 미디어 정보 캐시 저장 실패: {e}")
+
+
+def probe_media(media_path: Path, use_disk_cache: bool = True) -> Optional[Dict[str, Any]]:
+    """
+    미디어 파일 정보 조회 ((경로, 크기, 수정 시간) 기준 메모리 + 디스크 캐시)
+
+    Returns:
+        {
+            'duration': 초 (알 수 없으면 None),
+            'format_name': 컨테이너 포맷,
+            'video': {codec_name, profile, level, has_b_frames, extradata_hash, width, height,
+                      pix_fmt, sample_aspect_ratio, r_frame_rate, fps} 또는 None,
+            'audio': {codec_name, profile, sample_rate, channels, channel_layout} 또는 None,
+        }
+        파일이 없거나 ffprobe가 실패하면 None (실패 결과는 캐시하지 않음)
+    """
+    key = _probe_key(media_path)
+    if key is None:
+        logger.warning(f"⚠️ 미디어 파일 없음: {media_path}")
+        return None
+
+    info = _load_probe(key, use_disk_cache)
+    if info is None:
+        info = _run_probe(media_path)
+        if info is not None:
+            _store_probe(key, info, use_disk_cache)
+    return info
+
+
+def probe_many(
+    media_paths: Iterable[Path],
+    max_workers: Optional[int] = None,
+    use_disk_cache: bool = True
+) -> Dict[Path, Optional[Dict[str, Any]]]:
+    """
+    여러 미디어 파일 일괄 조회 (캐시 미스만 제한된 스레드 풀에서 동시에 ffprobe 실행)
+
+    Returns:
+        {경로: probe_media 결과} - 입력 순서 유지, 중복 경로는 한 번만 조회
+    """
+    paths = list(dict.fromkeys(Path(p) for p in media_paths))
+    if not paths:
+        return {}
+
+    workers = max(1, min(len(paths), max_workers or PROBE_MAX_WORKERS))
+    if workers == 1:
+        return {path: probe_media(path, use_disk_cache) for path in paths}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        infos = executor.map(lambda path: probe_media(path, use_disk_cache), paths)
+        return dict(zip(paths, infos))
+
+
+def get_video_duration(video_path: Path) -> float:
+    """비디오 길이 확인 (MP3/WAV/MP4는 헤더에서 바로 읽고, 그 외는 probe_media 캐시 사용)"""
+    duration = read_media_duration(video_path)
+    if duration is not None:
+        return duration
+
+    if not get_ffprobe_path():
+        raise RuntimeError("FFmpeg not found.")
+
+    info = probe_media(Path(video_path))
+    if not info or info['duration'] is None:
+        logger.warning(f"⚠️ 비디오 길이 확인 실패: {Path(video_path).name}")
         return 0.0
+    return info['duration']
 
 
 def get_audio_duration(audio_path: Path) -> float:
-    """FFprobe로 오디오 길이 확인"""
-    ffmpeg = get_ffmpeg_path()
-    if not ffmpeg:
-        raise RuntimeError("FFmpeg not found.")
+    """오디오 길이 확인 (MP3/WAV/MP4는 헤더에서 바로 읽고, 그 외는 probe_media 캐시 사용)"""
+    duration = read_media_duration(audio_path)
+    if duration is not None:
+        return duration
 
-    ffprobe_path = ffmpeg.replace('ffmpeg', 'ffprobe')
+    if not get_ffprobe_path():
+        raise RuntimeError("FFmpeg not found.")
 
-    try:
-        cmd = [
-            ffprobe_path,
-            '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1',
-            str(audio_path)
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        return float(result.stdout.strip())
-    except Exception as e:
-        logger.warning(f"⚠️ 오디오 길이 확인 실패: {e}")
+    info = probe_media(Path(audio_path))
+    if not info or info['duration'] is None:
+        logger.warning(f"⚠️ 오디오 길이 확인 실패: {Path(audio_path).name}")
         return 0.0
+    return info['duration']
 
 
 def format_srt_time(seconds: float) -> str:
@@ -97,9 +418,186 @@ def format_ass_timestamp(seconds: float) -> str:
 format_ass_time = format_ass_timestamp
 
 
+def parse_ass_timestamp(value: str) -> int:
+    """ASS 타임스탬프(h:mm:ss.cc)를 센티초 정수로 변환"""
+    hours, minutes, rest = value.strip().split(':')
+    secs, centisecs = rest.split('.')
+    return ((int(hours) * 60 + int(minutes)) * 60 + int(secs)) * 100 + int(centisecs[:2].ljust(2, '0'))
+
+
+def _format_ass_centiseconds(total: int) -> str:
+    secs, centisecs = divmod(max(total, 0), 100)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}.{centisecs:02d}"
+
+
+def merge_ass_files(segments: List[Tuple[Path, float]], output_path: Path) -> Path:
+    """
+    씬별 ASS 자막을 시작 시각만큼 밀어서 하나의 ASS 파일로 합침
+
+    헤더([Script Info], [V4+ Styles], [Events] Format)는 첫 파일 것을 사용한다.
+    (씬 ASS는 모두 같은 헤더로 생성됨)
+
+    Args:
+        segments: [(ASS 경로, 전체 타임라인에서의 시작 초), ...]
+        output_path: 합친 ASS 저장 경로
+    """
+    header: List[str] = []
+    events: List[str] = []
+
+    for index, (ass_path, offset) in enumerate(segments):
+        offset_cs = int(round(offset * 100))
+        with open(ass_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.rstrip('\n')
+                if line.startswith('Dialogue:'):
+                    layer, start, end, remainder = line[len('Dialogue:'):].split(',', 3)
+                    start = _format_ass_centiseconds(parse_ass_timestamp(start) + offset_cs)
+                    end = _format_ass_centiseconds(parse_ass_timestamp(end) + offset_cs)
+                    events.append(f"Dialogue:{layer},{start},{end},{remainder}")
+                elif index == 0:
+                    header.append(line)
+
+    while header and not header[-1].strip():
+        header.pop()
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(header + events) + '\n')
+    return output_path
+
+
+# 인코더별 기본 preset (속도 우선)
+ENCODER_PRESETS = {
+    'h264_nvenc': 'p4',
+    'h264_qsv': 'fast',
+    'h264_amf': 'speed',
+    'h264_videotoolbox': 'medium',
+    'libx264': 'ultrafast'
+}
+
+
+def get_encoder_preset(encoder_name: str) -> str:
+    """인코더에 맞는 기본 preset (모르는 인코더는 medium)"""
+    return ENCODER_PRESETS.get(encoder_name, 'medium')
+
+
+# 우선순위 순 H.264 인코더 후보 (libx264는 항상 마지막 폴백)
+ENCODER_CANDIDATES = ['h264_nvenc', 'h264_qsv', 'h264_amf', 'h264_videotoolbox', 'libx264']
+GPU_ENCODERS = frozenset(ENCODER_CANDIDATES[:-1])
+
+# 테스트 인코딩 클립 (1280x720). 길이가 다른 두 클립의 시간 차이로 속도를 재서
+# 프로세스 시작/GPU 세션 초기화(NVENC/QSV/AMF는 수백 ms) 시간이 속도에 섞이지 않게 한다
+ENCODER_PROBE_SIZE = '1280x720'
+ENCODER_PROBE_FRAMES = (25, 125)
+ENCODER_PROBE_TIMEOUT = 20
+# 드라이버 교체 등 바이너리 밖의 변화를 반영하도록 주기적으로 다시 측정
+ENCODER_PROBE_TTL = 7 * 24 * 3600
+# 측정 방식이 바뀌면 올려서 디스크에 캐시된 결과를 무효화
+ENCODER_PROBE_VERSION = 2
+
+
+def _timed_encode(ffmpeg: str, encoder: str, frames: int) -> Optional[float]:
+    """
+    테스트 클립 frames프레임 인코딩에 걸린 시간(초)
+
+    Returns:
+        걸린 시간, 인코더를 쓸 수 없으면 None
+    """
+    cmd = [
+        ffmpeg, '-hide_banner', '-v', 'error',
+        '-f', 'lavfi', '-i', f"testsrc2=size={ENCODER_PROBE_SIZE}:rate=25",
+        '-frames:v', str(frames),
+        '-c:v', encoder,
+        '-preset', get_encoder_preset(encoder),
+        '-pix_fmt', 'yuv420p',
+        '-threads', str(get_encode_slot_pool().threads_per_slot),
+        '-f', 'null', '-'
+    ]
+    started = time.perf_counter()
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=ENCODER_PROBE_TIMEOUT)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.info(f"   {encoder}: 사용 불가 ({e.__class__.__name__})")
+        return None
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        reason = (result.stderr or '').strip().splitlines()[-1:] or ['종료 코드 ' + str(result.returncode)]
+        logger.info(f"   {encoder}: 사용 불가 ({reason[0][:200]})")
+        return None
+    return elapsed
+
+
+def _test_encode(ffmpeg: str, encoder: str) -> Optional[float]:
+    """
+    작은 테스트 클립을 실제로 인코딩해 처리 속도(fps) 측정
+
+    짧은 클립과 긴 클립을 인코딩해 늘어난 프레임 수 / 늘어난 시간으로 계산하므로
+    두 실행에 똑같이 드는 프로세스 시작·인코더 세션 초기화 시간은 빠진다.
+
+    Returns:
+        초당 인코딩 프레임 수, 인코더를 쓸 수 없으면 None
+    """
+    short_frames, long_frames = ENCODER_PROBE_FRAMES
+    short_elapsed = _timed_encode(ffmpeg, encoder, short_frames)
+    if short_elapsed is None:
+        return None
+    long_elapsed = _timed_encode(ffmpeg, encoder, long_frames)
+    if long_elapsed is None:
+        return None
+    return (long_frames - short_frames) / max(long_elapsed - short_elapsed, 1e-3)
+
+
+def probe_encoders(ffmpeg_path: Optional[str] = None, force: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    후보 인코더를 실제 테스트 인코딩으로 검증하고 처리 속도 측정
+
+    `ffmpeg -encoders` 목록에 있어도 드라이버/GPU가 없으면 실패하므로 직접 인코딩해 본다.
+    결과는 프로세스 메모리와 바이너리 기준 디스크 캐시(cache/ffmpeg/tools.json)에 저장하고
+    ENCODER_PROBE_TTL이 지나면 다시 측정한다.
+
+    Returns:
+        {인코더: {'ok': bool, 'fps': float 또는 None}} (목록에 없는 인코더는 제외)
+    """
+    ffmpeg = ffmpeg_path or get_ffmpeg_path()
+    if not ffmpeg:
+        return {}
+
+    with _resolver_lock:
+        if not force and ffmpeg in _encoder_probes:
+            return _encoder_probes[ffmpeg]
+
+    binary = shutil.which(ffmpeg) or ffmpeg
+    cached = _cached_binary_info(binary).get('encoder_probe')
+    if (not force and cached and cached.get('version') == ENCODER_PROBE_VERSION
+            and time.time() - cached.get('probed_at', 0) < ENCODER_PROBE_TTL):
+        results = cached['results']
+    else:
+        available = set(get_ffmpeg_encoders(ffmpeg))
+        logger.info("🔬 인코더 테스트 인코딩 중...")
+        results = {}
+        # GPU 세션 경합을 피하려고 순서대로 측정
+        for encoder in ENCODER_CANDIDATES:
+            if encoder not in available:
+                continue
+            fps = _test_encode(ffmpeg, encoder)
+            results[encoder] = {'ok': fps is not None, 'fps': round(fps, 1) if fps else None}
+            if fps:
+                logger.info(f"   {encoder}: {fps:.0f} fps")
+        _update_binary_info(binary, encoder_probe={'version': ENCODER_PROBE_VERSION, 'probed_at': time.time(),
+                                                     'results': results})
+
+    with _resolver_lock:
+        _encoder_probes[ffmpeg] = results
+    return results
+
+
 def detect_best_encoder() -> Tuple[str, str]:
     """
-    Detect the best available video encoder (GPU or CPU).
+    Detect the fastest verified video encoder (GPU or CPU).
+
+    Each candidate listed by `ffmpeg -encoders` is test-encoded once (see probe_encoders),
+    so an encoder that is listed but unusable is never picked.
 
     Returns:
         Tuple[str, str]: (encoder_name, encoder_type) where encoder_type is 'gpu' or 'cpu'
@@ -109,39 +607,22 @@ def detect_best_encoder() -> Tuple[str, str]:
         logger.warning("FFmpeg not found, defaulting to libx264")
         return ("libx264", "cpu")
 
-    # Check for NVIDIA GPU encoder
     try:
-        result = subprocess.run(
-            [ffmpeg_path, "-hide_banner", "-encoders"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=True,
-            timeout=10
-        )
-
-        encoders = result.stdout
-
-        if "h264_nvenc" in encoders:
-            logger.info("Using NVIDIA GPU encoder (h264_nvenc)")
-            return ("h264_nvenc", "gpu")
-        elif "h264_qsv" in encoders:
-            logger.info("Using Intel Quick Sync encoder (h264_qsv)")
-            return ("h264_qsv", "gpu")
-        elif "h264_amf" in encoders:
-            logger.info("Using AMD AMF encoder (h264_amf)")
-            return ("h264_amf", "gpu")
-        elif "h264_videotoolbox" in encoders:
-            logger.info("Using Apple VideoToolbox encoder (h264_videotoolbox)")
-            return ("h264_videotoolbox", "gpu")
-        else:
-            logger.info("Using CPU encoder (libx264)")
-            return ("libx264", "cpu")
-
+        results = probe_encoders(ffmpeg_path)
     except Exception as e:
         logger.warning(f"Failed to detect encoder, defaulting to libx264: {e}")
         return ("libx264", "cpu")
 
+    working = {name: info['fps'] for name, info in results.items() if info.get('ok') and info.get('fps')}
+    if not working:
+        logger.info("Using CPU encoder (libx264)")
+        return ("libx264", "cpu")
+
+    best = max(working, key=working.get)
+    encoder_type = "gpu" if best in GPU_ENCODERS else "cpu"
+    logger.info(f"Using {encoder_type.upper()} encoder ({best}, {working[best]:.0f} fps)")
+    return (best, encoder_type)
+
 
 def concatenate_videos_with_fps_normalization(
     video_paths: List[Path],
@@ -151,7 +632,7 @@ def concatenate_videos_with_fps_normalization(
     target_height: int = 1080
 ) -> Path:
     """
-    FFmpeg filter_complex를 사용하여 비디오 병합 (FPS/해상도 통일)
+    비디오 병합 (FPS/해상도 통일, concat_engine.smart_concat 사용)
 
     Args:
         video_paths: 입력 비디오 파일 경로 리스트
@@ -172,57 +653,11 @@ def concatenate_videos_with_fps_normalization(
     for i, path in enumerate(video_paths, 1):
         logger.info(f"   {i}. {path.name}")
 
-    # 입력 파일들
-    input_args = []
-    for path in video_paths:
-        input_args.extend(['-i', str(path)])
-
-    # filter_complex 문자열 생성
-    # 모든 비디오를 target_width x target_height로 통일 + SAR 1:1 정규화 + FPS 통일 후 concat
-    scale_filters = []
-    concat_inputs = []
-    for i in range(len(video_paths)):
-        scale_filters.append(
-            f"[{i}:v]scale={target_width}:{target_height}:force_original_aspect_ratio=decrease,"
-            f"pad={target_width}:{target_height}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={target_fps}[v{i}]"
-        )
-        concat_inputs.append(f"[v{i}][{i}:a]")
-
-    filter_str = ";".join(scale_filters) + ";" + "".join(concat_inputs) + f"concat=n={len(video_paths)}:v=1:a=1[outv][outa]"
-
-    logger.info(f"🎬 FFmpeg filter_complex 명령 실행 중...")
-
-    cmd = [
-        ffmpeg,
-        '-y',  # 덮어쓰기
-        *input_args,  # 입력 파일들
-        '-filter_complex', filter_str,
-        '-map', '[outv]',
-        '-map', '[outa]',
-        '-c:v', 'libx264',
-        '-preset', 'medium',
-        '-crf', '18',  # 고품질
-        '-c:a', 'aac',
-        '-b:a', '192k',
-        str(output_path)
-    ]
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        timeout=600
-    )
-
-    if result.returncode != 0:
-        logger.error(f"❌ FFmpeg stderr: {result.stderr}")
-        raise RuntimeError(f"FFmpeg 실패:\n{result.stderr}")
+    # 공용 병합 엔진: 속성이 같으면 스트림 복사, 다른 구간만 재인코딩 (FPS/해상도 통일)
+    from .concat_engine import smart_concat
+    smart_concat(video_paths, output_path, target_width, target_height, target_fps, ffmpeg=ffmpeg)
 
     logger.info(f"✅ 비디오 병합 완료: {output_path.name}")
-
-    if not output_path.exists():
-        raise RuntimeError(f"출력 비디오가 생성되지 않았습니다: {output_path}")
-
     return output_path
 
 
@@ -256,3 +691,357 @@ def build_ffmpeg_video_filter(
         filter_parts.append(f"ass={subtitle_path}")
 
     return ",".join(filter_parts)
+
+
+# 정지 이미지 씬: 입력은 초당 1프레임만 읽고, 출력 직전에 목표 FPS로 맞춤
+STILL_INPUT_FPS = 1
+
+
+def build_still_scene_commands(
+    ffmpeg: str,
+    image_path: Path,
+    audio_path: Optional[Path],
+    output_path: Path,
+    prescaled_path: Path,
+    width: int,
+    height: int,
+    codec: str = 'libx264',
+    preset: str = 'ultrafast',
+    fps: int = 25,
+    subtitle_filter: Optional[str] = None,
+    crop_box: Optional[Tuple[int, int, int, int]] = None,
+    audio_bitrate: Optional[str] = None,
+    duration: Optional[float] = None
+) -> Tuple[List[str], List[str]]:
+    """
+    정지 이미지 씬용 FFmpeg 명령 2개 생성 (사전 리스케일 + 저프레임 입력 인코딩)
+
+    기존 `-loop 1 -vf scale,crop,fps=25` 방식은 같은 이미지를 매 프레임(25fps) 리스케일한다.
+    여기서는:
+        1. 이미지를 목표 해상도로 한 번만 scale+crop 하여 PNG로 저장
+        2. 그 PNG를 STILL_INPUT_FPS로 반복 입력 → fps 필터로 목표 FPS에 맞춤 (프레임 복제만 수행)
+           libx264는 -tune stillimage 사용
+
+    Args:
+        ffmpeg: FFmpeg 실행 파일 경로
+        image_path: 원본 이미지
+        audio_path: 나레이션 오디오 (None이면 비디오 전용 씬 - duration 길이로 인코딩)
+        output_path: 출력 씬 비디오
+        prescaled_path: 사전 리스케일 이미지 저장 경로 (PNG)
+        width: 목표 너비
+        height: 목표 높이
+        codec: 비디오 코덱
+        preset: 코덱 프리셋
+        fps: 출력 FPS (병합 시 다른 씬과 맞춰야 하는 타임라인, 기본값: 25)
+        subtitle_filter: 출력 FPS 적용 후 붙일 자막 필터 (예: "ass=scene_01_audio.ass")
+        crop_box: 원본 좌표계 크롭 영역 (left, top, right, bottom) - 9:16 스마트 크롭.
+                  주어지면 그 영역을 잘라 목표 해상도로 LANCZOS 리사이즈 (비율 맞춤 크롭 없음)
+        audio_bitrate: AAC 비트레이트 (예: "64k", 기본: FFmpeg 기본값)
+        duration: 비디오 전용 씬 길이 (초, audio_path가 None일 때 필수)
+
+    Returns:
+        (prescale_cmd, encode_cmd)
+    """
+    if crop_box:
+        left, top, right, bottom = crop_box
+        prescale_filter = f"crop={right - left}:{bottom - top}:{left}:{top},scale={width}:{height}:flags=lanczos"
+    else:
+        prescale_filter = f"scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height}"
+
+    prescale_cmd = [
+        ffmpeg, '-y',
+        '-i', str(image_path),
+        '-vf', prescale_filter,
+        '-frames:v', '1',
+        str(prescaled_path)
+    ]
+
+    video_filter = f"fps={fps}"
+    if subtitle_filter:
+        video_filter += f",{subtitle_filter}"
+
+    encode_cmd = [
+        ffmpeg,
+        '-loop', '1',
+        '-framerate', str(STILL_INPUT_FPS),
+        '-i', str(prescaled_path),
+    ]
+    if audio_path is not None:
+        encode_cmd.extend(['-i', str(audio_path)])
+    encode_cmd.extend([
+        '-vf', video_filter,
+        '-c:v', codec,
+        '-preset', preset,
+    ])
+    if codec == 'libx264':
+        encode_cmd.extend(['-tune', 'stillimage'])
+    if audio_path is None:
+        if duration is None:
+            raise ValueError("비디오 전용 씬은 duration이 필요합니다")
+        encode_cmd.extend(['-t', f"{duration:.3f}", '-an'])
+    else:
+        encode_cmd.extend(['-c:a', 'aac'])
+        if audio_bitrate:
+            encode_cmd.extend(['-b:a', audio_bitrate])
+        encode_cmd.append('-shortest')
+    encode_cmd.extend([
+        '-pix_fmt', 'yuv420p',
+        '-y',
+        str(output_path)
+    ])
+
+    return prescale_cmd, encode_cmd
+
+
+def build_image_scene_command(
+    ffmpeg: str,
+    image_path: Path,
+    audio_path: Path,
+    output_path: Path,
+    width: int,
+    height: int,
+    duration: float,
+    fps: int = 25,
+    fade: float = 1.0,
+    subtitle_filter: Optional[str] = None,
+    video_args: Optional[List[str]] = None,
+    audio_args: Optional[List[str]] = None
+) -> List[str]:
+    """
+    이미지 + 나레이션 씬을 FFmpeg 명령 하나로 렌더링 (MoviePy ImageClip 파이프라인 대체)
+
+    필터 그래프 하나로 처리:
+        비율 맞춤 중앙 크롭 → 출력 FPS → 페이드 인/아웃 → ASS 자막 번인
+    이미지는 STILL_INPUT_FPS로 반복 입력하므로 스케일/크롭은 출력 프레임마다가 아니라 초당 한 번만 수행된다.
+    자막은 페이드 뒤에 입히므로 페이드 중에도 그대로 보인다 (MoviePy 버전과 같음).
+
+    Args:
+        ffmpeg: FFmpeg 실행 파일 경로
+        image_path: 씬 이미지
+        audio_path: 나레이션 오디오
+        output_path: 출력 씬 비디오
+        width, height: 목표 해상도
+        duration: 씬 길이 (초, 나레이션 길이)
+        fps: 출력 FPS
+        fade: 페이드 인/아웃 길이 (초, 씬이 fade*2 이하로 짧으면 생략, 0이면 사용 안 함)
+        subtitle_filter: 페이드 뒤에 붙일 자막 필터 (예: "ass=scene_01_audio.ass")
+        video_args: 비디오 인코딩 옵션 (기본: libx264 medium)
+        audio_args: 오디오 인코딩 옵션 (기본: AAC)
+
+    Returns:
+        FFmpeg 명령
+    """
+    filters = [
+        f"scale={width}:{height}:force_original_aspect_ratio=increase",
+        f"crop={width}:{height}",
+        "setsar=1",
+        f"fps={fps}",
+        "format=yuv420p",
+    ]
+    if fade and duration > fade * 2:
+        filters.append(f"fade=t=in:st=0:d={fade:g}")
+        filters.append(f"fade=t=out:st={duration - fade:.3f}:d={fade:g}")
+    if subtitle_filter:
+        filters.append(subtitle_filter)
+
+    return [
+        ffmpeg, '-y',
+        '-loop', '1',
+        '-framerate', str(STILL_INPUT_FPS),
+        '-i', str(image_path),
+        '-i', str(audio_path),
+        '-map', '0:v:0',
+        '-map', '1:a:0',
+        '-vf', ",".join(filters),
+        *(video_args or ['-c:v', 'libx264', '-preset', 'medium']),
+        *(audio_args or ['-c:a', 'aac']),
+        '-t', f"{duration:.3f}",
+        '-pix_fmt', 'yuv420p',
+        str(output_path)
+    ]
+
+
+def stream_signature(info: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    probe_media 결과에서 concat 스트림 복사 비교용 속성만 추출
+
+    Returns:
+        {'video': {...}, 'audio': {...}} (오디오가 없으면 'audio'는 None),
+        조회 실패 또는 비디오 스트림이 없으면 None
+    """
+    if not info or not info.get('video'):
+        return None
+    video = info['video']
+    audio = info.get('audio')
+
+    # SAR 미지정(N/A, 0:1)은 정사각 픽셀로 간주
+    sar = video.get('sample_aspect_ratio')
+    if sar in (None, 'N/A', '0:1'):
+        sar = '1:1'
+
+    return {
+        'video': {
+            'codec_name': video.get('codec_name'),
+            'profile': video.get('profile'),
+            # 레벨/B-프레임/extradata(SPS·PPS)가 다르면 스트림 복사 결과가 디코더마다 깨질 수 있음
+            'level': video.get('level'),
+            'has_b_frames': video.get('has_b_frames'),
+            'extradata_hash': video.get('extradata_hash'),
+            'width': video.get('width'),
+            'height': video.get('height'),
+            'pix_fmt': video.get('pix_fmt'),
+            'sample_aspect_ratio': sar,
+            'r_frame_rate': video.get('r_frame_rate'),
+        },
+        'audio': {
+            'codec_name': audio.get('codec_name'),
+            'profile': audio.get('profile'),
+            'sample_rate': audio.get('sample_rate'),
+            'channels': audio.get('channels'),
+        } if audio else None,
+    }
+
+
+def probe_stream_signature(video_path: Path) -> Optional[Dict[str, Any]]:
+    """concat 스트림 복사 가능 여부 판단용 비디오/오디오 스트림 속성 조회 (probe_media 캐시 사용)"""
+    return stream_signature(probe_media(Path(video_path)))
+
+
+def _signature_key(signature: Dict[str, Any]) -> str:
+    return json.dumps(signature, sort_keys=True)
+
+
+def find_concat_outliers(
+    signatures: Dict[Path, Optional[Dict[str, Any]]],
+    width: int,
+    height: int,
+    fps: Union[int, str] = 25,
+    require_audio: bool = True
+) -> Tuple[Optional[Dict[str, Any]], List[Path]]:
+    """
+    스트림 복사 concat 기준 속성과 재인코딩이 필요한 파일 찾기
+
+    목표 해상도/FPS에 맞고 오디오가 있는 파일들 중 가장 많은 속성을 기준으로 삼는다.
+
+    Args:
+        signatures: {경로: probe_stream_signature 결과}
+        width, height, fps: 최종 영상 해상도/FPS (fps는 정수 또는 '30000/1001' 같은 분수 문자열)
+        require_audio: False면 오디오 없는 파일도 기준 후보 (비디오 전용 병합)
+
+    Returns:
+        (기준 속성, 기준과 다른 파일 목록 - 입력 순서 유지).
+        기준으로 삼을 파일이 없으면 (None, 전체 파일 목록)
+    """
+    rate = fps if isinstance(fps, str) else f"{fps}/1"
+
+    def is_candidate(sig):
+        if not sig or (require_audio and not sig['audio']):
+            return False
+        video = sig['video']
+        return (video['width'] == width and video['height'] == height
+                and video['r_frame_rate'] == rate
+                and video['sample_aspect_ratio'] == '1:1')
+
+    counts = Counter(_signature_key(sig) for sig in signatures.values() if is_candidate(sig))
+    if not counts:
+        return None, list(signatures)
+
+    reference_key = counts.most_common(1)[0][0]
+    reference = json.loads(reference_key)
+    outliers = [path for path, sig in signatures.items()
+                if not sig or _signature_key(sig) != reference_key]
+    return reference, outliers
+
+
+def write_concat_list(paths: List[Path], list_path: Path):
+    """concat demuxer 목록 파일 작성 (절대 경로, 작은따옴표 이스케이프 - '-safe 0'으로 읽기)"""
+    with open(list_path, 'w', encoding='utf-8') as f:
+        for path in paths:
+            escaped = str(Path(path).resolve()).replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+
+
+def concat_stream_copy(ffmpeg: str, video_paths: List[Path], output_path: Path, list_path: Path,
+                       stop_dir: Optional[Path] = None):
+    """
+    concat demuxer + -c copy로 재인코딩 없이 병합 (모든 입력이 같은 스트림 속성이어야 함)
+
+    Returns:
+        FFmpegJobResult (returncode, stderr)
+    """
+    write_concat_list(video_paths, list_path)
+
+    cmd = [
+        ffmpeg, '-y',
+        '-f', 'concat', '-safe', '0',
+        '-i', str(list_path),
+        '-c', 'copy',
+        str(output_path)
+    ]
+    return run_ffmpeg(cmd, stop_dir=stop_dir)
+
+
+def build_single_pass_graph(
+    segments: List[Dict[str, Any]],
+    width: int,
+    height: int,
+    fps: int = 25,
+    subtitle_filename: Optional[str] = None
+) -> Tuple[List[str], str]:
+    """
+    프로젝트 전체를 한 번에 인코딩하는 입력 인자와 filter_complex 그래프 생성
+
+    씬마다 미디어 입력 1개 + 나레이션 입력 1개를 받아,
+    비디오는 씬 길이만큼 자른 뒤 하나로 concat하고 (통합 ASS 자막은 concat 이후 한 번만 적용),
+    나레이션은 씬 길이에 맞춰 패딩/자른 뒤 별도 concat으로 하나의 오디오 트랙으로 만든다.
+
+    비디오 프레임 수는 누적 시각 기준으로 반올림하므로 씬이 많아도 오디오와 어긋나지 않는다.
+
+    Args:
+        segments: [{'media_type': 'image'|'video', 'media_path': Path,
+                    'audio_path': Path, 'duration': float}, ...] (재생 순서)
+        width, height: 출력 해상도
+        fps: 출력 FPS
+        subtitle_filename: 통합 ASS 파일명 (FFmpeg 실행 디렉토리 기준, 없으면 자막 없음)
+
+    Returns:
+        (입력 인자 리스트, filter_complex 그래프) - 출력 라벨은 [outv], [outa]
+    """
+    input_args: List[str] = []
+    video_filters: List[str] = []
+    audio_filters: List[str] = []
+    cursor = 0.0
+
+    for i, segment in enumerate(segments):
+        duration = segment['duration']
+        frames = max(1, round((cursor + duration) * fps) - round(cursor * fps))
+        cursor += duration
+
+        if segment['media_type'] == 'image':
+            # 정지 이미지: 초당 1프레임 입력 → fps 필터로 타임라인만 채움
+            input_args.extend(['-loop', '1', '-framerate', str(STILL_INPUT_FPS),
+                               '-t', str(math.ceil(duration) + 1), '-i', str(segment['media_path'])])
+            video_filter = (f"scale={width}:{height}:force_original_aspect_ratio=increase,"
+                            f"crop={width}:{height},setsar=1,fps={fps}")
+        else:
+            # 비디오: 해상도 통일 후 나레이션보다 짧으면 마지막 프레임 freeze
+            input_args.extend(['-i', str(segment['media_path'])])
+            video_filter = (f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+                            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={fps},"
+                            f"tpad=stop_mode=clone:stop_duration={duration:.3f}")
+        input_args.extend(['-i', str(segment['audio_path'])])
+
+        video_filters.append(f"[{2 * i}:v]{video_filter},trim=end_frame={frames},setpts=PTS-STARTPTS[v{i}]")
+        audio_filters.append(f"[{2 * i + 1}:a]apad=whole_dur={duration:.3f},"
+                             f"atrim=duration={duration:.3f},asetpts=PTS-STARTPTS[a{i}]")
+
+    count = len(segments)
+    video_out = 'vcat' if subtitle_filename else 'outv'
+    graph = video_filters + audio_filters + [
+        "".join(f"[v{i}]" for i in range(count)) + f"concat=n={count}:v=1:a=0[{video_out}]",
+        "".join(f"[a{i}]" for i in range(count)) + f"concat=n={count}:v=0:a=1[outa]",
+    ]
+    if subtitle_filename:
+        graph.append(f"[vcat]ass={subtitle_filename}[outv]")
+
+    return input_args, ";\n".join(graph)
@@ -0,0 +1,303 @@
+"""
+얼굴 중심(포커스) 감지 서비스
+
+9:16 스마트 크롭에서 쓰는 Haar Cascade 얼굴 감지를 공통화한 모듈.
+
+- Cascade 분류기는 프로세스당 한 번만 로드
+- 긴 변 DETECT_MAX_SIDE 이하로 축소한 그레이스케일에서 감지 후 원본 좌표로 환산
+- 결과(얼굴 없음 포함)는 이미지 내용 해시 기준으로 메모리 + 디스크 캐시
+- 폴더 단위 일괄 감지는 프로세스 풀에서 병렬 실행
+
+캐시 폴더 구조:
+    cache/focus/
+        ab/ab12...ef.json   {"focus": [x, y]} 또는 {"focus": null}
+"""
+import os
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+
+from .json_store import atomic_write_json
+
+try:
+    import cv2
+    OPENCV_AVAILABLE = True
+except ImportError:
+    OPENCV_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 감지 방식(축소 크기, 파라미터)이 바뀌면 올려서 기존 캐시를 무효화
+FOCUS_CACHE_VERSION = 1
+DETECT_MAX_SIDE = 800
+CASCADE_NAME = 'haarcascade_frontalface_default.xml'
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[2] / 'cache' / 'focus'
+
+FocusPoint = Optional[Tuple[int, int]]
+
+_cascade = None
+_cascade_lock = threading.Lock()
+# 분류기 하나를 여러 스레드가 공유하므로 감지 호출은 직렬화
+_detect_lock = threading.Lock()
+
+
+def _get_cascade():
+    """프로세스 공용 Cascade 분류기 (최초 호출 시 한 번만 로드)"""
+    global _cascade
+    if _cascade is None:
+        with _cascade_lock:
+            if _cascade is None:
+                _cascade = cv2.CascadeClassifier(cv2.data.haarcascades + CASCADE_NAME)
+    return _cascade
+
+
+def detect_focus_point(image_path: Path) -> FocusPoint:
+    """
+    캐시 없이 얼굴 감지 (프로세스 풀 워커에서도 호출)
+
+    Returns:
+        가장 큰 얼굴의 원본 좌표계 중심 (center_x, center_y) 또는 None
+    """
+    if not OPENCV_AVAILABLE:
+        return None
+
+    gray = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+    if gray is None:
+        return None
+
+    height, width = gray.shape[:2]
+    scale = min(1.0, DETECT_MAX_SIDE / max(width, height))
+    if scale < 1.0:
+        gray = cv2.resize(gray, (round(width * scale), round(height * scale)), interpolation=cv2.INTER_AREA)
+
+    # minSize는 원본 기준 30px (축소 비율만큼 줄임)
+    min_side = max(1, round(30 * scale))
+    cascade = _get_cascade()
+    with _detect_lock:
+        faces = cascade.detectMultiScale(
+            gray,
+            scaleFactor=1.1,
+            minNeighbors=5,
+            minSize=(min_side, min_side)
+        )
+
+    if len(faces) == 0:
+        return None
+
+    # 가장 큰 얼굴을 주요 인물로 선택
+    x, y, w, h = max(faces, key=lambda f: f[2] * f[3])
+    return (int((x + w / 2) / scale), int((y + h / 2) / scale))
+
+
+def _detect_safely(image_path: str) -> FocusPoint:
+    try:
+        return detect_focus_point(Path(image_path))
+    except Exception as e:
+        logger.warning(f"  ⚠️ 얼굴 감지 실패: {e}")
+        return None
+
+
+def _content_key(image_path: Path) -> str:
+    h = hashlib.sha1(f"v{FOCUS_CACHE_VERSION}:{DETECT_MAX_SIDE}:{CASCADE_NAME}:".encode('utf-8'))
+    with open(image_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+class FocusDetector:
+    """내용 해시 기준 캐시를 가진 얼굴 중심 감지기"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, use_disk_cache: bool = True):
+        """
+        Args:
+            cache_dir: 디스크 캐시 폴더 (기본: FOCUS_CACHE_DIR 환경변수 또는 cache/focus)
+            use_disk_cache: 디스크 캐시 사용 여부 (False면 프로세스 메모리 캐시만 사용)
+        """
+        self.cache_dir = None
+        if use_disk_cache:
+            self.cache_dir = Path(cache_dir or os.getenv('FOCUS_CACHE_DIR') or DEFAULT_CACHE_DIR)
+        self._memory: Dict[str, FocusPoint] = {}
+        self._lock = threading.Lock()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _lookup(self, key: str) -> Tuple[bool, FocusPoint]:
+        """(히트 여부, 결과)"""
+        with self._lock:
+            if key in self._memory:
+                return True, self._memory[key]
+        if self.cache_dir is None:
+            return False, None
+
+        try:
+            with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                focus = json.load(f)['focus']
+        except (OSError, ValueError, KeyError):
+            return False, None
+
+        focus = tuple(focus) if focus else None
+        with self._lock:
+            self._memory[key] = focus
+        return True, focus
+
+    def _store(self, key: str, focus: FocusPoint):
+        with self._lock:
+            self._memory[key] = focus
+        if self.cache_dir is None:
+            return
+
+        entry_path = self._entry_path(key)
+        try:
+            atomic_write_json(entry_path, {'focus': list(focus) if focus else None})
+        except OSError as e:
+            logger.warning(f"⚠️ 포커스 캐시 저장 실패: {e}")
+
+    def detect(self, image_path: Path) -> FocusPoint:
+        """
+        이미지에서 인물 중심 좌표 반환 (캐시 우선)
+
+        Returns:
+            (center_x, center_y) 또는 None (감지 실패 시)
+        """
+        if not OPENCV_AVAILABLE:
+            return None
+
+        try:
+            key = _content_key(Path(image_path))
+        except OSError as e:
+            logger.warning(f"  ⚠️ 얼굴 감지 실패: {e}")
+            return None
+
+        hit, focus = self._lookup(key)
+        if not hit:
+            focus = _detect_safely(str(image_path))
+            self._store(key, focus)
+
+        if focus:
+            logger.info(f"  ✅ 얼굴 감지됨: ({focus[0]}, {focus[1]}){' (캐시)' if hit else ''}")
+        else:
+            logger.info(f"  ℹ️ 얼굴 미감지 (중앙 크롭 사용){' (캐시)' if hit else ''}")
+        return focus
+
+    def detect_many(self, image_paths: Iterable[Path], max_workers: Optional[int] = None) -> Dict[Path, FocusPoint]:
+        """
+        여러 이미지 일괄 감지 (캐시 미스만 프로세스 풀에서 병렬 실행)
+
+        Returns:
+            {이미지 경로: 중심 좌표 또는 None}
+        """
+        results: Dict[Path, FocusPoint] = {}
+        if not OPENCV_AVAILABLE:
+            return {Path(p): None for p in image_paths}
+
+        misses: Dict[str, Path] = {}
+        keys: Dict[Path, str] = {}
+        for path in dict.fromkeys(Path(p) for p in image_paths):
+            try:
+                key = _content_key(path)
+            except OSError:
+                results[path] = None
+                continue
+            keys[path] = key
+            hit, focus = self._lookup(key)
+            if hit:
+                results[path] = focus
+            else:
+                misses.setdefault(key, path)
+
+        if misses:
+            workers = max_workers or max(1, min(len(misses), (os.cpu_count() or 2) - 1))
+            logger.info(f"🔍 얼굴 감지: {len(misses)}개 이미지 (캐시 히트 {len(keys) - len(misses)}개, 워커 {workers}개)")
+            miss_items = list(misses.items())
+            if workers == 1 or len(miss_items) == 1:
+                detected = [_detect_safely(str(path)) for _, path in miss_items]
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    detected = list(executor.map(_detect_safely, [str(path) for _, path in miss_items]))
+            for (key, _), focus in zip(miss_items, detected):
+                self._store(key, focus)
+
+        for path, key in keys.items():
+            if path not in results:
+                results[path] = self._lookup(key)[1]
+        return results
+
+
+def is_landscape_16_9(width: int, height: int) -> bool:
+    """16:9 가로 이미지인지 확인 (허용 오차 ±0.2)"""
+    return abs(width / height - 16 / 9) < 0.2
+
+
+def vertical_crop_box(width: int, height: int, focus_point: FocusPoint = None) -> Tuple[int, int, int, int]:
+    """
+    가로 이미지를 9:16 세로로 자를 영역 계산 (스마트 크롭)
+    얼굴이 감지되면 얼굴 중심으로, 아니면 중앙(세로로 긴 이미지는 상단) 크롭
+
+    Returns:
+        (left, top, right, bottom) - 원본 좌표계
+    """
+    # 목표 비율: 9:16 (세로)
+    target_ratio = 9 / 16
+
+    # 현재 높이를 기준으로 9:16 비율의 너비 계산
+    new_width = int(height * target_ratio)
+
+    if new_width > width:
+        # 높이를 기준으로 계산한 너비가 원본보다 크면, 너비를 기준으로 재계산
+        new_height = int(width / target_ratio)
+
+        # 얼굴이 감지되면 얼굴 중심으로, 아니면 상단 크롭
+        if focus_point:
+            center_y = focus_point[1]
+            top = max(0, center_y - new_height // 2)
+            bottom = min(height, top + new_height)
+
+            if bottom > height:
+                bottom = height
+                top = bottom - new_height
+            if top < 0:
+                top = 0
+                bottom = new_height
+        else:
+            # 상단 부분을 우선적으로 크롭
+            top = 0
+            bottom = new_height
+
+        return (0, top, width, bottom)
+
+    # 높이는 그대로, 너비를 크롭
+    if focus_point:
+        center_x = focus_point[0]
+        left = max(0, center_x - new_width // 2)
+        right = min(width, left + new_width)
+
+        if right > width:
+            right = width
+            left = right - new_width
+        if left < 0:
+            left = 0
+            right = new_width
+    else:
+        # 중앙 크롭
+        left = (width - new_width) // 2
+        right = left + new_width
+
+    return (left, 0, right, height)
+
+
+_default_detector: Optional[FocusDetector] = None
+
+
+def get_focus_detector() -> FocusDetector:
+    """프로세스 공용 FocusDetector"""
+    global _default_detector
+    if _default_detector is None:
+        _default_detector = FocusDetector()
+    return _default_detector
@@ -0,0 +1,66 @@
+"""
+JSON 상태 파일 읽기/쓰기 공통 함수
+
+매니페스트, 체크포인트, 디스크 캐시 엔트리는 모두 같은 방식으로 저장한다.
+
+- 쓰기: 같은 폴더의 임시 파일에 쓴 뒤 os.replace (중간에 죽어도 반쯤 쓴 파일이 남지 않음)
+- 읽기: 최상위 'version'이 다르거나 손상된 문서는 없는 것으로 보고 새로 작성
+"""
+import os
+import json
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def atomic_write_json(path: Path, data: Any, indent: Optional[int] = None):
+    """
+    JSON을 임시 파일 → os.replace로 원자적으로 저장 (상위 폴더 자동 생성)
+
+    Raises:
+        OSError: 저장 실패 (임시 파일은 정리됨)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=indent)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def load_versioned_json(path: Path, version: int, label: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    최상위 'version'이 같은 JSON 문서 읽기
+
+    Args:
+        label: 로그에 쓸 이름 (없으면 손상/버전 변경도 조용히 무시)
+
+    Returns:
+        문서 딕셔너리, 파일이 없거나 손상됐거나 버전이 다르면 None
+    """
+    path = Path(path)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        if label:
+            logger.warning(f"⚠️ {label} 읽기 실패 ({path.name}): {e}")
+        return None
+
+    if not isinstance(data, dict) or data.get('version') != version:
+        if label:
+            logger.info(f"ℹ️ {label} 형식 변경 → 기록 무시 ({path.name})")
+        return None
+    return data
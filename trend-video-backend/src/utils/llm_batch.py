@@ -0,0 +1,268 @@
+"""
+LLM 요청 일괄 처리 (동시 실행 제한 / 제공자별 속도 제한 / 지터 재시도 / 체크포인트)
+
+씬 수십 개의 상세 나레이션을 한 씬씩 순서대로 요청하면 대부분의 시간이 응답 대기다.
+씬끼리는 서로의 결과를 쓰지 않으므로 여러 개를 동시에 요청하되,
+
+- 제공자별 분당 요청 수를 넘지 않도록 요청 간격을 벌리고 (프로세스 전체 공유)
+- 429/5xx/연결 오류/깨진 JSON 응답은 지수 백오프 + 전체 지터로 재시도하고
+- 결과는 완료 순서와 관계없이 입력 순서대로 돌려주고
+- 끝난 항목은 바로 체크포인트에 저장해 중단 후 재실행 시 빠진 항목만 다시 요청한다
+
+이미지 생성 제공자(dalle/imagen3/huggingface/replicate)도 같은 제한기를 쓴다.
+
+환경변수:
+    LLM_RPM_<PROVIDER> / LLM_RPM: 분당 요청 수 (0이면 제한 없음)
+    LLM_CONCURRENCY_<PROVIDER> / LLM_CONCURRENCY: 동시 요청 수
+"""
+import os
+import time
+import random
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from .json_store import atomic_write_json, load_versioned_json
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# 제공자별 기본값 (분당 요청 수, 동시 요청 수) - 로컬 Ollama는 GPU 하나를 나눠 쓰므로 1개씩
+PROVIDER_LIMITS = {
+    'openai': (60, 6),
+    'groq': (30, 3),
+    'grok': (60, 4),
+    'ollama': (0, 1),
+    # 이미지 생성
+    'dalle': (15, 4),
+    'imagen3': (20, 4),
+    'huggingface': (30, 2),
+    'replicate': (60, 4),
+}
+DEFAULT_LIMITS = (30, 3)
+
+RETRY_ATTEMPTS = 4
+RETRY_BASE_DELAY = 2.0
+RETRY_MAX_DELAY = 60.0
+
+# 기록 형식이 바뀌면 올려서 기존 체크포인트를 무시
+CHECKPOINT_VERSION = 1
+
+
+def _env_int(provider: str, name: str, default: int) -> int:
+    for key in (f"{name}_{provider.upper()}", name):
+        value = os.environ.get(key)
+        if value:
+            try:
+                return max(0, int(value))
+            except ValueError:
+                logger.warning(f"⚠️ {key}={value!r} 무시 (정수가 아님)")
+    return default
+
+
+def provider_rpm(provider: str) -> int:
+    """제공자의 분당 요청 수 (0이면 제한 없음)"""
+    return _env_int(provider, 'LLM_RPM', PROVIDER_LIMITS.get(provider, DEFAULT_LIMITS)[0])
+
+
+def provider_concurrency(provider: str) -> int:
+    """제공자의 동시 요청 수 (최소 1)"""
+    return max(1, _env_int(provider, 'LLM_CONCURRENCY', PROVIDER_LIMITS.get(provider, DEFAULT_LIMITS)[1]))
+
+
+class RateLimiter:
+    """분당 요청 수 제한 - 요청 시작 시각을 60/rpm 초 간격으로 예약 (스레드 안전)"""
+
+    def __init__(self, rpm: int, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.interval = 60.0 / rpm if rpm > 0 else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> float:
+        """내 차례까지 대기하고 대기한 시간(초)을 반환"""
+        if not self.interval:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        wait = slot - now
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def defer(self, seconds: float):
+        """서버가 속도 제한(429)을 알려 오면 이후 예약을 모두 뒤로 미룸"""
+        with self._lock:
+            self._next_slot = max(self._next_slot, self._clock() + seconds)
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str) -> RateLimiter:
+    """제공자별 속도 제한기 (프로세스 전체 공유)"""
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limiter = _limiters[provider] = RateLimiter(provider_rpm(provider))
+        return limiter
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status if isinstance(status, int) else None
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    return _status_code(error) == 429 or type(error).__name__ == 'RateLimitError'
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    다시 요청하면 성공할 수 있는 오류인지
+
+    - HTTP 408/409/429/5xx, 연결/타임아웃 오류
+    - 깨진 JSON 응답이나 필드 누락 (ValueError/KeyError) - 같은 프롬프트도 다시 요청하면 대개 정상 응답
+    """
+    status = _status_code(error)
+    if status is not None:
+        return status in (408, 409, 429) or status >= 500
+    if type(error).__name__ in ('APIConnectionError', 'APITimeoutError', 'RateLimitError'):
+        return True
+    return isinstance(error, (ConnectionError, TimeoutError, ValueError, KeyError))
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """응답의 Retry-After 헤더 (초)"""
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    try:
+        value = headers.get('retry-after') or headers.get('Retry-After')
+        return float(value) if value is not None else None
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def backoff_delay(attempt: int, base_delay: float = RETRY_BASE_DELAY, max_delay: float = RETRY_MAX_DELAY,
+                  rng: Optional[random.Random] = None) -> float:
+    """지수 백오프 + 전체 지터: [0, min(max_delay, base * 2^attempt)] 에서 균등 추출"""
+    return (rng or random).uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+def call_with_retry(
+    fn: Callable[[], R],
+    attempts: int = RETRY_ATTEMPTS,
+    limiter: Optional[RateLimiter] = None,
+    retryable: Callable[[BaseException], bool] = is_retryable_error,
+    base_delay: float = RETRY_BASE_DELAY,
+    max_delay: float = RETRY_MAX_DELAY,
+    sleep: Callable[[float], None] = time.sleep,
+    rng: Optional[random.Random] = None,
+    label: str = 'LLM 요청',
+) -> R:
+    """
+    fn()을 속도 제한을 지켜 호출하고 일시적 오류는 지터 백오프로 재시도
+
+    Raises:
+        마지막 시도의 예외 또는 재시도할 수 없는 예외
+    """
+    for attempt in range(attempts):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            return fn()
+        except Exception as e:
+            if attempt + 1 >= attempts or not retryable(e):
+                raise
+            delay = backoff_delay(attempt, base_delay, max_delay, rng)
+            if is_rate_limit_error(e):
+                delay = max(delay, retry_after(e) or 0.0)
+                if limiter is not None:
+                    limiter.defer(delay)
+            logger.warning(f"⚠️ {label} 실패 ({attempt + 1}/{attempts}), {delay:.1f}초 후 재시도: {e}")
+            sleep(delay)
+    raise RuntimeError("attempts must be >= 1")
+
+
+def run_bounded(fn: Callable[[T], R], items: Sequence[T], max_workers: int,
+                on_done: Optional[Callable[[int, R], None]] = None) -> List[R]:
+    """
+    items를 최대 max_workers개씩 동시에 처리하고 결과를 입력 순서대로 반환
+
+    Args:
+        on_done: 항목이 끝날 때마다 (입력 인덱스, 결과)로 호출 (완료 순서, 호출 스레드에서 실행)
+
+    Raises:
+        처리 중 첫 예외 (아직 시작하지 않은 항목은 취소)
+    """
+    results: List[Any] = [None] * len(items)
+    if not items:
+        return results
+    if max_workers <= 1 or len(items) == 1:
+        for index, item in enumerate(items):
+            results[index] = fn(item)
+            if on_done:
+                on_done(index, results[index])
+        return results
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(items)))
+    try:
+        futures = {executor.submit(fn, item): index for index, item in enumerate(items)}
+        for future in as_completed(futures):
+            index = futures[future]
+            results[index] = future.result()
+            if on_done:
+                on_done(index, results[index])
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return results
+
+
+class BatchCheckpoint:
+    """
+    항목별 결과 체크포인트 (JSON, 항목이 끝날 때마다 임시 파일 → os.replace)
+
+    항목마다 입력 지문을 함께 저장하고, 입력이 바뀐 항목은 다시 생성한다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self):
+        data = load_versioned_json(self.path, CHECKPOINT_VERSION, "체크포인트")
+        if data is not None:
+            self.items = data.get('items', {})
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def get(self, key: str, fingerprint: str) -> Optional[Any]:
+        """입력 지문이 같은 항목의 저장된 결과 (없으면 None)"""
+        with self._lock:
+            entry = self.items.get(str(key))
+        if not entry or entry.get('fingerprint') != fingerprint:
+            return None
+        return entry.get('value')
+
+    def put(self, key: str, fingerprint: str, value: Any):
+        """항목 결과 기록 후 바로 저장"""
+        with self._lock:
+            self.items[str(key)] = {'fingerprint': fingerprint, 'value': value}
+            data = {'version': CHECKPOINT_VERSION, 'items': dict(self.items)}
+            try:
+                atomic_write_json(self.path, data, indent=2)
+            except OSError as e:
+                logger.warning(f"⚠️ 체크포인트 저장 실패 ({self.path.name}): {e}")
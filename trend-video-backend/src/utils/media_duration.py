@@ -0,0 +1,259 @@
+"""
+컨테이너 헤더 기반 미디어 길이 리더 (subprocess 없음)
+
+TTS MP3 / WAV / 씬 MP4 길이만 필요할 때 ffprobe를 띄우지 않고 헤더에서 바로 읽는다.
+
+- MP3: Xing/Info 또는 VBRI 헤더의 프레임 수, 없으면 프레임 헤더를 따라가며 개수 세기 (CBR)
+- WAV: fmt 청크의 byte rate + data 청크 크기
+- MP4/MOV/M4A: moov/mvhd 길이 (0이면 trak/mdia/mdhd 중 가장 긴 값), mmap으로 mdat은 읽지 않음
+
+알 수 없는 포맷이거나 헤더가 깨져 있으면 None을 반환하므로 호출 측에서 ffprobe로 폴백한다.
+"""
+import os
+import mmap
+import struct
+import logging
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+MP3_EXTENSIONS = frozenset({'.mp3'})
+WAV_EXTENSIONS = frozenset({'.wav', '.wave'})
+MP4_EXTENSIONS = frozenset({'.mp4', '.m4a', '.m4v', '.mov'})
+
+# 첫 MP3 프레임을 찾을 때 ID3 태그 이후 최대 탐색 범위
+MP3_SYNC_SEARCH_BYTES = 64 * 1024
+
+# MPEG 버전 → (비트레이트 표 키, 샘플레이트 목록)
+_MP3_VERSIONS = {
+    3: ('1', (44100, 48000, 32000)),  # MPEG 1
+    2: ('2', (22050, 24000, 16000)),  # MPEG 2
+    0: ('2', (11025, 12000, 8000)),   # MPEG 2.5
+}
+
+# (버전 키, 레이어) → 비트레이트(kbps) 표
+_MP3_BITRATES = {
+    ('1', 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    ('1', 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    ('1', 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    ('2', 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    ('2', 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    ('2', 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+
+def _parse_mp3_header(data, offset: int):
+    """
+    MP3 프레임 헤더 파싱
+
+    Returns:
+        (프레임 길이, 프레임당 샘플 수, 샘플레이트, 버전 키, 모노 여부) 또는 None
+    """
+    if offset + 4 > len(data):
+        return None
+    b0, b1, b2, b3 = data[offset], data[offset + 1], data[offset + 2], data[offset + 3]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+
+    version = (b1 >> 3) & 0x03
+    layer = 4 - ((b1 >> 1) & 0x03)  # 비트값 3/2/1 → Layer I/II/III
+    bitrate_index = b2 >> 4
+    sample_rate_index = (b2 >> 2) & 0x03
+    if version not in _MP3_VERSIONS or layer == 4 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    version_key, sample_rates = _MP3_VERSIONS[version]
+    bitrate = _MP3_BITRATES[(version_key, layer)][bitrate_index] * 1000
+    sample_rate = sample_rates[sample_rate_index]
+    padding = (b2 >> 1) & 0x01
+
+    if layer == 1:
+        samples = 384
+        frame_length = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples = 1152 if (layer == 2 or version_key == '1') else 576
+        frame_length = samples // 8 * bitrate // sample_rate + padding
+
+    return frame_length, samples, sample_rate, version_key, (b3 >> 6) == 3
+
+
+def _id3v2_size(data) -> int:
+    """파일 앞 ID3v2 태그 크기 (없으면 0)"""
+    if len(data) < 10 or data[:3] != b'ID3':
+        return 0
+    size = 0
+    for b in data[6:10]:
+        size = (size << 7) | (b & 0x7F)
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _mp3_duration(data) -> Optional[float]:
+    start = _id3v2_size(data)
+    end = len(data)
+    if end >= 128 and data[end - 128:end - 125] == b'TAG':
+        end -= 128  # ID3v1
+
+    # 첫 프레임 찾기 (다음 프레임 헤더까지 맞아야 인정)
+    offset = start
+    limit = min(end - 4, start + MP3_SYNC_SEARCH_BYTES)
+    header = None
+    while offset <= limit:
+        header = _parse_mp3_header(data, offset)
+        if header:
+            next_offset = offset + header[0]
+            if next_offset + 4 > end or _parse_mp3_header(data, next_offset):
+                break
+        header = None
+        offset += 1
+    if header is None:
+        return None
+
+    frame_length, samples, sample_rate, version_key, mono = header
+
+    # Xing/Info (LAME) 헤더: 사이드 정보 바로 뒤
+    side_info = (17 if mono else 32) if version_key == '1' else (9 if mono else 17)
+    xing = offset + 4 + side_info
+    if data[xing:xing + 4] in (b'Xing', b'Info'):
+        flags = struct.unpack('>I', data[xing + 4:xing + 8])[0]
+        if flags & 0x01:
+            frames = struct.unpack('>I', data[xing + 8:xing + 12])[0]
+            if frames:
+                return frames * samples / sample_rate
+
+    # VBRI (Fraunhofer) 헤더: 프레임 시작 + 36바이트
+    vbri = offset + 36
+    if data[vbri:vbri + 4] == b'VBRI':
+        frames = struct.unpack('>I', data[vbri + 14:vbri + 18])[0]
+        if frames:
+            return frames * samples / sample_rate
+
+    # 프레임 헤더를 따라가며 샘플 수 합산
+    total_samples = 0
+    while offset + 4 <= end:
+        header = _parse_mp3_header(data, offset)
+        if not header or header[2] != sample_rate:
+            break
+        total_samples += header[1]
+        offset += header[0]
+    if not total_samples:
+        return None
+    return total_samples / sample_rate
+
+
+def _wav_duration(data) -> Optional[float]:
+    if len(data) < 12 or data[:4] not in (b'RIFF', b'RF64') or data[8:12] != b'WAVE':
+        return None
+
+    byte_rate = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        chunk_size = struct.unpack('<I', data[offset + 4:offset + 8])[0]
+        body = offset + 8
+        if chunk_id == b'fmt ' and chunk_size >= 16:
+            byte_rate = struct.unpack('<I', data[body + 8:body + 12])[0]
+        elif chunk_id == b'data':
+            if not byte_rate:
+                return None
+            # 스트리밍으로 쓴 파일은 크기가 0 또는 0xFFFFFFFF → 파일 끝까지
+            available = len(data) - body
+            if chunk_size in (0, 0xFFFFFFFF) or chunk_size > available:
+                chunk_size = available
+            return chunk_size / byte_rate
+        offset = body + chunk_size + (chunk_size & 1)
+    return None
+
+
+def _iter_boxes(data, start: int, end: int):
+    """(타입, 본문 시작, 박스 끝) 순회"""
+    offset = start
+    while offset + 8 <= end:
+        size, box_type = struct.unpack('>I4s', data[offset:offset + 8])
+        header = 8
+        if size == 1:
+            if offset + 16 > end:
+                return
+            size = struct.unpack('>Q', data[offset + 8:offset + 16])[0]
+            header = 16
+        elif size == 0:
+            size = end - offset
+        if size < header or offset + size > end:
+            return
+        yield box_type, offset + header, offset + size
+        offset += size
+
+
+def _find_box(data, start: int, end: int, box_type: bytes):
+    for found_type, body, box_end in _iter_boxes(data, start, end):
+        if found_type == box_type:
+            return body, box_end
+    return None
+
+
+def _full_box_duration(data, body: int) -> Optional[float]:
+    """mvhd/mdhd 본문에서 duration / timescale"""
+    version = data[body]
+    if version == 1:
+        timescale, duration = struct.unpack('>IQ', data[body + 20:body + 32])
+        unknown = 0xFFFFFFFFFFFFFFFF
+    else:
+        timescale, duration = struct.unpack('>II', data[body + 12:body + 20])
+        unknown = 0xFFFFFFFF
+    if not timescale or not duration or duration == unknown:
+        return None
+    return duration / timescale
+
+
+def _mp4_duration(data) -> Optional[float]:
+    moov = _find_box(data, 0, len(data), b'moov')
+    if moov is None:
+        return None
+
+    mvhd = _find_box(data, moov[0], moov[1], b'mvhd')
+    duration = _full_box_duration(data, mvhd[0]) if mvhd else None
+    if duration:
+        return duration
+
+    # 조각(fragmented) 파일 등 mvhd 길이가 없으면 트랙별 mdhd 중 최댓값
+    track_durations = []
+    for box_type, body, box_end in _iter_boxes(data, moov[0], moov[1]):
+        if box_type != b'trak':
+            continue
+        mdia = _find_box(data, body, box_end, b'mdia')
+        mdhd = _find_box(data, mdia[0], mdia[1], b'mdhd') if mdia else None
+        track_duration = _full_box_duration(data, mdhd[0]) if mdhd else None
+        if track_duration:
+            track_durations.append(track_duration)
+    return max(track_durations) if track_durations else None
+
+
+_READERS = (
+    (MP3_EXTENSIONS, _mp3_duration),
+    (WAV_EXTENSIONS, _wav_duration),
+    (MP4_EXTENSIONS, _mp4_duration),
+)
+
+
+def read_media_duration(media_path: Path) -> Optional[float]:
+    """
+    컨테이너 헤더에서 미디어 길이(초) 읽기
+
+    Returns:
+        길이 또는 None (지원하지 않는 포맷, 파일 없음, 헤더 손상 - ffprobe로 폴백)
+    """
+    ext = os.path.splitext(str(media_path))[1].lower()
+    reader = next((r for extensions, r in _READERS if ext in extensions), None)
+    if reader is None:
+        return None
+
+    try:
+        with open(media_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return reader(data)
+    except (OSError, ValueError, struct.error, IndexError) as e:
+        logger.debug(f"헤더 길이 읽기 실패 ({Path(media_path).name}): {e}")
+        return None
@@ -0,0 +1,197 @@
+"""
+프로젝트 폴더 미디어 스캐너
+
+루트 폴더와 images/, videos/ 서브폴더를 os.scandir로 한 번씩만 읽어서
+이미지/비디오 목록, scene_XX_image 매핑, 정렬 키를 한 번에 만든다.
+
+- 확장자는 소문자로 비교 (대소문자 변형별 glob 반복 없음)
+- 파일마다 stat 한 번, 시퀀스 번호 추출 한 번 (정렬 키는 MediaFile에 저장)
+- 정렬 규칙은 Frontend extractSequenceNumber와 동일 (기존 extract_sequence 로직 그대로)
+"""
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg'})
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mov', '.avi', '.mkv'})
+
+_SCENE_IMAGE_PATTERN = re.compile(r"scene_(\d+)_image\.(png|jpg|jpeg)")
+
+# 이미지/비디오 개별 정렬 (파일명 기준)
+_LEADING_NUMBER = re.compile(r'^(\d+)\.')
+_SCENE_PREFIX = re.compile(r'scene_(\d+)_')
+_SEPARATOR_NUMBER = re.compile(r'[_-](\d{1,3})\.')
+_PAREN_NUMBER = re.compile(r'\((\d+)\)')
+_RANDOM_ID = re.compile(r'[_-]\w{8,}')
+
+# 이미지+비디오 통합 정렬 (확장자 제외 파일명 기준)
+_UNIFIED_PATTERNS = (
+    (re.compile(r'^(image|video|scene|clip|img)[-_](\d+)$', re.IGNORECASE), 2),
+    (re.compile(r'^(image|video|scene|clip|img)\((\d+)\)$', re.IGNORECASE), 2),
+    (re.compile(r'^\((\d+)\)$'), 1),
+    (re.compile(r'^(\d+)$'), 1),
+    (re.compile(r'(\d+)'), 1),
+)
+
+
+def extract_sequence(filename: str, media_type: str = 'image') -> Optional[int]:
+    """
+    파일명에서 시퀀스 번호 추출 (Frontend extractSequenceNumber와 동일한 로직)
+    - 1.jpg, 02.png (숫자로 시작)
+    - scene_00_hook.jpeg (scene_XX_ 패턴, 이미지만)
+    - image_01.jpg, scene-02.png (_숫자 또는 -숫자)
+    - Image_fx (47).jpg (괄호 안 숫자, 랜덤 ID 없을 때만)
+    """
+    match = _LEADING_NUMBER.match(filename)
+    if match:
+        return int(match.group(1))
+
+    if media_type == 'image':
+        match = _SCENE_PREFIX.match(filename)
+        if match:
+            return int(match.group(1))
+
+    match = _SEPARATOR_NUMBER.search(filename)
+    if match:
+        return int(match.group(1))
+
+    match = _PAREN_NUMBER.search(filename)
+    if match and not _RANDOM_ID.search(filename):
+        return int(match.group(1))
+
+    return None
+
+
+def extract_unified_sequence(stem: str) -> Optional[int]:
+    """통합 정렬용 시퀀스 번호 (image_01, video(2), (3), 04, 영상05 등 파일명 어디든 숫자)"""
+    for pattern, group in _UNIFIED_PATTERNS:
+        match = pattern.search(stem)
+        if match:
+            return int(match.group(group))
+    return None
+
+
+@dataclass
+class MediaFile:
+    """스캔된 미디어 파일 (stat/시퀀스 번호는 생성 시 한 번만 계산)"""
+    path: Path
+    media_type: str
+    mtime: float
+    sequence: Optional[int]
+    unified_sequence: Optional[int]
+
+    @classmethod
+    def create(cls, path: Path, media_type: str, mtime: Optional[float] = None) -> 'MediaFile':
+        if mtime is None:
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                mtime = 0
+        return cls(
+            path=path,
+            media_type=media_type,
+            mtime=mtime,
+            sequence=extract_sequence(path.name, media_type),
+            unified_sequence=extract_unified_sequence(path.stem),
+        )
+
+    @property
+    def sort_key(self) -> Tuple[bool, int, float]:
+        """시퀀스 번호가 있으면 우선, 없으면 수정 시간 순"""
+        return (self.sequence is None, self.sequence or 0, self.mtime)
+
+    @property
+    def unified_sort_key(self) -> Tuple[bool, int, float]:
+        """통합 정렬 키 (시퀀스 번호가 있으면 시간은 비교하지 않음)"""
+        if self.unified_sequence is not None:
+            return (False, self.unified_sequence, 0)
+        return (True, 0, self.mtime)
+
+
+@dataclass
+class MediaScan:
+    """폴더 스캔 결과"""
+    images: List[MediaFile] = field(default_factory=list)
+    videos: List[MediaFile] = field(default_factory=list)
+    scene_images: Dict[int, Path] = field(default_factory=dict)
+    _by_path: Dict[Path, MediaFile] = field(default_factory=dict, repr=False)
+
+    def sorted_images(self) -> List[MediaFile]:
+        return sorted(self.images, key=lambda m: m.sort_key)
+
+    def sorted_videos(self) -> List[MediaFile]:
+        return sorted(self.videos, key=lambda m: m.sort_key)
+
+    def get(self, path: Path, media_type: str = 'image') -> MediaFile:
+        """경로로 MediaFile 조회 (스캔 이후 생성된 파일이면 새로 만들어 캐시)"""
+        media = self._by_path.get(path)
+        if media is None:
+            media = MediaFile.create(path, media_type)
+            self._by_path[path] = media
+        return media
+
+    def _add(self, media: MediaFile):
+        self._by_path[media.path] = media
+        (self.images if media.media_type == 'image' else self.videos).append(media)
+
+
+def _scan_dir(folder: Path):
+    """(이름순 DirEntry 목록) - 폴더가 없으면 빈 목록"""
+    try:
+        with os.scandir(folder) as it:
+            entries = [entry for entry in it if entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    entries.sort(key=lambda entry: entry.name)
+    return entries
+
+
+def scan_media_folder(folder_path: Path) -> MediaScan:
+    """
+    프로젝트 폴더 미디어 스캔
+
+    - 루트: 이미지(썸네일 제외) + 비디오 (경로에 generated_videos가 포함되면 제외)
+    - images/: 이미지 (썸네일 제외)
+    - videos/: 비디오
+    - scene_XX_image.* 는 루트 우선, 없으면 images/ 에서 매핑
+    """
+    folder_path = Path(folder_path)
+    scan = MediaScan()
+
+    sources = (
+        (folder_path, True, True, True),
+        (folder_path / "images", True, False, False),
+        (folder_path / "videos", False, True, False),
+    )
+    for folder, want_images, want_videos, is_root in sources:
+        for entry in _scan_dir(folder):
+            name = entry.name
+            path = folder / name
+
+            if want_images:
+                match = _SCENE_IMAGE_PATTERN.match(name)
+                if match:
+                    scan.scene_images.setdefault(int(match.group(1)), path)
+
+            ext = os.path.splitext(name)[1].lower()
+            if want_images and ext in IMAGE_EXTENSIONS:
+                media_type = 'image'
+                if 'thumbnail' in name.lower():
+                    continue
+            elif want_videos and ext in VIDEO_EXTENSIONS:
+                media_type = 'video'
+            else:
+                continue
+
+            if is_root and 'generated_videos' in str(path):
+                continue
+
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                mtime = 0
+            scan._add(MediaFile.create(path, media_type, mtime))
+
+    return scan
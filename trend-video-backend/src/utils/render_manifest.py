@@ -0,0 +1,136 @@
+"""
+씬 렌더링 매니페스트 (증분 재렌더링용)
+
+generated_videos/render_manifest.json 에 씬별 입력 지문(fingerprint)을 기록하고,
+다음 실행에서 지문이 같으면 기존 scene_XX.mp4 를 그대로 재사용한다.
+
+지문에 포함되는 입력:
+    - 미디어 파일(이미지/비디오), 오디오, ASS 자막의 내용 해시
+    - 해상도, 코덱/프리셋, 필터 문자열 등 인코딩 파라미터
+
+파일 해시는 (경로, 크기, mtime)이 같으면 매니페스트에 저장된 값을 재사용하므로
+큰 비디오 파일도 매번 다시 읽지 않는다.
+"""
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .json_store import atomic_write_json, load_versioned_json
+
+logger = logging.getLogger(__name__)
+
+# 지문 계산 방식이 바뀌면 올려서 기존 매니페스트를 무효화
+RENDER_MANIFEST_VERSION = 1
+MANIFEST_FILENAME = 'render_manifest.json'
+
+
+class RenderManifest:
+    """씬별 입력 지문과 출력 파일을 기록하는 매니페스트"""
+
+    def __init__(self, output_folder: Path):
+        """
+        Args:
+            output_folder: 씬 비디오가 저장되는 폴더 (generated_videos)
+        """
+        self.path = Path(output_folder) / MANIFEST_FILENAME
+        self._lock = threading.Lock()
+        self.scenes: Dict[str, Dict[str, Any]] = {}
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self):
+        data = load_versioned_json(self.path, RENDER_MANIFEST_VERSION, "렌더 매니페스트")
+        if data is None:
+            return
+
+        self.scenes = data.get('scenes', {})
+        self.files = data.get('files', {})
+
+    def file_hash(self, path: Path) -> Optional[str]:
+        """파일 내용 해시 (크기/mtime이 같으면 캐시된 값 사용)"""
+        path = Path(path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        key = str(path.resolve())
+        with self._lock:
+            cached = self.files.get(key)
+        if cached and cached.get('size') == stat.st_size and cached.get('mtime_ns') == stat.st_mtime_ns:
+            return cached['sha1']
+
+        h = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                h.update(block)
+        digest = h.hexdigest()
+
+        with self._lock:
+            self.files[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha1': digest}
+        return digest
+
+    @staticmethod
+    def fingerprint(**inputs) -> str:
+        """입력 딕셔너리로 씬 지문 생성 (키 순서 무관)"""
+        payload = json.dumps(
+            {'v': RENDER_MANIFEST_VERSION, **inputs},
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def is_fresh(self, scene_num: int, fingerprint: str, output_path: Path) -> bool:
+        """기록된 지문과 같고 출력 파일이 그대로 남아 있으면 True"""
+        with self._lock:
+            entry = self.scenes.get(str(scene_num))
+        if not entry or entry.get('fingerprint') != fingerprint:
+            return False
+
+        output_path = Path(output_path)
+        if output_path.name != entry.get('output'):
+            return False
+        try:
+            stat = output_path.stat()
+        except OSError:
+            return False
+        return stat.st_size > 0 and stat.st_size == entry.get('size') and stat.st_mtime_ns == entry.get('mtime_ns')
+
+    def record(self, scene_num: int, fingerprint: str, output_path: Path):
+        """렌더링 완료된 씬 기록 후 즉시 저장 (중간에 중단돼도 완료분은 재사용)"""
+        output_path = Path(output_path)
+        try:
+            stat = output_path.stat()
+        except OSError:
+            return
+
+        with self._lock:
+            self.scenes[str(scene_num)] = {
+                'fingerprint': fingerprint,
+                'output': output_path.name,
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+            }
+        self.save()
+
+    def invalidate(self, scene_num: int):
+        """씬 기록 삭제 (렌더링 실패 등)"""
+        with self._lock:
+            self.scenes.pop(str(scene_num), None)
+
+    def save(self):
+        """매니페스트 저장 (임시 파일 → os.replace)"""
+        with self._lock:
+            data = {
+                'version': RENDER_MANIFEST_VERSION,
+                'scenes': dict(self.scenes),
+                'files': dict(self.files),
+            }
+            try:
+                atomic_write_json(self.path, data, indent=2)
+            except OSError as e:
+                logger.warning(f"⚠️ 렌더 매니페스트 저장 실패: {e}")
@@ -0,0 +1,389 @@
+"""
+나레이션 자막 렌더링 엔진 (ASS 출력 / 캐시된 자막 스프라이트 + FFmpeg overlay)
+
+문장마다 PIL 이미지를 만들어 MoviePy CompositeVideoClip으로 합성하면
+매 프레임 Python에서 합성이 일어나고, 외곽선은 draw.text를 (2·stroke+1)² 번 호출해 그렸다.
+
+여기서는 합성을 FFmpeg에 맡긴다:
+    - ASS (기본): 스타일을 ASS [V4+ Styles]로 옮기고 libass가 번인 (배경 박스 + 외곽선 모두 유지)
+    - overlay: 문장 비트맵을 (문장, 스타일)별로 한 번만 그려 PNG로 저장하고
+      FFmpeg overlay 필터가 문장 구간(enable=between)마다 얹음 - PIL로 그리던 모양 그대로
+
+비트맵 렌더링은:
+    - 폰트는 (경로, 크기)별로 프로세스당 한 번만 로드
+    - 외곽선은 Pillow 내장 stroke 렌더링 (draw.text 한 번)
+    - 줄 너비 측정은 폰트에서 직접 (임시 ImageDraw 없음)
+"""
+import os
+import re
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+from .ffmpeg_utils import format_ass_timestamp
+
+logger = logging.getLogger(__name__)
+
+Event = Tuple[float, float, str]
+
+# 폰트 탐색 순서 (SUBTITLE_FONT 환경변수가 있으면 그것부터)
+FONT_CANDIDATES = [
+    "C:/Windows/Fonts/malgun.ttf",   # 맑은 고딕
+    "C:/Windows/Fonts/gulim.ttc",    # 굴림
+    "C:/Windows/Fonts/batang.ttc",   # 바탕
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc",
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+    "arial.ttf",
+]
+
+_NAMED_COLORS = {
+    'white': (255, 255, 255),
+    'black': (0, 0, 0),
+    'yellow': (255, 255, 0),
+    'red': (255, 0, 0),
+    'green': (0, 128, 0),
+    'blue': (0, 0, 255),
+    'gray': (128, 128, 128),
+    'grey': (128, 128, 128),
+}
+
+# 렌더러당 메모리에 유지할 문장 비트맵 수 (스프라이트는 디스크에 내용 해시로 저장되므로 최근 것만 유지)
+RENDER_CACHE_SIZE = 64
+
+_SENTENCE_SPLIT = re.compile(r'[.!?。]\s*')
+
+
+@dataclass(frozen=True)
+class SubtitleStyle:
+    """나레이션 자막 스타일 (config ai.subtitle_style)"""
+    font_size: int = 52
+    color: Any = 'white'
+    stroke_color: Any = 'black'
+    stroke_width: int = 3
+    background: bool = True
+    background_color: Tuple[int, int, int] = (0, 0, 0)
+    background_opacity: float = 0.7
+    position: str = 'bottom'
+    margin: int = 80
+    font_name: str = 'NanumGothic'
+    line_spacing: int = 10
+    padding: int = 20
+    max_width_ratio: float = 0.85
+
+    @classmethod
+    def from_config(cls, style: Optional[Dict[str, Any]]) -> 'SubtitleStyle':
+        style = style or {}
+        defaults = cls()
+        color = style.get("color", defaults.color)
+        stroke_color = style.get("stroke_color", defaults.stroke_color)
+        return cls(
+            font_size=int(style.get("font_size", defaults.font_size)),
+            color=tuple(color) if isinstance(color, list) else color,
+            stroke_color=tuple(stroke_color) if isinstance(stroke_color, list) else stroke_color,
+            stroke_width=int(style.get("stroke_width", defaults.stroke_width)),
+            background=bool(style.get("background", defaults.background)),
+            background_color=tuple(style.get("background_color", defaults.background_color)),
+            background_opacity=float(style.get("background_opacity", defaults.background_opacity)),
+            position=style.get("position", defaults.position),
+            margin=int(style.get("margin", defaults.margin)),
+            font_name=style.get("font_name", defaults.font_name),
+        )
+
+
+def split_sentences(text: str) -> List[str]:
+    """나레이션을 문장 단위로 분리 (. ! ? 。 기준)"""
+    return [s.strip() for s in _SENTENCE_SPLIT.split((text or '').strip()) if s.strip()]
+
+
+def sentence_events(text: str, duration: float) -> List[Event]:
+    """문장들을 씬 길이에 균등 배분한 자막 이벤트 [(시작, 끝, 문장), ...]"""
+    sentences = split_sentences(text)
+    if not sentences or duration <= 0:
+        return []
+    per_sentence = duration / len(sentences)
+    return [(i * per_sentence, (i + 1) * per_sentence, s) for i, s in enumerate(sentences)]
+
+
+def to_rgb(color: Any) -> Tuple[int, int, int]:
+    """색 지정(이름, #RRGGBB, [r, g, b])을 RGB 튜플로"""
+    if isinstance(color, (tuple, list)):
+        return tuple(int(c) for c in color[:3])
+    value = str(color).strip().lower()
+    if value in _NAMED_COLORS:
+        return _NAMED_COLORS[value]
+    if re.fullmatch(r'#[0-9a-f]{6}', value):
+        return tuple(int(value[i:i + 2], 16) for i in (1, 3, 5))
+    if PIL_AVAILABLE:
+        try:
+            from PIL import ImageColor
+            return ImageColor.getrgb(str(color))[:3]
+        except ValueError:
+            pass
+    logger.warning(f"⚠️ 알 수 없는 자막 색상 {color!r} → 흰색 사용")
+    return (255, 255, 255)
+
+
+def ass_color(color: Any, opacity: float = 1.0) -> str:
+    """ASS 색상 (&HAABBGGRR, 알파 0이 불투명)"""
+    r, g, b = to_rgb(color)
+    alpha = 255 - max(0, min(255, round(opacity * 255)))
+    return f"&H{alpha:02X}{b:02X}{g:02X}{r:02X}"
+
+
+def _escape_ass_text(text: str) -> str:
+    return text.replace('{', '\\{').replace('}', '\\}').replace('\n', '\\N')
+
+
+def build_narration_ass(events: Sequence[Event], style: SubtitleStyle, width: int, height: int) -> str:
+    """
+    자막 이벤트를 ASS 문서로 변환
+
+    libass 박스(BorderStyle 3)는 외곽선 색을 박스 색으로 쓰기 때문에 박스와 글자 외곽선을 한 스타일로
+    같이 그릴 수 없다. 배경 박스가 켜져 있으면 문장마다 두 줄을 쓴다:
+        - Layer 0 'Box': 글자는 완전 투명, 배경 박스만 (padding 만큼 여유)
+        - Layer 1 'Default': 외곽선(stroke) 있는 글자
+    줄바꿈은 libass가 좌우 여백(화면 너비의 max_width_ratio) 안에서 처리한다.
+    """
+    alignment = {'bottom': 2, 'top': 8}.get(style.position, 5)
+    margin_h = int(width * (1 - style.max_width_ratio) / 2)
+    back_colour = ass_color(style.background_color, style.background_opacity)
+
+    def style_line(name: str, primary: str, border_style: int, outline_colour: str, outline: int) -> str:
+        return (f"Style: {name},{style.font_name},{style.font_size},{primary},&H000000FF,{outline_colour},"
+                f"{back_colour},0,0,0,0,100,100,0,0,{border_style},{outline},0,{alignment},"
+                f"{margin_h},{margin_h},{style.margin},1")
+
+    lines = [
+        "[Script Info]",
+        "ScriptType: v4.00+",
+        f"PlayResX: {width}",
+        f"PlayResY: {height}",
+        "WrapStyle: 0",
+        "ScaledBorderAndShadow: yes",
+        "",
+        "[V4+ Styles]",
+        "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, "
+        "Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, "
+        "MarginL, MarginR, MarginV, Encoding",
+        style_line('Default', ass_color(style.color), 1, ass_color(style.stroke_color), style.stroke_width),
+    ]
+    if style.background:
+        lines.append(style_line('Box', '&HFF000000', 3, back_colour, max(1, style.padding // 2)))
+    lines += [
+        "",
+        "[Events]",
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
+    ]
+    for start, end, text in events:
+        timing = f"{format_ass_timestamp(start)},{format_ass_timestamp(end)}"
+        text = _escape_ass_text(text)
+        if style.background:
+            lines.append(f"Dialogue: 0,{timing},Box,,0,0,0,,{text}")
+        lines.append(f"Dialogue: 1,{timing},Default,,0,0,0,,{text}")
+    return "\n".join(lines) + "\n"
+
+
+def write_narration_ass(events: Sequence[Event], style: SubtitleStyle, width: int, height: int,
+                        output_path: Path) -> Path:
+    """build_narration_ass 결과를 파일로 저장"""
+    output_path = Path(output_path)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(build_narration_ass(events, style, width, height))
+    return output_path
+
+
+def build_overlay_graph(placements: Sequence[Tuple[int, float, float]], style: SubtitleStyle) -> str:
+    """
+    자막 스프라이트를 문장 구간마다 얹는 filter_complex 그래프
+
+    Args:
+        placements: [(스프라이트 입력 번호, 시작, 끝), ...] - 입력 0은 원본 비디오,
+                    같은 스프라이트(같은 문장)는 같은 입력 번호를 써도 된다 (split으로 나눔)
+
+    Returns:
+        그래프 문자열 (출력 라벨 [outv])
+    """
+    if style.position == 'bottom':
+        y = f"main_h-overlay_h-{style.margin}"
+    elif style.position == 'top':
+        y = str(style.margin)
+    else:
+        y = "(main_h-overlay_h)/2"
+
+    uses: Dict[int, int] = {}
+    for index, _, _ in placements:
+        uses[index] = uses.get(index, 0) + 1
+
+    parts = []
+    for index, count in uses.items():
+        if count > 1:
+            outputs = "".join(f"[s{index}_{n}]" for n in range(count))
+            parts.append(f"[{index}:v]split={count}{outputs}")
+
+    taken: Dict[int, int] = {}
+    current = "[0:v]"
+    for n, (index, start, end) in enumerate(placements):
+        if uses[index] > 1:
+            sprite = f"[s{index}_{taken.get(index, 0)}]"
+            taken[index] = taken.get(index, 0) + 1
+        else:
+            sprite = f"[{index}:v]"
+        label = "[outv]" if n == len(placements) - 1 else f"[v{n}]"
+        parts.append(f"{current}{sprite}overlay=x=(main_w-overlay_w)/2:y={y}:"
+                     f"enable='between(t,{start:.3f},{end:.3f})'{label}")
+        current = label
+    if not placements:
+        parts.append("[0:v]null[outv]")
+    return ";\n".join(parts)
+
+
+@lru_cache(maxsize=None)
+def resolve_font_path() -> Optional[str]:
+    """자막 폰트 경로 (프로세스당 한 번 탐색, 없으면 None → PIL 기본 폰트)"""
+    env_font = os.environ.get('SUBTITLE_FONT')
+    for candidate in ([env_font] if env_font else []) + FONT_CANDIDATES:
+        if os.path.isabs(candidate) and not os.path.exists(candidate):
+            continue
+        if PIL_AVAILABLE:
+            try:
+                ImageFont.truetype(candidate, 12)
+            except OSError:
+                continue
+        return candidate
+    return None
+
+
+@lru_cache(maxsize=32)
+def load_font(font_path: Optional[str], size: int):
+    """(경로, 크기)별로 한 번만 로드한 PIL 폰트"""
+    if not PIL_AVAILABLE:
+        raise RuntimeError("Pillow가 필요합니다: pip install Pillow")
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except OSError as e:
+            logger.warning(f"⚠️ 자막 폰트 로드 실패 ({font_path}): {e}")
+    return ImageFont.load_default()
+
+
+class SubtitleRenderer:
+    """문장 자막 비트맵 렌더러 (스타일 하나당 하나, 최근 문장 비트맵 LRU 캐시)"""
+
+    def __init__(self, style: SubtitleStyle, font_path: Optional[str] = None,
+                 cache_size: int = RENDER_CACHE_SIZE):
+        if not PIL_AVAILABLE:
+            raise RuntimeError("Pillow가 필요합니다: pip install Pillow")
+        self.style = style
+        self.font = load_font(font_path or resolve_font_path(), style.font_size)
+        self._lock = threading.Lock()
+        self._cache: 'OrderedDict[Tuple[str, int], Any]' = OrderedDict()
+        self._cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+
+    def _line_width(self, text: str) -> float:
+        return self.font.getlength(text)
+
+    def wrap(self, text: str, max_width: int) -> List[str]:
+        """단어 단위 줄바꿈 (폰트에서 직접 너비 측정)"""
+        lines: List[str] = []
+        current: List[str] = []
+        for word in text.split():
+            candidate = ' '.join(current + [word])
+            if self._line_width(candidate) <= max_width:
+                current.append(word)
+            else:
+                if current:
+                    lines.append(' '.join(current))
+                current = [word]
+        if current:
+            lines.append(' '.join(current))
+        return lines or [text]
+
+    def render(self, text: str, max_width: int):
+        """문장 자막 RGBA 이미지 (같은 문장/너비는 캐시된 이미지 반환 - 수정하지 말 것)"""
+        key = (text, max_width)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        image = self._draw(text, max_width)
+        with self._lock:
+            image = self._cache.setdefault(key, image)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+            return image
+
+    def _draw(self, text: str, max_width: int):
+        style = self.style
+        stroke = style.stroke_width
+        lines = self.wrap(text, max_width)
+
+        boxes = [self.font.getbbox(line) for line in lines]
+        line_heights = [bottom - top for _, top, _, bottom in boxes]
+        line_widths = [right - left for left, _, right, _ in boxes]
+        total_height = sum(line_heights) + (len(lines) - 1) * style.line_spacing
+
+        img_width = max(line_widths) + style.padding * 2 + stroke * 4
+        img_height = total_height + style.padding * 2 + stroke * 4
+        image = Image.new('RGBA', (img_width, img_height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+
+        if style.background:
+            opacity = int(style.background_opacity * 255)
+            draw.rectangle([(0, 0), (img_width, img_height)], fill=to_rgb(style.background_color) + (opacity,))
+
+        y = style.padding + stroke * 2
+        for line, line_width, line_height in zip(lines, line_widths, line_heights):
+            draw.text(
+                ((img_width - line_width) // 2, y),
+                line,
+                font=self.font,
+                fill=to_rgb(style.color),
+                stroke_width=stroke,
+                stroke_fill=to_rgb(style.stroke_color),
+            )
+            y += line_height + style.line_spacing
+        return image
+
+    def save_sprite(self, text: str, max_width: int, folder: Path) -> Path:
+        """문장 자막을 PNG로 저장 (같은 문장/스타일/너비면 기존 파일 재사용)"""
+        digest = hashlib.sha1(repr((text, max_width, self.style)).encode('utf-8')).hexdigest()[:16]
+        path = Path(folder) / f"subtitle_{digest}.png"
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.stem}.{threading.get_ident()}.tmp.png")
+            self.render(text, max_width).save(tmp)
+            os.replace(tmp, path)
+        return path
+
+
+_renderers: Dict[Tuple[SubtitleStyle, Optional[str]], SubtitleRenderer] = {}
+_renderers_lock = threading.Lock()
+
+
+def get_subtitle_renderer(style: SubtitleStyle, font_path: Optional[str] = None) -> SubtitleRenderer:
+    """스타일별 공유 렌더러 (문장 비트맵 캐시가 (문장, 스타일) 단위로 유지됨)"""
+    with _renderers_lock:
+        renderer = _renderers.get((style, font_path))
+        if renderer is None:
+            renderer = _renderers[(style, font_path)] = SubtitleRenderer(style, font_path)
+        return renderer
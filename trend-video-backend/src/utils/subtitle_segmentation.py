@@ -0,0 +1,206 @@
+"""
+자막 줄 나누기 (단어 그룹화) 공통 모듈
+
+폴더 영상(Edge TTS 타임스탬프 / 대본 기반), 영상 병합, 롱폼이 모두 같은 규칙으로
+자막을 나눈다.
+
+- 단어를 이어 붙이다가 max_chars를 넘으면 줄을 바꾼다
+- 줄을 바꿀 때 남은 글자(공백 포함)가 MIN_REMAINING_CHARS 미만이면 남은 단어를 현재 줄에 붙인다
+
+예전 구현은 단어마다 남은 단어 전체를 " ".join() 해서 길이를 쟀기 때문에 단어 수 n에 대해
+O(n²)였다 (수천 단어 대본에서 눈에 띄게 느림). 여기서는 뒤에서부터 누적한 남은 글자 수
+(suffix)를 한 번 만들어 두고 O(1)로 조회하므로 O(n)이며, 나뉘는 결과는 예전과 같다.
+"""
+import re
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from .ffmpeg_utils import format_ass_timestamp
+
+MAX_CHARS_PER_LINE = 22
+MIN_REMAINING_CHARS = 5
+
+# 대본의 제어 명령어 ([무음 3초], [침묵] 등)
+CONTROL_MARKER_PATTERN = re.compile(r'\[(무음|침묵|pause)\s*(\d+(?:\.\d+)?)?초?\]')
+SENTENCE_END_PATTERN = re.compile(r'([.!?。！？])')
+
+# NanumGothic 96pt, 하단 중앙 (폴더 영상 / 롱폼 공용)
+ASS_HEADER = (
+    "[Script Info]\n"
+    "ScriptType: v4.00+\n"
+    "PlayResX: 1920\n"
+    "PlayResY: 1080\n\n"
+    "[V4+ Styles]\n"
+    "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n"
+    "Style: Default,NanumGothic,96,&H00FFFFFF,&H000000FF,&H00000000,&H00000000,-1,0,0,0,100,100,0,0,1,3,2,2,10,10,20,1\n\n"
+    "[Events]\n"
+    "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+)
+
+
+def suffix_char_counts(words: Sequence[str]) -> List[int]:
+    """
+    counts[k] = len(" ".join(words[k:])) (counts[len(words)] = 0)
+
+    뒤에서부터 한 번 누적하므로 O(n)
+    """
+    counts = [0] * (len(words) + 1)
+    for k in range(len(words) - 1, -1, -1):
+        counts[k] = len(words[k]) + (counts[k + 1] + 1 if k + 1 < len(words) else 0)
+    return counts
+
+
+def strip_control_markers(text: str) -> str:
+    """대본의 제어 명령어 제거 ([무음 3초], [침묵], [pause] 등)"""
+    return CONTROL_MARKER_PATTERN.sub('', text)
+
+
+def split_script_sentences(text: str) -> List[str]:
+    """대본을 문장으로 분리 (마침표/느낌표/물음표는 앞 문장에 붙임, 문장이 없으면 전체를 한 문장으로)"""
+    parts = SENTENCE_END_PATTERN.split(text)
+    sentences = [(parts[i] + parts[i + 1]).strip() for i in range(0, len(parts) - 1, 2)]
+    if len(parts) % 2 == 1 and parts[-1].strip():
+        sentences.append(parts[-1].strip())
+    return sentences or [text.strip()]
+
+
+def group_timed_words(word_timings: Sequence[Dict], max_chars: int = MAX_CHARS_PER_LINE,
+                      min_remaining: int = MIN_REMAINING_CHARS) -> List[Dict]:
+    """
+    단어별 타임스탬프({"word", "start", "end"})를 자막 줄로 묶음
+
+    Returns:
+        [{"start", "end", "text"}, ...] - 겹침 조정 전
+    """
+    remaining = suffix_char_counts([w["word"] for w in word_timings])
+    subtitles = []
+    current_text = ""
+    current_start = None
+    current_end = None
+
+    for i, word_info in enumerate(word_timings):
+        word = word_info["word"]
+        start = word_info["start"]
+        end = word_info["end"]
+
+        # 빈 단어는 건너뛰기 (남은 글자 수에는 포함 - 예전 출력과 동일)
+        if not word.strip():
+            continue
+        if current_start is None:
+            current_start = start
+
+        next_text = current_text + (" " if current_text else "") + word
+
+        if len(next_text) > max_chars and current_text:
+            if 0 < remaining[i + 1] < min_remaining:
+                # 남은 글자가 너무 적으면 남은 단어까지 현재 줄에 포함 (문자열은 이때 한 번만 만든다)
+                tail = " ".join(w["word"] for w in word_timings[i + 1:])
+                current_text = next_text + " " + tail
+                current_end = word_timings[-1]["end"]
+                subtitles.append({"start": current_start, "end": current_end, "text": current_text.strip()})
+                break
+            subtitles.append({"start": current_start, "end": current_end, "text": current_text.strip()})
+            current_text = word
+            current_start = start
+            current_end = end
+        else:
+            current_text = next_text
+            current_end = end
+
+    # 남은 텍스트 처리 - 위에서 break한 마지막 줄도 한 번 더 들어가며, 예전 출력과 같게 그대로 둔다
+    # (바로 뒤 겹침 조정에서 앞 줄이 최소 표시 시간으로 줄어든다)
+    if current_text:
+        subtitles.append({"start": current_start, "end": current_end, "text": current_text.strip()})
+    return subtitles
+
+
+def group_script_text(sentences: Sequence[str], duration: float, max_chars: int = MAX_CHARS_PER_LINE,
+                      min_remaining: int = MIN_REMAINING_CHARS) -> List[Dict]:
+    """
+    타임스탬프 없이 문장들을 자막 줄로 묶고 글자 수 비례로 시간 배분
+
+    Returns:
+        [{"start", "end", "text"}, ...] - 0초부터 이어지는 구간
+    """
+    total_chars = len(" ".join(sentences))
+    time_per_char = duration / total_chars if total_chars > 0 else 0
+
+    subtitles = []
+    current_time = 0.0
+
+    def emit(text: str):
+        nonlocal current_time
+        end_time = current_time + len(text) * time_per_char
+        subtitles.append({"start": current_time, "end": end_time, "text": text.strip()})
+        current_time = end_time
+
+    for sentence in sentences:
+        words = sentence.split()
+        if not words:
+            continue
+        remaining = suffix_char_counts(words)
+
+        current_text = ""
+        for i, word in enumerate(words):
+            next_text = current_text + (" " if current_text else "") + word
+
+            if len(next_text) > max_chars and current_text:
+                if 0 < remaining[i + 1] < min_remaining:
+                    # 남은 단어까지 현재 줄에 포함하고 이 문장 끝
+                    emit(next_text + " " + " ".join(words[i + 1:]))
+                    current_text = ""
+                    break
+                emit(current_text)
+                current_text = word
+            else:
+                current_text = next_text
+
+        if current_text:
+            emit(current_text)
+
+    return subtitles
+
+
+def resolve_overlaps(subtitles: List[Dict], gap: float = 0.05, min_duration: float = 0.3) -> List[Dict]:
+    """
+    앞 자막이 다음 자막과 겹치면 다음 자막 시작 gap초 전에 끝나도록 줄임 (제자리 수정)
+
+    그러면 min_duration보다 짧아지는 경우엔 min_duration을 보장하고 다음 자막 시작을 뒤로 민다.
+    """
+    for current_sub, next_sub in zip(subtitles, subtitles[1:]):
+        if current_sub["end"] >= next_sub["start"]:
+            adjusted_end = next_sub["start"] - gap
+            if adjusted_end - current_sub["start"] < min_duration:
+                current_sub["end"] = current_sub["start"] + min_duration
+                next_sub["start"] = current_sub["end"] + gap
+            else:
+                current_sub["end"] = adjusted_end
+    return subtitles
+
+
+def clip_to_duration(subtitles: Sequence[Dict], duration: float) -> List[Dict]:
+    """duration 이후에 시작하는 자막은 빼고, 넘치는 끝 시간은 duration으로 자름"""
+    return [
+        {"start": sub["start"], "end": min(sub["end"], duration), "text": sub["text"]}
+        for sub in subtitles
+        if sub["start"] < duration
+    ]
+
+
+def build_subtitle_ass(subtitles: Sequence[Dict]) -> str:
+    """자막 구간 → ASS 문서 (NanumGothic 96pt 기본 스타일)"""
+    lines = [ASS_HEADER]
+    for sub in subtitles:
+        start = format_ass_timestamp(sub["start"])
+        end = format_ass_timestamp(sub["end"])
+        text = sub["text"].replace('\n', '\\N')
+        lines.append(f"Dialogue: 0,{start},{end},Default,,0,0,0,,{text}\n")
+    return "".join(lines)
+
+
+def write_subtitle_ass(subtitles: Sequence[Dict], ass_path: Path) -> Path:
+    """자막 구간을 ASS 파일로 저장"""
+    ass_path = Path(ass_path)
+    with open(ass_path, 'w', encoding='utf-8') as f:
+        f.write(build_subtitle_ass(subtitles))
+    return ass_path
@@ -0,0 +1,194 @@
+"""
+Whisper 음성 인식 공용 서비스
+
+자막 타이밍용 Whisper 호출을 한 곳으로 모은 모듈.
+
+- 모델은 (백엔드, 크기)별로 프로세스당 한 번만 로드
+- 같은 모델에 대한 요청은 직렬화 (씬 병렬 렌더링 중에도 모델 복사본이 늘지 않음)
+- faster-whisper(CTranslate2)가 설치되어 있으면 int8 양자화 CPU 백엔드 사용,
+  없으면 openai-whisper 사용
+
+환경변수:
+    WHISPER_BACKEND       auto(기본) | faster | openai
+    WHISPER_DEVICE        faster-whisper 디바이스 (기본: auto)
+    WHISPER_COMPUTE_TYPE  faster-whisper 연산 타입 (기본: int8)
+    WHISPER_CPU_THREADS   faster-whisper CPU 스레드 수 (기본: 0 = 자동)
+"""
+import os
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import faster_whisper
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+try:
+    import whisper
+    WHISPER_AVAILABLE = True
+except ImportError:
+    WHISPER_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+BACKEND_FASTER = 'faster'
+BACKEND_OPENAI = 'openai'
+
+
+def split_segments_to_words(segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    세그먼트 텍스트를 공백 단위 단어로 나누고 세그먼트 시간을 균등 분배
+
+    Returns:
+        [{"word": str, "start": float, "end": float}, ...]
+    """
+    word_segments = []
+    for segment in segments:
+        words = segment.get("text", "").strip().split()
+        if not words:
+            continue
+
+        start_time = segment.get("start", 0.0)
+        end_time = segment.get("end", 0.0)
+        duration_per_word = (end_time - start_time) / len(words)
+
+        for i, word in enumerate(words):
+            word_start = start_time + (i * duration_per_word)
+            word_segments.append({
+                "word": word.strip(),
+                "start": word_start,
+                "end": word_start + duration_per_word
+            })
+    return word_segments
+
+
+class TranscriptionService:
+    """모델을 한 번만 로드해서 공유하는 Whisper 음성 인식 서비스"""
+
+    def __init__(self, backend: Optional[str] = None, device: Optional[str] = None,
+                 compute_type: Optional[str] = None, cpu_threads: Optional[int] = None):
+        """
+        Args:
+            backend: 'faster' | 'openai' | 'auto' (기본: WHISPER_BACKEND 환경변수 또는 auto)
+            device: faster-whisper 디바이스 (기본: WHISPER_DEVICE 또는 auto)
+            compute_type: faster-whisper 연산 타입 (기본: WHISPER_COMPUTE_TYPE 또는 int8)
+            cpu_threads: faster-whisper CPU 스레드 수 (기본: WHISPER_CPU_THREADS 또는 0)
+        """
+        self.backend = self._resolve_backend(backend or os.getenv('WHISPER_BACKEND', 'auto'))
+        self.device = device or os.getenv('WHISPER_DEVICE', 'auto')
+        self.compute_type = compute_type or os.getenv('WHISPER_COMPUTE_TYPE', 'int8')
+        self.cpu_threads = cpu_threads if cpu_threads is not None else int(os.getenv('WHISPER_CPU_THREADS', '0'))
+
+        self._models: Dict[Tuple[str, str], Any] = {}
+        self._model_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def _resolve_backend(name: str) -> str:
+        name = name.lower()
+        if name in ('faster', 'faster-whisper', 'faster_whisper', 'ctranslate2'):
+            return BACKEND_FASTER
+        if name in ('openai', 'openai-whisper', 'whisper'):
+            return BACKEND_OPENAI
+        return BACKEND_FASTER if FASTER_WHISPER_AVAILABLE else BACKEND_OPENAI
+
+    def _load_model(self, model_size: str):
+        """백엔드별 모델 로드 (캐시 없음)"""
+        if self.backend == BACKEND_FASTER:
+            if not FASTER_WHISPER_AVAILABLE:
+                raise ImportError("faster-whisper 모듈이 설치되지 않았습니다. pip install faster-whisper")
+            return faster_whisper.WhisperModel(
+                model_size,
+                device=self.device,
+                compute_type=self.compute_type,
+                cpu_threads=self.cpu_threads
+            )
+
+        if not WHISPER_AVAILABLE:
+            raise ImportError("whisper 모듈이 설치되지 않았습니다. pip install openai-whisper")
+        return whisper.load_model(model_size)
+
+    def get_model(self, model_size: str = 'base'):
+        """(모델, 요청 직렬화 락) - 크기별로 최초 한 번만 로드"""
+        key = (self.backend, model_size)
+        with self._lock:
+            model_lock = self._model_locks.setdefault(key, threading.Lock())
+
+        # 로드도 모델 락 안에서 해서 같은 크기를 동시에 두 번 로드하지 않음
+        with model_lock:
+            model = self._models.get(key)
+            if model is None:
+                logger.info(f"🎤 Whisper 모델 로드: {model_size} ({self.backend})")
+                model = self._load_model(model_size)
+                self._models[key] = model
+        return model, model_lock
+
+    def transcribe(self, audio, model_size: str = 'base', language: Optional[str] = None,
+                   task: str = 'transcribe') -> List[Dict[str, Any]]:
+        """
+        음성 인식 (같은 모델 요청은 순서대로 처리)
+
+        Args:
+            audio: 오디오 파일 경로 또는 float32 샘플 배열
+            model_size: Whisper 모델 크기 (tiny, base, small, medium, large ...)
+            language: 언어 코드 (None이면 자동 감지)
+            task: 'transcribe' 또는 'translate'
+
+        Returns:
+            [{"start": float, "end": float, "text": str}, ...]
+        """
+        model, model_lock = self.get_model(model_size)
+        if not isinstance(audio, (str, bytes)) and hasattr(audio, '__fspath__'):
+            audio = os.fspath(audio)
+
+        with model_lock:
+            if self.backend == BACKEND_FASTER:
+                segments, _info = model.transcribe(audio, language=language, task=task)
+                # 제너레이터라서 락 안에서 끝까지 소비해야 실제 인식이 끝남
+                return [
+                    {"start": seg.start, "end": seg.end, "text": seg.text.strip()}
+                    for seg in segments
+                ]
+
+            device = getattr(model, 'device', None)
+            result = model.transcribe(
+                audio,
+                language=language,
+                task=task,
+                verbose=False,
+                fp16=getattr(device, 'type', 'cpu') == 'cuda'  # CPU에서 FP16 경고 방지
+            )
+        return [
+            {"start": seg["start"], "end": seg["end"], "text": seg["text"].strip()}
+            for seg in result.get("segments", [])
+        ]
+
+    async def transcribe_async(self, audio, model_size: str = 'base', language: Optional[str] = None,
+                               task: str = 'transcribe') -> List[Dict[str, Any]]:
+        """transcribe()를 서비스 전용 스레드에서 실행 (이벤트 루프 블로킹 없음)"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='whisper')
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, lambda: self.transcribe(audio, model_size, language, task)
+        )
+
+
+_default_service: Optional[TranscriptionService] = None
+_default_service_lock = threading.Lock()
+
+
+def get_transcription_service() -> TranscriptionService:
+    """프로세스 공용 TranscriptionService"""
+    global _default_service
+    if _default_service is None:
+        with _default_service_lock:
+            if _default_service is None:
+                _default_service = TranscriptionService()
+    return _default_service
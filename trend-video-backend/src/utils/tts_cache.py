@@ -0,0 +1,191 @@
+"""
+TTS 결과 디스크 캐시 (내용 주소 기반)
+
+같은 나레이션을 다시 렌더링할 때 TTS 서버 왕복과 ffprobe 호출을 건너뛰기 위한 캐시.
+키는 (provider, voice, speed, 정규화된 텍스트)의 SHA-256 이며,
+엔트리마다 MP3 파일과 사이드카 JSON(단어 타임스탬프 + 길이)을 저장한다.
+
+캐시 폴더 구조:
+    cache/tts/
+        ab/ab12...ef.mp3
+        ab/ab12...ef.json
+"""
+import os
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from .json_store import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+# 키 포맷이 바뀌면 올려서 기존 캐시를 무효화
+TTS_CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[2] / 'cache' / 'tts'
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024  # 2GB
+
+
+def make_tts_cache_key(provider: str, voice: str, speed: float, text: str) -> str:
+    """(provider, voice, speed, text)로 캐시 키 생성"""
+    payload = json.dumps(
+        {
+            'v': TTS_CACHE_VERSION,
+            'provider': provider,
+            'voice': voice,
+            'speed': round(float(speed), 4),
+            'text': text,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class TTSCache:
+    """크기 제한 LRU 방식의 TTS 디스크 캐시"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: Optional[int] = None):
+        """
+        Args:
+            cache_dir: 캐시 폴더 (기본: TTS_CACHE_DIR 환경변수 또는 cache/tts)
+            max_bytes: 최대 캐시 크기 (기본: TTS_CACHE_MAX_MB 환경변수 또는 2GB)
+        """
+        if cache_dir is None:
+            cache_dir = os.getenv('TTS_CACHE_DIR') or DEFAULT_CACHE_DIR
+        if max_bytes is None:
+            max_mb = os.getenv('TTS_CACHE_MAX_MB')
+            max_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES
+
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _entry_paths(self, key: str) -> Tuple[Path, Path]:
+        """키에 해당하는 (오디오, 사이드카) 경로"""
+        folder = self.cache_dir / key[:2]
+        return folder / f"{key}.mp3", folder / f"{key}.json"
+
+    def get(self, key: str, output_path: Path) -> Optional[Tuple[float, List[dict]]]:
+        """
+        캐시 조회. 히트하면 오디오를 output_path로 복사하고 (duration, word_timings) 반환
+
+        Returns:
+            (duration, word_timings) 또는 None (미스)
+        """
+        audio_path, meta_path = self._entry_paths(key)
+        if not audio_path.exists() or not meta_path.exists():
+            return None
+
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            duration = float(meta['duration'])
+            word_timings = meta.get('word_timings', [])
+
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(audio_path, output_path)
+
+            # LRU: 사이드카 mtime을 마지막 사용 시각으로 사용
+            os.utime(meta_path, None)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"⚠️ TTS 캐시 엔트리 손상, 삭제: {key[:12]} ({e})")
+            self._remove_entry(key)
+            return None
+
+        return duration, word_timings
+
+    def put(self, key: str, audio_path: Path, duration: float, word_timings: List[dict], **info) -> bool:
+        """
+        생성된 TTS 결과를 캐시에 저장 (임시 파일 → os.replace로 원자적 저장)
+
+        Args:
+            key: make_tts_cache_key()로 만든 키
+            audio_path: 생성된 MP3 경로
+            duration: 오디오 길이 (초)
+            word_timings: 단어별 타임스탬프 리스트
+            **info: 사이드카에 함께 기록할 정보 (provider, voice 등)
+        """
+        audio_path = Path(audio_path)
+        if not audio_path.exists() or audio_path.stat().st_size == 0:
+            return False
+
+        cached_audio, cached_meta = self._entry_paths(key)
+        cached_audio.parent.mkdir(parents=True, exist_ok=True)
+
+        meta = {
+            'duration': duration,
+            'word_timings': word_timings or [],
+            'created_at': datetime.now().isoformat(),
+            **info,
+        }
+
+        try:
+            self._atomic_copy(audio_path, cached_audio)
+            atomic_write_json(cached_meta, meta)
+        except OSError as e:
+            logger.warning(f"⚠️ TTS 캐시 저장 실패: {e}")
+            self._remove_entry(key)
+            return False
+
+        self.evict()
+        return True
+
+    def evict(self) -> int:
+        """max_bytes를 넘으면 오래 사용하지 않은 엔트리부터 삭제. 삭제된 엔트리 수 반환"""
+        entries = []
+        total = 0
+        for meta_path in self.cache_dir.glob('*/*.json'):
+            audio_path = meta_path.with_suffix('.mp3')
+            try:
+                size = meta_path.stat().st_size
+                last_used = meta_path.stat().st_mtime
+                if audio_path.exists():
+                    size += audio_path.stat().st_size
+            except OSError:
+                continue
+            entries.append((last_used, size, meta_path.stem))
+            total += size
+
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        for _, size, key in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove_entry(key)
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.info(f"🧹 TTS 캐시 정리: {removed}개 엔트리 삭제 (현재 {total / 1024 / 1024:.1f}MB)")
+        return removed
+
+    def _remove_entry(self, key: str):
+        for path in self._entry_paths(key):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _atomic_copy(src: Path, dst: Path):
+        fd, tmp = tempfile.mkstemp(dir=str(dst.parent), suffix='.tmp')
+        os.close(fd)
+        try:
+            shutil.copyfile(src, tmp)
+            os.replace(tmp, dst)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
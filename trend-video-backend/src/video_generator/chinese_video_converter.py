@@ -31,6 +31,23 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+# 백엔드 루트를 경로에 추가 (스크립트 단독 실행 시 src 패키지 임포트용)
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from src.utils.concat_engine import ConcatError, smart_concat
+from src.utils.ffmpeg_job import run_ffmpeg
+from src.utils.ffmpeg_utils import (
+    get_audio_duration,
+    get_ffmpeg_path as shared_get_ffmpeg_path,
+    get_video_duration,
+    probe_media,
+    probe_many,
+)
+from src.utils.media_duration import read_media_duration
+from src.utils.transcription import get_transcription_service
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -83,20 +100,10 @@ except ImportError:
 
 
 def get_ffmpeg_path():
-    """FFmpeg 경로 확인"""
-    try:
-        result = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True)
-        if result.returncode == 0:
-            return 'ffmpeg'
-    except FileNotFoundError:
-        pass
-
-    # imageio-ffmpeg 시도
-    try:
-        import imageio_ffmpeg
-        return imageio_ffmpeg.get_ffmpeg_exe()
-    except ImportError:
-        pass
+    """FFmpeg 경로 확인 (공용 리졸버: 프로세스당 한 번 탐색, 결과는 디스크 캐시)"""
+    ffmpeg = shared_get_ffmpeg_path()
+    if ffmpeg:
+        return ffmpeg
 
     raise RuntimeError("FFmpeg를 찾을 수 없습니다. FFmpeg를 설치해주세요.")
 
@@ -104,22 +111,9 @@ def get_ffmpeg_path():
 def get_video_dimensions(video_path: Path) -> tuple:
     """비디오 해상도 가져오기 (width, height)"""
     try:
-        ffmpeg = get_ffmpeg_path()
-        ffprobe = ffmpeg.replace('ffmpeg', 'ffprobe')
-
-        cmd = [
-            ffprobe,
-            '-v', 'error',
-            '-select_streams', 'v:0',
-            '-show_entries', 'stream=width,height',
-            '-of', 'csv=p=0',
-            str(video_path)
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            width, height = map(int, result.stdout.strip().split(','))
-            return width, height
+        info = probe_media(Path(video_path))
+        if info and info['video']:
+            return info['video']['width'], info['video']['height']
         return 1920, 1080  # 기본값
 
     except Exception as e:
@@ -255,6 +249,8 @@ def _remove_watermark_lama(input_video: Path, output_video: Path, x: int, y: int
 
         try:
             ffmpeg = get_ffmpeg_path()
+            # 전체 길이 처리 - FFmpeg 타임아웃을 영상 길이에 맞춤
+            video_duration = get_video_duration(input_video)
 
             # 1. 프레임 추출
             logger.info(f"🎞️ 프레임 추출 중...")
@@ -263,7 +259,7 @@ def _remove_watermark_lama(input_video: Path, output_video: Path, x: int, y: int
                 '-vf', 'fps=30',  # 30fps로 고정
                 str(frames_dir / 'frame_%06d.png')
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_ffmpeg(cmd, duration=video_duration, stop_dir=output_dir)
             if result.returncode != 0:
                 logger.error(f"❌ 프레임 추출 실패: {result.stderr}")
                 return False
@@ -333,7 +329,7 @@ def _remove_watermark_lama(input_video: Path, output_video: Path, x: int, y: int
                 '-y',
                 str(output_video)
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_ffmpeg(cmd, duration=video_duration, stop_dir=output_dir, encode_slot=True)
             if result.returncode != 0:
                 logger.error(f"❌ 비디오 재조립 실패: {result.stderr}")
                 return False
@@ -466,6 +462,8 @@ def _remove_watermark_e2fgvi(input_video: Path, output_video: Path, x: int, y: i
         try:
             # FFmpeg로 프레임 추출
             ffmpeg = get_ffmpeg_path()
+            # 전체 길이 처리 - FFmpeg 타임아웃을 영상 길이에 맞춤
+            video_duration = get_video_duration(input_video)
             logger.info("🎬 프레임 추출 중...")
 
             extract_cmd = [
@@ -474,7 +472,7 @@ def _remove_watermark_e2fgvi(input_video: Path, output_video: Path, x: int, y: i
                 str(frames_dir / '%d.jpg')
             ]
 
-            result = subprocess.run(extract_cmd, capture_output=True, text=True)
+            result = run_ffmpeg(extract_cmd, duration=video_duration, stop_dir=output_dir)
             if result.returncode != 0:
                 logger.error(f"❌ 프레임 추출 실패: {result.stderr}")
                 return False
@@ -541,7 +539,7 @@ def _remove_watermark_e2fgvi(input_video: Path, output_video: Path, x: int, y: i
                 str(output_video)
             ]
 
-            result = subprocess.run(assemble_cmd, capture_output=True, text=True)
+            result = run_ffmpeg(assemble_cmd, duration=video_duration, stop_dir=output_dir, encode_slot=True)
             if result.returncode != 0:
                 logger.error(f"❌ 비디오 재조립 실패: {result.stderr}")
                 return False
@@ -746,7 +744,8 @@ def remove_watermark_ai(input_video: Path, output_video: Path, watermark_region:
                 str(output_video)
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_ffmpeg(cmd, duration=get_video_duration(input_video), stop_dir=output_dir,
+                                encode_slot=True)
             if result.returncode == 0:
                 logger.info(f"✅ 검은색 박스 처리 완료")
                 return True
@@ -784,7 +783,7 @@ def remove_watermark_ai(input_video: Path, output_video: Path, watermark_region:
                 '-qscale:v', '2',  # 고품질 유지
                 str(frames_dir / 'frame_%05d.png')
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = run_ffmpeg(cmd, timeout=120, stop_dir=output_dir)
             if result.returncode != 0:
                 raise Exception(f"프레임 추출 실패: {result.stderr}")
 
@@ -835,7 +834,7 @@ def remove_watermark_ai(input_video: Path, output_video: Path, watermark_region:
                 str(output_video)
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            result = run_ffmpeg(cmd, timeout=300, stop_dir=output_dir, encode_slot=True)
             if result.returncode != 0:
                 raise Exception(f"비디오 재조립 실패: {result.stderr}")
 
@@ -875,7 +874,7 @@ def extract_audio(video_path: Path, output_audio: Path) -> bool:
             str(output_audio)
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = run_ffmpeg(cmd, duration=get_video_duration(video_path))
 
         if result.returncode != 0:
             logger.error(f"❌ 오디오 추출 실패: {result.stderr}")
@@ -892,28 +891,16 @@ def extract_audio(video_path: Path, output_audio: Path) -> bool:
 def transcribe_audio_whisper(audio_path: Path, language: str = 'zh') -> Optional[List[Dict]]:
     """Whisper를 사용하여 오디오 전사 (타임스탬프 포함)"""
     try:
-        import whisper
         logger.info(f"🎤 Whisper로 음성 인식 중 (언어: {language})...")
 
-        # 모델 로드 (medium 추천, 정확도와 속도 균형)
-        model = whisper.load_model("medium")
-
-        # 전사
-        result = model.transcribe(
+        # medium 추천, 정확도와 속도 균형 (모델은 프로세스당 한 번만 로드)
+        segments = get_transcription_service().transcribe(
             str(audio_path),
+            model_size="medium",
             language=language,
-            task='transcribe',
-            verbose=False
+            task='transcribe'
         )
 
-        segments = []
-        for segment in result['segments']:
-            segments.append({
-                'start': segment['start'],
-                'end': segment['end'],
-                'text': segment['text'].strip()
-            })
-
         logger.info(f"✅ 음성 인식 완료: {len(segments)}개 세그먼트")
         return segments
 
@@ -1202,55 +1189,34 @@ async def generate_audio_for_segments(segments: List[Dict], output_dir: Path, us
             success = generate_tts_openai(text, audio_path)
 
         if success and audio_path.exists():
-            # 실제 오디오 길이 측정
-            try:
-                import subprocess
-                ffmpeg = get_ffmpeg_path()
-                result = subprocess.run(
-                    [ffmpeg, '-i', str(audio_path)],
-                    capture_output=True,
-                    text=True
-                )
-                # FFmpeg stderr에서 Duration 추출
-                duration_match = None
-                for line in result.stderr.split('\n'):
-                    if 'Duration:' in line:
-                        import re
-                        duration_match = re.search(r'Duration: (\d{2}):(\d{2}):(\d{2}\.\d{2})', line)
-                        if duration_match:
-                            h, m, s = duration_match.groups()
-                            actual_duration = int(h) * 3600 + int(m) * 60 + float(s)
-                            break
-
-                if duration_match:
-                    audio_segments.append({
-                        'path': audio_path,
-                        'text': text,
-                        'original_start': segment['start'],
-                        'original_end': segment['end'],
-                        'actual_duration': actual_duration
-                    })
-                else:
-                    # Duration을 못 찾으면 원본 길이 사용
-                    audio_segments.append({
-                        'path': audio_path,
-                        'text': text,
-                        'original_start': segment['start'],
-                        'original_end': segment['end'],
-                        'actual_duration': segment['end'] - segment['start']
-                    })
-            except Exception as e:
-                logger.warning(f"⚠️ 오디오 길이 측정 실패 (원본 길이 사용): {e}")
-                audio_segments.append({
-                    'path': audio_path,
-                    'text': text,
-                    'original_start': segment['start'],
-                    'original_end': segment['end'],
-                    'actual_duration': segment['end'] - segment['start']
-                })
+            audio_segments.append({
+                'path': audio_path,
+                'text': text,
+                'original_start': segment['start'],
+                'original_end': segment['end'],
+                'actual_duration': segment['end'] - segment['start']
+            })
         else:
             logger.error(f"❌ 세그먼트 {i} TTS 생성 실패")
 
+    # 실제 오디오 길이 측정 (MP3 헤더에서 읽고, 못 읽은 파일만 한 번에 병렬 조회. 실패하면 원본 길이 유지)
+    try:
+        unread = []
+        for item in audio_segments:
+            duration = read_media_duration(item['path'])
+            if duration is None:
+                unread.append(item)
+            else:
+                item['actual_duration'] = duration
+
+        probes = probe_many(item['path'] for item in unread)
+        for item in unread:
+            info = probes.get(item['path'])
+            if info and info['duration'] is not None:
+                item['actual_duration'] = info['duration']
+    except Exception as e:
+        logger.warning(f"⚠️ 오디오 길이 측정 실패 (원본 길이 사용): {e}")
+
     logger.info(f"✅ TTS 생성 완료: {len(audio_segments)}개 파일")
     return audio_segments
 
@@ -1265,33 +1231,15 @@ def merge_audio_segments(audio_segments: List[Dict], output_audio: Path) -> bool
             logger.error("❌ 병합할 오디오 파일이 없습니다.")
             return False
 
-        # 파일 리스트 생성
-        list_file = output_audio.parent / "audio_list.txt"
-        with open(list_file, 'w', encoding='utf-8') as f:
-            for seg in audio_segments:
-                f.write(f"file '{seg['path'].absolute()}'\n")
-
-        cmd = [
-            ffmpeg,
-            '-f', 'concat',
-            '-safe', '0',
-            '-i', str(list_file),
-            '-c', 'copy',
-            '-y',
-            str(output_audio)
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        if result.returncode != 0:
-            logger.error(f"❌ 오디오 병합 실패: {result.stderr}")
+        # 코덱/샘플레이트가 같으면 스트림 복사, 다르면 재인코딩 (공용 병합 엔진)
+        try:
+            smart_concat([seg['path'] for seg in audio_segments], output_audio, ffmpeg=ffmpeg)
+        except ConcatError as e:
+            logger.error(f"❌ 오디오 병합 실패: {e}")
             return False
 
         logger.info(f"✅ 오디오 병합 완료: {output_audio.name}")
 
-        # 정리
-        list_file.unlink()
-
         return True
 
     except Exception as e:
@@ -1304,23 +1252,8 @@ def create_simple_srt(full_text: str, audio_path: Path, output_srt: Path) -> boo
     try:
         logger.info(f"📝 SRT 자막 파일 생성 중: {output_srt.name}")
 
-        # 오디오 길이 측정
-        ffmpeg = get_ffmpeg_path()
-        result = subprocess.run(
-            [ffmpeg, '-i', str(audio_path)],
-            capture_output=True,
-            text=True
-        )
-
-        audio_duration = 0
-        for line in result.stderr.split('\n'):
-            if 'Duration:' in line:
-                import re
-                match = re.search(r'Duration: (\d{2}):(\d{2}):(\d{2}\.\d{2})', line)
-                if match:
-                    h, m, s = match.groups()
-                    audio_duration = int(h) * 3600 + int(m) * 60 + float(s)
-                    break
+        # 오디오 길이 측정 (헤더에서 읽고, 안 되면 ffprobe)
+        audio_duration = get_audio_duration(audio_path)
 
         if audio_duration == 0:
             logger.error("❌ 오디오 길이를 측정할 수 없습니다")
@@ -1464,6 +1397,9 @@ def replace_video_audio_with_subtitle(
         ffmpeg = get_ffmpeg_path()
         logger.info(f"🎞️ 영상 합성 중...")
 
+        # 오디오 길이 측정 (헤더에서 읽고, 안 되면 ffprobe) - 출력 길이이자 타임아웃 기준
+        audio_duration = get_audio_duration(audio_path)
+
         if burn_subtitle:
             # 자막을 비디오에 하드코딩 (burned-in)
             # Windows 경로 이스케이프 처리
@@ -1490,22 +1426,6 @@ def replace_video_audio_with_subtitle(
                 f"subtitles='{subtitle_path_escaped}':force_style='{subtitle_style}'"  # 한국어 자막
             )
 
-            # 오디오 길이 측정
-            result = subprocess.run(
-                [ffmpeg, '-i', str(audio_path)],
-                capture_output=True,
-                text=True
-            )
-            audio_duration = 0
-            for line in result.stderr.split('\n'):
-                if 'Duration:' in line:
-                    import re
-                    match = re.search(r'Duration: (\d{2}):(\d{2}):(\d{2}\.\d{2})', line)
-                    if match:
-                        h, m, s = match.groups()
-                        audio_duration = int(h) * 3600 + int(m) * 60 + float(s)
-                        break
-
             logger.info(f"🎵 오디오 길이: {audio_duration:.2f}초")
 
             # 영상을 오디오 길이에 맞추기 (loop 사용)
@@ -1547,7 +1467,7 @@ def replace_video_audio_with_subtitle(
             ]
 
         logger.info(f"📹 FFmpeg 명령 실행 중...")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = run_ffmpeg(cmd, duration=audio_duration, stop_dir=output_video.parent, encode_slot=True)
 
         if result.returncode != 0:
             logger.error(f"❌ 영상 합성 실패: {result.stderr}")
@@ -26,12 +26,14 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
-# OpenCV 임포트 시도
-try:
-    import cv2
-    OPENCV_AVAILABLE = True
-except ImportError:
-    OPENCV_AVAILABLE = False
+# 백엔드 루트를 경로에 추가 (스크립트 단독 실행 시 src 패키지 임포트용)
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from src.utils.focus_detection import OPENCV_AVAILABLE, get_focus_detector, is_landscape_16_9, vertical_crop_box
+
+if not OPENCV_AVAILABLE:
     print("⚠️ OpenCV가 없습니다. 얼굴 감지 없이 중앙 크롭만 수행합니다.")
     print("   설치: pip install opencv-python")
 
@@ -46,52 +48,12 @@ logger = logging.getLogger(__name__)
 def detect_focus_area(image_path: Path) -> Optional[Tuple[int, int]]:
     """
     이미지에서 인물이나 주요 물체를 감지하여 중심 좌표 반환
+    (공용 FocusDetector 사용 - 분류기 1회 로드, 축소 감지, 내용 해시 캐시)
 
     Returns:
         (center_x, center_y) 또는 None (감지 실패 시)
     """
-    if not OPENCV_AVAILABLE:
-        return None
-
-    try:
-        # 이미지 로드
-        img = cv2.imread(str(image_path))
-        if img is None:
-            return None
-
-        # 그레이스케일 변환
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-        # Haar Cascade로 얼굴 감지
-        cascade_path = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-        face_cascade = cv2.CascadeClassifier(cascade_path)
-
-        # 얼굴 감지 (여러 스케일, 최소 인접)
-        faces = face_cascade.detectMultiScale(
-            gray,
-            scaleFactor=1.1,
-            minNeighbors=5,
-            minSize=(30, 30)
-        )
-
-        if len(faces) > 0:
-            # 가장 큰 얼굴을 주요 인물로 선택
-            largest_face = max(faces, key=lambda f: f[2] * f[3])
-            x, y, w, h = largest_face
-
-            # 얼굴 중심 좌표
-            center_x = x + w // 2
-            center_y = y + h // 2
-
-            logger.info(f"  ✅ 얼굴 감지됨: ({center_x}, {center_y}), 크기: {w}x{h}")
-            return (center_x, center_y)
-
-        logger.info(f"  ℹ️ 얼굴 미감지 (중앙 크롭 사용)")
-        return None
-
-    except Exception as e:
-        logger.warning(f"  ⚠️ 얼굴 감지 실패: {e}")
-        return None
+    return get_focus_detector().detect(image_path)
 
 
 def is_landscape_image(image_path: Path) -> bool:
@@ -99,10 +61,8 @@ def is_landscape_image(image_path: Path) -> bool:
     try:
         with Image.open(image_path) as img:
             width, height = img.size
-            ratio = width / height
             # 16:9 = 1.778, 허용 오차 ±10%
-            target_ratio = 16 / 9
-            return abs(ratio - target_ratio) < 0.2
+            return is_landscape_16_9(width, height)
     except Exception as e:
         logger.warning(f"이미지 확인 실패: {image_path} - {e}")
         return False
@@ -128,79 +88,14 @@ def convert_to_vertical(input_path: Path, output_path: Path) -> bool:
             width, height = img.size
             logger.info(f"  원본 크기: {width}x{height}")
 
-            # 목표 비율: 9:16 (세로)
-            target_ratio = 9 / 16
-
-            # 현재 높이를 기준으로 9:16 비율의 너비 계산
-            new_width = int(height * target_ratio)
-
-            if new_width > width:
-                # 높이를 기준으로 계산한 너비가 원본보다 크면, 너비를 기준으로 재계산
-                new_height = int(width / target_ratio)
-                new_width = width
-
-                # 얼굴이 감지되면 얼굴 중심으로, 아니면 상단 크롭
-                if focus_point:
-                    focus_x, focus_y = focus_point
-                    # 얼굴 y좌표를 중심으로 크롭 (위아래 여유 공간 확보)
-                    center_y = focus_y
-                    top = max(0, center_y - new_height // 2)
-                    bottom = min(height, top + new_height)
-
-                    # 경계 조정
-                    if bottom > height:
-                        bottom = height
-                        top = bottom - new_height
-                    if top < 0:
-                        top = 0
-                        bottom = new_height
-
-                    logger.info(f"  ✨ 얼굴 중심 크롭: y={center_y}")
-                else:
-                    # 상단 부분을 우선적으로 크롭
-                    top = 0
-                    bottom = new_height
-
-                left = 0
-                right = width
-
-                logger.info(f"  크롭 영역: ({left}, {top}) ~ ({right}, {bottom})")
-
-                # 이미지 크롭
-                img = img.crop((left, top, right, bottom))
-            else:
-                # 높이는 그대로, 너비를 크롭
-                new_height = height
-
-                # 얼굴이 감지되면 얼굴 중심으로, 아니면 중앙 크롭
-                if focus_point:
-                    focus_x, focus_y = focus_point
-                    # 얼굴 x좌표를 중심으로 크롭
-                    center_x = focus_x
-                    left = max(0, center_x - new_width // 2)
-                    right = min(width, left + new_width)
-
-                    # 경계 조정
-                    if right > width:
-                        right = width
-                        left = right - new_width
-                    if left < 0:
-                        left = 0
-                        right = new_width
-
-                    logger.info(f"  ✨ 얼굴 중심 크롭: x={center_x}")
-                else:
-                    # 중앙 크롭
-                    left = (width - new_width) // 2
-                    right = left + new_width
-
-                top = 0
-                bottom = height
-
-                logger.info(f"  크롭 영역: ({left}, {top}) ~ ({right}, {bottom})")
-
-                # 이미지 크롭
-                img = img.crop((left, top, right, bottom))
+            # 9:16 크롭 영역 (얼굴 중심 또는 중앙/상단)
+            left, top, right, bottom = vertical_crop_box(width, height, focus_point)
+            if focus_point:
+                logger.info(f"  ✨ 얼굴 중심 크롭: ({focus_point[0]}, {focus_point[1]})")
+            logger.info(f"  크롭 영역: ({left}, {top}) ~ ({right}, {bottom})")
+
+            # 이미지 크롭
+            img = img.crop((left, top, right, bottom))
 
             # 표준 쇼츠 해상도로 리사이즈 (1080x1920)
             target_size = (1080, 1920)
@@ -261,6 +156,9 @@ def convert_folder_images(folder_path: Path) -> int:
 
     logger.info(f"\n🎨 이미지 변환 시작... ({len(landscape_images)}개)")
 
+    # 얼굴 감지를 프로세스 풀에서 한 번에 실행 (결과는 캐시되어 변환 시 재사용)
+    get_focus_detector().detect_many(landscape_images)
+
     # 변환 수행
     converted_count = 0
     for img_file in landscape_images:
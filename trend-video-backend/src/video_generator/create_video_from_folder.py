@@ -40,7 +40,7 @@ warnings.filterwarnings("ignore", category=UserWarning, module="pytorch_lightnin
 # 로깅 레벨 조정 (pytorch_lightning INFO 메시지 숨기기)
 import logging as base_logging
 base_logging.getLogger("pytorch_lightning").setLevel(base_logging.WARNING)
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import edge_tts
 import asyncio
 
@@ -62,8 +62,9 @@ except ImportError:
     logger_msg = "⚠️ boto3 패키지가 없습니다. pip install boto3"
 import re
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 import multiprocessing
+import threading
 import tempfile
 from PIL import Image as PILImage
 import numpy as np
@@ -74,14 +75,48 @@ from src.utils import (
     get_video_duration,
     get_audio_duration,
     detect_best_encoder,
-    format_ass_time,
+    get_encoder_preset,
+    build_still_scene_commands,
+    merge_ass_files,
+    build_single_pass_graph,
+    TTSCache,
+    make_tts_cache_key,
+    RenderManifest,
+    MediaFile,
+    MediaScan,
+    scan_media_folder,
+    OPENCV_AVAILABLE,
+    get_focus_detector,
+    is_landscape_16_9,
+    vertical_crop_box,
+    get_transcription_service,
+    split_segments_to_words,
+    ConcatError,
+    smart_concat,
+    AudioTrackError,
+    assemble_audio_track,
+    mux_audio_track,
+    probe_many,
+    run_ffmpeg,
+    get_encode_slot_pool,
+    clip_to_duration,
+    group_script_text,
+    group_timed_words,
+    resolve_overlaps,
+    split_script_sentences,
+    write_subtitle_ass,
 )
-# OpenCV 임포트 시도 (얼굴 감지용)
-try:
-    import cv2
-    OPENCV_AVAILABLE = True
-except ImportError:
-    OPENCV_AVAILABLE = False
+from src.utils.draft_render import (
+    DRAFT_AUDIO_BITRATE,
+    DRAFT_PRESET,
+    DRAFT_REENCODE_ARGS,
+    DRAFT_VIDEO_ARGS,
+    DraftTiming,
+    draft_output_path,
+    draft_resolution,
+)
+# 얼굴 감지 가능 여부 (OpenCV)
+if not OPENCV_AVAILABLE:
     logger_msg = "⚠️ OpenCV가 없습니다. 얼굴 감지 없이 중앙 크롭만 수행합니다. 설치: pip install opencv-python"
 
 # 로깅 설정 (먼저 설정)
@@ -142,13 +177,18 @@ except ImportError:
     ANTHROPIC_AVAILABLE = False
     logger.warning("[WARNING] anthropic module not found. Claude prompt refinement disabled.")
 
+# TTS 캐시에 기록된 길이와 실제 파일 길이의 허용 오차 (초)
+TTS_DURATION_TOLERANCE = 0.05
+
 
 class VideoFromFolderCreator:
     """story.json과 이미지로 영상을 생성하는 클래스"""
 
     def __init__(self, folder_path: str, voice: str = "ko-KR-SoonBokNeural",
                  speed: float = 1.0, aspect_ratio: str = "16:9", add_subtitles: bool = False,
-                 image_source: str = "none", image_provider: str = "openai", is_admin: bool = False):
+                 image_source: str = "none", image_provider: str = "openai", is_admin: bool = False,
+                 use_tts_cache: bool = True, incremental: bool = True, single_pass: bool = False,
+                 draft: bool = False, from_draft: bool = False):
         """
         Args:
             folder_path: story.json과 이미지가 있는 폴더 경로
@@ -159,6 +199,11 @@ class VideoFromFolderCreator:
             image_source: 이미지 소스 ("none", "dalle", "imagen3")
             image_provider: 이미지 생성 제공자 ("openai", "imagen3")
             is_admin: 관리자 모드 (비용 로그 표시)
+            use_tts_cache: TTS 디스크 캐시 사용 여부 (기본: True)
+            incremental: 입력이 바뀌지 않은 씬 비디오 재사용 여부 (기본: True)
+            single_pass: 씬별 인코딩 없이 전체 영상을 한 번에 인코딩 (기본: False)
+            draft: 검수용 초안 렌더링 - 540p, ultrafast, 저비트레이트 오디오, 별도 출력 경로 (기본: False)
+            from_draft: 초안의 씬 오디오/타이밍을 그대로 사용 (나레이션이 같은 씬은 TTS 생략, 기본: False)
         """
         self.folder_path = Path(folder_path)
 
@@ -263,33 +308,72 @@ class VideoFromFolderCreator:
         else:
             raise ValueError(f"지원하지 않는 비율: {aspect_ratio}")
 
+        # 초안 모드: 짧은 변 540px
+        self.draft = draft
+        if draft:
+            self.width, self.height = draft_resolution(self.width, self.height)
+
         # story.json 로드
         self.story_data = self._load_story_json()
 
         # 썸네일 자동 생성
         self._create_thumbnail()
 
-        # GPU 인코더 감지
-        self.video_codec, self.codec_preset = self._detect_best_encoder()
+        # GPU 인코더 감지 (초안은 libx264 ultrafast + 저비트레이트 오디오)
+        if draft:
+            self.video_codec, self.codec_preset = 'libx264', DRAFT_PRESET
+            self.audio_bitrate = DRAFT_AUDIO_BITRATE
+            logger.info(f"📝 초안 모드: {self.width}x{self.height}, {self.codec_preset}, 오디오 {self.audio_bitrate}")
+        else:
+            self.video_codec, self.codec_preset = self._detect_best_encoder()
+            self.audio_bitrate = None
 
         # Whisper 모델 캐싱 (한 번만 로드)
         self._whisper_model = None
 
+        # TTS 캐시 (나레이션이 같으면 TTS 재생성 건너뜀)
+        self.tts_cache = None
+        if use_tts_cache:
+            try:
+                self.tts_cache = TTSCache()
+                logger.info(f"🗄️ TTS 캐시 사용: {self.tts_cache.cache_dir}")
+            except OSError as e:
+                logger.warning(f"⚠️ TTS 캐시 초기화 실패, 캐시 없이 진행: {e}")
+
+        # 증분 렌더링 (create_all_videos에서 출력 폴더 기준으로 매니페스트 로드)
+        self.incremental = incremental
+        self.render_manifest = None
+        # 인코딩 워커 스레드별로 씬 렌더링에 실제 실행한 FFmpeg 명령 기록 (씬 지문용)
+        self._scene_encode_log = threading.local()
+
+        # 렌더링 방식 (False: 씬별 인코딩 후 병합, True: 전체 단일 인코딩)
+        self.single_pass = single_pass
+
+        # 초안 타이밍: 초안 렌더링은 기록, from_draft 렌더링은 초안 기록을 승격해 TTS 생략
+        self.draft_timing = DraftTiming(self._output_folder()) if draft else None
+        self.promoted_timing = None
+        if from_draft:
+            draft_folder = self.folder_path / "generated_videos_draft"
+            self.promoted_timing = DraftTiming(draft_folder)
+            if len(self.promoted_timing):
+                logger.info(f"📋 초안 타이밍 승격: {len(self.promoted_timing)}개 씬 ({draft_folder})")
+            else:
+                logger.warning(f"⚠️ 초안 타이밍 기록이 없습니다. TTS를 새로 생성합니다: {draft_folder}")
+
+        # 마지막 실행의 씬별 단계 소요 시간 (TTS/인코딩)
+        self.stage_timings = {}
+
+        # 미디어 폴더 스캔 결과 (이미지/비디오 찾기에서 공유)
+        self._media_scan = None
+
     def _detect_best_encoder(self):
         """사용 가능한 최고의 비디오 인코더 감지 (공통 모듈 사용)"""
         encoder_name, encoder_type = detect_best_encoder()
+        return encoder_name, get_encoder_preset(encoder_name)
 
-        # preset 매핑
-        preset_map = {
-            'h264_nvenc': 'p4',
-            'h264_qsv': 'fast',
-            'h264_amf': 'speed',
-            'h264_videotoolbox': 'medium',
-            'libx264': 'ultrafast'
-        }
-
-        preset = preset_map.get(encoder_name, 'medium')
-        return encoder_name, preset
+    def _output_folder(self) -> Path:
+        """씬 비디오/오디오 출력 폴더 (초안은 최종 렌더링과 분리)"""
+        return self.folder_path / ("generated_videos_draft" if self.draft else "generated_videos")
 
     def _load_story_json(self) -> Dict:
         """story로 시작하는 JSON 파일 로드"""
@@ -394,292 +478,102 @@ class VideoFromFolderCreator:
     def _detect_focus_area(self, image_path: Path) -> Optional[tuple]:
         """
         이미지에서 인물이나 주요 물체를 감지하여 중심 좌표 반환
-        OpenCV Haar Cascade로 얼굴 감지
+        OpenCV Haar Cascade로 얼굴 감지 (공용 FocusDetector - 내용 해시 캐시)
 
         Returns:
             (center_x, center_y) 또는 None (감지 실패 시)
         """
-        if not OPENCV_AVAILABLE:
-            return None
+        return get_focus_detector().detect(image_path)
 
+    @staticmethod
+    def _is_landscape_image(image_path: Path) -> bool:
+        """16:9 가로 이미지인지 (헤더만 읽음, 읽기 실패면 False)"""
         try:
-            # 이미지 로드
-            img = cv2.imread(str(image_path))
-            if img is None:
-                return None
-
-            # 그레이스케일 변환
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-            # Haar Cascade로 얼굴 감지
-            cascade_path = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-            face_cascade = cv2.CascadeClassifier(cascade_path)
-
-            # 얼굴 감지
-            faces = face_cascade.detectMultiScale(
-                gray,
-                scaleFactor=1.1,
-                minNeighbors=5,
-                minSize=(30, 30)
-            )
-
-            if len(faces) > 0:
-                # 가장 큰 얼굴을 주요 인물로 선택
-                largest_face = max(faces, key=lambda f: f[2] * f[3])
-                x, y, w, h = largest_face
-
-                # 얼굴 중심 좌표
-                center_x = x + w // 2
-                center_y = y + h // 2
-
-                logger.info(f"  ✅ 얼굴 감지됨: ({center_x}, {center_y}), 크기: {w}x{h}")
-                return (center_x, center_y)
-
-            logger.info(f"  ℹ️ 얼굴 미감지 (중앙 크롭 사용)")
-            return None
-
-        except Exception as e:
-            logger.warning(f"  ⚠️ 얼굴 감지 실패: {e}")
-            return None
+            with PILImage.open(image_path) as img:
+                width, height = img.size
+        except Exception:
+            return False
+        return is_landscape_16_9(width, height)
 
-    def _smart_crop_to_vertical(self, input_path: Path, output_path: Path) -> bool:
+    def _vertical_crop_box(self, scene_num: int, image_path: Path) -> Optional[tuple]:
         """
-        가로 이미지(16:9)를 세로(9:16)로 스마트 크롭 변환
+        숏폼(9:16)에서 16:9 가로 이미지의 스마트 크롭 영역 계산
         얼굴이 감지되면 얼굴 중심으로 크롭, 아니면 중앙 크롭
 
-        Args:
-            input_path: 원본 이미지 경로
-            output_path: 출력 이미지 경로
-
         Returns:
-            성공 여부
+            (left, top, right, bottom) 또는 None (크롭 불필요/실패 → 기본 scale+crop)
         """
-        try:
-            # 얼굴/물체 감지
-            focus_point = self._detect_focus_area(input_path)
+        if self.aspect_ratio != "9:16":
+            return None
 
-            with PILImage.open(input_path) as img:
+        try:
+            # 이미지 비율 체크 (헤더만 읽음)
+            with PILImage.open(image_path) as img:
                 width, height = img.size
-                logger.info(f"  🎨 스마트 크롭: 원본 {width}x{height}")
-
-                # 목표 비율: 9:16 (세로)
-                target_ratio = 9 / 16
-
-                # 현재 높이를 기준으로 9:16 비율의 너비 계산
-                new_width = int(height * target_ratio)
-
-                if new_width > width:
-                    # 높이를 기준으로 계산한 너비가 원본보다 크면, 너비를 기준으로 재계산
-                    new_height = int(width / target_ratio)
-                    new_width = width
-
-                    # 얼굴이 감지되면 얼굴 중심으로, 아니면 상단 크롭
-                    if focus_point:
-                        focus_x, focus_y = focus_point
-                        center_y = focus_y
-                        top = max(0, center_y - new_height // 2)
-                        bottom = min(height, top + new_height)
-
-                        if bottom > height:
-                            bottom = height
-                            top = bottom - new_height
-                        if top < 0:
-                            top = 0
-                            bottom = new_height
-
-                        logger.info(f"  ✨ 얼굴 중심 크롭: y={center_y}")
-                    else:
-                        # 상단 부분을 우선적으로 크롭
-                        top = 0
-                        bottom = new_height
-
-                    left = 0
-                    right = width
-                else:
-                    # 높이는 그대로, 너비를 크롭
-                    new_height = height
-
-                    # 얼굴이 감지되면 얼굴 중심으로, 아니면 중앙 크롭
-                    if focus_point:
-                        focus_x, focus_y = focus_point
-                        center_x = focus_x
-                        left = max(0, center_x - new_width // 2)
-                        right = min(width, left + new_width)
-
-                        if right > width:
-                            right = width
-                            left = right - new_width
-                        if left < 0:
-                            left = 0
-                            right = new_width
-
-                        logger.info(f"  ✨ 얼굴 중심 크롭: x={center_x}")
-                    else:
-                        # 중앙 크롭
-                        left = (width - new_width) // 2
-                        right = left + new_width
+            img_ratio = width / height
 
-                    top = 0
-                    bottom = height
-
-                logger.info(f"  ✂️ 크롭 영역: ({left}, {top}) ~ ({right}, {bottom})")
-
-                # 이미지 크롭
-                img = img.crop((left, top, right, bottom))
+            # 16:9 비율 (가로 영상)인지 확인 (허용 오차 ±10%)
+            if not is_landscape_16_9(width, height):
+                return None
 
-                # 표준 쇼츠 해상도로 리사이즈 (1080x1920)
-                target_size = (1080, 1920)
-                img = img.resize(target_size, PILImage.Resampling.LANCZOS)
+            logger.info(f"  🎨 씬 {scene_num}: 롱폼 이미지 감지 ({width}x{height}, 비율: {img_ratio:.3f})")
+            logger.info(f"  ✂️ 스마트 크롭 적용 중 (얼굴/물체 중심)...")
 
-                logger.info(f"  ✅ 스마트 크롭 완료: {target_size[0]}x{target_size[1]} (9:16)")
+            # 얼굴/물체 감지 → 크롭 영역 (FFmpeg 필터에서 바로 crop+scale)
+            focus_point = self._detect_focus_area(image_path)
+            crop_box = vertical_crop_box(width, height, focus_point)
+            if focus_point:
+                logger.info(f"  ✨ 얼굴 중심 크롭: ({focus_point[0]}, {focus_point[1]})")
+            logger.info(f"  ✂️ 크롭 영역: ({crop_box[0]}, {crop_box[1]}) ~ ({crop_box[2]}, {crop_box[3]})")
+            return crop_box
+        except Exception as e:
+            logger.warning(f"  ⚠️ 이미지 비율 체크 실패: {e}, 원본 이미지 사용")
+            return None
 
-                # 저장
-                img.save(output_path, quality=95)
-                return True
+    def _scan_media(self) -> MediaScan:
+        """프로젝트 폴더 미디어 스캔 (한 번 스캔한 결과를 create_all_videos 실행 동안 재사용)"""
+        if self._media_scan is None:
+            self._media_scan = scan_media_folder(self.folder_path)
+        return self._media_scan
 
-        except Exception as e:
-            logger.error(f"스마트 크롭 실패: {input_path} - {e}")
-            return False
+    def _log_sorted_media(self, idx: int, media: MediaFile, sequence: Optional[int], label: str = ""):
+        """정렬 결과 로그 (시퀀스 번호 또는 수정 시간)"""
+        if sequence is not None:
+            logger.info(f"  씬 {idx}: {media.path.name} ({label}시퀀스: {sequence})")
+        else:
+            import datetime
+            mtime_str = datetime.datetime.fromtimestamp(media.mtime).strftime('%Y-%m-%d %H:%M:%S')
+            logger.info(f"  씬 {idx}: {media.path.name} ({label}시간: {mtime_str})")
 
     def _find_all_media_files(self):
         """
         모든 이미지와 비디오 파일을 찾아서 정렬 없이 반환
         Returns: (image_paths, video_paths)
         """
-        # 이미지 파일 찾기
-        all_images_set = set()
-        for ext in ['*.png', '*.jpg', '*.jpeg', '*.PNG', '*.JPG', '*.JPEG']:
-            for img_file in self.folder_path.glob(ext):
-                if 'generated_videos' not in str(img_file) and 'thumbnail' not in img_file.name.lower():
-                    all_images_set.add(img_file)
-
-        images_folder = self.folder_path / "images"
-        if images_folder.exists():
-            for ext in ['*.png', '*.jpg', '*.jpeg', '*.PNG', '*.JPG', '*.JPEG']:
-                for img_file in images_folder.glob(ext):
-                    if 'thumbnail' not in img_file.name.lower():
-                        all_images_set.add(img_file)
-
-        # 비디오 파일 찾기
-        all_videos_set = set()
-        for ext in ['*.mp4', '*.mov', '*.avi', '*.mkv', '*.MP4', '*.MOV', '*.AVI', '*.MKV']:
-            for vid_file in self.folder_path.glob(ext):
-                if 'generated_videos' not in str(vid_file):
-                    all_videos_set.add(vid_file)
-
-        videos_folder = self.folder_path / "videos"
-        if videos_folder.exists():
-            for ext in ['*.mp4', '*.mov', '*.avi', '*.mkv', '*.MP4', '*.MOV', '*.AVI', '*.MKV']:
-                for vid_file in videos_folder.glob(ext):
-                    all_videos_set.add(vid_file)
-
-        return list(all_images_set), list(all_videos_set)
+        scan = self._scan_media()
+        return [m.path for m in scan.images], [m.path for m in scan.videos]
 
     def _find_images_with_scene_numbers(self) -> Dict[int, Path]:
         """씬별 이미지 파일 찾기 (scene_XX 패턴 또는 시간순 자동 정렬)"""
-        images = {}
+        scan = self._scan_media()
 
-        # 1. scene_XX_image 패턴 찾기
-        for file in self.folder_path.glob("scene_*_image.*"):
-            match = re.match(r"scene_(\d+)_image\.(png|jpg|jpeg)", file.name)
-            if match:
-                scene_num = int(match.group(1))
-                images[scene_num] = file
-
-        # images 서브폴더에서도 찾기
-        images_folder = self.folder_path / "images"
-        if images_folder.exists():
-            for file in images_folder.glob("scene_*_image.*"):
-                match = re.match(r"scene_(\d+)_image\.(png|jpg|jpeg)", file.name)
-                if match:
-                    scene_num = int(match.group(1))
-                    if scene_num not in images:
-                        images[scene_num] = file
+        # 1. scene_XX_image 패턴 (루트 우선, 없으면 images 서브폴더)
+        images = dict(scan.scene_images)
 
         # 2. scene 패턴이 없으면 모든 이미지 파일 찾기
         if not images:
             logger.info("scene_XX 패턴 없음. 모든 이미지를 찾습니다.")
 
-            # 모든 이미지 파일 찾기 (generated_videos 폴더 및 썸네일 제외, 중복 제거)
-            all_images_set = set()
-            for ext in ['*.png', '*.jpg', '*.jpeg', '*.PNG', '*.JPG', '*.JPEG']:
-                for img_file in self.folder_path.glob(ext):
-                    # generated_videos 폴더 안의 파일과 썸네일은 제외
-                    if 'generated_videos' not in str(img_file) and 'thumbnail' not in img_file.name.lower():
-                        all_images_set.add(img_file)
-
-            if images_folder and images_folder.exists():
-                for ext in ['*.png', '*.jpg', '*.jpeg', '*.PNG', '*.JPG', '*.JPEG']:
-                    for img_file in images_folder.glob(ext):
-                        # 썸네일 제외
-                        if 'thumbnail' not in img_file.name.lower():
-                            all_images_set.add(img_file)
-
-            # Set을 리스트로 변환하고 정렬
             # ⚠️ 중요: Frontend와 동일한 로직 사용!
             # 1. 명확한 시퀀스 패턴이 있으면 시퀀스로 정렬
             # 2. 없으면 파일 수정 시간으로 정렬 (오래된 것부터)
-            def extract_sequence(filepath):
-                """
-                파일명에서 시퀀스 번호 추출 (Frontend extractSequenceNumber와 동일한 로직)
-                - 1.jpg, 02.png (숫자로 시작)
-                - image_01.jpg, scene-02.png (_숫자 또는 -숫자)
-                - Image_fx (47).jpg (괄호 안 숫자, 랜덤 ID 없을 때만)
-
-                Returns: (sequence_number or None, mtime)
-                """
-                import re
-                filename = filepath.name
-
-                # 파일 수정 시간 (항상 가져오기)
-                try:
-                    mtime = filepath.stat().st_mtime
-                except:
-                    mtime = 0
-
-                # 1. 파일명이 숫자로 시작: "1.jpg", "02.png"
-                match = re.match(r'^(\d+)\.', filename)
-                if match:
-                    return (int(match.group(1)), mtime)
-
-                # 2. scene_XX_ 패턴: "scene_00_hook.jpeg", "scene_01_problem.jpeg" (Whisk/ImageFX)
-                match = re.match(r'scene_(\d+)_', filename)
-                if match:
-                    return (int(match.group(1)), mtime)
-
-                # 3. _숫자. 또는 -숫자. 패턴: "image_01.jpg", "scene-02.png"
-                match = re.search(r'[_-](\d{1,3})\.', filename)
-                if match:
-                    return (int(match.group(1)), mtime)
-
-                # 4. (숫자) 패턴: "Image_fx (47).jpg"
-                # 단, 랜덤 ID가 없을 때만 (8자 이상의 영숫자 조합이 없을 때)
-                match = re.search(r'\((\d+)\)', filename)
-                if match and not re.search(r'[_-]\w{8,}', filename):
-                    return (int(match.group(1)), mtime)
-
-                # 시퀀스 번호 없음 - 파일 수정 시간 사용
-                return (None, mtime)
-
-            # 정렬: 시퀀스 번호가 있으면 우선, 없으면 시간 순서
-            all_images_list = list(all_images_set)
-            all_images = sorted(all_images_list, key=lambda f: (
-                extract_sequence(f)[0] is None,  # 시퀀스 없는 것을 뒤로
-                extract_sequence(f)[0] if extract_sequence(f)[0] is not None else 0,  # 시퀀스 정렬
-                extract_sequence(f)[1]  # 시간 정렬
-            ))
+            all_images = scan.sorted_images()
 
             # 씬 번호 자동 할당 및 로그 출력
             logger.info(f"\n📷 이미지 정렬 완료 (총 {len(all_images)}개):")
-            for idx, img_path in enumerate(all_images, start=1):
-                images[idx] = img_path
-                seq_info = extract_sequence(img_path)
-                if seq_info[0] is not None:
-                    logger.info(f"  씬 {idx}: {img_path.name} (시퀀스: {seq_info[0]})")
-                else:
-                    import datetime
-                    mtime_str = datetime.datetime.fromtimestamp(seq_info[1]).strftime('%Y-%m-%d %H:%M:%S')
-                    logger.info(f"  씬 {idx}: {img_path.name} (시간: {mtime_str})")
+            for idx, media in enumerate(all_images, start=1):
+                images[idx] = media.path
+                self._log_sorted_media(idx, media, media.sequence)
 
         logger.info(f"이미지 {len(images)}개 발견")
 
@@ -695,78 +589,14 @@ class VideoFromFolderCreator:
 
         logger.info("비디오 파일을 찾습니다.")
 
-        # 모든 비디오 파일 찾기 (generated_videos 폴더 제외, 중복 제거)
-        all_videos_set = set()
-        for ext in ['*.mp4', '*.mov', '*.avi', '*.mkv', '*.MP4', '*.MOV', '*.AVI', '*.MKV']:
-            for vid_file in self.folder_path.glob(ext):
-                # generated_videos 폴더 안의 파일은 제외
-                if 'generated_videos' not in str(vid_file):
-                    all_videos_set.add(vid_file)
-
-        # videos 서브폴더에서도 찾기
-        videos_folder = self.folder_path / "videos"
-        if videos_folder and videos_folder.exists():
-            for ext in ['*.mp4', '*.mov', '*.avi', '*.mkv', '*.MP4', '*.MOV', '*.AVI', '*.MKV']:
-                for vid_file in videos_folder.glob(ext):
-                    all_videos_set.add(vid_file)
-
-        # 정렬 로직 (이미지와 동일)
-        def extract_sequence(filepath):
-            """
-            파일명에서 시퀀스 번호 추출 (Frontend extractSequenceNumber와 동일한 로직)
-            - 1.mp4, 02.mp4 (숫자로 시작)
-            - video_01.mp4, scene-02.mp4 (_숫자 또는 -숫자)
-            - Video_fx (47).mp4 (괄호 안 숫자, 랜덤 ID 없을 때만)
-
-            Returns: (sequence_number or None, mtime)
-            """
-            import re
-            filename = filepath.name
-
-            # 파일 수정 시간 (항상 가져오기)
-            try:
-                mtime = filepath.stat().st_mtime
-            except:
-                mtime = 0
-
-            # 1. 파일명이 숫자로 시작: "1.mp4", "02.mp4"
-            match = re.match(r'^(\d+)\.', filename)
-            if match:
-                return (int(match.group(1)), mtime)
-
-            # 2. _숫자. 또는 -숫자. 패턴: "video_01.mp4", "scene-02.mp4"
-            match = re.search(r'[_-](\d{1,3})\.', filename)
-            if match:
-                return (int(match.group(1)), mtime)
-
-            # 3. (숫자) 패턴: "Video_fx (47).mp4"
-            # 단, 랜덤 ID가 없을 때만 (8자 이상의 영숫자 조합이 없을 때)
-            match = re.search(r'\((\d+)\)', filename)
-            if match and not re.search(r'[_-]\w{8,}', filename):
-                return (int(match.group(1)), mtime)
-
-            # 시퀀스 번호 없음 - 파일 수정 시간 사용
-            return (None, mtime)
-
         # 정렬: 시퀀스 번호가 있으면 우선, 없으면 시간 순서
-        all_videos_list = list(all_videos_set)
-        all_videos = sorted(all_videos_list, key=lambda f: (
-            extract_sequence(f)[0] is None,  # 시퀀스 없는 것을 뒤로
-            extract_sequence(f)[0] if extract_sequence(f)[0] is not None else 0,  # 시퀀스 정렬
-            extract_sequence(f)[1]  # 시간 정렬
-        ))
+        all_videos = self._scan_media().sorted_videos()
 
         # 씬 번호 자동 할당 및 로그 출력
         logger.info(f"\n🎬 비디오 정렬 완료 (총 {len(all_videos)}개):")
-        for idx, vid_path in enumerate(all_videos, start=1):
-            videos[idx] = vid_path
-            seq_info = extract_sequence(vid_path)
-            if seq_info[0] is not None:
-                logger.info(f"  씬 {idx}: {vid_path.name} (시퀀스: {seq_info[0]})")
-            else:
-                import datetime
-                mtime_str = datetime.datetime.fromtimestamp(seq_info[1]).strftime('%Y-%m-%d %H:%M:%S')
-                logger.info(f"  씬 {idx}: {vid_path.name} (시간: {mtime_str})")
+        for idx, media in enumerate(all_videos, start=1):
+            videos[idx] = media.path
+            self._log_sorted_media(idx, media, media.sequence)
 
         logger.info(f"비디오 {len(videos)}개 발견")
 
@@ -1487,14 +1317,70 @@ Return ONLY the refined prompt without any explanation or additional text."""
 
         return text
 
+    def _tts_cache_key(self, text: str) -> str:
+        """현재 제공자/음성/속도 기준 TTS 캐시 키 (실제 TTS에 들어가는 텍스트로 계산)"""
+        clean_text = self._clean_narration(text) or "무음"
+        if self.tts_provider == 'edge':
+            # Edge TTS는 구두점 쉼이 추가된 텍스트를 합성함
+            clean_text = self._add_natural_pauses(clean_text)
+        return make_tts_cache_key(self.tts_provider, self.voice, self.speed, clean_text)
+
+    async def _scene_tts(self, scene_num: int, narration: str, clean_narration: str, audio_path: Path) -> tuple:
+        """씬 TTS (from_draft면 초안 오디오/타이밍 재사용, 초안 모드면 결과 기록)"""
+        if self.promoted_timing is not None:
+            promoted = self.promoted_timing.promote(scene_num, clean_narration, audio_path,
+                                                    voice=self.voice, speed=self.speed)
+            if promoted:
+                logger.info(f"📋 씬 {scene_num}: 초안 오디오/타이밍 사용 (TTS 생략)")
+                return promoted
+            logger.info(f"씬 {scene_num}: 초안과 나레이션/음성이 달라 TTS를 새로 생성합니다")
+
+        duration, word_timings = await self._generate_tts(narration, audio_path)
+        if self.draft_timing is not None:
+            self.draft_timing.record(scene_num, clean_narration, audio_path, duration, word_timings,
+                                     voice=self.voice, speed=self.speed)
+        return duration, word_timings
+
+    def _tts_duration_matches(self, audio_path: Path, duration: float) -> bool:
+        """오디오 파일에서 실제로 측정한 길이가 duration과 같은지 (측정 실패면 False)"""
+        try:
+            measured = self._get_audio_duration(audio_path)
+        except Exception:
+            return False
+        return measured > 0 and abs(measured - duration) <= TTS_DURATION_TOLERANCE
+
     async def _generate_tts(self, text: str, output_path: Path) -> tuple:
-        """TTS 생성 (제공자별로 라우팅)"""
+        """TTS 생성 (캐시 확인 후 제공자별로 라우팅)"""
+        if self.tts_cache:
+            cached = self.tts_cache.get(self._tts_cache_key(text), output_path)
+            if cached and self._tts_duration_matches(output_path, cached[0]):
+                duration, word_timings = cached
+                logger.info(f"🗄️ TTS 캐시 히트: {output_path.name} ({duration:.2f}초, 단어 {len(word_timings)}개)")
+                return duration, word_timings
+            if cached:
+                # 예전에 길이 측정 실패 기본값(1초)이 저장된 엔트리 - 미스로 보고 다시 생성해 덮어씀
+                logger.warning(f"⚠️ TTS 캐시 길이 불일치, 다시 생성: {output_path.name} (기록 {cached[0]:.2f}초)")
+
         if self.tts_provider == 'google':
-            return await self._generate_google_tts(text, output_path)
+            result = await self._generate_google_tts(text, output_path)
         elif self.tts_provider == 'aws':
-            return await self._generate_aws_polly(text, output_path)
+            result = await self._generate_aws_polly(text, output_path)
         else:
-            return await self._generate_edge_tts(text, output_path)
+            result = await self._generate_edge_tts(text, output_path)
+
+        if self.tts_cache:
+            # 폴백(google/aws → edge)이 일어났을 수 있으므로 키를 다시 계산
+            duration, word_timings = result
+            # 길이 측정에 실패해 기본값(1초)이 들어온 결과는 저장하지 않음 (영구히 1초 씬이 됨)
+            if self._tts_duration_matches(output_path, duration):
+                self.tts_cache.put(
+                    self._tts_cache_key(text), output_path, duration, word_timings,
+                    provider=self.tts_provider, voice=self.voice, speed=self.speed
+                )
+            else:
+                logger.warning(f"⚠️ TTS 길이를 확인할 수 없어 캐시하지 않음: {output_path.name}")
+
+        return result
 
     async def _generate_edge_tts(self, text: str, output_path: Path) -> tuple:
         """Edge TTS로 음성 생성 + 단어별 타임스탬프 추출"""
@@ -1718,10 +1604,10 @@ Return ONLY the refined prompt without any explanation or additional text."""
         ]
 
         try:
-            subprocess.run(ffmpeg_cmd, check=True, capture_output=True)
+            run_ffmpeg(ffmpeg_cmd, check=True)
             logger.info(f"[CHUNKED TTS] 병합 완료: {output_path.name}")
         except subprocess.CalledProcessError as e:
-            logger.error(f"[CHUNKED TTS] ffmpeg 병합 실패: {e.stderr.decode()}")
+            logger.error(f"[CHUNKED TTS] ffmpeg 병합 실패: {e.stderr}")
             # 폴백: 첫 번째 청크만 사용
             with open(output_path, "wb") as f:
                 f.write(all_audio_data[0])
@@ -1803,11 +1689,12 @@ Return ONLY the refined prompt without any explanation or additional text."""
 
             # 오디오 길이 가져오기
             try:
-                audio_clip = AudioFileClip(str(output_path))
-                duration = audio_clip.duration
-                audio_clip.close()
+                duration = self._get_audio_duration(output_path)
             except Exception as e:
-                logger.warning(f"오디오 길이 측정 실패, 기본값 1초 사용: {e}")
+                logger.warning(f"오디오 길이 측정 실패: {e}")
+                duration = 0.0
+            if duration <= 0:
+                logger.warning(f"오디오 길이 측정 실패, 기본값 1초 사용")
                 duration = 1.0
 
             # 타임스탬프가 없으면 텍스트 기반으로 생성
@@ -1889,11 +1776,12 @@ Return ONLY the refined prompt without any explanation or additional text."""
 
             # 오디오 길이 가져오기
             try:
-                audio_clip = AudioFileClip(str(output_path))
-                duration = audio_clip.duration
-                audio_clip.close()
+                duration = self._get_audio_duration(output_path)
             except Exception as e:
-                logger.warning(f"오디오 길이 측정 실패, 기본값 1초 사용: {e}")
+                logger.warning(f"오디오 길이 측정 실패: {e}")
+                duration = 0.0
+            if duration <= 0:
+                logger.warning(f"오디오 길이 측정 실패, 기본값 1초 사용")
                 duration = 1.0
 
             # end 시간 조정 (다음 단어 시작 시간 또는 duration 기준)
@@ -1929,44 +1817,55 @@ Return ONLY the refined prompt without any explanation or additional text."""
         return get_audio_duration(str(audio_path))
 
     def _combine_video_audio(self, scene_num: int, video_path: Path,
-                            audio_path: Path, output_path: Path) -> Optional[Path]:
-        """비디오 파일에 오디오 결합 - FFmpeg 직접 사용 (자막 없음)"""
+                            audio_path: Path, output_path: Path,
+                            audio_duration: Optional[float] = None) -> Optional[Path]:
+        """
+        비디오 씬 준비 (자막 없음) - 비디오 전용 출력
+
+        나레이션은 병합 후 프로젝트 오디오 트랙으로 한 번만 인코딩하므로 여기서는 비디오만 만든다.
+        비디오가 나레이션보다 길면 재인코딩 없이 복사, 짧으면 마지막 프레임을 freeze하여 나레이션 길이에 맞춤.
+        """
         try:
-            logger.info(f"씬 {scene_num} 비디오에 오디오 결합 중...")
-
-            # FFmpeg 명령어로 비디오 + 오디오 결합
-            # 자막이 없으므로 -c:v copy 사용 (빠름)
-            cmd = [
-                'ffmpeg',
-                '-y',
-                '-i', str(video_path.resolve()),  # 입력 비디오
-                '-i', str(audio_path.resolve()),  # 입력 오디오
-                '-c:v', 'copy',  # 비디오 재인코딩 없이 복사 (빠름)
-                '-c:a', 'aac',  # 오디오 AAC 인코딩
-                '-map', '0:v:0',  # 첫 번째 입력의 비디오
-                '-map', '1:a:0',  # 두 번째 입력의 오디오
-                '-y',  # 덮어쓰기
-                str(output_path.resolve())  # 출력 경로
-            ]
+            logger.info(f"씬 {scene_num} 비디오 준비 중...")
 
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True, encoding='utf-8', errors='ignore')
-            logger.info(f"씬 {scene_num} 비디오+오디오 결합 완료: {output_path}")
+            video_duration = self._get_video_duration(video_path)
+            audio_duration = audio_duration or self._get_audio_duration(audio_path)
+
+            def build(codec, preset):
+                return self._video_scene_command(video_path, output_path, video_duration, audio_duration,
+                                                 codec, preset)
+
+            if video_duration >= audio_duration:
+                self._run_scene_encode(build(None, None), duration=video_duration)
+            else:
+                logger.info(f"⚠️ 비디오가 TTS보다 짧습니다. 마지막 프레임을 {audio_duration - video_duration:.2f}초 freeze합니다.")
+                try:
+                    self._run_scene_encode(build(self.video_codec, self.codec_preset), duration=audio_duration,
+                                           encode_slot=True)
+                except subprocess.CalledProcessError:
+                    if self.video_codec == 'libx264':
+                        raise
+                    logger.warning(f"씬 {scene_num} GPU 인코더 실패, CPU 인코더로 재시도...")
+                    self._run_scene_encode(build('libx264', 'ultrafast'), duration=audio_duration,
+                                           encode_slot=True)
+
+            logger.info(f"씬 {scene_num} 비디오 준비 완료: {output_path}")
             return output_path
 
         except subprocess.CalledProcessError as e:
-            logger.error(f"씬 {scene_num} 비디오+오디오 결합 실패: {e.stderr}")
+            logger.error(f"씬 {scene_num} 비디오 준비 실패: {e.stderr}")
             return None
         except Exception as e:
-            logger.error(f"씬 {scene_num} 비디오+오디오 결합 실패: {e}")
+            logger.error(f"씬 {scene_num} 비디오 준비 실패: {e}")
             return None
 
     def _combine_video_audio_with_subtitles(self, scene_num: int, video_path: Path,
                                            audio_path: Path, output_path: Path,
                                            narration: str, audio_duration: float,
                                            word_timings: list = None) -> Optional[Path]:
-        """비디오 파일에 오디오와 자막 결합 - FFmpeg 직접 사용 (영상병합 방식)"""
+        """비디오 파일에 자막 결합 - 비디오 전용 출력 (나레이션은 병합 후 프로젝트 오디오 트랙으로 한 번만 인코딩)"""
         try:
-            logger.info(f"씬 {scene_num} 비디오에 오디오+자막 결합 중...")
+            logger.info(f"씬 {scene_num} 비디오에 자막 결합 중...")
 
             # 비디오 길이 확인
             video_duration = self._get_video_duration(video_path)
@@ -1976,56 +1875,18 @@ Return ONLY the refined prompt without any explanation or additional text."""
             srt_path = audio_path.with_suffix('.srt')
             ass_path = self._create_srt_with_timings(word_timings or [], srt_path, narration, audio_duration, max_chars_per_line=22)
 
-            # FFmpeg ass 필터에 절대 경로 전달 (Windows 경로를 Unix 스타일로 변환 + 콜론 이스케이프)
-            ass_absolute_path = str(ass_path.resolve()).replace('\\', '/').replace(':', '\\\\:')
-
-            # 비디오와 오디오 길이 비교하여 필터 준비 (영상병합 방식)
-            video_filter_parts = []
-            audio_filter = None
-
-            # FPS 통일 (25fps)
-            video_filter_parts.append("fps=25")
-
             if video_duration < audio_duration:
                 # 비디오가 짧으면: 마지막 프레임을 freeze하여 오디오 길이에 맞춤
-                freeze_duration = audio_duration - video_duration
-                video_filter_parts.append(f"tpad=stop_mode=clone:stop_duration={freeze_duration:.3f}")
-                logger.info(f"⚠️ 비디오가 TTS보다 짧습니다. 마지막 프레임을 {freeze_duration:.2f}초 freeze합니다.")
+                logger.info(f"⚠️ 비디오가 TTS보다 짧습니다. 마지막 프레임을 {audio_duration - video_duration:.2f}초 freeze합니다.")
             elif audio_duration < video_duration:
-                # 오디오가 짧으면: 무음 추가하여 비디오 길이에 맞춤
-                audio_filter = f"apad=whole_dur={video_duration:.3f}"
-                logger.info(f"⚠️ TTS가 비디오보다 짧습니다. 무음을 추가하여 비디오 길이에 맞춥니다.")
-
-            # 자막 필터 추가
-            video_filter_parts.append(f"ass={ass_absolute_path}")
-            vf_combined = ",".join(video_filter_parts)
-
-            # FFmpeg 명령어로 비디오 + 오디오 + 자막 결합
-            cmd = [
-                'ffmpeg',
-                '-y',
-                '-i', str(video_path.resolve()),  # 입력 비디오
-                '-i', str(audio_path.resolve()),  # 입력 오디오
-                '-vf', vf_combined,  # 비디오 필터 (tpad + ass)
-                '-c:v', self.video_codec,  # 비디오 재인코딩 (자막 때문에)
-                '-preset', self.codec_preset,
-                '-c:a', 'aac',  # 오디오 AAC 인코딩
-                '-map', '0:v:0',  # 첫 번째 입력의 비디오
-                '-map', '1:a:0',  # 두 번째 입력의 오디오
-                '-pix_fmt', 'yuv420p',  # 호환성
-            ]
+                # 오디오가 짧으면: 오디오 트랙 조립 시 무음으로 채움
+                logger.info(f"⚠️ TTS가 비디오보다 짧습니다. 오디오 트랙에서 무음으로 채웁니다.")
 
-            # 오디오 필터 추가 (패딩이 필요한 경우)
-            if audio_filter:
-                cmd.extend(['-af', audio_filter])
-
-            cmd.extend([
-                '-y',  # 덮어쓰기
-                str(output_path.resolve())  # 출력 경로
-            ])
-
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True, encoding='utf-8', errors='ignore')
-            logger.info(f"씬 {scene_num} 비디오+오디오+자막 결합 완료: {output_path}")
+            # FFmpeg 명령어로 비디오 + 자막 결합 (오디오 없음, 자막 때문에 재인코딩)
+            cmd = self._video_scene_command(video_path, output_path, video_duration, audio_duration,
+                                            self.video_codec, self.codec_preset, ass_path=ass_path)
+            self._run_scene_encode(cmd, duration=max(video_duration, audio_duration), encode_slot=True)
+            logger.info(f"씬 {scene_num} 비디오+자막 결합 완료: {output_path}")
 
             # 자막 파일 삭제
             if ass_path.exists():
@@ -2040,27 +1901,11 @@ Return ONLY the refined prompt without any explanation or additional text."""
             if 'h264_nvenc' in str(e.stderr) or 'nvenc' in str(e.stderr):
                 logger.warning(f"씬 {scene_num} GPU 인코더 실패, CPU 인코더로 재시도...")
                 try:
-                    cmd_cpu = [
-                        'ffmpeg',
-                        '-y',
-                        '-i', str(video_path.resolve()),
-                        '-i', str(audio_path.resolve()),
-                        '-vf', vf_combined,  # 비디오 필터 (tpad + ass)
-                        '-c:v', 'libx264',  # CPU 인코더
-                        '-preset', 'ultrafast',
-                        '-c:a', 'aac',
-                        '-map', '0:v:0',
-                        '-map', '1:a:0',
-                        '-pix_fmt', 'yuv420p',
-                    ]
-
-                    if audio_filter:
-                        cmd_cpu.extend(['-af', audio_filter])
-
-                    cmd_cpu.extend(['-y', str(output_path.resolve())])
-
-                    result = subprocess.run(cmd_cpu, check=True, capture_output=True, text=True, encoding='utf-8', errors='ignore')
-                    logger.info(f"씬 {scene_num} 비디오+오디오+자막 결합 완료 (CPU): {output_path}")
+                    cmd_cpu = self._video_scene_command(video_path, output_path, video_duration, audio_duration,
+                                                        'libx264', 'ultrafast', ass_path=ass_path)
+                    self._run_scene_encode(cmd_cpu, duration=max(video_duration, audio_duration),
+                                           encode_slot=True)
+                    logger.info(f"씬 {scene_num} 비디오+자막 결합 완료 (CPU): {output_path}")
 
                     if ass_path.exists():
                         ass_path.unlink()
@@ -2072,77 +1917,206 @@ Return ONLY the refined prompt without any explanation or additional text."""
                     logger.error(f"씬 {scene_num} CPU 인코더도 실패: {e2.stderr}")
                     return None
             else:
-                logger.error(f"씬 {scene_num} 비디오+오디오+자막 결합 실패: {e.stderr}")
+                logger.error(f"씬 {scene_num} 비디오+자막 결합 실패: {e.stderr}")
                 return None
         except Exception as e:
-            logger.error(f"씬 {scene_num} 비디오+오디오+자막 결합 실패: {e}")
+            logger.error(f"씬 {scene_num} 비디오+자막 결합 실패: {e}")
             return None
 
+    def _run_scene_encode(self, cmd: List[str], **kwargs):
+        """
+        씬 렌더링 FFmpeg 실행 (check=True, STOP 파일 확인)
+
+        성공한 명령은 현재 스레드의 씬 기록에 추가된다 - 렌더 매니페스트에는 폴백 인코더까지
+        포함해 실제로 실행한 명령의 지문을 남긴다.
+        """
+        result = run_ffmpeg(cmd, check=True, stop_dir=self.folder_path, **kwargs)
+        commands = getattr(self._scene_encode_log, 'commands', None)
+        if commands is not None:
+            commands.append(list(cmd))
+        return result
+
+    def _video_scene_command(self, video_path: Path, output_path: Path, video_duration: float,
+                             audio_duration: float, codec: Optional[str], preset: Optional[str],
+                             ass_path: Optional[Path] = None) -> List[str]:
+        """
+        비디오 씬 FFmpeg 명령 (비디오 전용 출력, 렌더링과 지문 계산 공용)
+
+        codec이 None이면 재인코딩 없이 복사. 재인코딩 시 25fps로 맞추고, 비디오가 나레이션보다
+        짧으면 마지막 프레임을 freeze, ass_path가 있으면 자막을 입힌다.
+        """
+        cmd = ['ffmpeg', '-y', '-i', str(video_path.resolve()), '-map', '0:v:0']
+        if codec is None:
+            cmd.extend(['-c:v', 'copy'])  # 비디오 재인코딩 없이 복사 (빠름)
+        else:
+            filters = ["fps=25"]
+            if video_duration < audio_duration:
+                filters.append(f"tpad=stop_mode=clone:stop_duration={audio_duration - video_duration:.3f}")
+            if ass_path is not None:
+                # FFmpeg ass 필터에 절대 경로 전달 (Windows 경로를 Unix 스타일로 변환 + 콜론 이스케이프)
+                filters.append("ass=" + str(Path(ass_path).resolve()).replace('\\', '/').replace(':', '\\\\:'))
+            cmd.extend([
+                '-vf', ",".join(filters),
+                '-c:v', codec,
+                '-preset', preset,
+                '-pix_fmt', 'yuv420p',
+            ])
+        cmd.extend(['-an', str(output_path.resolve())])
+        return cmd
+
+    def _still_scene_commands(self, image_path: Path, duration: float, output_path: Path,
+                              codec: str, preset: str, subtitle_filter: Optional[str] = None,
+                              crop_box: Optional[tuple] = None) -> Tuple[List[str], List[str]]:
+        """정지 이미지 씬 FFmpeg 명령 (사전 리스케일, 인코딩) - 렌더링과 지문 계산 공용"""
+        return build_still_scene_commands(
+            'ffmpeg',
+            image_path.resolve(),
+            None,
+            output_path.resolve(),
+            self._prescaled_path(output_path).resolve(),
+            self.width,
+            self.height,
+            codec=codec,
+            preset=preset,
+            fps=25,
+            subtitle_filter=subtitle_filter,
+            crop_box=crop_box,
+            duration=duration
+        )
+
+    @staticmethod
+    def _prescaled_path(output_path: Path) -> Path:
+        """정지 이미지 씬의 사전 리스케일 이미지 경로 (인코딩 후 삭제)"""
+        return output_path.with_name(f"{output_path.stem}_still.png")
+
+    def _encode_still_scene(self, image_path: Path, duration: float, output_path: Path,
+                            codec: str, preset: str, subtitle_filter: Optional[str] = None,
+                            crop_box: Optional[tuple] = None):
+        """
+        정지 이미지 씬 인코딩 (이미지를 한 번만 리스케일한 뒤 저프레임 입력으로 인코딩)
+
+        비디오 전용 출력 (나레이션 길이만큼, 나레이션은 병합 후 프로젝트 오디오 트랙으로 한 번만 인코딩)
+
+        실패 시 subprocess.CalledProcessError 발생 (호출자가 CPU 폴백 처리)
+        """
+        prescale_cmd, encode_cmd = self._still_scene_commands(image_path, duration, output_path, codec, preset,
+                                                              subtitle_filter=subtitle_filter, crop_box=crop_box)
+        try:
+            self._run_scene_encode(prescale_cmd)
+            # ass 필터는 파일명만 받으므로 출력 폴더에서 실행
+            return self._run_scene_encode(encode_cmd, duration=duration, cwd=output_path.parent, encode_slot=True)
+        finally:
+            try:
+                self._prescaled_path(output_path).unlink()
+            except OSError:
+                pass
+
+    def _expected_scene_commands(self, scene_data: Dict, output_path: Path,
+                                 ass_path: Optional[Path]) -> List[List[str]]:
+        """설정된 인코더로 이 씬을 렌더링할 때 실행할 FFmpeg 명령 (렌더링 경로와 같은 조건)"""
+        media_path = scene_data['media_path']
+        duration = scene_data['audio_duration']
+        if scene_data['media_type'] == 'image':
+            if ass_path is not None:
+                return list(self._still_scene_commands(media_path, duration, output_path,
+                                                       self.video_codec, self.codec_preset,
+                                                       subtitle_filter=f"ass={ass_path.name}"))
+            # 자막 없는 9:16 씬만 스마트 크롭 (_create_scene_video와 같은 조건)
+            crop_box = self._vertical_crop_box(scene_data['scene_num'], media_path)
+            return list(self._still_scene_commands(media_path, duration, output_path,
+                                                   self.video_codec, self.codec_preset, crop_box=crop_box))
+
+        video_duration = self._get_video_duration(media_path)
+        codec, preset = self.video_codec, self.codec_preset
+        if ass_path is None and video_duration >= duration:
+            codec = preset = None  # 자막 없고 나레이션보다 길면 복사
+        return [self._video_scene_command(media_path, output_path, video_duration, duration,
+                                          codec, preset, ass_path=ass_path)]
+
+    def _normalize_scene_commands(self, commands: List[List[str]]) -> List[List[str]]:
+        """지문용 명령 - 프로젝트 폴더 경로를 빼서 폴더를 옮겨도 같은 지문"""
+        root = self.folder_path.resolve()
+        variants = sorted({str(root), root.as_posix(), root.as_posix().replace(':', '\\\\:')},
+                          key=len, reverse=True)
+        normalized = []
+        for cmd in commands:
+            args = []
+            for arg in cmd:
+                arg = str(arg)
+                for variant in variants:
+                    arg = arg.replace(variant, '<project>')
+                args.append(arg)
+            normalized.append(args)
+        return normalized
+
+    def _scene_fingerprint_inputs(self, scene_data: Dict) -> Optional[Dict]:
+        """씬 출력에 영향을 주는 입력 내용 (증분 렌더링용, 계산 실패 시 None)"""
+        manifest = self.render_manifest
+        try:
+            ass_path = None
+            subtitle_hash = None
+            if self.add_subtitles:
+                # 인코딩 단계와 같은 방식으로 ASS를 미리 만들어 내용 해시 (결정적 출력)
+                srt_path = scene_data['audio_path'].with_suffix('.srt')
+                ass_path = self._create_srt_with_timings(
+                    scene_data.get('word_timings') or [], srt_path,
+                    scene_data['clean_narration'], scene_data.get('audio_duration', 1.0),
+                    max_chars_per_line=22
+                )
+                subtitle_hash = manifest.file_hash(ass_path)
+
+            # 씬 비디오는 비디오 전용 → 나레이션은 내용이 아니라 길이만 영향
+            media_hash = manifest.file_hash(scene_data['media_path'])
+            audio_duration = scene_data.get('audio_duration')
+            if not media_hash or not audio_duration:
+                return None
+
+            return {
+                'ass_path': ass_path,
+                'inputs': {
+                    'media_type': scene_data['media_type'],
+                    'media': media_hash,
+                    'duration': round(audio_duration, 3),
+                    'subtitle': subtitle_hash,
+                },
+            }
+        except Exception as e:
+            logger.warning(f"씬 {scene_data['scene_num']} 지문 계산 실패, 다시 렌더링합니다: {e}")
+            return None
+
+    def _scene_fingerprint(self, inputs: Dict, commands: List[List[str]]) -> Optional[str]:
+        """
+        씬 지문 = 입력 내용 + 렌더링 FFmpeg 명령 (경로 제외)
+
+        명령에 인코더/프리셋/필터가 모두 들어 있으므로 CPU 폴백으로 만든 씬이나
+        명령 생성 방식이 바뀌기 전에 만든 씬은 다음 실행에서 다시 렌더링된다.
+        """
+        if not inputs or not commands:
+            return None
+        return self.render_manifest.fingerprint(
+            **inputs['inputs'],
+            commands=self._normalize_scene_commands(commands),
+        )
+
     def _create_scene_video(self, scene_num: int, image_path: Path,
-                           audio_path: Path, output_path: Path) -> Optional[Path]:
-        """씬 비디오 생성 (이미지 + 오디오) - FFmpeg 직접 사용"""
+                           audio_path: Path, output_path: Path,
+                           audio_duration: Optional[float] = None) -> Optional[Path]:
+        """씬 비디오 생성 (이미지, 나레이션 길이만큼 - 비디오 전용) - FFmpeg 직접 사용"""
         try:
             logger.info(f"씬 {scene_num} 비디오 생성 중...")
 
             # ============================================================
             # 숏폼 영상인 경우 16:9 이미지를 9:16으로 스마트 크롭
+            # (크롭 영역을 FFmpeg 필터로 전달 → 임시 JPEG 없음)
             # ============================================================
-            processed_image_path = image_path
-            temp_image_file = None
-
-            if self.aspect_ratio == "9:16":
-                try:
-                    # 이미지 비율 체크
-                    with PILImage.open(image_path) as img:
-                        width, height = img.size
-                        img_ratio = width / height
-
-                        # 16:9 비율 (가로 영상)인지 확인 (허용 오차 ±10%)
-                        target_landscape_ratio = 16 / 9  # 1.778
-                        is_landscape = abs(img_ratio - target_landscape_ratio) < 0.2
-
-                        if is_landscape:
-                            logger.info(f"  🎨 씬 {scene_num}: 롱폼 이미지 감지 ({width}x{height}, 비율: {img_ratio:.3f})")
-                            logger.info(f"  ✂️ 스마트 크롭 적용 중 (얼굴/물체 중심)...")
-
-                            # 임시 파일 생성
-                            temp_image_file = image_path.parent / f"temp_cropped_scene_{scene_num}.jpg"
-
-                            # 스마트 크롭 적용
-                            if self._smart_crop_to_vertical(image_path, temp_image_file):
-                                processed_image_path = temp_image_file
-                                logger.info(f"  ✅ 스마트 크롭 완료: {temp_image_file.name}")
-                            else:
-                                logger.warning(f"  ⚠️ 스마트 크롭 실패, 원본 이미지 사용 (레터박스 적용)")
-                except Exception as e:
-                    logger.warning(f"  ⚠️ 이미지 비율 체크 실패: {e}, 원본 이미지 사용")
-
-            # FFmpeg 명령어로 이미지 + 오디오 결합 (초고속)
-            # -loop 1: 이미지 반복
-            # -i: 입력 파일
-            # -shortest: 오디오 길이만큼만
-            # -c:v: 비디오 코덱 (GPU 가속)
-            # -c:a: 오디오 코덱
-            # -pix_fmt yuv420p: 호환성
-            # -vf scale: 리스케일 + 레터박스
-
-            cmd = [
-                'ffmpeg',
-                '-loop', '1',  # 이미지 반복
-                '-i', str(image_path.resolve()),  # 입력 이미지 (절대 경로)
-                '-i', str(audio_path.resolve()),  # 입력 오디오 (절대 경로)
-                '-vf', f"scale={self.width}:{self.height}:force_original_aspect_ratio=increase,crop={self.width}:{self.height},fps=25",  # 리스케일 + 크롭 + FPS 통일
-                '-c:v', self.video_codec,  # GPU 가속 코덱
-                '-preset', self.codec_preset,  # 프리셋
-                '-c:a', 'aac',  # 오디오 코덱
-                '-shortest',  # 오디오 길이만큼
-                '-pix_fmt', 'yuv420p',  # 호환성
-                '-y',  # 덮어쓰기
-                str(output_path.resolve())  # 출력 경로 (절대 경로)
-            ]
+            crop_box = self._vertical_crop_box(scene_num, image_path)
 
-            # FFmpeg 실행 (UTF-8 인코딩)
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True, encoding='utf-8', errors='ignore')
+            # FFmpeg로 이미지 + 오디오 결합 (정지 이미지 고속 경로)
+            # - 이미지를 한 번만 crop+scale (스마트 크롭 영역이 있으면 그 영역)
+            # - 초당 1프레임 입력 → fps=25로 타임라인만 맞춤, libx264는 -tune stillimage
+            duration = audio_duration or self._get_audio_duration(audio_path)
+            self._encode_still_scene(image_path, duration, output_path,
+                                     self.video_codec, self.codec_preset, crop_box=crop_box)
 
             logger.info(f"씬 {scene_num} 비디오 생성 완료: {output_path}")
             return output_path
@@ -2153,23 +2127,9 @@ Return ONLY the refined prompt without any explanation or additional text."""
                 logger.warning(f"씬 {scene_num} GPU 인코더 실패, CPU 인코더로 재시도...")
 
                 # CPU 인코더로 재시도
-                cmd_cpu = [
-                    'ffmpeg',
-                    '-loop', '1',
-                    '-i', str(image_path.resolve()),
-                    '-i', str(audio_path.resolve()),
-                    '-vf', f"scale={self.width}:{self.height}:force_original_aspect_ratio=increase,crop={self.width}:{self.height},fps=25",
-                    '-c:v', 'libx264',  # CPU 인코더
-                    '-preset', 'ultrafast',
-                    '-c:a', 'aac',
-                    '-shortest',
-                    '-pix_fmt', 'yuv420p',
-                    '-y',
-                    str(output_path.resolve())
-                ]
-
                 try:
-                    result = subprocess.run(cmd_cpu, check=True, capture_output=True, text=True, encoding='utf-8', errors='ignore')
+                    self._encode_still_scene(image_path, duration, output_path,
+                                             'libx264', 'ultrafast', crop_box=crop_box)
                     logger.info(f"씬 {scene_num} 비디오 생성 완료 (CPU): {output_path}")
                     return output_path
                 except subprocess.CalledProcessError as e2:
@@ -2198,24 +2158,10 @@ Return ONLY the refined prompt without any explanation or additional text."""
             ass_filename = ass_path.name
             logger.info(f"DEBUG 씬 {scene_num}: ass_filename = {ass_filename}")
 
-            # FFmpeg 명령어: 이미지 + 오디오 + 자막을 한번에 처리 (ass 필터 사용)
-            cmd = [
-                'ffmpeg',
-                '-loop', '1',
-                '-i', str(image_path.resolve()),
-                '-i', str(audio_path.resolve()),
-                '-vf', f"scale={self.width}:{self.height}:force_original_aspect_ratio=increase,crop={self.width}:{self.height},fps=25,ass={ass_filename}",
-                '-c:v', self.video_codec,
-                '-preset', self.codec_preset,
-                '-c:a', 'aac',
-                '-shortest',
-                '-pix_fmt', 'yuv420p',
-                '-y',
-                str(output_path.resolve())
-            ]
-
-            logger.info(f"DEBUG 씬 {scene_num}: FFmpeg 명령어 = {' '.join(cmd)}")
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True, encoding='utf-8', errors='ignore', cwd=str(output_path.parent))
+            # 이미지 + 오디오 + 자막을 한번에 처리 (정지 이미지 고속 경로 + ass 필터)
+            result = self._encode_still_scene(image_path, audio_duration, output_path,
+                                              self.video_codec, self.codec_preset,
+                                              subtitle_filter=f"ass={ass_filename}")
             if result.stderr and 'error' in result.stderr.lower():
                 logger.warning(f"FFmpeg 경고 (씬 {scene_num}): {result.stderr[:500]}")
             logger.info(f"씬 {scene_num} 비디오 + 자막 생성 완료: {output_path}")
@@ -2232,23 +2178,10 @@ Return ONLY the refined prompt without any explanation or additional text."""
                 # FFmpeg ass 필터에는 파일명만 전달
                 ass_filename = ass_path.name
 
-                cmd_cpu = [
-                    'ffmpeg',
-                    '-loop', '1',
-                    '-i', str(image_path.resolve()),
-                    '-i', str(audio_path.resolve()),
-                    '-vf', f"scale={self.width}:{self.height}:force_original_aspect_ratio=increase,crop={self.width}:{self.height},fps=25,ass={ass_filename}",
-                    '-c:v', 'libx264',
-                    '-preset', 'ultrafast',
-                    '-c:a', 'aac',
-                    '-shortest',
-                    '-pix_fmt', 'yuv420p',
-                    '-y',
-                    str(output_path.resolve())
-                ]
-
                 try:
-                    result_cpu = subprocess.run(cmd_cpu, check=True, capture_output=True, text=True, encoding='utf-8', errors='ignore', cwd=str(output_path.parent))
+                    result_cpu = self._encode_still_scene(image_path, audio_duration, output_path,
+                                                          'libx264', 'ultrafast',
+                                                          subtitle_filter=f"ass={ass_filename}")
                     if result_cpu.stderr and 'error' in result_cpu.stderr.lower():
                         logger.warning(f"FFmpeg CPU 경고 (씬 {scene_num}): {result_cpu.stderr[:500]}")
                     logger.info(f"씬 {scene_num} CPU 인코더로 성공")
@@ -2263,84 +2196,59 @@ Return ONLY the refined prompt without any explanation or additional text."""
             logger.error(f"씬 {scene_num} 비디오 + 자막 생성 실패: {e}")
             return None
 
-    def _combine_videos(self, video_paths: List[Path], output_path: Path, start_time: float) -> Optional[Path]:
-        """여러 씬 비디오를 하나로 결합 - FFmpeg filter_complex 사용 (FPS/해상도 통일)"""
+    def _combine_videos(self, scene_videos: List[Tuple[Path, Path]], output_path: Path,
+                        start_time: float) -> Optional[Path]:
+        """
+        씬 비디오(비디오 전용)를 하나로 결합하고 프로젝트 오디오 트랙을 한 번에 먹임
 
-        # generated_videos 폴더에서 씬 비디오 찾기
-        video_folder = output_path.parent / "generated_videos"
-        logger.info(f"비디오 결합 시작: {len(video_paths)}개 씬")
-        logger.info(f"씬 비디오 검색 경로: {video_folder}")
+        1. 공용 병합 엔진으로 씬 비디오 병합 (FPS/해상도 통일)
+        2. 씬 나레이션을 씬 비디오 길이에 맞춰 패딩해 FFmpeg 한 번으로 AAC 트랙 조립 (씬별 시작 시각 기록)
+        3. 병합 비디오 + 오디오 트랙을 스트림 복사로 결합
 
-        # scene_XX.mp4 파일 찾기
-        scene_videos = sorted(video_folder.glob("scene_*.mp4"))
-        if not scene_videos:
-            logger.error(f"씬 비디오 파일을 찾을 수 없습니다 (경로: {video_folder})")
-            return None
+        Args:
+            scene_videos: [(씬 비디오, 씬 나레이션 오디오), ...] (씬 순서)
+        """
+        video_folder = self._output_folder()
+        logger.info(f"비디오 결합 시작: {len(scene_videos)}개 씬")
 
-        logger.info(f"발견된 씬 비디오: {len(scene_videos)}개")
+        video_paths = [video for video, _ in scene_videos]
+        # 중간 파일 (프론트엔드가 최종 영상으로 오인하지 않도록 scene_ 접두사, 결합 후 삭제)
+        video_only_path = video_folder / "scene_concat_video.mp4"
+        track_path = video_folder / "narration_track.m4a"
 
         try:
-            # 입력 파일 인자 생성
-            input_args = []
-            for video in scene_videos:
-                input_args.extend(['-i', str(video)])
-
-            # filter_complex로 FPS/해상도 통일 후 concat
-            scale_filters = []
-            concat_inputs = []
-            for i in range(len(scene_videos)):
-                # 모든 비디오를 지정된 해상도(self.width x self.height), 25fps, SAR 1:1로 통일
-                scale_filters.append(f"[{i}:v]scale={self.width}:{self.height}:force_original_aspect_ratio=decrease,pad={self.width}:{self.height}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps=25[v{i}]")
-                concat_inputs.append(f"[v{i}][{i}:a]")
-
-            filter_str = ";".join(scale_filters) + ";" + "".join(concat_inputs) + f"concat=n={len(scene_videos)}:v=1:a=1[outv][outa]"
-
-            cmd = [
-                'ffmpeg',
-                '-y',
-                *input_args,
-                '-filter_complex', filter_str,
-                '-map', '[outv]',
-                '-map', '[outa]',
-                '-c:v', 'libx264',
-                '-preset', 'medium',
-                '-crf', '18',
-                '-c:a', 'aac',
-                '-b:a', '192k',
-                str(output_path)
-            ]
-
-            logger.info(f"FFmpeg filter_complex 병합 실행 중...")
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='ignore'
-            )
-
-            if result.returncode != 0:
-                logger.error(f"FFmpeg 실패 (종료 코드: {result.returncode})")
-                if result.stderr:
-                    logger.error(f"에러 메시지:\n{result.stderr[-1000:]}")
-                return None
-
-            if not output_path.exists():
-                logger.error(f"병합된 비디오 파일이 생성되지 않았습니다: {output_path}")
-                return None
-
-            # 총 수행 시간
-            elapsed_time = time() - start_time
-            minutes = int(elapsed_time // 60)
-            seconds = int(elapsed_time % 60)
-            logger.info(f"비디오 결합 완료: {output_path}")
-            logger.info(f"총 수행 시간: {minutes}분 {seconds}초")
-
-            return output_path
-
-        except Exception as e:
+            # 공용 병합 엔진: 씬 속성이 같으면 스트림 복사, 다른 씬 구간만 재인코딩,
+            # 기준으로 삼을 씬이 없으면 filter_complex 전체 재인코딩 (해상도 self.width x self.height, 25fps)
+            smart_concat(video_paths, video_only_path, self.width, self.height, 25,
+                         work_dir=video_folder, stop_dir=self.folder_path,
+                         codec=self.video_codec, preset=self.codec_preset,
+                         reencode_args=DRAFT_REENCODE_ARGS if self.draft else None)
+
+            # 씬 타임라인 길이 = 씬 비디오 길이 (병합 엔진이 방금 조회해 캐시됨)
+            probes = probe_many(video_paths)
+            segments = []
+            for video, audio in scene_videos:
+                duration = (probes.get(video) or {}).get('duration') or self._get_video_duration(video)
+                segments.append((audio.resolve() if audio.exists() else None, duration))
+
+            track = assemble_audio_track(segments, track_path, bitrate=self.audio_bitrate or '192k',
+                                         stop_dir=self.folder_path)
+            track.save(video_folder / "audio_track.json")
+            mux_audio_track(video_only_path, track_path, output_path, stop_dir=self.folder_path)
+        except (ConcatError, AudioTrackError) as e:
             logger.error(f"비디오 결합 중 오류: {e}")
             return None
+        finally:
+            video_only_path.unlink(missing_ok=True)
+
+        # 총 수행 시간
+        elapsed_time = time() - start_time
+        minutes = int(elapsed_time // 60)
+        seconds = int(elapsed_time % 60)
+        logger.info(f"비디오 결합 완료: {output_path}")
+        logger.info(f"총 수행 시간: {minutes}분 {seconds}초")
+
+        return output_path
 
     def _backup_previous_videos(self):
         """기존 generated_videos 폴더를 backup으로 이동 (파일 사용 중이면 건너뛰기)"""
@@ -2385,13 +2293,22 @@ Return ONLY the refined prompt without any explanation or additional text."""
                     pass
 
     async def create_all_videos(self, combine: bool = True) -> Optional[Path]:
-        """모든 씬의 비디오 생성 및 결합"""
+        """
+        모든 씬의 비디오 생성 및 결합
+
+        씬 비디오는 비디오 전용으로 렌더링하고 나레이션은 결합 단계에서 트랙 하나로 먹인다.
+        combine=False면 씬마다 나레이션을 스트림 복사로 먹여 오디오가 있는 scene_XX.mp4를 남긴다.
+
+        Returns:
+            최종 영상 경로 (combine=False면 첫 씬 비디오), 실패 시 None
+        """
         start_time = time()
 
         # 기존 generated_videos 폴더 백업 (비활성화 - backup 폴더 생성 방지)
         # self._backup_previous_videos()
 
-        # 이미지와 비디오 파일 찾기 (자동 생성 포함)
+        # 이미지와 비디오 파일 찾기 (자동 생성 포함, 폴더는 실행마다 새로 스캔)
+        self._media_scan = None
         images_dict = self._find_images_with_scene_numbers()  # 이미지 자동 생성 포함
         videos_dict = self._find_videos()  # 비디오 파일 찾기
 
@@ -2406,73 +2323,24 @@ Return ONLY the refined prompt without any explanation or additional text."""
         # 이미지와 비디오를 통합 정렬 (타입 구분 없이)
         logger.info(f"📊 통합 정렬 시작: 이미지 {len(image_paths)}개, 비디오 {len(video_paths)}개")
 
-        # 모든 미디어 파일을 하나의 리스트로 합치기
-        all_media_files = []
-        for path in image_paths:
-            all_media_files.append(('image', path))
-        for path in video_paths:
-            all_media_files.append(('video', path))
-
-        # 통합 정렬 함수
-        def extract_sequence_unified(media_tuple):
-            """시퀀스 번호 추출 (타입 관계없이)"""
-            media_type, filepath = media_tuple
-            import re
-            name = filepath.stem
-
-            # 패턴 매칭 (image_01, video_02, scene_03, clip_01 등)
-            match = re.match(r'^(image|video|scene|clip|img)[-_](\d+)$', name, re.IGNORECASE)
-            if match:
-                return (int(match.group(2)), 0)
-
-            match = re.match(r'^(image|video|scene|clip|img)\((\d+)\)$', name, re.IGNORECASE)
-            if match:
-                return (int(match.group(2)), 0)
-
-            match = re.match(r'^\((\d+)\)$', name)
-            if match:
-                return (int(match.group(1)), 0)
-
-            match = re.match(r'^(\d+)$', name)
-            if match:
-                return (int(match.group(1)), 0)
-
-            # 파일명 어디든 숫자가 있으면 추출 (영상01, 한글01, abc123 등)
-            match = re.search(r'(\d+)', name)
-            if match:
-                return (int(match.group(1)), 0)
-
-            # 숫자가 없으면 파일 시간
-            try:
-                mtime = filepath.stat().st_mtime
-            except:
-                mtime = 0
-            return (None, mtime)
+        # 모든 미디어 파일을 하나의 리스트로 합치기 (스캔 때 계산한 정렬 키 재사용)
+        scan = self._scan_media()
+        all_media_files = [scan.get(path, 'image') for path in image_paths]
+        all_media_files += [scan.get(path, 'video') for path in video_paths]
 
-        # 정렬: 시퀀스 번호 우선, 없으면 시간 순
-        all_media_files.sort(key=lambda f: (
-            extract_sequence_unified(f)[0] is None,
-            extract_sequence_unified(f)[0] if extract_sequence_unified(f)[0] is not None else 0,
-            extract_sequence_unified(f)[1]
-        ))
+        # 정렬: 시퀀스 번호 우선, 없으면 시간 순 (타입 관계없이)
+        all_media_files.sort(key=lambda media: media.unified_sort_key)
 
         # 씬 번호 재할당
         images = {}
         videos = {}
         logger.info(f"\n🎯 통합 정렬 결과 (총 {len(all_media_files)}개):")
-        for idx, (media_type, filepath) in enumerate(all_media_files, start=1):
-            if media_type == 'image':
-                images[idx] = filepath
-            else:
-                videos[idx] = filepath
-
-            seq_info = extract_sequence_unified((media_type, filepath))
-            if seq_info[0] is not None:
-                logger.info(f"  씬 {idx}: {filepath.name} ({media_type.upper()}, 시퀀스: {seq_info[0]})")
+        for idx, media in enumerate(all_media_files, start=1):
+            if media.media_type == 'image':
+                images[idx] = media.path
             else:
-                import datetime
-                mtime_str = datetime.datetime.fromtimestamp(seq_info[1]).strftime('%Y-%m-%d %H:%M:%S')
-                logger.info(f"  씬 {idx}: {filepath.name} ({media_type.upper()}, 시간: {mtime_str})")
+                videos[idx] = media.path
+            self._log_sorted_media(idx, media, media.unified_sequence, label=f"{media.media_type.upper()}, ")
 
         logger.info(f"✅ 최종: 이미지 {len(images)}개, 비디오 {len(videos)}개")
 
@@ -2557,12 +2425,16 @@ Return ONLY the refined prompt without any explanation or additional text."""
         # 기존 generated_videos 폴더 백업 건너뜀 (파일 덮어쓰기 허용)
 
         # 출력 폴더 생성 (백업 후 새로 생성)
-        output_folder = self.folder_path / "generated_videos"
+        output_folder = self._output_folder()
         output_folder.mkdir(exist_ok=True)
 
-        # 1단계: TTS 생성 (병렬 처리)
+        # 증분 렌더링 매니페스트 (입력이 같은 씬은 인코딩 건너뜀)
+        if self.incremental:
+            self.render_manifest = RenderManifest(output_folder)
+
+        # 1단계: TTS 작업 준비
         logger.info("=" * 70)
-        logger.info("1단계: TTS 음성 생성 (병렬 처리)")
+        logger.info("1단계: 씬별 TTS 작업 준비 (인코딩과 파이프라인으로 실행)")
 
         tts_tasks = []
         scene_data_list = []
@@ -2620,7 +2492,7 @@ Return ONLY the refined prompt without any explanation or additional text."""
 
             # TTS 태스크 생성
             audio_path = output_folder / f"scene_{scene_num:02d}_audio.mp3"
-            tts_tasks.append(self._generate_tts(narration, audio_path))
+            tts_tasks.append(self._scene_tts(scene_num, narration, clean_narration, audio_path))
 
             scene_data_list.append({
                 'scene_num': scene_num,
@@ -2630,46 +2502,34 @@ Return ONLY the refined prompt without any explanation or additional text."""
                 'clean_narration': clean_narration
             })
 
-        # TTS 병렬 생성 (8개씩 제한) - 타임스탬프도 함께 받음!
-        logger.info(f"⚡ TTS 병렬 생성: 최대 8개씩 동시 처리 (타임스탬프 포함)")
-
-        tts_results = []
-        batch_size = 8
-        for i in range(0, len(tts_tasks), batch_size):
-            batch = tts_tasks[i:i+batch_size]
-            batch_results = await asyncio.gather(*batch)
-            tts_results.extend(batch_results)
-            logger.info(f"TTS 배치 완료: {i+1}~{min(i+len(batch), len(tts_tasks))}/{len(tts_tasks)}")
-
-        logger.info(f"TTS 생성 완료: {len(tts_tasks)}개")
-
-        # 오디오 길이와 타임스탬프를 scene_data에 저장
-        for i, scene_data in enumerate(scene_data_list):
-            duration, word_timings = tts_results[i]
-            scene_data['audio_duration'] = duration
-            scene_data['word_timings'] = word_timings  # Edge TTS 타임스탬프!
-
         # 2단계: 건너뜀 (Whisper 대신 대본 사용)
         # Whisper 음성 인식 없이 대본을 직접 사용하므로 훨씬 빠름!
 
-        # 3단계: 비디오 생성 + 자막 추가 (병렬 처리)
+        # 3단계: 비디오 생성 + 자막 추가 (TTS가 끝난 씬부터 바로 인코딩)
         logger.info("=" * 70)
-        logger.info("3단계: 비디오 생성 및 자막 추가")
+        logger.info("3단계: 비디오 생성 및 자막 추가 (TTS → 인코딩 파이프라인)")
 
         # 인코더 정보 표시
         encoder_type = "GPU 가속" if self.video_codec != 'libx264' else "CPU"
         logger.info(f"🎬 비디오 인코더: {self.video_codec} ({encoder_type})")
         logger.info(f"📊 총 {len(scene_data_list)}개 씬 처리 예정")
 
-        # 시스템에 무리 안 가도록 워커 수 제한 (CPU 코어의 75%, 최소 2, 최대 3)
-        cpu_count = multiprocessing.cpu_count()
-        max_workers = max(2, min(3, (cpu_count * 3) // 4))
-        logger.info(f"⚡ 병렬 처리: {max_workers}개 워커 (CPU 코어: {cpu_count}개)")
-
-        scene_videos = []
-        all_narrations = []
-
-        # 병렬 처리 함수
+        # 인코딩 동시 실행은 머신 전체 인코딩 슬롯이 제한 (다른 작업 프로세스와 공유, 슬롯마다 -threads 지정)
+        # 워커는 이 프로세스가 동시에 쓸 수 있는 최대 슬롯 수만큼만 둔다
+        slot_pool = get_encode_slot_pool()
+        max_workers = slot_pool.slots
+        tts_concurrency = 8
+        logger.info(f"⚡ TTS 동시 처리: 최대 {tts_concurrency}개 (타임스탬프 포함), 인코딩 워커: {max_workers}개 "
+                    f"(슬롯당 {slot_pool.threads_per_slot}스레드, CPU 코어: {multiprocessing.cpu_count()}개)")
+
+        # 단일 패스 모드: 씬별 인코딩/병합 없이 TTS 후 전체 영상을 한 번에 인코딩
+        if self.single_pass:
+            if combine:
+                return await self._create_video_single_pass(scene_data_list, tts_tasks, tts_concurrency,
+                                                            output_folder, start_time)
+            logger.warning("⚠️ 단일 패스 모드는 병합 출력만 지원합니다. 씬별 인코딩으로 진행합니다.")
+
+        # 씬 처리 함수 (인코딩 워커에서 실행)
         def process_scene(idx, scene_data):
             scene_num = scene_data['scene_num']
             media_path = scene_data['media_path']
@@ -2683,6 +2543,25 @@ Return ONLY the refined prompt without any explanation or additional text."""
             # 비디오 생성 (자막 포함)
             video_path = output_folder / f"scene_{scene_num:02d}.mp4"
 
+            # 입력과 렌더링 명령이 이전 렌더링과 같으면 기존 씬 비디오 재사용
+            fingerprint_inputs = None
+            if self.render_manifest is not None:
+                fingerprint_inputs = self._scene_fingerprint_inputs(scene_data)
+                expected = None
+                if fingerprint_inputs:
+                    try:
+                        expected = self._scene_fingerprint(fingerprint_inputs, self._expected_scene_commands(
+                            scene_data, video_path, fingerprint_inputs['ass_path']))
+                    except Exception as e:
+                        logger.warning(f"씬 {scene_num} 지문 계산 실패, 다시 렌더링합니다: {e}")
+                if expected and self.render_manifest.is_fresh(scene_num, expected, video_path):
+                    logger.info(f"{progress} ♻️ 씬 {scene_num}: 입력 변경 없음, 기존 비디오 재사용")
+                    return (scene_num, video_path, audio_path, clean_narration)
+                self.render_manifest.invalidate(scene_num)
+
+            # 실제로 실행한 명령 기록 시작 (폴백 인코더 포함)
+            self._scene_encode_log.commands = []
+
             # 비디오 파일이 이미 있으면 그대로 사용하거나 오디오와 결합
             if media_type == 'video':
                 logger.info(f"{progress} 씬 {scene_num}: 비디오 파일에 오디오 결합 중...")
@@ -2695,7 +2574,8 @@ Return ONLY the refined prompt without any explanation or additional text."""
                         clean_narration, audio_duration, word_timings
                     )
                 else:
-                    result = self._combine_video_audio(scene_num, media_path, audio_path, video_path)
+                    result = self._combine_video_audio(scene_num, media_path, audio_path, video_path,
+                                                       scene_data.get('audio_duration'))
             else:
                 # 이미지에서 비디오 생성
                 logger.info(f"{progress} 씬 {scene_num} 비디오 생성 중... ({encoder_type})")
@@ -2707,173 +2587,334 @@ Return ONLY the refined prompt without any explanation or additional text."""
                         clean_narration, audio_duration, word_timings
                     )
                 else:
-                    result = self._create_scene_video(scene_num, media_path, audio_path, video_path)
+                    result = self._create_scene_video(scene_num, media_path, audio_path, video_path,
+                                                      scene_data.get('audio_duration'))
 
+            commands, self._scene_encode_log.commands = self._scene_encode_log.commands, None
             if result:
+                fingerprint = self._scene_fingerprint(fingerprint_inputs, commands)
+                if fingerprint:
+                    self.render_manifest.record(scene_num, fingerprint, result)
                 logger.info(f"{progress} ✅ 씬 {scene_num} 완료!")
-                return (scene_num, result, clean_narration)
+                return (scene_num, result, audio_path, clean_narration)
             return None
 
-        # 병렬 실행
+        # 9:16 스마트 크롭 대상 이미지의 얼굴 감지를 미리 일괄 실행 (결과는 캐시되어 씬 인코딩 시 재사용)
+        if self.aspect_ratio == "9:16" and not self.add_subtitles and OPENCV_AVAILABLE:
+            # 크롭하지 않는 이미지(16:9 가로가 아닌 것)는 감지할 필요 없음 - 헤더만 읽어 거름
+            image_paths_to_scan = [
+                d['media_path'] for d in scene_data_list
+                if d['media_type'] == 'image' and self._is_landscape_image(d['media_path'])
+            ]
+            if image_paths_to_scan:
+                get_focus_detector().detect_many(image_paths_to_scan)
+
+        # TTS → 인코딩 스트리밍 파이프라인
+        # - TTS 동시 개수는 세마포어로만 제한 (배치 단위 대기 없음)
+        # - 각 씬은 TTS가 끝나는 즉시 인코딩 워커에 제출
+        # → 전체 시간 ≈ max(TTS, 인코딩)
+        tts_semaphore = asyncio.Semaphore(tts_concurrency)
+        loop = asyncio.get_running_loop()
+        stage_timings = {}
+        tts_done_count = 0
+        pipeline_start = time()
+
+        def timed_process_scene(idx, scene_data):
+            timing = stage_timings[scene_data['scene_num']]
+            timing['encode_start'] = time()
+            try:
+                return process_scene(idx, scene_data)
+            finally:
+                timing['encode_end'] = time()
+
+        async def tts_then_encode(idx, scene_data, tts_task):
+            nonlocal tts_done_count
+            timing = stage_timings.setdefault(scene_data['scene_num'], {})
+            async with tts_semaphore:
+                timing['tts_start'] = time()
+                duration, word_timings = await tts_task
+                timing['tts_end'] = time()
+
+            # 오디오 길이와 타임스탬프를 scene_data에 저장
+            scene_data['audio_duration'] = duration
+            scene_data['word_timings'] = word_timings  # Edge TTS 타임스탬프!
+
+            tts_done_count += 1
+            logger.info(f"TTS 완료 ({tts_done_count}/{len(tts_tasks)}): 씬 {scene_data['scene_num']} → 인코딩 대기열 추가")
+            return await loop.run_in_executor(executor, timed_process_scene, idx, scene_data)
+
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(process_scene, idx, scene_data): idx
-                      for idx, scene_data in enumerate(scene_data_list, 1)}
+            results = await asyncio.gather(*[
+                tts_then_encode(idx, scene_data, tts_task)
+                for idx, (scene_data, tts_task) in enumerate(zip(scene_data_list, tts_tasks), 1)
+            ])
 
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    scene_num, video_path, narration = result
-                    scene_videos.append((scene_num, video_path))
-                    all_narrations.append(narration)
+        self._log_stage_timings(stage_timings, pipeline_start)
+        self._save_draft_timing()
 
         # 씬 번호 순서로 정렬
-        scene_videos.sort(key=lambda x: x[0])
-        scene_videos = [path for _, path in scene_videos]
+        results = sorted((r for r in results if r), key=lambda r: r[0])
+        scene_videos = [(video_path, audio_path) for _, video_path, audio_path, _ in results]
+        all_narrations = [narration for _, _, _, narration in results]
 
         if not scene_videos:
             logger.error("생성된 씬 비디오가 없습니다.")
             return None
 
         # 전체 나레이션 저장
-        full_narration_path = output_folder / "full_narration.txt"
-        with open(full_narration_path, 'w', encoding='utf-8') as f:
-            f.write('\n\n'.join(all_narrations))
-        logger.info(f"전체 나레이션 저장: {full_narration_path}")
+        self._save_full_narration(output_folder, all_narrations)
 
-        # 결합
-        if combine and len(scene_videos) > 1:
-            # title이 최상위에 있거나 metadata 안에 있을 수 있음
-            title = self.story_data.get("title")
-            if not title and "metadata" in self.story_data:
-                title = self.story_data["metadata"].get("title")
-            if not title:
-                title = "video"
-
-            # 파일명으로 사용 가능하도록 특수문자 제거
-            safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '_', '-', '.')).strip()
-            safe_title = safe_title.replace(' ', '_')
-            # 최종 영상을 프로젝트 루트에 저장 (영상병합과 같은 위치)
-            final_path = self.folder_path / f"{safe_title}.mp4"
-            logger.info(f"📝 최종 영상 제목: {title} → {safe_title}.mp4")
-            logger.info(f"📂 최종 영상 위치: {final_path}")
+        # 결합 (씬 비디오는 비디오 전용이므로 씬이 하나여도 오디오 트랙을 먹임)
+        if combine:
+            final_path = self._final_video_path()
             return self._combine_videos(scene_videos, final_path, start_time)
-        elif scene_videos:
-            logger.info(f"씬 비디오 {len(scene_videos)}개 생성 완료 (결합 안 함)")
-            return scene_videos[0]
-
-        return None
 
-    async def _generate_word_timestamps_async(self, audio_path: Path) -> list:
-        """Whisper로 음성 분석하여 단어별 타임스탬프 생성 (async 버전)"""
-        import concurrent.futures
+        if not self._mux_scene_narrations(scene_videos):
+            return None
+        logger.info(f"씬 비디오 {len(scene_videos)}개 생성 완료 (결합 안 함, 씬별 나레이션 포함)")
+        return scene_videos[0][0]
 
-        def _run_whisper(audio_path_str):
+    def _mux_scene_narrations(self, scene_videos: List[Tuple[Path, Path]]) -> bool:
+        """결합하지 않는 경우 비디오 전용 씬 비디오에 각 씬 나레이션을 재인코딩 없이 먹이기 (제자리 교체)"""
+        for video_path, audio_path in scene_videos:
+            if not audio_path.exists():
+                continue
+            # 중간 파일도 scene_ 접두사 (프론트엔드가 최종 영상으로 오인하지 않도록)
+            muxed_path = video_path.with_name(f"{video_path.stem}_mux.mp4")
             try:
-                import whisper
+                mux_audio_track(video_path, audio_path, muxed_path, stop_dir=self.folder_path)
+            except AudioTrackError as e:
+                muxed_path.unlink(missing_ok=True)
+                logger.error(f"씬 나레이션 결합 실패 ({video_path.name}): {e}")
+                return False
+            os.replace(muxed_path, video_path)
+        return True
 
-                logger.info(f"Whisper 분석 중: {Path(audio_path_str).name}")
+    def _save_draft_timing(self):
+        """초안 씬 타이밍 저장 (--from-draft 최종 렌더링에서 재사용)"""
+        if self.draft_timing is not None:
+            self.draft_timing.save()
+            logger.info(f"📋 초안 타이밍 저장: {self.draft_timing.path}")
 
-                # Whisper 모델 로드 (base 모델: 빠르고 충분히 정확함)
-                model = whisper.load_model("base")
+    def _save_full_narration(self, output_folder: Path, narrations: List[str]):
+        """전체 나레이션 텍스트 저장 (씬 순서)"""
+        full_narration_path = output_folder / "full_narration.txt"
+        with open(full_narration_path, 'w', encoding='utf-8') as f:
+            f.write('\n\n'.join(narrations))
+        logger.info(f"전체 나레이션 저장: {full_narration_path}")
 
-                # 음성 인식 실행 (세그먼트 단위로 타임스탬프 추출)
-                result = model.transcribe(
-                    audio_path_str,
-                    language="ko",
-                    verbose=False,
-                    fp16=False  # CPU에서 FP16 경고 방지
-                )
+    def _final_video_path(self) -> Path:
+        """story.json 제목으로 최종 영상 경로 결정 (프로젝트 루트)"""
+        # title이 최상위에 있거나 metadata 안에 있을 수 있음
+        title = self.story_data.get("title")
+        if not title and "metadata" in self.story_data:
+            title = self.story_data["metadata"].get("title")
+        if not title:
+            title = "video"
+
+        # 파일명으로 사용 가능하도록 특수문자 제거
+        safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '_', '-', '.')).strip()
+        safe_title = safe_title.replace(' ', '_')
+        # 최종 영상을 프로젝트 루트에 저장 (영상병합과 같은 위치)
+        final_path = self.folder_path / f"{safe_title}.mp4"
+        if self.draft:
+            final_path = draft_output_path(final_path)
+        logger.info(f"📝 최종 영상 제목: {title} → {final_path.name}")
+        logger.info(f"📂 최종 영상 위치: {final_path}")
+        return final_path
+
+    async def _create_video_single_pass(self, scene_data_list: List[Dict], tts_tasks: list,
+                                        tts_concurrency: int, output_folder: Path,
+                                        start_time: float) -> Optional[Path]:
+        """단일 패스 렌더링: 모든 씬 TTS 완료 후 전체 영상을 FFmpeg 한 번으로 인코딩"""
+        logger.info("🎞️ 렌더링 방식: 단일 패스 (씬별 인코딩/병합 없음)")
+
+        tts_semaphore = asyncio.Semaphore(tts_concurrency)
+
+        async def run_tts(scene_data, tts_task):
+            async with tts_semaphore:
+                duration, word_timings = await tts_task
+            scene_data['audio_duration'] = duration
+            scene_data['word_timings'] = word_timings
 
-                # 세그먼트별 타임스탬프를 단어 단위로 변환
-                word_segments = []
-                for segment in result.get("segments", []):
-                    # 세그먼트 텍스트를 단어로 분리
-                    text = segment.get("text", "").strip()
-                    words = text.split()
+        await asyncio.gather(*[
+            run_tts(scene_data, tts_task)
+            for scene_data, tts_task in zip(scene_data_list, tts_tasks)
+        ])
+        logger.info(f"TTS 완료: {len(scene_data_list)}개 씬")
+        self._save_draft_timing()
 
-                    if not words:
-                        continue
+        if not scene_data_list:
+            logger.error("생성할 씬이 없습니다.")
+            return None
 
-                    # 세그먼트 시간을 단어 개수로 나눠서 근사치 계산
-                    start_time = segment.get("start", 0)
-                    end_time = segment.get("end", 0)
-                    duration = end_time - start_time
-                    time_per_word = duration / len(words) if words else 0
-
-                    for i, word in enumerate(words):
-                        word_start = start_time + (i * time_per_word)
-                        word_end = start_time + ((i + 1) * time_per_word)
-                        word_segments.append({
-                            "word": word.strip(),
-                            "start": word_start,
-                            "end": word_end
-                        })
+        self._save_full_narration(output_folder, [d['clean_narration'] for d in scene_data_list])
 
-                logger.info(f"Whisper 완료: {Path(audio_path_str).name} - {len(word_segments)}개 단어")
-                return word_segments
+        final_path = self._final_video_path()
+        return self._render_single_pass(scene_data_list, output_folder, final_path, start_time)
 
-            except Exception as e:
-                logger.error(f"Whisper 분석 실패 ({Path(audio_path_str).name}): {e}")
-                import traceback
-                logger.error(traceback.format_exc())
-                # 자막 생성 실패 시 예외를 발생시켜 영상 제작 중단
-                raise RuntimeError(f"자막 생성 실패: {Path(audio_path_str).name} - {e}")
+    def _render_single_pass(self, scene_data_list: List[Dict], output_folder: Path,
+                            final_path: Path, start_time: float) -> Optional[Path]:
+        """씬 미디어 + 나레이션 + 통합 자막을 하나의 filter_complex로 최종 영상 인코딩"""
+        script_path = output_folder / "single_pass_filter.txt"
+        try:
+            # 씬 길이: 나레이션 길이 (비디오 씬은 비디오가 더 길면 비디오 길이)
+            segments = []
+            for scene_data in scene_data_list:
+                duration = scene_data.get('audio_duration') or self._get_audio_duration(scene_data['audio_path'])
+                if scene_data['media_type'] == 'video':
+                    duration = max(duration, self._get_video_duration(scene_data['media_path']))
+                segments.append({
+                    'media_type': scene_data['media_type'],
+                    'media_path': scene_data['media_path'].resolve(),
+                    'audio_path': scene_data['audio_path'].resolve(),
+                    'duration': duration,
+                })
 
-        # ThreadPoolExecutor로 병렬 실행
-        loop = asyncio.get_event_loop()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-            return await loop.run_in_executor(executor, _run_whisper, str(audio_path))
+            # 씬별 ASS 자막을 씬 시작 시각만큼 밀어서 하나로 합침
+            subtitle_filename = None
+            if self.add_subtitles:
+                ass_segments = []
+                offset = 0.0
+                for scene_data, segment in zip(scene_data_list, segments):
+                    srt_path = scene_data['audio_path'].with_suffix('.srt')
+                    ass_path = self._create_srt_with_timings(
+                        scene_data.get('word_timings') or [], srt_path,
+                        scene_data['clean_narration'], scene_data.get('audio_duration', 1.0),
+                        max_chars_per_line=22
+                    )
+                    ass_segments.append((ass_path, offset))
+                    offset += segment['duration']
+                subtitle_filename = merge_ass_files(ass_segments, output_folder / "full_subtitles.ass").name
 
-    def _generate_word_timestamps(self, audio_path: Path) -> list:
-        """Whisper로 음성 분석하여 세그먼트별 타임스탬프 생성 (동기 버전)"""
-        try:
-            import whisper
+            input_args, filter_graph = build_single_pass_graph(
+                segments, self.width, self.height, fps=25, subtitle_filename=subtitle_filename
+            )
+            # 씬이 많으면 명령줄 길이 제한을 넘으므로 그래프는 파일로 전달
+            with open(script_path, 'w', encoding='utf-8') as f:
+                f.write(filter_graph)
+
+            total_duration = sum(segment['duration'] for segment in segments)
+            all_images = all(segment['media_type'] == 'image' for segment in segments)
+            logger.info(f"🎬 단일 패스 인코딩 시작: {len(segments)}개 씬, {total_duration:.1f}초")
+
+            def encode(codec, preset):
+                if self.draft:
+                    codec_args = list(DRAFT_VIDEO_ARGS)
+                elif codec == 'libx264':
+                    # 최종 출력이므로 병합 단계와 같은 품질 설정 사용
+                    codec_args = ['-c:v', 'libx264', '-preset', 'medium', '-crf', '18']
+                    if all_images:
+                        codec_args.extend(['-tune', 'stillimage'])
+                else:
+                    codec_args = ['-c:v', codec, '-preset', preset]
+                cmd = [
+                    'ffmpeg', '-y',
+                    *input_args,
+                    '-filter_complex_script', str(script_path.resolve()),
+                    '-map', '[outv]',
+                    '-map', '[outa]',
+                    *codec_args,
+                    '-pix_fmt', 'yuv420p',
+                    '-c:a', 'aac',
+                    '-b:a', self.audio_bitrate or '192k',
+                    str(final_path.resolve())
+                ]
+                # ass 필터는 파일명만 받으므로 출력 폴더에서 실행
+                run_ffmpeg(cmd, check=True, cwd=output_folder, stop_dir=self.folder_path,
+                           duration=sum(segment['duration'] for segment in segments), encode_slot=True)
 
-            logger.info(f"Whisper로 음성 분석 중: {audio_path.name}")
+            try:
+                encode(self.video_codec, self.codec_preset)
+            except subprocess.CalledProcessError as e:
+                if self.video_codec == 'libx264':
+                    raise
+                logger.warning(f"GPU 인코더 실패, CPU 인코더로 재시도... ({(e.stderr or '')[-300:]})")
+                encode('libx264', 'medium')
+
+            if not final_path.exists():
+                logger.error(f"최종 영상이 생성되지 않았습니다: {final_path}")
+                return None
 
-            # Whisper 모델 로드 (base 모델: 빠르고 충분히 정확함)
-            model = whisper.load_model("base")
+            elapsed_time = time() - start_time
+            minutes = int(elapsed_time // 60)
+            seconds = int(elapsed_time % 60)
+            logger.info(f"✅ 단일 패스 인코딩 완료: {final_path}")
+            logger.info(f"총 수행 시간: {minutes}분 {seconds}초")
+            return final_path
 
-            # 음성 인식 실행
-            result = model.transcribe(
-                str(audio_path),
-                language="ko",
-                verbose=False,
-                fp16=False  # CPU에서 FP16 경고 방지
-            )
+        except subprocess.CalledProcessError as e:
+            logger.error(f"단일 패스 인코딩 실패: {(e.stderr or '')[-1000:]}")
+            return None
+        except Exception as e:
+            logger.error(f"단일 패스 렌더링 중 오류: {e}")
+            return None
+        finally:
+            script_path.unlink(missing_ok=True)
 
-            # 세그먼트별 타임스탬프 추출 후 단어로 분할
-            word_segments = []
+    def _log_stage_timings(self, stage_timings: Dict[int, Dict[str, float]], pipeline_start: float):
+        """씬별 TTS/인코딩 소요 시간과 파이프라인 중첩 효과 요약 로그"""
+        self.stage_timings = stage_timings
+        if not stage_timings:
+            return
 
-            if not result or "segments" not in result:
-                logger.warning("Whisper가 세그먼트를 반환하지 않음")
-                return []
+        def span(start_key, end_key):
+            starts = [t[start_key] for t in stage_timings.values() if end_key in t]
+            ends = [t[end_key] for t in stage_timings.values() if end_key in t]
+            return (max(ends) - min(starts)) if starts else 0.0
+
+        logger.info("⏱️ 단계별 소요 시간:")
+        for scene_num in sorted(stage_timings):
+            t = stage_timings[scene_num]
+            tts = t.get('tts_end', 0) - t.get('tts_start', 0)
+            wait = t['encode_start'] - t['tts_end'] if 'encode_start' in t and 'tts_end' in t else 0.0
+            encode = t.get('encode_end', 0) - t.get('encode_start', 0)
+            logger.info(f"  씬 {scene_num}: TTS {tts:.1f}초, 인코딩 대기 {wait:.1f}초, 인코딩 {encode:.1f}초")
+
+        tts_span = span('tts_start', 'tts_end')
+        encode_span = span('encode_start', 'encode_end')
+        total = time() - pipeline_start
+        overlap = max(0.0, tts_span + encode_span - total)
+        logger.info(
+            f"  TTS 구간 {tts_span:.1f}초, 인코딩 구간 {encode_span:.1f}초 → "
+            f"파이프라인 전체 {total:.1f}초 (중첩으로 {overlap:.1f}초 단축)"
+        )
 
-            for segment in result.get("segments", []):
-                text = segment.get("text", "").strip()
-                start_time = segment.get("start", 0.0)
-                end_time = segment.get("end", 0.0)
+    async def _generate_word_timestamps_async(self, audio_path: Path) -> list:
+        """Whisper로 음성 분석하여 단어별 타임스탬프 생성 (async 버전)"""
+        try:
+            logger.info(f"Whisper 분석 중: {audio_path.name}")
 
-                if not text:
-                    continue
+            # 공용 서비스: base 모델을 한 번만 로드하고 요청은 전용 스레드에서 순서대로 처리
+            segments = await get_transcription_service().transcribe_async(
+                str(audio_path), model_size="base", language="ko"
+            )
+            word_segments = split_segments_to_words(segments)
 
-                # 세그먼트 텍스트를 단어로 분할
-                words = text.split()
-                if not words:
-                    continue
+            logger.info(f"Whisper 완료: {audio_path.name} - {len(word_segments)}개 단어")
+            return word_segments
 
-                # 각 단어에 균등하게 시간 분배
-                duration_per_word = (end_time - start_time) / len(words)
+        except Exception as e:
+            logger.error(f"Whisper 분석 실패 ({audio_path.name}): {e}")
+            import traceback
+            logger.error(traceback.format_exc())
+            # 자막 생성 실패 시 예외를 발생시켜 영상 제작 중단
+            raise RuntimeError(f"자막 생성 실패: {audio_path.name} - {e}")
 
-                for i, word in enumerate(words):
-                    word_start = start_time + (i * duration_per_word)
-                    word_end = word_start + duration_per_word
+    def _generate_word_timestamps(self, audio_path: Path) -> list:
+        """Whisper로 음성 분석하여 세그먼트별 타임스탬프 생성 (동기 버전)"""
+        try:
+            logger.info(f"Whisper로 음성 분석 중: {audio_path.name}")
 
-                    word_segments.append({
-                        "word": word.strip(),
-                        "start": word_start,
-                        "end": word_end
-                    })
+            segments = get_transcription_service().transcribe(
+                str(audio_path), model_size="base", language="ko"
+            )
+            if not segments:
+                logger.warning("Whisper가 세그먼트를 반환하지 않음")
+                return []
+
+            # 세그먼트 텍스트를 단어로 분할, 각 단어에 균등하게 시간 분배
+            word_segments = split_segments_to_words(segments)
 
             logger.info(f"단어 {len(word_segments)}개의 타임스탬프 추출 완료")
             return word_segments
@@ -2897,132 +2938,19 @@ Return ONLY the refined prompt without any explanation or additional text."""
 
             logger.info(f"Edge TTS 타임스탬프로 자막 생성 중... ({len(word_segments)}개 단어)")
 
-            # 단어들을 max_chars_per_line에 맞춰 그룹화
-            subtitles = []
-            current_text = ""
-            current_start = None
-            current_end = None
-
-            MIN_REMAINING_CHARS = 5
-
-            for i, word_info in enumerate(word_segments):
-                word = word_info["word"]
-                start = word_info["start"]
-                end = word_info["end"]
-
-                # 빈 단어는 건너뛰기
-                if not word.strip():
-                    continue
-
-                # 첫 단어면 시작 시간 설정
-                if current_start is None:
-                    current_start = start
-
-                # 다음 텍스트 계산
-                next_text = current_text + (" " if current_text else "") + word
-
-                # 남은 단어들 계산
-                remaining_words = word_segments[i+1:]
-                remaining_text = " ".join([w["word"] for w in remaining_words]) if remaining_words else ""
-
-                # 스마트 줄바꿈 로직
-                if len(next_text) > max_chars_per_line and current_text:
-                    # 남은 글자가 너무 적으면 현재 라인에 포함
-                    if len(remaining_text) > 0 and len(remaining_text) < MIN_REMAINING_CHARS:
-                        current_text = next_text + (" " + remaining_text if remaining_text else "")
-                        # 남은 모든 단어의 끝 시간 찾기
-                        if remaining_words:
-                            current_end = remaining_words[-1]["end"]
-                        else:
-                            current_end = end
-
-                        subtitles.append({
-                            "start": current_start,
-                            "end": current_end,
-                            "text": current_text.strip()
-                        })
-                        break  # 모든 단어 처리 완료
-                    else:
-                        # 정상적으로 줄바꿈 - 현재 라인의 끝 시간은 current_end (이전 단어의 끝)
-                        subtitles.append({
-                            "start": current_start,
-                            "end": current_end,  # 수정: end 대신 current_end 사용
-                            "text": current_text.strip()
-                        })
-                        current_text = word
-                        current_start = start
-                        current_end = end
-                else:
-                    current_text = next_text
-                    current_end = end
-
-            # 남은 텍스트 처리
-            if current_text:
-                subtitles.append({
-                    "start": current_start,
-                    "end": current_end,
-                    "text": current_text.strip()
-                })
+            # 단어들을 max_chars_per_line에 맞춰 그룹화 (남은 글자 수는 누적값으로 O(1) 조회)
+            subtitles = group_timed_words(word_segments, max_chars_per_line)
 
-            # 자막이 겹치지 않도록 시간 조정 (영상병합 방식)
-            for i in range(len(subtitles) - 1):
-                current_sub = subtitles[i]
-                next_sub = subtitles[i + 1]
-
-                # 현재 자막이 다음 자막과 겹치거나 간격이 너무 좁으면 조정
-                if current_sub["end"] >= next_sub["start"]:
-                    # 다음 자막 시작 직전으로 조정 (0.05초 간격)
-                    gap = 0.05
-                    adjusted_end = next_sub["start"] - gap
-                    # 최소 표시 시간 보장 (0.3초)
-                    min_duration = 0.3
-                    if adjusted_end - current_sub["start"] < min_duration:
-                        # 현재 자막이 너무 짧아지면 다음 자막 시작을 뒤로 밀기
-                        current_sub["end"] = current_sub["start"] + min_duration
-                        next_sub["start"] = current_sub["end"] + gap
-                    else:
-                        current_sub["end"] = adjusted_end
+            # 자막이 겹치지 않도록 시간 조정 (영상병합 방식, 0.05초 간격 / 최소 0.3초 표시)
+            resolve_overlaps(subtitles)
 
             # 마지막 자막이 오디오 길이를 초과하지 않도록 조정
             if subtitles and subtitles[-1]["end"] > audio_duration:
                 subtitles[-1]["end"] = audio_duration
 
-            # ASS 파일 작성
-            ass_path = srt_path.with_suffix('.ass')
-
-            with open(ass_path, 'w', encoding='utf-8') as f:
-                # ASS 헤더
-                f.write("[Script Info]\n")
-                f.write("ScriptType: v4.00+\n")
-                f.write("PlayResX: 1920\n")
-                f.write("PlayResY: 1080\n\n")
-
-                # 스타일 정의 - NanumGothic 96pt, 맨 하단
-                f.write("[V4+ Styles]\n")
-                f.write("Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n")
-                f.write("Style: Default,NanumGothic,96,&H00FFFFFF,&H000000FF,&H00000000,&H00000000,-1,0,0,0,100,100,0,0,1,3,2,2,10,10,20,1\n\n")
-
-                # 이벤트 (자막) - audio_duration을 초과하는 자막 필터링
-                f.write("[Events]\n")
-                f.write("Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n")
-
-                filtered_subtitles = []
-                for sub in subtitles:
-                    # audio_duration을 초과하는 자막은 제외
-                    if sub["start"] < audio_duration:
-                        # 끝 시간이 duration을 초과하면 duration으로 잘라냄
-                        end_time_adjusted = min(sub["end"], audio_duration)
-                        filtered_subtitles.append({
-                            "start": sub["start"],
-                            "end": end_time_adjusted,
-                            "text": sub["text"]
-                        })
-
-                for sub in filtered_subtitles:
-                    start_time = self._format_ass_timestamp(sub["start"])
-                    end_time = self._format_ass_timestamp(sub["end"])
-                    text = sub["text"].replace('\n', '\\N')
-                    f.write(f"Dialogue: 0,{start_time},{end_time},Default,,0,0,0,,{text}\n")
+            # ASS 파일 작성 - audio_duration을 초과하는 자막 필터링
+            filtered_subtitles = clip_to_duration(subtitles, audio_duration)
+            ass_path = write_subtitle_ass(filtered_subtitles, srt_path.with_suffix('.ass'))
 
             logger.info(f"Edge TTS 타임스탬프 기반 ASS 자막 완료: {len(filtered_subtitles)}개 라인 (duration: {audio_duration:.2f}초)")
             return ass_path
@@ -3038,114 +2966,12 @@ Return ONLY the refined prompt without any explanation or additional text."""
         if not narration or not narration.strip():
             raise RuntimeError("자막 생성 실패: 대본이 비어있습니다.")
 
-        # 대본을 문장으로 분리 (마침표, 느낌표, 물음표 기준)
-        import re
-        sentences = re.split(r'([.!?。！？])', narration)
-
-        # 분리된 구두점을 앞 문장에 붙이기
-        combined_sentences = []
-        for i in range(0, len(sentences)-1, 2):
-            if i+1 < len(sentences):
-                combined_sentences.append((sentences[i] + sentences[i+1]).strip())
-
-        # 마지막 문장 처리
-        if len(sentences) % 2 == 1 and sentences[-1].strip():
-            combined_sentences.append(sentences[-1].strip())
-
-        # 문장이 없으면 전체 텍스트를 하나의 문장으로
-        if not combined_sentences:
-            combined_sentences = [narration.strip()]
-
-        # 전체 글자 수 계산 (공백 포함)
-        total_text = " ".join(combined_sentences)
-        total_chars = len(total_text)
-        time_per_char = audio_duration / total_chars if total_chars > 0 else 0
-
-        # 각 문장을 22자 단위로 분할 (글자 수 기반 타이밍)
-        subtitles = []
-        current_time = 0.0
-
-        MIN_REMAINING_CHARS = 5  # 남은 글자가 이보다 적으면 현재 라인에 포함
-
-        for sentence in combined_sentences:
-            # 문장을 단어로 분리
-            words = sentence.split()
-            if not words:
-                continue
-
-            current_text = ""
-            for i, word in enumerate(words):
-                next_text = current_text + (" " if current_text else "") + word
-
-                # 다음 단어까지 포함하면 얼마나 남는지 계산
-                remaining_words = words[i+1:]
-                remaining_text = " ".join(remaining_words) if remaining_words else ""
-
-                # 스마트 줄바꿈 로직
-                if len(next_text) > max_chars_per_line and current_text:
-                    # 남은 글자가 너무 적으면 (1-2글자) 현재 라인에 포함
-                    if len(remaining_text) > 0 and len(remaining_text) < MIN_REMAINING_CHARS:
-                        # 현재 단어를 포함하고 줄바꿈 (다음 단어들도 함께)
-                        current_text = next_text + (" " + remaining_text if remaining_text else "")
-                        duration = len(current_text) * time_per_char
-                        end_time = current_time + duration
-                        subtitles.append({
-                            "start": current_time,
-                            "end": end_time,
-                            "text": current_text.strip()
-                        })
-                        current_text = ""
-                        current_time = end_time
-                        break  # 이 문장 끝
-                    else:
-                        # 정상적으로 줄바꿈
-                        duration = len(current_text) * time_per_char
-                        end_time = current_time + duration
-                        subtitles.append({
-                            "start": current_time,
-                            "end": end_time,
-                            "text": current_text.strip()
-                        })
-                        current_text = word
-                        current_time = end_time
-                else:
-                    current_text = next_text
-
-            # 남은 텍스트 처리
-            if current_text:
-                duration = len(current_text) * time_per_char
-                end_time = current_time + duration
-                subtitles.append({
-                    "start": current_time,
-                    "end": end_time,
-                    "text": current_text.strip()
-                })
-                current_time = end_time
+        # 대본을 문장으로 분리 (마침표, 느낌표, 물음표 기준) 후 22자 단위로 분할 (글자 수 기반 타이밍)
+        sentences = split_script_sentences(narration)
+        subtitles = group_script_text(sentences, audio_duration, max_chars_per_line)
 
         # ASS 파일 작성 (스타일 포함)
-        ass_path = srt_path.with_suffix('.ass')
-
-        with open(ass_path, 'w', encoding='utf-8') as f:
-            # ASS 헤더
-            f.write("[Script Info]\n")
-            f.write("ScriptType: v4.00+\n")
-            f.write("PlayResX: 1920\n")
-            f.write("PlayResY: 1080\n\n")
-
-            # 스타일 정의
-            f.write("[V4+ Styles]\n")
-            f.write("Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n")
-            f.write("Style: Default,NanumGothic,96,&H00FFFFFF,&H000000FF,&H00000000,&H00000000,-1,0,0,0,100,100,0,0,1,3,2,2,10,10,20,1\n\n")
-
-            # 이벤트 (자막)
-            f.write("[Events]\n")
-            f.write("Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n")
-
-            for sub in subtitles:
-                start = self._format_ass_timestamp(sub["start"])
-                end = self._format_ass_timestamp(sub["end"])
-                text = sub['text'].replace('\n', '\\N')
-                f.write(f"Dialogue: 0,{start},{end},Default,,0,0,0,,{text}\n")
+        ass_path = write_subtitle_ass(subtitles, srt_path.with_suffix('.ass'))
 
         logger.info(f"대본 기반 ASS 생성 완료: {len(subtitles)}개 구간")
 
@@ -3235,14 +3061,8 @@ Return ONLY the refined prompt without any explanation or additional text."""
         millis = int((seconds % 1) * 1000)
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
-    def _format_ass_timestamp(self, seconds: float) -> str:
-        """초를 ASS 타임스탬프 형식으로 변환 (공통 모듈 사용)"""
-        return format_ass_time(seconds)
-
     def _add_subtitles_with_segments(self, video_path: Path, audio_path: Path, output_path: Path, word_segments: list):
         """미리 분석된 Whisper 타임스탬프로 자막 추가 (병렬 처리용)"""
-        import subprocess
-
         # 자막 스타일 (나눔고딕, 큰 글씨) - _add_subtitles_from_script와 동일하게
         subtitle_style = (
             "FontName=NanumGothic,"  # 나눔고딕
@@ -3273,7 +3093,8 @@ Return ONLY the refined prompt without any explanation or additional text."""
             str(output_path)
         ]
 
-        subprocess.run(cmd, check=True, capture_output=True)
+        run_ffmpeg(cmd, check=True, duration=self._get_video_duration(video_path), stop_dir=self.folder_path,
+                   encode_slot=True)
 
     def _add_subtitles_from_script(self, video_path: Path, audio_path: Path, output_path: Path, narration: str, audio_duration: float):
         """대본을 기반으로 자막 추가 (Whisper 없이)"""
@@ -3298,7 +3119,8 @@ Return ONLY the refined prompt without any explanation or additional text."""
         ]
 
         try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True, encoding='utf-8', errors='ignore', cwd=str(audio_path.parent))
+            result = run_ffmpeg(cmd, check=True, duration=audio_duration, stop_dir=self.folder_path,
+                                cwd=audio_path.parent, encode_slot=True)
         except subprocess.CalledProcessError as e:
             logger.error(f"FFmpeg 자막 추가 실패: {e.stderr}")
             raise
@@ -3336,6 +3158,16 @@ def main():
                        help="관리자 모드 (비용 로그 표시)")
     parser.add_argument("--job-id", "--task-id", default=None, dest="task_id",
                        help="Task ID (추적용)")
+    parser.add_argument("--no-tts-cache", action="store_false", dest="use_tts_cache",
+                       help="TTS 캐시 사용 안 함 (항상 새로 생성)")
+    parser.add_argument("--full-render", action="store_false", dest="incremental",
+                       help="모든 씬 다시 인코딩 (변경 없는 씬 재사용 안 함)")
+    parser.add_argument("--single-pass", action="store_true", default=False,
+                       help="씬별 인코딩/병합 대신 전체 영상을 한 번에 인코딩")
+    parser.add_argument("--draft", action="store_true", default=False,
+                       help="검수용 초안 렌더링 (540p, ultrafast, 저비트레이트 오디오, *_draft.mp4로 출력)")
+    parser.add_argument("--from-draft", action="store_true", default=False,
+                       help="초안의 씬 오디오/타이밍으로 최종 렌더링 (나레이션이 같은 씬은 TTS 생략)")
 
     args = parser.parse_args()
 
@@ -3362,6 +3194,8 @@ def main():
     print(f"비율: {args.aspect_ratio}")
     print(f"자막: {'추가' if args.add_subtitles else '추가 안 함'}")
     print(f"이미지 소스: {args.image_source}")
+    if args.draft:
+        print("렌더링: 초안 (540p)")
     print("=" * 70)
 
     # 크리에이터 생성
@@ -3373,7 +3207,12 @@ def main():
         add_subtitles=args.add_subtitles,
         image_source=args.image_source,
         image_provider=args.image_provider,
-        is_admin=args.is_admin
+        is_admin=args.is_admin,
+        use_tts_cache=args.use_tts_cache,
+        incremental=args.incremental,
+        single_pass=args.single_pass,
+        draft=args.draft,
+        from_draft=args.from_draft
     )
 
     # 비디오 생성 (항상 병합)
@@ -3,8 +3,9 @@
 import logging
 import os
 import json
+import hashlib
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from openai import OpenAI
 from moviepy.editor import VideoFileClip, concatenate_videoclips, AudioFileClip, ImageClip
@@ -21,14 +22,59 @@ from app.utils import (
     detect_best_encoder,
     format_ass_time,
 )
+from src.utils.concat_engine import smart_concat
+from src.utils.draft_render import (
+    DRAFT_AUDIO_ARGS,
+    DRAFT_AUDIO_BITRATE,
+    DRAFT_CRF,
+    DRAFT_PRESET,
+    DRAFT_REENCODE_ARGS,
+    DRAFT_VIDEO_ARGS,
+    DraftTiming,
+    draft_output_path,
+    draft_resolution,
+)
+from src.utils.encode_slots import get_encode_slot_pool
+from src.utils.ffmpeg_job import FFmpegJobCancelled, FFmpegJobTimeout, run_ffmpeg
+from src.utils.ffmpeg_utils import build_image_scene_command, probe_media
+from src.utils.llm_batch import (
+    BatchCheckpoint,
+    call_with_retry,
+    get_rate_limiter,
+    provider_concurrency,
+    run_bounded,
+)
+from src.utils.subtitle_renderer import (
+    SubtitleStyle,
+    build_overlay_graph,
+    get_subtitle_renderer,
+    sentence_events,
+    write_narration_ass,
+)
+from src.utils.subtitle_segmentation import write_subtitle_ass
+from src.utils.transcription import get_transcription_service
+
+# Per-scene detailed narrations finished so far (lets a crashed run resume only missing scenes)
+NARRATION_CHECKPOINT_FILENAME = "narration_checkpoint.json"
 
 
 class LongFormStoryCreator:
     """Create long-form story videos with multiple scenes and images."""
 
-    def __init__(self, config: Dict[str, Any], job_id: Optional[str] = None):
+    def __init__(self, config: Dict[str, Any], job_id: Optional[str] = None,
+                 draft: bool = False, from_draft: bool = False):
+        """
+        Args:
+            config: AutoShortsEditor config
+            job_id: Job ID for DB logging
+            draft: Fast review render - 540p, ultrafast, low-bitrate audio, *_draft.mp4 outputs
+            from_draft: Reuse the draft's scene narration audio/timing (no TTS for unchanged scenes)
+        """
         self.config = config
         self.job_id = job_id
+        self.draft = draft
+        self.from_draft = from_draft
+        self.draft_timing = None
 
         # DB 로깅 설정 (job_id가 있으면)
         if job_id:
@@ -88,6 +134,9 @@ class LongFormStoryCreator:
         else:
             self.logger.info("✗ 자동 이미지 생성 비활성화됨 - image_prompt가 없으면 이미지 생성 건너뜀")
 
+        if self.draft:
+            self.logger.info("📝 초안 모드: 540p, ultrafast, 저비트레이트 오디오 (*_draft.mp4)")
+
     def _initialize_llm_client(self):
         """Initialize LLM client based on configured provider."""
         llm_config = self.config.get("ai", {}).get("llm", {})
@@ -365,7 +414,6 @@ class LongFormStoryCreator:
 
     def _continue_from_media(self, project_dir: Path, story_data: Dict, scene_media: list, aspect_ratio: str, target_minutes: int, is_test_mode: bool = False) -> Dict[str, Any]:
         """Continue video creation from approved media (images and/or videos)."""
-        from tqdm import tqdm
         import time
 
         num_scenes = len(story_data['scenes'])
@@ -402,32 +450,16 @@ class LongFormStoryCreator:
             target_per_scene = int(target_length / num_scenes)
             min_per_scene = int(target_per_scene * 0.8)
 
-            with tqdm(total=num_scenes, desc="나레이션 생성 진행", position=0) as pbar_narration:
-                for media_data in scene_media:
-                    i = media_data['scene_num']
-                    scene = media_data['scene']
-
-                    # Create scene directory for this scene's files
-                    scene_dir = project_dir / f"scene_{i:02d}"
-                    scene_dir.mkdir(parents=True, exist_ok=True)
-
-                    # Update scene_dir in media_data for later use
-                    media_data['scene_dir'] = scene_dir
-
-                    print(f"\n[Scene {i}/{num_scenes}] {scene['title']} - 상세 나레이션 생성 중...")
-
-                    # Generate detailed narration for this scene
-                    self._generate_single_scene_narration(story_data, scene, i, target_per_scene, min_per_scene)
-
-                    # Save immediately after generation
-                    scene_script_path = scene_dir / f"scene_{i:02d}_narration.txt"
-                    with open(scene_script_path, 'w', encoding='utf-8') as f:
-                        f.write(f"씬 {i}: {scene['title']}\n")
-                        f.write(f"{'='*60}\n\n")
-                        f.write(scene['narration'])
+            narration_jobs = []
+            for media_data in scene_media:
+                i = media_data['scene_num']
+                # Create scene directory for this scene's files (used later for video/audio)
+                scene_dir = project_dir / f"scene_{i:02d}"
+                scene_dir.mkdir(parents=True, exist_ok=True)
+                media_data['scene_dir'] = scene_dir
+                narration_jobs.append((i, media_data['scene'], scene_dir))
 
-                    print(f"   [OK] 저장: {scene_script_path.name} ({len(scene['narration'])} chars)")
-                    pbar_narration.update(1)
+            self._generate_scene_narrations(story_data, narration_jobs, project_dir, target_per_scene, min_per_scene)
 
             # Update full script in story_data
             total_script = "\n\n".join([scene['narration'] for scene in story_data['scenes']])
@@ -459,11 +491,9 @@ class LongFormStoryCreator:
         print(f"{'='*70}")
         step_start = time.time()
 
-        from tqdm import tqdm
         with tqdm(total=1, desc="최종 비디오 결합", bar_format='{l_bar}{bar}| {elapsed}') as pbar:
             final_video_name = f"{safe_title}_full.mp4"
-            final_video_path = project_dir / final_video_name
-            self._combine_scenes(scene_videos, final_video_path)
+            final_video_path = self._combine_scenes(scene_videos, project_dir / final_video_name)
             pbar.update(1)
 
         step_elapsed = time.time() - step_start
@@ -666,25 +696,13 @@ class LongFormStoryCreator:
             target_per_scene = int(target_length / num_scenes)
             min_per_scene = int(target_per_scene * 0.8)
 
-            with tqdm(total=num_scenes, desc="나레이션 생성 진행", position=0) as pbar:
-                for i, scene in enumerate(story_data['scenes'], 1):
-                    scene_start = time.time()
-                    print(f"\n[Scene {i}/{num_scenes}] {scene['title']} - 상세 나레이션 생성 중...")
-                    self._generate_single_scene_narration(story_data, scene, i, target_per_scene, min_per_scene)
-
-                    # Save immediately
-                    scene_dir = project_dir / f"scene_{i:02d}"
-                    scene_dir.mkdir(exist_ok=True)
-                    scene_script_path = scene_dir / f"scene_{i:02d}_narration.txt"
-                    with open(scene_script_path, 'w', encoding='utf-8') as f:
-                        f.write(f"씬 {i}: {scene['title']}\n")
-                        f.write(f"{'='*60}\n\n")
-                        f.write(scene['narration'])
-
-                    scene_elapsed = time.time() - scene_start
-                    print(f"   [OK] 저장: {scene_script_path.name} ({len(scene['narration'])} chars)")
-                    print(f"    Scene {i} 소요시간: {self._format_elapsed_time(scene_elapsed)}")
-                    pbar.update(1)
+            narration_jobs = []
+            for i, scene in enumerate(story_data['scenes'], 1):
+                scene_dir = project_dir / f"scene_{i:02d}"
+                scene_dir.mkdir(exist_ok=True)
+                narration_jobs.append((i, scene, scene_dir))
+
+            self._generate_scene_narrations(story_data, narration_jobs, project_dir, target_per_scene, min_per_scene)
 
             # Update full script
             total_script = "\n\n".join([scene['narration'] for scene in story_data['scenes']])
@@ -737,73 +755,38 @@ class LongFormStoryCreator:
         print(f"{'='*70}")
         step_start = time.time()
 
-        scene_images = []
-        previous_image_path = None
-        character_descriptions = []
-
-        with tqdm(total=num_scenes, desc="이미지 생성 진행", position=0) as pbar_images:
-            for i, scene in enumerate(story_data['scenes'], 1):
-                scene_start = time.time()
-                print(f"\n{'='*70}")
-                print(f"Scene {i}/{num_scenes}: {scene['title']}")
-                print(f"{'='*70}")
-
-                scene_dir = project_dir / f"scene_{i:02d}"
-                scene_dir.mkdir(exist_ok=True)
-
-                # Generate image for scene (with reference to previous scene)
-                with tqdm(total=1, desc=f"   이미지 생성", leave=False, position=1) as pbar:
-                    image_path, char_desc = self._generate_scene_image(
-                        scene,
-                        story_data,
-                        scene_dir,
-                        aspect_ratio,
-                        i,
-                        previous_image_path,
-                        character_descriptions
-                    )
-
-                    # 이 장면의 이미지 생성이 건너뛰어진 경우 (None, None 반환)
-                    if image_path is None:
-                        print(f"   ✓ Sora 프롬프트로 직접 생성 (이미지 생성 건너뜀)")
-                    else:
-                        previous_image_path = image_path
-                    if char_desc:
-                        character_descriptions.append(char_desc)
-                        # Print character description for first scene
-                        if i == 1:
-                            print(f"\n[캐릭터 분석 완료]")
-                            print(f"{'='*70}")
-                            print(char_desc)
-                            print(f"{'='*70}")
-                            print(f" 이 캐릭터 설명이 다음 씬들에 전달됩니다.\n")
-                    pbar.update(1)
-
-                scene_images.append({
-                    'scene': scene,
-                    'image_path': image_path,
-                    'scene_dir': scene_dir,
-                    'scene_num': i
-                })
-
-                scene_elapsed = time.time() - scene_start
-                print(f"[OK] Image {i} Complete: {image_path.name}")
-                print(f" Scene {i} 소요시간: {self._format_elapsed_time(scene_elapsed)}")
-                pbar_images.update(1)
+        image_jobs = []
+        for i, scene in enumerate(story_data['scenes'], 1):
+            scene_dir = project_dir / f"scene_{i:02d}"
+            scene_dir.mkdir(exist_ok=True)
+            image_jobs.append((i, scene, scene_dir))
+
+        # Scene 1 first (establishes the character bible), then the rest concurrently
+        image_paths = self._generate_scene_images(story_data, image_jobs, aspect_ratio)
+        scene_images = [
+            {
+                'scene': scene,
+                'image_path': image_path,
+                'scene_dir': scene_dir,
+                'scene_num': i
+            }
+            for (i, scene, scene_dir), image_path in zip(image_jobs, image_paths)
+        ]
 
-                # Create YouTube thumbnail from first scene
-                if i == 1:
-                    print(f"\n[Generating YouTube Thumbnail]")
-                    try:
-                        thumbnail_path = self._create_youtube_thumbnail(
-                            image_path,
-                            story_data['title'],
-                            project_dir
-                        )
-                        print(f"[OK] Thumbnail created: {thumbnail_path.name}\n")
-                    except Exception as e:
-                        self.logger.warning(f"Failed to create thumbnail: {e}")
-                        print(f"[Warning] Thumbnail creation failed: {e}\n")
+        # Create YouTube thumbnail from first scene
+        first_image = scene_images[0]['image_path'] if scene_images else None
+        if first_image is not None:
+            print(f"\n[Generating YouTube Thumbnail]")
+            try:
+                thumbnail_path = self._create_youtube_thumbnail(
+                    first_image,
+                    story_data['title'],
+                    project_dir
+                )
+                print(f"[OK] Thumbnail created: {thumbnail_path.name}\n")
+            except Exception as e:
+                self.logger.warning(f"Failed to create thumbnail: {e}")
+                print(f"[Warning] Thumbnail creation failed: {e}\n")
 
         step_elapsed = time.time() - step_start
         print(f"\n[OK] Step 2-A 완료 - 소요시간: {self._format_elapsed_time(step_elapsed)}")
@@ -906,28 +889,11 @@ class LongFormStoryCreator:
         target_per_scene = int(target_length / num_scenes)
         min_per_scene = int(target_per_scene * 0.8)
 
-        with tqdm(total=num_scenes, desc="나레이션 생성 진행", position=0) as pbar_narration:
-            for img_data in scene_images:
-                scene_start = time.time()
-                i = img_data['scene_num']
-                scene = img_data['scene']
-
-                print(f"\n[Scene {i}/{num_scenes}] {scene['title']} - 상세 나레이션 생성 중...")
-
-                # Generate detailed narration for this scene
-                self._generate_single_scene_narration(story_data, scene, i, target_per_scene, min_per_scene)
-
-                # Save immediately after generation
-                scene_script_path = img_data['scene_dir'] / f"scene_{i:02d}_narration.txt"
-                with open(scene_script_path, 'w', encoding='utf-8') as f:
-                    f.write(f"씬 {i}: {scene['title']}\n")
-                    f.write(f"{'='*60}\n\n")
-                    f.write(scene['narration'])
-
-                scene_elapsed = time.time() - scene_start
-                print(f"   [OK] 저장: {scene_script_path.name} ({len(scene['narration'])} chars)")
-                print(f"    Scene {i} 소요시간: {self._format_elapsed_time(scene_elapsed)}")
-                pbar_narration.update(1)
+        narration_jobs = [
+            (img_data['scene_num'], img_data['scene'], img_data['scene_dir'])
+            for img_data in scene_images
+        ]
+        self._generate_scene_narrations(story_data, narration_jobs, project_dir, target_per_scene, min_per_scene)
 
         # Update full script in story_data
         total_script = "\n\n".join([scene['narration'] for scene in story_data['scenes']])
@@ -1189,8 +1155,6 @@ class LongFormStoryCreator:
                 self.logger.warning(f"Images directory not found: {user_images_dir}")
 
         scene_images = []
-        previous_image_path = None
-        character_descriptions = []
 
         # Check if images already exist in project folder OR workspace root
         # (workspace root = where story.json is located for user-generated images)
@@ -1261,40 +1225,21 @@ class LongFormStoryCreator:
             # Generate images
             print(f"   Using {self.image_provider.upper()} for image generation...")
 
-            with tqdm(total=num_scenes, desc="이미지 생성 중", unit="scene") as pbar:
-                for i, scene in enumerate(story_data['scenes'], 1):
-                    # Use the proper scene image generation with consistency
-                    # Pass images_dir instead of scene_dir for image storage
-                    image_path, generated_character_descriptions = self._generate_scene_image(
-                        scene=scene,
-                        story_data=story_data,
-                        scene_dir=images_dir,  # Save all images in one folder
-                        aspect_ratio=aspect_ratio,
-                        scene_num=i,
-                        previous_image_path=previous_image_path,
-                        character_descriptions=character_descriptions if i > 1 else None
-                    )
-
-                    # 이 장면의 이미지 생성이 건너뛰어진 경우 (None, None 반환)
-                    if image_path is None:
-                        print(f"   씬 {i}: 건너뜀 (Sora 프롬프트로 직접 생성)")
-                        pbar.update(1)
-                        continue
-
-                    # Accumulate character descriptions for consistency
-                    if i == 1 and generated_character_descriptions:
-                        character_descriptions = generated_character_descriptions
-
-                    previous_image_path = image_path
+            image_jobs = [(i, scene, images_dir) for i, scene in enumerate(story_data['scenes'], 1)]
+            image_paths = self._generate_scene_images(story_data, image_jobs, aspect_ratio)
 
-                    scene_images.append({
-                        'scene': scene,
-                        'image_path': image_path,
-                        'scene_dir': images_dir,
-                        'scene_num': i
-                    })
+            for (i, scene, scene_dir), image_path in zip(image_jobs, image_paths):
+                # 이 장면의 이미지 생성이 건너뛰어진 경우 (None 반환)
+                if image_path is None:
+                    print(f"   씬 {i}: 건너뜀 (Sora 프롬프트로 직접 생성)")
+                    continue
 
-                    pbar.update(1)
+                scene_images.append({
+                    'scene': scene,
+                    'image_path': image_path,
+                    'scene_dir': scene_dir,  # All images in one folder
+                    'scene_num': i
+                })
 
         step_elapsed = time.time() - step_start
         print(f"\n[OK] Step 1 완료 - 소요시간: {self._format_elapsed_time(step_elapsed)}")
@@ -1701,8 +1646,83 @@ JSON만 출력하세요:"""
             self.logger.error(f"Story structure generation failed: {e}")
             raise
 
+    def _narration_fingerprint(self, scene: Dict[str, Any], target_per_scene: int, min_per_scene: int) -> str:
+        """Fingerprint of everything a scene's detailed narration depends on (outline, targets, model)."""
+        payload = json.dumps({
+            'title': scene.get('title'),
+            'outline': scene.get('narration'),
+            'target': target_per_scene,
+            'min': min_per_scene,
+            'model': self.llm_model,
+        }, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def _generate_scene_narrations(self, story_data: Dict[str, Any], jobs: List[Tuple[int, Dict[str, Any], Path]],
+                                   project_dir: Path, target_per_scene: int, min_per_scene: int):
+        """
+        Generate detailed narrations for many scenes concurrently.
+
+        Scenes are requested through a bounded thread pool (per-provider concurrency and
+        requests-per-minute limits, jittered retries). Every finished scene is written to its
+        narration file and to narration_checkpoint.json right away, so a crashed run resumed
+        on the same project only requests the scenes that are still missing.
+
+        Args:
+            jobs: [(scene number, scene dict, scene directory), ...] - scene dicts are updated in place
+        """
+        num_scenes = len(story_data['scenes'])
+        checkpoint = BatchCheckpoint(project_dir / NARRATION_CHECKPOINT_FILENAME)
+
+        def save_narration(i: int, scene: Dict[str, Any], scene_dir: Path) -> Path:
+            scene_script_path = scene_dir / f"scene_{i:02d}_narration.txt"
+            with open(scene_script_path, 'w', encoding='utf-8') as f:
+                f.write(f"씬 {i}: {scene['title']}\n")
+                f.write(f"{'='*60}\n\n")
+                f.write(scene['narration'])
+            return scene_script_path
+
+        pending = []
+        for i, scene, scene_dir in jobs:
+            fingerprint = self._narration_fingerprint(scene, target_per_scene, min_per_scene)
+            cached = checkpoint.get(str(i), fingerprint)
+            if cached is not None:
+                scene['narration'] = cached
+                save_narration(i, scene, scene_dir)
+            else:
+                pending.append((i, scene, scene_dir, fingerprint))
+
+        if len(pending) < len(jobs):
+            print(f"\n♻️ 체크포인트에서 {len(jobs) - len(pending)}개 씬 나레이션 복원, {len(pending)}개 씬만 생성합니다")
+        if not pending:
+            return
+
+        workers = provider_concurrency(self.llm_provider)
+        print(f"\n🚀 나레이션 병렬 생성: {len(pending)}개 씬 (동시 {workers}개, {self.llm_provider})")
+
+        def generate(job) -> Tuple[Path, float]:
+            i, scene, scene_dir, fingerprint = job
+            scene_start = time.time()
+            if self._generate_single_scene_narration(story_data, scene, i, target_per_scene, min_per_scene):
+                checkpoint.put(str(i), fingerprint, scene['narration'])
+            return save_narration(i, scene, scene_dir), time.time() - scene_start
+
+        with tqdm(total=len(pending), desc="나레이션 생성 진행", position=0) as pbar_narration:
+            def on_done(index: int, result: Tuple[Path, float]):
+                i, scene = pending[index][0], pending[index][1]
+                scene_script_path, scene_elapsed = result
+                print(f"\n[Scene {i}/{num_scenes}] {scene['title']}")
+                print(f"   [OK] 저장: {scene_script_path.name} ({len(scene['narration'])} chars)")
+                print(f"    Scene {i} 소요시간: {self._format_elapsed_time(scene_elapsed)}")
+                pbar_narration.update(1)
+
+            run_bounded(generate, pending, workers, on_done=on_done)
+
     def _generate_single_scene_narration(self, story_data: Dict[str, Any], scene: Dict[str, Any], scene_num: int, target_per_scene: int, min_per_scene: int):
-        """Generate detailed narration for a single scene."""
+        """Generate detailed narration for a single scene.
+
+        Transient API errors and malformed JSON responses are retried with jittered backoff.
+        Returns True when the scene narration was replaced, False when the outline was kept.
+        """
         try:
             i = scene_num
             # Prepare context
@@ -1786,29 +1806,38 @@ JSON 형식으로 출력:
   "actual_length": 글자수
 }}"""
 
-            response = self.client.chat.completions.create(
-                model=self.llm_model,
-                messages=[
-                    {"role": "system", "content": "너는 유튜브 오디오북실화극사연 드라마 전문 시나리오 작가이다. 매우 상세하고 감정선이 풍부한 나레이션을 작성한다."},
-                    {"role": "user", "content": context + "\n\n" + narration_prompt}
-                ],
-                temperature=0.85,
-                max_tokens=6000,  # Allow long narration per scene
-                response_format={"type": "json_object"}
-            )
+            def request_narration() -> str:
+                response = self.client.chat.completions.create(
+                    model=self.llm_model,
+                    messages=[
+                        {"role": "system", "content": "너는 유튜브 오디오북실화극사연 드라마 전문 시나리오 작가이다. 매우 상세하고 감정선이 풍부한 나레이션을 작성한다."},
+                        {"role": "user", "content": context + "\n\n" + narration_prompt}
+                    ],
+                    temperature=0.85,
+                    max_tokens=6000,  # Allow long narration per scene
+                    response_format={"type": "json_object"}
+                )
+
+                narration_json = response.choices[0].message.content.strip()
+                return json.loads(narration_json)['narration']
 
-            narration_json = response.choices[0].message.content.strip()
-            narration_data = json.loads(narration_json)
+            narration = call_with_retry(
+                request_narration,
+                limiter=get_rate_limiter(self.llm_provider),
+                label=f"씬 {i} 나레이션",
+            )
 
             # Update scene with detailed narration
-            scene['narration'] = narration_data['narration']
-            actual_length = len(narration_data['narration'])
+            scene['narration'] = narration
+            actual_length = len(narration)
 
             self.logger.info(f"Scene {i} detailed narration generated: {actual_length} chars")
+            return True
 
         except Exception as e:
             self.logger.error(f"Failed to generate narration for scene {i}: {e}")
             # Keep the original outline as fallback
+            return False
 
     def _evaluate_scenario(self, story_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -2167,6 +2196,88 @@ JSON 형식으로 평가 결과를 출력하시오:
         except Exception as e:
             raise Exception(f"Failed to generate image with Imagen 3: {e}")
 
+    def _image_backend(self) -> str:
+        """Image provider actually used - falls back to DALL-E when the configured one has no credentials."""
+        if self.image_provider == "replicate" and self.replicate_api_token:
+            return "replicate"
+        if self.image_provider == "huggingface" and self.hf_api_key:
+            return "huggingface"
+        if self.image_provider == "imagen3" and self.google_genai:
+            return "imagen3"
+        return "dalle"
+
+    def _generate_scene_images(self, story_data: Dict[str, Any], jobs: List[Tuple[int, Dict[str, Any], Path]],
+                               aspect_ratio: str) -> List[Optional[Path]]:
+        """
+        Generate scene images, scene 1 first and the rest concurrently.
+
+        Character consistency only depends on the descriptions extracted from the first
+        scene's image, so once that image exists every other scene can be requested in
+        parallel (per-provider concurrency and requests-per-minute limits). Concurrency comes
+        from ai.image_generation.max_concurrency, else LLM_CONCURRENCY_<PROVIDER>
+        (DALLE, IMAGEN3, HUGGINGFACE, REPLICATE), else the provider default.
+
+        Args:
+            jobs: [(scene number, scene dict, output directory), ...] - first job establishes the characters
+
+        Returns:
+            Image path per job in jobs order (None where the scene is rendered from its Sora prompt)
+        """
+        if not jobs:
+            return []
+
+        backend = self._image_backend()
+        limiter = get_rate_limiter(backend)
+        configured = self.config.get("ai", {}).get("image_generation", {}).get("max_concurrency")
+        workers = max(1, int(configured)) if configured else provider_concurrency(backend)
+        num_scenes = len(story_data['scenes'])
+        character_descriptions: List[str] = []
+
+        def generate(job) -> Tuple[Optional[Path], float]:
+            i, scene, scene_dir = job
+            scene_start = time.time()
+            limiter.acquire()
+            image_path, char_desc = self._generate_scene_image(
+                scene,
+                story_data,
+                scene_dir,
+                aspect_ratio,
+                i,
+                character_descriptions=character_descriptions or None
+            )
+            if char_desc:
+                character_descriptions.append(char_desc)
+            return image_path, time.time() - scene_start
+
+        with tqdm(total=len(jobs), desc="이미지 생성 진행", position=0) as pbar_images:
+            def on_done(index: int, result: Tuple[Optional[Path], float]):
+                i, scene = jobs[index][0], jobs[index][1]
+                image_path, scene_elapsed = result
+                print(f"\n[Scene {i}/{num_scenes}] {scene['title']}")
+                if image_path is None:
+                    print(f"   ✓ Sora 프롬프트로 직접 생성 (이미지 생성 건너뜀)")
+                else:
+                    print(f"[OK] Image {i} Complete: {image_path.name}")
+                print(f" Scene {i} 소요시간: {self._format_elapsed_time(scene_elapsed)}")
+                pbar_images.update(1)
+
+            first = run_bounded(generate, jobs[:1], 1, on_done=on_done)
+
+            if character_descriptions:
+                print(f"\n[캐릭터 분석 완료]")
+                print(f"{'='*70}")
+                print(character_descriptions[0])
+                print(f"{'='*70}")
+                print(f" 이 캐릭터 설명이 다음 씬들에 전달됩니다.\n")
+
+            rest = jobs[1:]
+            if rest:
+                print(f"\n🚀 이미지 병렬 생성: {len(rest)}개 씬 (동시 {workers}개, {backend})")
+            results = first + run_bounded(generate, rest, workers,
+                                          on_done=lambda index, result: on_done(index + 1, result))
+
+        return [image_path for image_path, _ in results]
+
     def _generate_scene_image(
         self,
         scene: Dict[str, Any],
@@ -2295,7 +2406,8 @@ Genre aesthetic: {story_data['genre']}
 Important: Create a visually striking scene with NATURAL, EXPRESSIVE faces that match the story mood and TIME PERIOD."""
 
         # Generate image using configured provider
-        if self.image_provider == "replicate" and self.replicate_api_token:
+        backend = self._image_backend()
+        if backend == "replicate":
             print(f"   Using Replicate for image generation...")
             # Parse size for Replicate
             width, height = map(int, dalle_size.split('x'))
@@ -2303,7 +2415,7 @@ Important: Create a visually striking scene with NATURAL, EXPRESSIVE faces that
 
             image_path = scene_dir / f"scene_{scene_num:02d}_image.png"
             img.save(image_path)
-        elif self.image_provider == "huggingface" and self.hf_api_key:
+        elif backend == "huggingface":
             print(f"   Using Hugging Face for image generation...")
             # Parse size for Hugging Face
             width, height = map(int, dalle_size.split('x'))
@@ -2311,7 +2423,7 @@ Important: Create a visually striking scene with NATURAL, EXPRESSIVE faces that
 
             image_path = scene_dir / f"scene_{scene_num:02d}_image.png"
             img.save(image_path)
-        elif self.image_provider == "imagen3" and self.google_genai:
+        elif backend == "imagen3":
             print(f"   Using Google Imagen 3 for image generation...")
             # Parse size for Imagen 3
             width, height = map(int, dalle_size.split('x'))
@@ -2459,14 +2571,20 @@ Style: Cinematic, high quality, natural lighting, professional Korean drama aest
         from concurrent.futures import ThreadPoolExecutor, as_completed
         import time
 
-        # Determine optimal number of workers (CPU cores - 1, max 3)
-        import os
-        max_workers = min(3, max(1, os.cpu_count() - 1))
-        print(f"   병렬 작업 수: {max_workers} (CPU cores: {os.cpu_count()})")
+        # Encodes are limited by the machine-wide encode slots (shared with other jobs);
+        # one extra worker keeps narration generation overlapping with encoding
+        slot_pool = get_encode_slot_pool()
+        max_workers = slot_pool.slots + 1
+        print(f"   병렬 작업 수: {max_workers} (인코딩 슬롯 {slot_pool.slots}개 × {slot_pool.threads_per_slot}스레드)")
 
         scene_videos = [None] * len(scene_media)  # Pre-allocate list
         completed = 0
 
+        # Draft timing (draft renders record it, from_draft renders reuse the draft narration)
+        self.draft_timing = None
+        if (self.draft or self.from_draft) and scene_media:
+            self.draft_timing = DraftTiming(scene_media[0]['scene_dir'].parent)
+
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all tasks
             future_to_scene = {}
@@ -2497,6 +2615,9 @@ Style: Cinematic, high quality, natural lighting, professional Korean drama aest
                         print(f"\n[ERROR] Scene {i} failed: {e}")
                         pbar.update(1)
 
+        if self.draft and self.draft_timing is not None:
+            self.draft_timing.save()
+
         print(f"\n[OK] 병렬 비디오 생성 완료: {completed}/{num_scenes} 성공")
         return scene_videos
 
@@ -2528,6 +2649,10 @@ Style: Cinematic, high quality, natural lighting, professional Korean drama aest
             i
         )
 
+        scene_video_path = scene_dir / f"scene_{i:02d}.mp4"
+        if self.draft:
+            scene_video_path = draft_output_path(scene_video_path)
+
         # Create or process scene video based on media type
         if media_type == 'video':
             # Video already exists - just add audio and subtitles
@@ -2535,7 +2660,7 @@ Style: Cinematic, high quality, natural lighting, professional Korean drama aest
             scene_video = self._add_audio_and_subtitles_to_video(
                 media_path,
                 audio_path,
-                scene_dir / f"scene_{i:02d}.mp4",
+                scene_video_path,
                 scene['narration']
             )
         else:
@@ -2545,7 +2670,7 @@ Style: Cinematic, high quality, natural lighting, professional Korean drama aest
             scene_video = self._create_scene_video(
                 image_path,
                 audio_path,
-                scene_dir / f"scene_{i:02d}.mp4",
+                scene_video_path,
                 aspect_ratio,
                 scene['narration']  # Pass narration for subtitles
             )
@@ -2570,10 +2695,18 @@ Style: Cinematic, high quality, natural lighting, professional Korean drama aest
 
         from .narrator import Narrator
 
-        narrator = Narrator(self.config)
         narration_text = scene['narration']
-
         audio_path = scene_dir / f"scene_{scene_num:02d}_audio.mp3"
+        tts_signature = json.dumps(self.config.get("tts", {}), ensure_ascii=False, sort_keys=True, default=str)
+
+        # Reuse the draft narration as-is (exact draft timing, no TTS)
+        if self.from_draft and self.draft_timing is not None:
+            promoted = self.draft_timing.promote(scene_num, narration_text, audio_path, voice=tts_signature)
+            if promoted:
+                self.logger.info(f"Scene {scene_num} narration reused from draft ({promoted[0]:.1f}s)")
+                return audio_path
+
+        narrator = Narrator(self.config)
         narrator.generate_speech(narration_text, audio_path)
 
         # Get duration
@@ -2581,10 +2714,67 @@ Style: Cinematic, high quality, natural lighting, professional Korean drama aest
         duration = audio_clip.duration
         audio_clip.close()
 
+        if self.draft and self.draft_timing is not None:
+            self.draft_timing.record(scene_num, narration_text, audio_path, duration, voice=tts_signature)
+
         self.logger.info(f"Scene {scene_num} narration generated ({duration:.1f}s)")
 
         return audio_path
 
+    def _scene_resolution(self, aspect_ratio: str) -> Tuple[int, int]:
+        """Scene video resolution for the aspect ratio (540p in draft mode)."""
+        if aspect_ratio == "9:16":
+            target_w, target_h = 1080, 1920
+        elif aspect_ratio == "16:9":
+            target_w, target_h = 1920, 1080
+        else:
+            target_w, target_h = 1080, 1080
+        if self.draft:
+            target_w, target_h = draft_resolution(target_w, target_h)
+        return target_w, target_h
+
+    def _ffmpeg_encode_args(self) -> Tuple[List[str], List[str]]:
+        """FFmpeg encoding options matching _video_write_params: (video args, audio args)."""
+        if self.draft:
+            return list(DRAFT_VIDEO_ARGS), list(DRAFT_AUDIO_ARGS)
+        return (
+            ['-c:v', self.config["output"]["codec"], '-b:v', self.config["output"]["bitrate"], '-preset', 'medium'],
+            ['-c:a', self.config["output"]["audio_codec"]],
+        )
+
+    def _transcribe_scene_segments(self, audio_path: Path) -> list:
+        """Transcribe the scene narration (any audio format) with the shared Whisper service.
+
+        Returns the timed segments, or [] when transcription failed or found no speech.
+        """
+        try:
+            # Shared Whisper model (loaded once per process, requests serialized)
+            model_size = os.getenv("WHISPER_MODEL", "base")
+            print(f"      Transcribing audio for subtitle timing...")
+            segments = get_transcription_service().transcribe(
+                audio_path,
+                model_size=model_size,
+                language="ko"
+            )
+            print(f"      Transcribed {len(segments)} segments")
+            return segments or []
+        except Exception as e:
+            self.logger.warning(f"Failed to transcribe subtitles with Whisper: {e}")
+            print(f"      [Warning] Subtitle generation failed: {e}")
+            return []
+
+    def _transcribe_scene_subtitles(self, audio_path: Path) -> Optional[Path]:
+        """Transcribe the scene narration with Whisper and save it as ASS next to the audio.
+
+        Returns the ASS path, or None when transcription failed or found no speech.
+        """
+        segments = self._transcribe_scene_segments(audio_path)
+        if not segments:
+            return None
+        self._save_ass_file(audio_path, segments)
+        ass_path = audio_path.with_suffix('.ass')
+        return ass_path if ass_path.exists() else None
+
     def _create_scene_video(
         self,
         image_path: Path,
@@ -2593,7 +2783,117 @@ Style: Cinematic, high quality, natural lighting, professional Korean drama aest
         aspect_ratio: str,
         narration_text: str = None
     ) -> Path:
-        """Create video from scene image and audio with optional subtitles."""
+        """Create video from scene image and audio with optional subtitles.
+
+        Renders with a single FFmpeg command; falls back to MoviePy (much slower)
+        when FFmpeg is not available or the FFmpeg render fails. A cancelled (STOP)
+        or timed-out FFmpeg job is re-raised instead of being retried with MoviePy.
+        """
+        ffmpeg_path, _ = self._get_ffmpeg_path()
+        if not ffmpeg_path:
+            self.logger.warning("FFmpeg not found, rendering scene with MoviePy (매우 느림)")
+            return self._create_scene_video_moviepy(image_path, audio_path, output_path, aspect_ratio, narration_text)
+
+        try:
+            return self._create_scene_video_ffmpeg(
+                ffmpeg_path, image_path, audio_path, output_path, aspect_ratio, narration_text
+            )
+        except (FFmpegJobCancelled, FFmpegJobTimeout):
+            raise
+        except Exception as e:
+            self.logger.warning(f"FFmpeg scene render failed, falling back to MoviePy: {e}")
+            print(f"   [Warning] FFmpeg 씬 렌더링 실패, MoviePy로 재시도...")
+            return self._create_scene_video_moviepy(image_path, audio_path, output_path, aspect_ratio, narration_text)
+
+    def _create_scene_video_ffmpeg(
+        self,
+        ffmpeg_path: str,
+        image_path: Path,
+        audio_path: Path,
+        output_path: Path,
+        aspect_ratio: str,
+        narration_text: str = None
+    ) -> Path:
+        """Render an image scene with one FFmpeg filter graph.
+
+        Crop-to-aspect, 1s fade in/out and the Whisper ASS subtitles (saved by
+        _save_ass_file) are applied in a single pass - no frames go through Python.
+        When Whisper fails, the narration sentences are evenly timed over the scene
+        instead (_add_narration_subtitles) so the scene is never left without subtitles.
+        """
+        audio_path = Path(audio_path).resolve()
+        output_path = Path(output_path).resolve()
+        target_w, target_h = self._scene_resolution(aspect_ratio)
+
+        duration = get_audio_duration(audio_path)
+        if not duration or duration <= 0:
+            raise RuntimeError(f"나레이션 길이를 확인할 수 없습니다: {audio_path.name}")
+
+        subtitle_filter = None
+        narration_overlay = False
+        if narration_text and self.config.get("ai", {}).get("add_subtitles", True):
+            print(f"   Adding subtitles...")
+            ass_path = self._transcribe_scene_subtitles(audio_path)
+            if not ass_path:
+                print(f"      [Info] Whisper 자막 없음 → 나레이션 문장 자막 사용")
+                if self._subtitle_renderer() == "overlay":
+                    # Sprite overlays need their own filter graph - burned after the scene render
+                    narration_overlay = True
+                else:
+                    ass_path = self._write_narration_ass(
+                        narration_text, duration, target_w, target_h,
+                        audio_path.with_name(f"{audio_path.stem}_narration.ass")
+                    )
+            if ass_path:
+                subtitle_filter = f"ass={ass_path.name}"
+
+        video_args, audio_args = self._ffmpeg_encode_args()
+        cmd = build_image_scene_command(
+            ffmpeg_path,
+            Path(image_path).resolve(),
+            audio_path,
+            output_path,
+            target_w,
+            target_h,
+            duration,
+            fps=self.config["video"]["fps"],
+            subtitle_filter=subtitle_filter,
+            video_args=video_args,
+            audio_args=audio_args
+        )
+
+        # ass filter takes a bare file name, so run from the audio/ASS folder;
+        # machine-wide encode slot limits FFmpeg threads like the MoviePy export
+        run_ffmpeg(cmd, check=True, duration=duration, cwd=audio_path.parent, encode_slot=True)
+        if narration_overlay:
+            self._burn_narration_overlay(output_path, narration_text, duration)
+        return output_path
+
+    def _burn_narration_overlay(self, video_path: Path, narration_text: str, duration: float):
+        """Burn sprite-overlay narration subtitles into a rendered scene in place."""
+        # scene_ prefix: the frontend only lists scene_* intermediates, and this one is removed anyway
+        unsubtitled = video_path.with_name(f"{video_path.stem}_nosub{video_path.suffix}")
+        os.replace(video_path, unsubtitled)
+        try:
+            result = self._add_narration_subtitles(unsubtitled, narration_text, duration, video_path)
+            if result == unsubtitled:
+                os.replace(unsubtitled, video_path)
+        except Exception:
+            os.replace(unsubtitled, video_path)
+            raise
+        else:
+            if unsubtitled.exists():
+                unsubtitled.unlink()
+
+    def _create_scene_video_moviepy(
+        self,
+        image_path: Path,
+        audio_path: Path,
+        output_path: Path,
+        aspect_ratio: str,
+        narration_text: str = None
+    ) -> Path:
+        """Create video from scene image and audio with MoviePy (fallback renderer)."""
 
         try:
             # Load audio
@@ -2604,12 +2904,7 @@ Style: Cinematic, high quality, natural lighting, professional Korean drama aest
             image_clip = ImageClip(str(image_path), duration=duration)
 
             # Determine resolution
-            if aspect_ratio == "9:16":
-                target_w, target_h = 1080, 1920
-            elif aspect_ratio == "16:9":
-                target_w, target_h = 1920, 1080
-            else:
-                target_w, target_h = 1080, 1080
+            target_w, target_h = self._scene_resolution(aspect_ratio)
 
             # Resize/crop image
             from moviepy.video.fx.all import crop, resize
@@ -2643,74 +2938,28 @@ Style: Cinematic, high quality, natural lighting, professional Korean drama aest
             # Add subtitles if narration text provided
             if narration_text and self.config.get("ai", {}).get("add_subtitles", True):
                 print(f"   Adding subtitles...")
-                # Transcribe audio directly using Whisper for accurate timing
-                try:
-                    import whisper
-                    import wave
-                    import numpy as np
-
-                    # Load Whisper model
-                    model_size = os.getenv("WHISPER_MODEL", "base")
-                    print(f"      Loading Whisper model: {model_size}")
-                    model = whisper.load_model(model_size)
-
-                    # Load audio file
-                    with wave.open(str(audio_path), 'rb') as wav_file:
-                        sample_rate = wav_file.getframerate()
-                        n_frames = wav_file.getnframes()
-                        audio_data = wav_file.readframes(n_frames)
-
-                        # Convert to numpy array
-                        audio_array = np.frombuffer(audio_data, dtype=np.int16)
-                        audio_array = audio_array.astype(np.float32) / 32768.0
-
-                        # Convert stereo to mono if needed
-                        if wav_file.getnchannels() == 2:
-                            audio_array = audio_array.reshape(-1, 2).mean(axis=1)
-
-                    # Transcribe
-                    print(f"      Transcribing audio for subtitle timing...")
-                    result = model.transcribe(
-                        audio_array,
-                        language="ko",
-                        verbose=False
-                    )
-
-                    segments = [
-                        {
-                            "start": seg["start"],
-                            "end": seg["end"],
-                            "text": seg["text"].strip()
-                        }
-                        for seg in result["segments"]
-                    ]
-
-                    print(f"      Transcribed {len(segments)} segments")
-
+                # Same Whisper transcription as the FFmpeg path (reads the MP3 directly)
+                segments = self._transcribe_scene_segments(audio_path)
+                if segments:
                     # Save segments as ASS file for later use
-                    if segments:
-                        self._save_ass_file(audio_path, segments)
-
-                    # Add subtitles using Transcriber
-                    if segments:
+                    self._save_ass_file(audio_path, segments)
+                    try:
                         from .transcriber import Transcriber
                         transcriber = Transcriber(self.config)
                         image_clip = transcriber.add_subtitles(image_clip, segments)
-
-                except Exception as e:
-                    self.logger.warning(f"Failed to add subtitles with Whisper: {e}")
-                    print(f"      [Warning] Subtitle generation failed: {e}")
-
-            # Export
-            image_clip.write_videofile(
-                str(output_path),
-                fps=self.config["video"]["fps"],
-                codec=self.config["output"]["codec"],
-                audio_codec=self.config["output"]["audio_codec"],
-                bitrate=self.config["output"]["bitrate"],
-                preset='medium',
-                logger=None
-            )
+                    except Exception as e:
+                        self.logger.warning(f"Failed to add subtitles with Whisper: {e}")
+                        print(f"      [Warning] Subtitle generation failed: {e}")
+
+            # Export (machine-wide encode slot, FFmpeg threads limited to the slot)
+            with get_encode_slot_pool().slot() as slot:
+                image_clip.write_videofile(
+                    str(output_path),
+                    fps=self.config["video"]["fps"],
+                    threads=slot.threads,
+                    logger=None,
+                    **self._video_write_params()
+                )
 
             image_clip.close()
             audio.close()
@@ -2748,6 +2997,12 @@ Style: Cinematic, high quality, natural lighting, professional Korean drama aest
             # Load audio
             audio = AudioFileClip(str(audio_path))
 
+            # Draft: downscale to 540p before subtitles are burned in
+            if self.draft:
+                from moviepy.video.fx.all import resize
+                draft_w, draft_h = draft_resolution(video_clip.w, video_clip.h)
+                video_clip = resize(video_clip, newsize=(draft_w, draft_h))
+
             # Set audio on the video
             video_clip = video_clip.set_audio(audio)
 
@@ -2765,74 +3020,28 @@ Style: Cinematic, high quality, natural lighting, professional Korean drama aest
             # Add subtitles if narration text provided
             if narration_text and self.config.get("ai", {}).get("add_subtitles", True):
                 print(f"   Adding subtitles...")
-                try:
-                    import whisper
-                    import wave
-                    import numpy as np
-                    import os
-
-                    # Load Whisper model
-                    model_size = os.getenv("WHISPER_MODEL", "base")
-                    print(f"      Loading Whisper model: {model_size}")
-                    model = whisper.load_model(model_size)
-
-                    # Load audio file
-                    with wave.open(str(audio_path), 'rb') as wav_file:
-                        sample_rate = wav_file.getframerate()
-                        n_frames = wav_file.getnframes()
-                        audio_data = wav_file.readframes(n_frames)
-
-                        # Convert to numpy array
-                        audio_array = np.frombuffer(audio_data, dtype=np.int16)
-                        audio_array = audio_array.astype(np.float32) / 32768.0
-
-                        # Convert stereo to mono if needed
-                        if wav_file.getnchannels() == 2:
-                            audio_array = audio_array.reshape(-1, 2).mean(axis=1)
-
-                    # Transcribe
-                    print(f"      Transcribing audio for subtitle timing...")
-                    result = model.transcribe(
-                        audio_array,
-                        language="ko",
-                        verbose=False
-                    )
-
-                    segments = [
-                        {
-                            "start": seg["start"],
-                            "end": seg["end"],
-                            "text": seg["text"].strip()
-                        }
-                        for seg in result["segments"]
-                    ]
-
-                    print(f"      Transcribed {len(segments)} segments")
-
+                # Same Whisper transcription as the image scenes (reads the MP3 directly)
+                segments = self._transcribe_scene_segments(audio_path)
+                if segments:
                     # Save segments as ASS file for later use
-                    if segments:
-                        self._save_ass_file(audio_path, segments)
-
-                    # Add subtitles using Transcriber
-                    if segments:
+                    self._save_ass_file(audio_path, segments)
+                    try:
                         from .transcriber import Transcriber
                         transcriber = Transcriber(self.config)
                         video_clip = transcriber.add_subtitles(video_clip, segments)
-
-                except Exception as e:
-                    self.logger.warning(f"Failed to add subtitles with Whisper: {e}")
-                    print(f"      [Warning] Subtitle generation failed: {e}")
-
-            # Export
-            video_clip.write_videofile(
-                str(output_path),
-                fps=self.config["video"]["fps"],
-                codec=self.config["output"]["codec"],
-                audio_codec=self.config["output"]["audio_codec"],
-                bitrate=self.config["output"]["bitrate"],
-                preset='medium',
-                logger=None
-            )
+                    except Exception as e:
+                        self.logger.warning(f"Failed to add subtitles with Whisper: {e}")
+                        print(f"      [Warning] Subtitle generation failed: {e}")
+
+            # Export (machine-wide encode slot, FFmpeg threads limited to the slot)
+            with get_encode_slot_pool().slot() as slot:
+                video_clip.write_videofile(
+                    str(output_path),
+                    fps=self.config["video"]["fps"],
+                    threads=slot.threads,
+                    logger=None,
+                    **self._video_write_params()
+                )
 
             video_clip.close()
             audio.close()
@@ -2843,230 +3052,105 @@ Style: Cinematic, high quality, natural lighting, professional Korean drama aest
             self.logger.error(f"Adding audio and subtitles to video failed: {e}")
             raise
 
-    def _add_narration_subtitles(self, clip, narration_text: str, duration: float):
-        """
-        Add subtitles to video clip from narration text.
+    def _subtitle_renderer(self) -> str:
+        """Narration subtitle renderer from ai.subtitle_style.renderer ("ass" or "overlay")."""
+        return self.config.get("ai", {}).get("subtitle_style", {}).get("renderer", "ass")
 
-        Splits narration into chunks and displays them as timed subtitles.
-        Uses PIL instead of ImageMagick for better compatibility.
-        """
-        from moviepy.editor import ImageClip, CompositeVideoClip
-        from PIL import Image, ImageDraw, ImageFont
-        import numpy as np
-
-        # Get subtitle style from config
-        style = self.config.get("ai", {}).get("subtitle_style", {})
-
-        # Split narration into sentences (by periods, exclamation marks, question marks)
-        import re
-        sentences = re.split(r'[.!?。]\s*', narration_text.strip())
-        sentences = [s.strip() for s in sentences if s.strip()]
+    def _write_narration_ass(self, narration_text: str, duration: float, width: int, height: int,
+                             ass_path: Path) -> Optional[Path]:
+        """Write evenly timed narration sentences as ASS (ai.subtitle_style); None without sentences."""
+        events = sentence_events(narration_text, duration)
+        if not events:
+            return None
+        style = SubtitleStyle.from_config(self.config.get("ai", {}).get("subtitle_style", {}))
+        return write_narration_ass(events, style, width, height, ass_path)
 
-        if not sentences:
-            return clip
+    def _add_narration_subtitles(self, video_path: Path, narration_text: str, duration: float,
+                                 output_path: Path) -> Path:
+        """
+        Burn narration sentences (evenly timed over the scene) into a video with FFmpeg.
 
-        # Calculate time per sentence
-        time_per_sentence = duration / len(sentences)
+        The default renderer writes the sentences as ASS (style from ai.subtitle_style) and
+        lets libass burn them. subtitle_style.renderer = "overlay" keeps the PIL look
+        (background box + outline): each sentence bitmap is drawn once, cached per
+        (sentence, style) and composited by FFmpeg overlay filters. No frame is composited
+        in Python either way. Used by _create_scene_video_ffmpeg when Whisper gives no
+        subtitles for the scene.
 
-        subtitle_clips = []
-        current_time = 0.0
+        Returns:
+            output_path, or video_path unchanged when the narration has no sentences
+        """
+        style = SubtitleStyle.from_config(self.config.get("ai", {}).get("subtitle_style", {}))
+        events = sentence_events(narration_text, duration)
+        if not events:
+            return Path(video_path)
 
-        # Font settings
-        font_size = style.get("font_size", 52)
-        text_color = style.get("color", "white")
-        stroke_color = style.get("stroke_color", "black")
-        stroke_width = style.get("stroke_width", 3)
+        ffmpeg_path, _ = self._get_ffmpeg_path()
+        if not ffmpeg_path:
+            raise RuntimeError("FFmpeg not found. Install FFmpeg or imageio-ffmpeg.")
+        info = probe_media(video_path)
+        if not info or not info.get('video'):
+            raise RuntimeError(f"비디오 정보를 확인할 수 없습니다: {Path(video_path).name}")
+        width, height = info['video']['width'], info['video']['height']
+
+        video_path = Path(video_path).resolve()
+        output_path = Path(output_path).resolve()
+        video_args, _ = self._ffmpeg_encode_args()
+
+        if self._subtitle_renderer() == "overlay":
+            renderer = get_subtitle_renderer(style)
+            max_width = int(width * style.max_width_ratio)
+            sprite_dir = output_path.parent / "subtitle_sprites"
+            sprite_inputs: List[str] = []
+            sprite_index: Dict[Path, int] = {}
+            placements = []
+            for start, end, text in events:
+                sprite = renderer.save_sprite(text, max_width, sprite_dir)
+                if sprite not in sprite_index:
+                    sprite_index[sprite] = len(sprite_index) + 1
+                    sprite_inputs.extend(['-i', str(sprite)])
+                placements.append((sprite_index[sprite], start, end))
 
-        # Try to load font
-        try:
-            # Try common Windows Korean fonts
-            font_names = [
-                "C:/Windows/Fonts/malgun.ttf",  # 맑은 고딕
-                "C:/Windows/Fonts/gulim.ttc",    # 굴림
-                "C:/Windows/Fonts/batang.ttc",   # 바탕
-                "arial.ttf"
+            cmd = [
+                ffmpeg_path, '-y',
+                '-i', str(video_path),
+                *sprite_inputs,
+                '-filter_complex', build_overlay_graph(placements, style),
+                '-map', '[outv]',
+                '-map', '0:a?',
+                *video_args,
+                '-c:a', 'copy',
+                str(output_path)
             ]
-            font = None
-            for font_name in font_names:
-                try:
-                    font = ImageFont.truetype(font_name, font_size)
-                    break
-                except:
-                    continue
-
-            if font is None:
-                font = ImageFont.load_default()
-        except:
-            font = ImageFont.load_default()
-
-        for sentence in sentences:
-            if not sentence:
-                continue
-
-            try:
-                # Create PIL image for text
-                max_width = int(clip.w * 0.85)
-
-                # Word wrap
-                lines = self._wrap_text(sentence, font, max_width)
-
-                # Calculate text size
-                temp_img = Image.new('RGBA', (1, 1))
-                temp_draw = ImageDraw.Draw(temp_img)
-
-                line_heights = []
-                max_line_width = 0
-                for line in lines:
-                    bbox = temp_draw.textbbox((0, 0), line, font=font)
-                    line_width = bbox[2] - bbox[0]
-                    line_height = bbox[3] - bbox[1]
-                    line_heights.append(line_height)
-                    max_line_width = max(max_line_width, line_width)
-
-                total_height = sum(line_heights) + (len(lines) - 1) * 10  # 10px line spacing
-
-                # Add padding for stroke and background
-                padding = 20
-                img_width = max_line_width + padding * 2 + stroke_width * 4
-                img_height = total_height + padding * 2 + stroke_width * 4
-
-                # Create image with transparent background
-                img = Image.new('RGBA', (img_width, img_height), (0, 0, 0, 0))
-                draw = ImageDraw.Draw(img)
-
-                # Add semi-transparent background if enabled
-                if style.get("background", True):
-                    bg_color = tuple(style.get("background_color", [0, 0, 0]))
-                    bg_opacity = int(style.get("background_opacity", 0.7) * 255)
-                    draw.rectangle(
-                        [(0, 0), (img_width, img_height)],
-                        fill=bg_color + (bg_opacity,)
-                    )
-
-                # Draw text with stroke
-                y_offset = padding + stroke_width * 2
-                for i, line in enumerate(lines):
-                    bbox = draw.textbbox((0, 0), line, font=font)
-                    line_width = bbox[2] - bbox[0]
-                    x = (img_width - line_width) // 2
-
-                    # Draw stroke (outline)
-                    if stroke_width > 0:
-                        for adj_x in range(-stroke_width, stroke_width + 1):
-                            for adj_y in range(-stroke_width, stroke_width + 1):
-                                if adj_x != 0 or adj_y != 0:
-                                    draw.text(
-                                        (x + adj_x, y_offset + adj_y),
-                                        line,
-                                        font=font,
-                                        fill=stroke_color
-                                    )
-
-                    # Draw main text
-                    draw.text((x, y_offset), line, font=font, fill=text_color)
-                    y_offset += line_heights[i] + 10
-
-                # Convert PIL image to numpy array
-                img_array = np.array(img)
-
-                # Create ImageClip
-                subtitle_clip = ImageClip(img_array, duration=time_per_sentence)
-
-                # Position subtitle
-                position = style.get("position", "bottom")
-                margin = style.get("margin", 80)
-
-                if position == "bottom":
-                    subtitle_clip = subtitle_clip.set_position(("center", clip.h - img_height - margin))
-                elif position == "top":
-                    subtitle_clip = subtitle_clip.set_position(("center", margin))
-                else:  # center
-                    subtitle_clip = subtitle_clip.set_position("center")
-
-                # Set timing
-                subtitle_clip = subtitle_clip.set_start(current_time)
-                subtitle_clips.append(subtitle_clip)
-
-                current_time += time_per_sentence
-
-            except Exception as e:
-                self.logger.warning(f"Failed to create subtitle for '{sentence[:30]}...': {e}")
-                import traceback
-                self.logger.warning(traceback.format_exc())
-                continue
-
-        if subtitle_clips:
-            # Composite video with subtitles
-            video = CompositeVideoClip([clip] + subtitle_clips)
-            self.logger.info(f"Added {len(subtitle_clips)} subtitle segments")
-            return video
-
-        return clip
-
-    def _wrap_text(self, text: str, font, max_width: int):
-        """Wrap text to fit within max_width."""
-        from PIL import ImageDraw, Image
-
-        temp_img = Image.new('RGB', (1, 1))
-        draw = ImageDraw.Draw(temp_img)
-
-        words = text.split()
-        lines = []
-        current_line = []
-
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            bbox = draw.textbbox((0, 0), test_line, font=font)
-            width = bbox[2] - bbox[0]
-
-            if width <= max_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-
-        if current_line:
-            lines.append(' '.join(current_line))
+            cwd = None
+        else:
+            ass_path = self._write_narration_ass(
+                narration_text, duration, width, height,
+                output_path.with_name(f"{output_path.stem}_subtitles.ass")
+            )
+            cmd = [
+                ffmpeg_path, '-y',
+                '-i', str(video_path),
+                '-vf', f"ass={ass_path.name}",
+                '-map', '0:v:0',
+                '-map', '0:a?',
+                *video_args,
+                '-c:a', 'copy',
+                str(output_path)
+            ]
+            # ass filter takes a bare file name
+            cwd = ass_path.parent
 
-        return lines if lines else [text]
+        run_ffmpeg(cmd, check=True, duration=duration, cwd=cwd, encode_slot=True)
+        self.logger.info(f"Added {len(events)} subtitle segments")
+        return output_path
 
     def _save_ass_file(self, audio_path: Path, segments: list):
         """Save Whisper transcription segments as ASS subtitle file."""
         ass_path = audio_path.with_suffix('.ass')
 
-        def format_ass_timestamp(seconds: float) -> str:
-            """Convert seconds to ASS timestamp format (h:mm:ss.cc)"""
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            secs = int(seconds % 60)
-            centisecs = int((seconds % 1) * 100)
-            return f"{hours}:{minutes:02d}:{secs:02d}.{centisecs:02d}"
-
         try:
-            with open(ass_path, 'w', encoding='utf-8') as f:
-                # ASS header
-                f.write("[Script Info]\n")
-                f.write("ScriptType: v4.00+\n")
-                f.write("PlayResX: 1920\n")
-                f.write("PlayResY: 1080\n")
-                f.write("\n")
-
-                # Style definition
-                f.write("[V4+ Styles]\n")
-                f.write("Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n")
-                f.write("Style: Default,NanumGothic,96,&H00FFFFFF,&H000000FF,&H00000000,&H00000000,-1,0,0,0,100,100,0,0,1,3,2,2,10,10,20,1\n")
-                f.write("\n")
-
-                # Events (subtitles)
-                f.write("[Events]\n")
-                f.write("Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n")
-
-                for seg in segments:
-                    start_time = format_ass_timestamp(seg["start"])
-                    end_time = format_ass_timestamp(seg["end"])
-                    text = seg["text"]
-                    f.write(f"Dialogue: 0,{start_time},{end_time},Default,,0,0,0,,{text}\n")
+            write_subtitle_ass(segments, ass_path)
 
             print(f"      Saved ASS subtitle file: {ass_path.name}")
             self.logger.info(f"ASS subtitle file created: {ass_path}")
@@ -3105,14 +3189,31 @@ Style: Cinematic, high quality, natural lighting, professional Korean drama aest
 
         return None, None
 
+    def _video_write_params(self) -> Dict[str, Any]:
+        """MoviePy write_videofile encoding options (draft: ultrafast + low-bitrate audio)."""
+        if self.draft:
+            return {
+                'codec': 'libx264',
+                'audio_codec': 'aac',
+                'audio_bitrate': DRAFT_AUDIO_BITRATE,
+                'preset': DRAFT_PRESET,
+                'ffmpeg_params': ['-crf', str(DRAFT_CRF)],
+            }
+        return {
+            'codec': self.config["output"]["codec"],
+            'audio_codec': self.config["output"]["audio_codec"],
+            'bitrate': self.config["output"]["bitrate"],
+            'preset': 'medium',
+        }
+
     def _combine_scenes(self, scene_videos: List[Path], output_path: Path) -> Path:
         """
         Combine all scene videos into one using FFmpeg for much faster performance.
 
         FFmpeg is 10-100x faster than MoviePy for video concatenation.
         """
-        import subprocess
-        import tempfile
+        if self.draft:
+            output_path = draft_output_path(output_path)
 
         # Get FFmpeg path
         ffmpeg_path, ffprobe_path = self._get_ffmpeg_path()
@@ -3124,100 +3225,26 @@ Style: Cinematic, high quality, natural lighting, professional Korean drama aest
             return self._combine_scenes_moviepy(scene_videos, output_path)
 
         try:
-            # Method 1: Try concat demuxer first (fastest - no re-encoding)
-            # This works if all videos have identical parameters
-            print(f"   시도 1: FFmpeg concat demuxer (재인코딩 없음, 가장 빠름)")
-
-            # Create concat file list
-            concat_file = output_path.parent / "concat_list.txt"
-            with open(concat_file, 'w', encoding='utf-8') as f:
-                for video_path in scene_videos:
-                    # Use forward slashes for FFmpeg compatibility on Windows
-                    video_path_str = str(video_path).replace('\\', '/')
-                    f.write(f"file '{video_path_str}'\n")
-
-            # Try concat demuxer (no re-encoding)
-            cmd = [
-                ffmpeg_path,
-                '-f', 'concat',
-                '-safe', '0',
-                '-i', str(concat_file),
-                '-c', 'copy',  # Copy streams without re-encoding
-                '-y',  # Overwrite output
-                str(output_path)
-            ]
-
-            result = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-
-            # Check if concat demuxer succeeded
-            if result.returncode == 0 and output_path.exists():
-                concat_file.unlink()  # Clean up
-
-                # Get duration
-                duration = self._get_video_duration_ffmpeg(output_path)
-                print(f"   [OK] concat demuxer 성공 (재인코딩 없음)")
-                print(f"[OK] Final Video: {output_path.name} (Total {duration/60:.1f} min)")
-                return output_path
-
-            # Method 2: Concat demuxer failed, try concat filter (re-encoding, slower but safer)
-            print(f"   [Warning] concat demuxer 실패 (비디오 파라미터 불일치)")
-            print(f"   시도 2: FFmpeg concat filter (재인코딩, 안전함)")
-
-            # Build filter complex for concatenation
-            filter_parts = []
-            for i in range(len(scene_videos)):
-                filter_parts.append(f"[{i}:v][{i}:a]")
-
-            filter_complex = f"{''.join(filter_parts)}concat=n={len(scene_videos)}:v=1:a=1[outv][outa]"
-
-            cmd = [
-                ffmpeg_path,
-                '-y'  # Overwrite output
-            ]
-
-            # Add all input files
-            for video_path in scene_videos:
-                cmd.extend(['-i', str(video_path)])
-
-            # Add filter and output
-            cmd.extend([
-                '-filter_complex', filter_complex,
-                '-map', '[outv]',
-                '-map', '[outa]',
-                '-c:v', self.config["output"]["codec"],
-                '-c:a', self.config["output"]["audio_codec"],
-                '-b:v', self.config["output"]["bitrate"],
-                '-preset', 'medium',
-                str(output_path)
-            ])
-
-            # Show progress
-            print(f"   FFmpeg 실행 중...")
-            result = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+            # Shared concat engine: concat demuxer when scene parameters match (no re-encoding),
+            # re-encode only mismatching scene runs, concat filter re-encode if nothing matches
+            print(f"   FFmpeg 스마트 병합 (파라미터가 같으면 재인코딩 없음)")
+            result = smart_concat(
+                scene_videos,
+                output_path,
+                fps=self.config["video"]["fps"],
+                ffmpeg=ffmpeg_path,
+                reencode_args=DRAFT_REENCODE_ARGS if self.draft else [
+                    '-c:v', self.config["output"]["codec"],
+                    '-c:a', self.config["output"]["audio_codec"],
+                    '-b:v', self.config["output"]["bitrate"],
+                    '-preset', 'medium',
+                ]
             )
 
-            if result.returncode != 0:
-                self.logger.error(f"FFmpeg concat filter failed: {result.stderr}")
-                raise RuntimeError(f"FFmpeg concat failed: {result.stderr}")
-
-            # Clean up concat file
-            if concat_file.exists():
-                concat_file.unlink()
-
             # Get duration
             duration = self._get_video_duration_ffmpeg(output_path)
-            print(f"   [OK] concat filter 성공")
+            print(f"   [OK] {result.strategy} 병합 성공 (재인코딩 {result.reencoded_count}개, {result.elapsed:.1f}초)")
             print(f"[OK] Final Video: {output_path.name} (Total {duration/60:.1f} min)")
-
             return output_path
 
         except FileNotFoundError:
@@ -3260,15 +3287,14 @@ Style: Cinematic, high quality, natural lighting, professional Korean drama aest
         final_clip = concatenate_videoclips(clips, method="compose")
         total_duration = final_clip.duration
 
-        final_clip.write_videofile(
-            str(output_path),
-            fps=self.config["video"]["fps"],
-            codec=self.config["output"]["codec"],
-            audio_codec=self.config["output"]["audio_codec"],
-            bitrate=self.config["output"]["bitrate"],
-            preset='medium',
-            logger='bar'
-        )
+        with get_encode_slot_pool().slot() as slot:
+            final_clip.write_videofile(
+                str(output_path),
+                fps=self.config["video"]["fps"],
+                threads=slot.threads,
+                logger='bar',
+                **self._video_write_params()
+            )
 
         # Cleanup
         final_clip.close()
@@ -7,7 +7,6 @@ import asyncio
 import json
 from pathlib import Path
 from typing import List
-import subprocess
 import logging
 import re
 
@@ -17,10 +16,14 @@ from app.utils import (
     get_video_duration,
     get_audio_duration,
     generate_tts_with_timestamps,
-    transcribe_audio_to_segments,
     generate_ass_subtitle,
     create_korean_subtitle_style,
 )
+from src.utils.ffmpeg_utils import probe_many
+from src.utils.concat_engine import ConcatError, smart_concat
+from src.utils.ffmpeg_job import run_ffmpeg
+from src.utils.transcription import get_transcription_service
+from src.utils.subtitle_segmentation import group_script_text, split_script_sentences, strip_control_markers
 
 # 워터마크 제거 기능
 try:
@@ -97,9 +100,11 @@ def remove_watermark_from_video(input_path: Path, output_path: Path, threshold:
     return output_path
 
 
-def concatenate_videos(video_paths: List[Path], output_path: Path) -> Path:
+def concatenate_videos(video_paths: List[Path], output_path: Path, width: int = None, height: int = None) -> Path:
     """
-    FFmpeg를 사용하여 비디오 병합 (filter_complex 방식)
+    비디오 병합 (25fps 통일, 공용 병합 엔진 사용)
+    속성이 같은 입력은 스트림 복사, 다른 구간만 재인코딩
+    width/height를 생략하면 가장 많은 입력의 해상도로 맞춤 (세로 영상도 그대로 유지)
     """
     ffmpeg = get_ffmpeg_path()
 
@@ -108,49 +113,11 @@ def concatenate_videos(video_paths: List[Path], output_path: Path) -> Path:
     for i, path in enumerate(video_paths, 1):
         logger.info(f"   {i}. {path.name}")
 
-    # filter_complex 방식으로 병합 (타임스탬프 문제 해결)
-    # 입력 파일들
-    input_args = []
-    for path in video_paths:
-        input_args.extend(['-i', str(path)])
-
-    # filter_complex 문자열 생성
-    # 모든 비디오를 1920x1080으로 통일 + SAR 1:1 정규화 후 concat
-    scale_filters = []
-    concat_inputs = []
-    for i in range(len(video_paths)):
-        scale_filters.append(f"[{i}:v]scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2,setsar=1,fps=25[v{i}]")
-        concat_inputs.append(f"[v{i}][{i}:a]")
-
-    filter_str = ";".join(scale_filters) + ";" + "".join(concat_inputs) + f"concat=n={len(video_paths)}:v=1:a=1[outv][outa]"
-
-    logger.info(f"🎬 FFmpeg filter_complex 명령 실행 중...")
-
-    cmd = [
-        ffmpeg,
-        '-y',  # 덮어쓰기
-        *input_args,  # 입력 파일들
-        '-filter_complex', filter_str,
-        '-map', '[outv]',
-        '-map', '[outa]',
-        '-c:v', 'libx264',
-        '-preset', 'medium',
-        '-crf', '18',  # 고품질
-        '-c:a', 'aac',
-        '-b:a', '192k',
-        str(output_path)
-    ]
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        timeout=600
-    )
-
-    if result.returncode != 0:
-        logger.error(f"❌ FFmpeg stderr: {result.stderr}")
-        raise RuntimeError(f"FFmpeg 실패:\n{result.stderr}")
+    try:
+        smart_concat(video_paths, output_path, width, height, 25, ffmpeg=ffmpeg)
+    except ConcatError as e:
+        logger.error(f"❌ FFmpeg 병합 실패: {e}")
+        raise RuntimeError(f"FFmpeg 실패:\n{e}")
 
     logger.info(f"비디오 병합 완료: {output_path.name}")
 
@@ -231,6 +198,9 @@ def align_videos_to_scenes(video_paths: list, scenes: list, whisper_segments: li
 
         logger.info(f"   씬 {i+1}: {duration:.2f}초 → {video_path.name}")
 
+    # 같은 비디오가 여러 씬에 반복 사용되므로 서로 다른 파일만 한 번씩 조회
+    probes = probe_many(vs['video_path'] for vs in video_segments)
+
     # FFmpeg filter_complex로 각 비디오를 trim하고 concat
     input_args = []
     trim_filters = []
@@ -239,7 +209,13 @@ def align_videos_to_scenes(video_paths: list, scenes: list, whisper_segments: li
     for i, vs in enumerate(video_segments):
         input_args.extend(['-i', str(vs['video_path'])])
         trim_filters.append(f"[{i}:v]trim=duration={vs['duration']},setpts=PTS-STARTPTS[v{i}]")
-        trim_filters.append(f"[{i}:a]atrim=duration={vs['duration']},asetpts=PTS-STARTPTS[a{i}]")
+        info = probes.get(Path(vs['video_path']))
+        if info and info['audio'] is None:
+            # 오디오 스트림이 없는 비디오는 [i:a]가 없어 concat이 실패하므로 무음으로 채움
+            logger.info(f"   🔇 {Path(vs['video_path']).name}: 오디오 없음, 무음 사용")
+            trim_filters.append(f"anullsrc=r=44100:cl=stereo,atrim=duration={vs['duration']},asetpts=PTS-STARTPTS[a{i}]")
+        else:
+            trim_filters.append(f"[{i}:a]atrim=duration={vs['duration']},asetpts=PTS-STARTPTS[a{i}]")
         concat_inputs.append(f"[v{i}][a{i}]")
 
     trim_filter_str = ";".join(trim_filters)
@@ -264,12 +240,7 @@ def align_videos_to_scenes(video_paths: list, scenes: list, whisper_segments: li
         str(output_path)
     ]
 
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        timeout=600
-    )
+    result = run_ffmpeg(cmd, timeout=600, encode_slot=True)
 
     if result.returncode != 0:
         logger.error(f"❌ FFmpeg stderr: {result.stderr}")
@@ -354,12 +325,7 @@ def align_videos_to_segments(video_paths: list, segments: list, output_path: Pat
         str(output_path)
     ]
 
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        timeout=600
-    )
+    result = run_ffmpeg(cmd, timeout=600, encode_slot=True)
 
     if result.returncode != 0:
         logger.error(f"❌ FFmpeg stderr: {result.stderr}")
@@ -380,17 +346,8 @@ def transcribe_audio_with_whisper(audio_path: Path, original_text: str) -> list:
     try:
         logger.info(f"🎧 Whisper로 타이밍 분석 중...")
 
-        # Whisper로 세그먼트 추출 (공통 모듈 사용)
-        whisper_segments_objs = transcribe_audio_to_segments(str(audio_path), model_name="base", language="ko")
-
-        # SubtitleSegment 객체를 딕셔너리로 변환
-        whisper_segments = []
-        for seg in whisper_segments_objs:
-            whisper_segments.append({
-                "start": seg.start,
-                "end": seg.end,
-                "text": seg.text
-            })
+        # Whisper로 세그먼트 추출 (공용 서비스: 모델은 프로세스당 한 번만 로드)
+        whisper_segments = get_transcription_service().transcribe(str(audio_path), model_size="base", language="ko")
 
         logger.info(f"✅ Whisper 타이밍 분석 완료: {len(whisper_segments)}개 세그먼트")
 
@@ -541,81 +498,10 @@ def create_ass_from_text(text: str, duration: float, output_path: Path, max_char
         return None
 
     # 제어 명령어 제거 ([무음 3초], [침묵] 등)
-    text = re.sub(r'\[(무음|침묵|pause)\s*(\d+(?:\.\d+)?)?초?\]', '', text)
-
-    # 문장 분리
-    sentences = re.split(r'([.!?。！？])', text)
-
-    # 분리된 구두점을 앞 문장에 붙이기
-    combined_sentences = []
-    for i in range(0, len(sentences)-1, 2):
-        if i+1 < len(sentences):
-            combined_sentences.append((sentences[i] + sentences[i+1]).strip())
-
-    # 마지막 문장 처리
-    if len(sentences) % 2 == 1 and sentences[-1].strip():
-        combined_sentences.append(sentences[-1].strip())
-
-    # 문장이 없으면 전체 텍스트를 하나의 문장으로
-    if not combined_sentences:
-        combined_sentences = [text.strip()]
-
-    # 전체 글자 수 계산
-    total_text = " ".join(combined_sentences)
-    total_chars = len(total_text)
-    time_per_char = duration / total_chars if total_chars > 0 else 0
-
-    # 각 문장을 max_chars_per_line자 단위로 분할
-    subtitles = []
-    current_time = 0.0
-    MIN_REMAINING_CHARS = 5
-
-    for sentence in combined_sentences:
-        words = sentence.split()
-        if not words:
-            continue
+    text = strip_control_markers(text)
 
-        current_text = ""
-        for i, word in enumerate(words):
-            next_text = current_text + (" " if current_text else "") + word
-            remaining_words = words[i+1:]
-            remaining_text = " ".join(remaining_words) if remaining_words else ""
-
-            if len(next_text) > max_chars_per_line and current_text:
-                if len(remaining_text) > 0 and len(remaining_text) < MIN_REMAINING_CHARS:
-                    current_text = next_text + (" " + remaining_text if remaining_text else "")
-                    duration_calc = len(current_text) * time_per_char
-                    end_time = current_time + duration_calc
-                    subtitles.append({
-                        "start": current_time,
-                        "end": end_time,
-                        "text": current_text.strip()
-                    })
-                    current_text = ""
-                    current_time = end_time
-                    break
-                else:
-                    duration_calc = len(current_text) * time_per_char
-                    end_time = current_time + duration_calc
-                    subtitles.append({
-                        "start": current_time,
-                        "end": end_time,
-                        "text": current_text.strip()
-                    })
-                    current_text = word
-                    current_time = end_time
-            else:
-                current_text = next_text
-
-        if current_text:
-            duration_calc = len(current_text) * time_per_char
-            end_time = current_time + duration_calc
-            subtitles.append({
-                "start": current_time,
-                "end": end_time,
-                "text": current_text.strip()
-            })
-            current_time = end_time
+    # 문장 분리 후 max_chars_per_line자 단위로 분할 (글자 수 기반 타이밍)
+    subtitles = group_script_text(split_script_sentences(text), duration, max_chars_per_line)
 
     # SubtitleSegment 객체 변환
     from app.utils import SubtitleSegment
@@ -777,12 +663,7 @@ def add_audio_to_video(video_path: Path, audio_path: Path, output_path: Path, su
                 logger.info(f"🎬 FFmpeg 명령어 실행 중...")
                 logger.info(f"   자막 필터: ass={ass_path_str}")
 
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=600
-                )
+                result = run_ffmpeg(cmd, timeout=600, encode_slot=True)
 
                 logger.info(f"📤 FFmpeg 반환 코드: {result.returncode}")
                 if result.stdout:
@@ -846,12 +727,7 @@ def add_audio_to_video(video_path: Path, audio_path: Path, output_path: Path, su
 
         cmd.append(str(output_path))
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600
-        )
+        result = run_ffmpeg(cmd, timeout=600, encode_slot=True)
 
     if result.returncode != 0:
         raise RuntimeError(f"오디오 추가 실패:\n{result.stderr}")